@@ -3,8 +3,48 @@ from exotx._version import __version__ as _version
 
 __version__ = _version
 
-# Import classes
-from exotx.enums import *
-from exotx.data import *
-from exotx.instruments import *
-from exotx.models import *
+# Import classes lazily (PEP 562): QuantLib, scipy, pandas and marshmallow are only loaded on first access.
+# The table mirrors the __all__ of the star-exported subpackages, exotx/tests/test_import.py keeps them in sync.
+_lazy_attributes = {
+    'PricingModel': 'exotx.enums',
+    'NumericalMethod': 'exotx.enums',
+    'VolatilityInterpolation': 'exotx.enums',
+    'MarketData': 'exotx.data',
+    'StaticData': 'exotx.data',
+    'StaticDataSchema': 'exotx.data',
+    'SviSurface': 'exotx.data',
+    'VolSurface': 'exotx.data',
+    'price': 'exotx.instruments',
+    'VanillaOption': 'exotx.instruments',
+    'Autocallable': 'exotx.instruments',
+    'BarrierOption': 'exotx.instruments',
+    'OptionType': 'exotx.instruments',
+    'BlackScholesModel': 'exotx.models',
+    'HestonModel': 'exotx.models',
+    'LocalVolatilityModel': 'exotx.models',
+    'LocalVolatilitySurface': 'exotx.models'
+}
+
+_star_exported_submodules = ['enums', 'data', 'instruments', 'models']
+
+_lazy_submodules = ['data', 'engines', 'enums', 'helpers', 'instruments', 'models', 'utils']
+
+__all__ = list(_lazy_attributes)
+
+
+def __getattr__(name: str):
+    import importlib
+
+    if name in _lazy_attributes:
+        value = getattr(importlib.import_module(_lazy_attributes[name]), name)
+    elif name in _lazy_submodules:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache the attribute, __getattr__ is not called again for it
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__ + _lazy_submodules)
@@ -2,9 +2,13 @@
 
 from exotx.data.marketdata import MarketData
 from exotx.data.staticdata import StaticData, StaticDataSchema
+from exotx.data.svi import SviSurface
+from exotx.data.volsurface import VolSurface
 
 __all__ = [
     'MarketData',
     'StaticData',
-    'StaticDataSchema'
+    'StaticDataSchema',
+    'SviSurface',
+    'VolSurface'
 ]
@@ -1,10 +1,18 @@
 import json
 from datetime import datetime
-from typing import List, Union
+from typing import Dict, List, Optional, Union
 
 import QuantLib as ql
+import numpy as np
 from marshmallow import Schema, fields, post_load
 
+from exotx.data.static.daycounters import DayCounter, year_fractions
+from exotx.data.staticdata import DayCounterField
+from exotx.data.svi import SviSurface, get_svi_surface
+from exotx.data.volsurface import VolSurface
+from exotx.helpers.dates import convert_dates_to_datetime64
+from exotx.helpers.implied_volatility import black_implied_volatilities
+
 
 class MarketData:
 
@@ -17,7 +25,12 @@ class MarketData:
                  strikes: List[float] = None,
                  data: List[List[float]] = None,
                  underlying_black_scholes_volatilities: List[float] = None,
-                 correlation_matrix: List[List[float]] = None) -> None:
+                 correlation_matrix: List[List[float]] = None,
+                 volatility_day_counter: DayCounter = None) -> None:
+        # volatility surfaces built from the market data, by day counter, reset when the market data they depend on
+        # is reassigned
+        self._vol_surfaces: Dict[DayCounter, VolSurface] = {}
+
         # set the reference date
         self._set_reference_date(reference_date)
 
@@ -33,6 +46,19 @@ class MarketData:
         # set the correlation matrix
         self._set_correlation_matrix(correlation_matrix)
 
+        # set the day counter the volatilities are quoted with, None when the volatilities hold for any day counter
+        self.volatility_day_counter = volatility_day_counter
+
+    def __reduce__(self) -> tuple:
+        # pickled as primitive constructor arguments with dates as strings, the volatility surfaces being rebuilt on
+        # first use when unpickled
+        expiration_dates = None if not self.expiration_dates else \
+            [expiration_date.strftime('%Y-%m-%d') for expiration_date in self.expiration_dates]
+        return type(self), (self.underlying_spots, self.risk_free_rate, self.dividend_rate,
+                            self.reference_date.strftime('%Y-%m-%d'), expiration_dates, self.strikes, self.data,
+                            self.underlying_black_scholes_volatilities, self.correlation_matrix,
+                            self.volatility_day_counter)
+
     # region setters
 
     # TODO: Have a proper rate curves stripper service
@@ -43,15 +69,7 @@ class MarketData:
     # TODO: Allow for multiple volatility surfaces for each underlying
     def _set_volatility_surface(self, underlying_black_scholes_volatilities: List[float], data, expiration_dates,
                                 strikes) -> None:
-        self.expiration_dates: List[datetime] = []
-        if not expiration_dates:
-            self.expiration_dates = None
-        else:
-            for expiration_date in expiration_dates:
-                if isinstance(expiration_date, str):
-                    self.expiration_dates.append(datetime.strptime(expiration_date, '%Y-%m-%d'))
-                elif isinstance(expiration_date, datetime):
-                    self.expiration_dates.append(expiration_date)
+        self.expiration_dates = expiration_dates
         self.strikes = strikes
         self.data = data
 
@@ -74,7 +92,7 @@ class MarketData:
         else:
             # defaults to today's date
             reference_date = datetime.today()
-        self.reference_date: datetime = reference_date
+        self.reference_date = reference_date
 
     def _set_correlation_matrix(self, correlation_matrix: Union[List[List[float]], None]) -> None:
         if correlation_matrix:
@@ -85,6 +103,62 @@ class MarketData:
 
     # endregion
 
+    # region volatility surface data
+    @property
+    def reference_date(self) -> datetime:
+        return self._reference_date
+
+    @reference_date.setter
+    def reference_date(self, value: datetime) -> None:
+        self._reference_date = value
+        self._vol_surfaces.clear()
+
+    @property
+    def expiration_dates(self) -> Optional[List[datetime]]:
+        return self._expiration_dates
+
+    @expiration_dates.setter
+    def expiration_dates(self, value: Optional[List[Union[datetime, str]]]) -> None:
+        if not value:
+            self._expiration_dates = None
+        else:
+            self._expiration_dates: List[datetime] = []
+            for expiration_date in value:
+                if isinstance(expiration_date, str):
+                    self._expiration_dates.append(datetime.strptime(expiration_date, '%Y-%m-%d'))
+                elif isinstance(expiration_date, datetime):
+                    self._expiration_dates.append(expiration_date)
+        self._vol_surfaces.clear()
+
+    @property
+    def strikes(self) -> Optional[List[float]]:
+        return self._strikes
+
+    @strikes.setter
+    def strikes(self, value: Optional[List[float]]) -> None:
+        self._strikes = value
+        self._vol_surfaces.clear()
+
+    @property
+    def data(self) -> Optional[List[List[float]]]:
+        return self._data
+
+    @data.setter
+    def data(self, value: Optional[List[List[float]]]) -> None:
+        self._data = value
+        self._vol_surfaces.clear()
+
+    @property
+    def volatility_day_counter(self) -> Optional[DayCounter]:
+        return self._volatility_day_counter
+
+    @volatility_day_counter.setter
+    def volatility_day_counter(self, value: Optional[DayCounter]) -> None:
+        self._volatility_day_counter = value
+        self._vol_surfaces.clear()
+
+    # endregion
+
     # region getters
     def get_ql_reference_date(self) -> ql.Date:
         return ql.Date().from_date(self.reference_date)
@@ -98,6 +172,56 @@ class MarketData:
                 matrix[j][i] = self.correlation_matrix[i][j]
         return matrix
 
+    def get_vol_surface(self, day_counter: DayCounter = DayCounter.Actual365Fixed) -> Optional[VolSurface]:
+        """
+        Gets the volatility surface defined by the expiration dates, strikes and volatility data.
+
+        The quotes are sorted by expiration date and strike, and the expiration dates on or before the reference date
+        are dropped. When the volatilities are quoted with another day counter, they are rescaled so that the surface
+        keeps the total variances of the quotes at the expiration dates. The surface is built once per day counter, and
+        rebuilt after the reference date, expiration dates, strikes or data are reassigned. Changes made in place to the
+        lists are not tracked.
+
+        :param day_counter: The day counter converting dates to times, defaults to Actual365Fixed.
+        :type day_counter: DayCounter, optional
+        :return: The volatility surface, or None when no surface data is available.
+        :rtype: Optional[VolSurface]
+        """
+        if not (self.expiration_dates and self.strikes and self.data):
+            return None
+        if day_counter not in self._vol_surfaces:
+            expiration_dates = convert_dates_to_datetime64(self.expiration_dates)
+            strikes = np.array(self.strikes, dtype=float)
+            volatilities = np.array(self.data, dtype=float)
+            expiration_order = np.argsort(expiration_dates, kind='stable')
+            expiration_order = expiration_order[
+                expiration_dates[expiration_order] > convert_dates_to_datetime64(self.reference_date)]
+            if expiration_order.shape[0] == 0:
+                return None
+            strike_order = np.argsort(strikes, kind='stable')
+            expiration_dates = expiration_dates[expiration_order]
+            volatilities = volatilities[np.ix_(expiration_order, strike_order)]
+            if self.volatility_day_counter is not None and self.volatility_day_counter != day_counter:
+                reference_date = convert_dates_to_datetime64(self.reference_date)
+                quoted_times = year_fractions(self.volatility_day_counter, reference_date, expiration_dates)
+                times = year_fractions(day_counter, reference_date, expiration_dates)
+                volatilities = volatilities * np.sqrt(quoted_times / times)[:, None]
+            self._vol_surfaces[day_counter] = VolSurface(self.reference_date, expiration_dates,
+                                                         strikes[strike_order], volatilities, day_counter)
+        return self._vol_surfaces[day_counter]
+
+    def get_svi_surface(self, day_counter: DayCounter = DayCounter.Actual365Fixed) -> Optional[SviSurface]:
+        """
+        Gets the SVI parametrization of the volatility surface, calibrated once per content of the surface.
+
+        :param day_counter: The day counter converting dates to times, defaults to Actual365Fixed.
+        :type day_counter: DayCounter, optional
+        :return: The SVI surface, or None when no surface data is available.
+        :rtype: Optional[SviSurface]
+        """
+        vol_surface = self.get_vol_surface(day_counter)
+        return None if vol_surface is None else get_svi_surface(vol_surface)
+
     # TODO: Get these from a proper rate curve stripper service
     def get_yield_curve(self, day_counter) -> ql.YieldTermStructureHandle:
         flat_forward = ql.FlatForward(self.get_ql_reference_date(), self.risk_free_rate, day_counter)
@@ -109,6 +233,66 @@ class MarketData:
 
     # endregion
 
+    # region construction from option prices
+    @classmethod
+    def from_option_prices(cls,
+                           underlying_spots: List[float],
+                           risk_free_rate: float,
+                           dividend_rate: float,
+                           reference_date: Union[datetime, str],
+                           expiration_dates: List[Union[datetime, str]],
+                           strikes: List[float],
+                           prices: List[List[float]],
+                           option_types: Union[int, List[List[int]]] = ql.Option.Call,
+                           day_counter: DayCounter = DayCounter.Actual365Fixed,
+                           **kwargs) -> 'MarketData':
+        """
+        Creates market data from a grid of European option prices, the volatility surface being implied from the
+        prices in a single batch.
+
+        The implied volatilities are quoted with the given day counter, which the market data remembers: the surfaces
+        built for other day counters, such as the one of the static data, keep the implied total variances and thus
+        reproduce the option prices.
+
+        :param underlying_spots: The spots of the underlyings, the first one being the underlying of the options.
+        :type underlying_spots: List[float]
+        :param risk_free_rate: The continuously compounded risk-free rate.
+        :type risk_free_rate: float
+        :param dividend_rate: The continuously compounded dividend yield.
+        :type dividend_rate: float
+        :param reference_date: The reference date.
+        :type reference_date: Union[datetime, str]
+        :param expiration_dates: The expiration dates of the options.
+        :type expiration_dates: List[Union[datetime, str]]
+        :param strikes: The strikes of the options.
+        :type strikes: List[float]
+        :param prices: The option prices, with one row per expiration date and one column per strike.
+        :type prices: List[List[float]]
+        :param option_types: The QuantLib option types (ql.Option.Call or ql.Option.Put), either one for all the
+                             options or one per price, defaults to calls.
+        :type option_types: Union[int, List[List[int]]], optional
+        :param day_counter: The day counter converting dates to times, defaults to Actual365Fixed.
+        :type day_counter: DayCounter, optional
+        :param kwargs: The other arguments of the market data, such as the correlation matrix.
+        :return: The market data.
+        :rtype: MarketData
+        :raises ValueError: If the implied volatility of any price cannot be found.
+        """
+        market_data = cls(underlying_spots, risk_free_rate, dividend_rate, reference_date, expiration_dates, strikes,
+                          volatility_day_counter=day_counter, **kwargs)
+        times = year_fractions(day_counter, convert_dates_to_datetime64(market_data.reference_date),
+                               convert_dates_to_datetime64(market_data.expiration_dates))[:, None]
+        forwards = underlying_spots[0] * np.exp((risk_free_rate - dividend_rate) * times)
+        volatilities, converged = black_implied_volatilities(option_types, prices, forwards, np.array(strikes), times,
+                                                             np.exp(-risk_free_rate * times))
+        if not np.all(converged):
+            failures = [(int(i), int(j)) for i, j in np.argwhere(~converged)]
+            raise ValueError(f"No implied volatility found for the prices at positions {failures}")
+        market_data.data = volatilities.tolist()
+        return market_data
+
+    # endregion
+
     # region serialization/deserialization
     @classmethod
     def from_json(cls, data: dict):
@@ -139,6 +323,7 @@ class MarketDataSchema(Schema):
     data = fields.List(fields.List(fields.Float), allow_none=True)
     underlying_black_scholes_volatilities = fields.List(fields.Float(allow_none=True))
     correlation_matrix = fields.List(fields.List(fields.Float()))
+    volatility_day_counter = DayCounterField(allow_none=True)
 
     @post_load
     def make_market_data(self, data, **kwargs) -> MarketData:
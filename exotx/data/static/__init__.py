@@ -1,11 +1,14 @@
+from exotx.data.static.business_day_index import BusinessDayIndex, get_business_day_index
 from exotx.data.static.calendar import Calendar
 from exotx.data.static.calendars import calendars_to_ql_calendars, CalendarRegion, CalendarMarket, region_to_markets, \
     available_regions
 from exotx.data.static.conventions import compoundings, frequencies, business_day_conventions_to_ql, \
     BusinessDayConvention
-from exotx.data.static.daycounters import day_counters_to_ql, DayCounter
+from exotx.data.static.daycounters import day_counters_to_ql, DayCounter, year_fractions
 
 __all__ = [
+    'BusinessDayIndex',
+    'get_business_day_index',
     'calendars_to_ql_calendars',
     'day_counters_to_ql',
     'compoundings',
@@ -17,5 +20,6 @@ __all__ = [
     'CalendarMarket',
     'region_to_markets',
     'available_regions',
-    'DayCounter'
+    'DayCounter',
+    'year_fractions'
 ]
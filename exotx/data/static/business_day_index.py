@@ -0,0 +1,335 @@
+from typing import Dict, Tuple, Union
+
+import QuantLib as ql
+import numpy as np
+
+from exotx.data.static.conventions import BusinessDayConvention
+from exotx.helpers.dates import convert_ql_dates_to_datetime64, convert_datetime64_to_ql_dates
+
+DateArray = Union[np.ndarray, np.datetime64, str, list]
+
+
+class BusinessDayIndex:
+    """
+    A precomputed business day index of a calendar, for vectorized date computations on NumPy datetime64 arrays.
+
+    The holidays of the calendar are queried once over a date range, after which business day checks, adjustments,
+    date advances and schedule generations are performed with array operations only, following the QuantLib
+    conventions. Dates must lie within the range of the index.
+
+    Attributes:
+        calendar (ql.Calendar): The calendar of the index.
+        start_date (np.datetime64): The first date of the index.
+        end_date (np.datetime64): The last date of the index.
+    """
+
+    def __init__(self,
+                 calendar: ql.Calendar,
+                 start_date: Union[np.datetime64, str] = '1990-01-01',
+                 end_date: Union[np.datetime64, str] = '2100-12-31') -> None:
+        self.calendar = calendar
+        self.start_date = np.datetime64(start_date, 'D')
+        self.end_date = np.datetime64(end_date, 'D')
+        assert self.start_date < self.end_date, f"Invalid date range [{self.start_date}, {self.end_date}]"
+
+        ql_start_date, ql_end_date = convert_datetime64_to_ql_dates(np.array([self.start_date, self.end_date]))
+        holidays = convert_ql_dates_to_datetime64(calendar.holidayList(ql_start_date, ql_end_date, True))
+        self._is_business_day = np.ones((self.end_date - self.start_date).astype(int) + 1, dtype=bool)
+        self._is_business_day[(holidays - self.start_date).astype(int)] = False
+        # offsets of the business days, and number of business days up to and including each day
+        self._business_days = np.flatnonzero(self._is_business_day)
+        self._business_day_counts = np.cumsum(self._is_business_day)
+
+    # region Helpers
+    def _to_offsets(self, dates: DateArray) -> np.ndarray:
+        offsets = (np.asarray(dates, dtype='datetime64[D]') - self.start_date).astype(np.int64)
+        if np.any(offsets < 0) or np.any(offsets >= self._is_business_day.shape[0]):
+            raise ValueError(f"Dates outside of the business day index range [{self.start_date}, {self.end_date}]")
+        return offsets
+
+    def _to_dates(self, offsets: np.ndarray) -> np.ndarray:
+        return self.start_date + offsets.astype('timedelta64[D]')
+
+    def _business_days_at(self, positions: np.ndarray) -> np.ndarray:
+        if np.any(positions < 0) or np.any(positions >= self._business_days.shape[0]):
+            raise ValueError(f"Dates outside of the business day index range [{self.start_date}, {self.end_date}]")
+        return self._business_days[positions]
+
+    def _following(self, offsets: np.ndarray) -> np.ndarray:
+        return self._business_days_at(np.searchsorted(self._business_days, offsets, side='left'))
+
+    def _preceding(self, offsets: np.ndarray) -> np.ndarray:
+        return self._business_days_at(np.searchsorted(self._business_days, offsets, side='right') - 1)
+
+    @staticmethod
+    def _months(dates: np.ndarray) -> np.ndarray:
+        return dates.astype('datetime64[M]')
+
+    def _last_days(self, dates: np.ndarray) -> np.ndarray:
+        # last calendar day of the month, as ql.Date.endOfMonth
+        return (self._months(dates) + 1).astype('datetime64[D]') - 1
+
+    def _end_of_month(self, dates: np.ndarray) -> np.ndarray:
+        # last business day of the month, as ql.Calendar.endOfMonth
+        return self.adjust(self._last_days(dates), BusinessDayConvention.Preceding)
+
+    @staticmethod
+    def _add_months(dates: np.ndarray, months: np.ndarray) -> np.ndarray:
+        # the day of the month is kept, or moved back to the end of shorter months
+        first_days = dates.astype('datetime64[M]')
+        shifted_first_days = first_days + months
+        days_in_month = ((shifted_first_days + 1).astype('datetime64[D]') -
+                         shifted_first_days.astype('datetime64[D]')).astype(np.int64)
+        day = (dates - first_days.astype('datetime64[D]')).astype(np.int64)
+        return shifted_first_days.astype('datetime64[D]') + np.minimum(day, days_in_month - 1).astype(
+            'timedelta64[D]')
+
+    # endregion
+
+    def is_business_day(self, dates: DateArray) -> np.ndarray:
+        """
+        Checks whether the given dates are business days.
+
+        :param dates: The dates.
+        :type dates: DateArray
+        :return: True for business days, False for holidays and weekends.
+        :rtype: np.ndarray
+        """
+        return self._is_business_day[self._to_offsets(dates)]
+
+    def is_end_of_month(self, dates: DateArray) -> np.ndarray:
+        """
+        Checks whether the given dates are on or after the last business day of their month, as
+        ql.Calendar.isEndOfMonth.
+
+        :param dates: The dates.
+        :type dates: DateArray
+        :return: True for dates at the end of their month.
+        :rtype: np.ndarray
+        """
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        next_business_days = self.adjust(dates + 1, BusinessDayConvention.Following)
+        return self._months(dates) != self._months(next_business_days)
+
+    def adjust(self,
+               dates: DateArray,
+               convention: BusinessDayConvention = BusinessDayConvention.Following) -> np.ndarray:
+        """
+        Adjusts the given dates to business days with a business day convention.
+
+        :param dates: The dates.
+        :type dates: DateArray
+        :param convention: The business day convention, defaults to Following.
+        :type convention: BusinessDayConvention, optional
+        :return: The adjusted dates.
+        :rtype: np.ndarray
+        """
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        offsets = self._to_offsets(dates)
+        if convention == BusinessDayConvention.Unadjusted:
+            return dates.copy()
+        elif convention == BusinessDayConvention.Following:
+            return self._to_dates(self._following(offsets))
+        elif convention == BusinessDayConvention.Preceding:
+            return self._to_dates(self._preceding(offsets))
+        elif convention == BusinessDayConvention.ModifiedFollowing:
+            adjusted = self._to_dates(self._following(offsets))
+            month_changed = self._months(adjusted) != self._months(dates)
+            if np.any(month_changed):
+                adjusted = np.where(month_changed, self._to_dates(self._preceding(offsets)), adjusted)
+            return adjusted
+        elif convention == BusinessDayConvention.ModifiedPreceding:
+            adjusted = self._to_dates(self._preceding(offsets))
+            month_changed = self._months(adjusted) != self._months(dates)
+            if np.any(month_changed):
+                adjusted = np.where(month_changed, self._to_dates(self._following(offsets)), adjusted)
+            return adjusted
+        else:
+            raise ValueError(f"Invalid business day convention \'{convention}\'")
+
+    def business_days_between(self, start_dates: DateArray, end_dates: DateArray) -> np.ndarray:
+        """
+        Counts the business days between the given dates, as ql.Calendar.businessDaysBetween: the start date is
+        included, the end date is excluded, and the count is negative when the end date is before the start date.
+
+        :param start_dates: The start dates.
+        :type start_dates: DateArray
+        :param end_dates: The end dates, broadcast against the start dates.
+        :type end_dates: DateArray
+        :return: The numbers of business days.
+        :rtype: np.ndarray
+        """
+        start_offsets, end_offsets = np.broadcast_arrays(self._to_offsets(start_dates), self._to_offsets(end_dates))
+        start_counts = self._business_day_counts[start_offsets]
+        end_counts = self._business_day_counts[end_offsets]
+        # business days in [start, end) going forward, and in (end, start] going backward
+        forward_counts = end_counts - self._is_business_day[end_offsets] - \
+            (start_counts - self._is_business_day[start_offsets])
+        return np.where(start_offsets <= end_offsets, forward_counts, end_counts - start_counts)
+
+    def advance(self,
+                dates: DateArray,
+                n: Union[int, np.ndarray],
+                time_unit: int = ql.Days,
+                convention: BusinessDayConvention = BusinessDayConvention.Following,
+                end_of_month: bool = False) -> np.ndarray:
+        """
+        Advances the given dates by a number of time units, as ql.Calendar.advance.
+
+        Days are business days. Weeks, months and years are calendar periods, the resulting dates are then adjusted
+        with the business day convention, or moved to the end of their month when the end of month rule applies.
+
+        :param dates: The dates.
+        :type dates: DateArray
+        :param n: The number of time units, broadcast against the dates.
+        :type n: Union[int, np.ndarray]
+        :param time_unit: The QuantLib time unit (ql.Days, ql.Weeks, ql.Months or ql.Years), defaults to ql.Days.
+        :type time_unit: int, optional
+        :param convention: The business day convention, defaults to Following.
+        :type convention: BusinessDayConvention, optional
+        :param end_of_month: Whether dates at the end of their month are moved to the end of the month when advancing
+                             by months or years, defaults to False.
+        :type end_of_month: bool, optional
+        :return: The advanced dates.
+        :rtype: np.ndarray
+        """
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        dates, n = np.broadcast_arrays(dates, np.asarray(n, dtype=np.int64))
+        if np.all(n == 0):
+            return self.adjust(dates, convention)
+        if time_unit == ql.Days:
+            offsets = self._to_offsets(dates)
+            counts = self._business_day_counts[offsets]
+            # the n-th business day strictly after (or before) each date, the date itself when n is zero
+            positions = np.where(n > 0, counts + n - 1, counts - self._is_business_day[offsets] + n)
+            advanced = self._to_dates(self._business_days_at(np.where(n == 0, 0, positions)))
+            if np.any(n == 0):
+                advanced = np.where(n == 0, self.adjust(dates, convention), advanced)
+            return advanced
+        elif time_unit == ql.Weeks:
+            return self.adjust(dates + (7 * n).astype('timedelta64[D]'), convention)
+        elif time_unit in (ql.Months, ql.Years):
+            months = n if time_unit == ql.Months else 12 * n
+            advanced = self._add_months(dates, months)
+            if end_of_month:
+                # dates which are not advanced are only adjusted
+                is_end_of_month = self.is_end_of_month(dates) & (n != 0)
+                if np.any(is_end_of_month):
+                    return np.where(is_end_of_month, self._end_of_month(advanced), self.adjust(advanced, convention))
+            return self.adjust(advanced, convention)
+        else:
+            raise ValueError(f"Invalid time unit \'{time_unit}\'")
+
+    def schedule(self,
+                 effective_dates: DateArray,
+                 termination_dates: DateArray,
+                 tenor_months: int,
+                 convention: BusinessDayConvention = BusinessDayConvention.Following,
+                 termination_convention: BusinessDayConvention = None,
+                 end_of_month: bool = False) -> np.ndarray:
+        """
+        Generates schedules forward from the effective dates to the termination dates, as ql.Schedule with the
+        ql.DateGeneration.Forward rule.
+
+        Schedules of different lengths are padded with NaT at their end.
+
+        :param effective_dates: The effective dates, one per schedule.
+        :type effective_dates: DateArray
+        :param termination_dates: The termination dates, one per schedule.
+        :type termination_dates: DateArray
+        :param tenor_months: The tenor of the schedules, in months.
+        :type tenor_months: int
+        :param convention: The business day convention of the schedule dates, defaults to Following.
+        :type convention: BusinessDayConvention, optional
+        :param termination_convention: The business day convention of the termination dates, defaults to the
+                                        convention of the schedule dates.
+        :type termination_convention: BusinessDayConvention, optional
+        :param end_of_month: Whether the end of month rule applies, defaults to False.
+        :type end_of_month: bool, optional
+        :return: The schedules, one per row.
+        :rtype: np.ndarray
+        """
+        assert tenor_months > 0, f"Invalid tenor: {tenor_months} months"
+        termination_convention = convention if termination_convention is None else termination_convention
+        effective_dates = np.atleast_1d(np.asarray(effective_dates, dtype='datetime64[D]'))
+        termination_dates = np.atleast_1d(np.asarray(termination_dates, dtype='datetime64[D]'))
+        effective_dates, termination_dates = np.broadcast_arrays(effective_dates, termination_dates)
+        assert np.all(effective_dates < termination_dates), "Effective dates must precede termination dates"
+
+        # unadjusted regular dates up to the termination dates, at the end of the calendar months when the end of
+        # month rule applies to effective dates on the last day of their month
+        total_months = ((termination_dates.astype('datetime64[M]') - effective_dates.astype('datetime64[M]'))
+                        .astype(np.int64))
+        number_of_periods = int(total_months.max()) // tenor_months + 2
+        periods = np.arange(number_of_periods) * tenor_months
+        unadjusted = self._add_months(effective_dates[:, None], periods[None, :])
+        if end_of_month:
+            is_last_day = effective_dates == self._last_days(effective_dates)
+            unadjusted = np.where(is_last_day[:, None], self._last_days(unadjusted), unadjusted)
+            unadjusted[:, 0] = effective_dates
+        in_schedule = unadjusted <= termination_dates[:, None]
+        number_of_regular_dates = in_schedule.sum(axis=1)
+        clipped = np.where(in_schedule, unadjusted, effective_dates[:, None])
+
+        # the termination date is only added when it differs from the last regular date after adjustment
+        last_regular_dates = np.take_along_axis(clipped, number_of_regular_dates[:, None] - 1, axis=1)[:, 0]
+        collapsed = self.adjust(last_regular_dates, termination_convention) == \
+            self.adjust(termination_dates, termination_convention)
+        last_dates = np.where(collapsed, last_regular_dates, termination_dates)
+
+        adjusted = self.adjust(clipped, convention)
+        adjusted_last_dates = self.adjust(last_dates, termination_convention)
+        is_end_of_month = self.is_end_of_month(effective_dates) if end_of_month else \
+            np.zeros(effective_dates.shape, dtype=bool)
+        if np.any(is_end_of_month):
+            if convention == BusinessDayConvention.Unadjusted:
+                adjusted[is_end_of_month] = self._last_days(clipped[is_end_of_month])
+            else:
+                adjusted[is_end_of_month] = self._end_of_month(clipped[is_end_of_month])
+            first_dates = effective_dates[is_end_of_month]
+            if termination_convention == BusinessDayConvention.Unadjusted:
+                adjusted[is_end_of_month, 0] = self._last_days(first_dates)
+            else:
+                adjusted[is_end_of_month, 0] = self._end_of_month(first_dates)
+                adjusted_last_dates[is_end_of_month] = self._end_of_month(last_dates[is_end_of_month])
+
+        schedules = np.full((effective_dates.shape[0], number_of_periods + 1), np.datetime64('NaT'),
+                            dtype='datetime64[D]')
+        for i in range(effective_dates.shape[0]):
+            dates = adjusted[i, :number_of_regular_dates[i]]
+            dates = np.append(dates[:-1] if collapsed[i] else dates, adjusted_last_dates[i])
+            # dates moved onto or beyond their neighbours by the adjustments are removed
+            if dates.shape[0] > 2 and dates[-2] >= dates[-1]:
+                dates = np.delete(dates, -2)
+            if dates.shape[0] > 2 and dates[1] <= dates[0]:
+                dates = np.delete(dates, 1)
+            schedules[i, :dates.shape[0]] = dates
+        # drop the padding columns that are never used
+        used_columns = np.any(~np.isnat(schedules), axis=0)
+        return schedules[:, used_columns]
+
+
+_business_day_indexes: Dict[Tuple[str, np.datetime64, np.datetime64], BusinessDayIndex] = {}
+
+
+def get_business_day_index(calendar: ql.Calendar,
+                           start_date: Union[np.datetime64, str] = '1990-01-01',
+                           end_date: Union[np.datetime64, str] = '2100-12-31') -> BusinessDayIndex:
+    """
+    Gets the business day index of a calendar, built once per calendar name and date range.
+
+    Holidays added to or removed from a QuantLib calendar after its index has been built are not reflected.
+
+    :param calendar: The calendar.
+    :type calendar: ql.Calendar
+    :param start_date: The first date of the index, defaults to 1990-01-01.
+    :type start_date: Union[np.datetime64, str], optional
+    :param end_date: The last date of the index, defaults to 2100-12-31.
+    :type end_date: Union[np.datetime64, str], optional
+    :return: The business day index.
+    :rtype: BusinessDayIndex
+    """
+    key = (calendar.name(), np.datetime64(start_date, 'D'), np.datetime64(end_date, 'D'))
+    if key not in _business_day_indexes:
+        _business_day_indexes[key] = BusinessDayIndex(calendar, start_date, end_date)
+    return _business_day_indexes[key]
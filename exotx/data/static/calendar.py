@@ -11,6 +11,11 @@ class Calendar:
                  market: Union[CalendarMarket, str, None] = None):
         self.region, self.market = Calendar.validate_inputs(region, market)
 
+    def __reduce__(self) -> tuple:
+        # pickled as the names of the region and market
+        return type(self), (None if self.region is None else self.region.name,
+                            None if self.market is None else self.market.name)
+
     @staticmethod
     def validate_inputs(region, market) -> Tuple[Union[CalendarRegion, None], Union[CalendarMarket, None]]:
         if region:
@@ -1,7 +1,10 @@
 import enum
+from functools import partial
 
 import QuantLib as ql
 
+from exotx.helpers.lazy import LazyMapping
+
 
 # based on https://quantlib-python-docs.readthedocs.io/en/latest/dates.html#calendar
 
@@ -243,160 +246,161 @@ region_to_markets = {
 
 available_regions = [region.name for region in CalendarRegion]
 
+# the calendars are only built when first looked up
 calendars_to_ql_calendars = {
-    CalendarRegion.Argentina: {
-        CalendarMarket.Merval: ql.Argentina(ql.Argentina.Merval),
-        CalendarMarket.Settlement: ql.Argentina()
-    },
-    CalendarRegion.Australia: {
-        CalendarMarket.Settlement: ql.Australia()
-    },
-    CalendarRegion.BespokeCalendar: {
-        CalendarMarket.Settlement: ql.BespokeCalendar('BespokeCalendar')
-    },
-    CalendarRegion.Brazil: {
-        CalendarMarket.Exchange: ql.Brazil(ql.Brazil.Exchange),
-        CalendarMarket.Settlement: ql.Brazil(ql.Brazil.Settlement)
-    },
-    CalendarRegion.Canada: {
-        CalendarMarket.Settlement: ql.Canada(ql.Canada.Settlement),
-        CalendarMarket.TSX: ql.Canada(ql.Canada.TSX)
-    },
-    CalendarRegion.China: {
-        CalendarMarket.IB: ql.China(ql.China.IB),
-        CalendarMarket.SSE: ql.China(ql.China.SSE),
-        CalendarMarket.Settlement: ql.China()
-    },
-    CalendarRegion.CzechRepublic: {
-        CalendarMarket.PSE: ql.CzechRepublic(ql.CzechRepublic.PSE),
-        CalendarMarket.Settlement: ql.CzechRepublic()
-    },
-    CalendarRegion.Denmark: {
-        CalendarMarket.Settlement: ql.Denmark()
-    },
-    CalendarRegion.Finland: {
-        CalendarMarket.Settlement: ql.Finland()
-    },
-    CalendarRegion.France: {
-        CalendarMarket.Exchange: ql.France(ql.France.Exchange),
-        CalendarMarket.Settlement: ql.France(ql.France.Settlement)
-    },
-    CalendarRegion.Germany: {
-        CalendarMarket.Eurex: ql.Germany(ql.Germany.Eurex),
-        CalendarMarket.FrankfurtStockExchange: ql.Germany(ql.Germany.FrankfurtStockExchange),
-        CalendarMarket.Settlement: ql.Germany(ql.Germany.Settlement),
-        CalendarMarket.Xetra: ql.Germany(ql.Germany.Xetra)
-    },
-    CalendarRegion.HongKong: {
-        CalendarMarket.HKEx: ql.HongKong(ql.HongKong.HKEx),
-        CalendarMarket.Settlement: ql.HongKong()
-    },
-    CalendarRegion.Hungary: {
-        CalendarMarket.Settlement: ql.Hungary()
-    },
-    CalendarRegion.Iceland: {
-        CalendarMarket.ICEX: ql.Iceland(ql.Iceland.ICEX),
-        CalendarMarket.Settlement: ql.Iceland()
-    },
-    CalendarRegion.India: {
-        CalendarMarket.NSE: ql.India(ql.India.NSE),
-        CalendarMarket.Settlement: ql.India()
-    },
-    CalendarRegion.Indonesia: {
-        CalendarMarket.BEJ: ql.Indonesia(ql.Indonesia.BEJ),
-        CalendarMarket.JSX: ql.Indonesia(ql.Indonesia.JSX),
-        CalendarMarket.Settlement: ql.Indonesia()
-    },
-    CalendarRegion.Israel: {
-        CalendarMarket.Settlement: ql.Israel(ql.Israel.Settlement),
-        CalendarMarket.TASE: ql.Israel(ql.Israel.TASE)
-    },
-    CalendarRegion.Italy: {
-        CalendarMarket.Exchange: ql.Italy(ql.Italy.Exchange),
-        CalendarMarket.Settlement: ql.Italy(ql.Italy.Settlement)
-    },
-    CalendarRegion.Japan: {
-        CalendarMarket.Settlement: ql.Japan()
-    },
-    CalendarRegion.Mexico: {
-        CalendarMarket.BMV: ql.Mexico(ql.Mexico.BMV),
-        CalendarMarket.Settlement: ql.Mexico()
-    },
-    CalendarRegion.NewZealand: {
-        CalendarMarket.Settlement: ql.NewZealand()
-    },
-    CalendarRegion.Norway: {
-        CalendarMarket.Settlement: ql.Norway()
-    },
-    CalendarRegion.NullCalendar: {
-        CalendarMarket.Settlement: ql.NullCalendar()
-    },
-    CalendarRegion.Poland: {
-        CalendarMarket.Settlement: ql.Poland()
-    },
-    CalendarRegion.Romania: {
-        CalendarMarket.Settlement: ql.Romania()
-    },
-    CalendarRegion.Russia: {
-        CalendarMarket.MOEX: ql.Russia(ql.Russia.MOEX),
-        CalendarMarket.Settlement: ql.Russia(ql.Russia.Settlement)
-    },
-    CalendarRegion.SaudiArabia: {
-        CalendarMarket.Tadawul: ql.SaudiArabia(ql.SaudiArabia.Tadawul),
-        CalendarMarket.Settlement: ql.SaudiArabia()
-    },
-    CalendarRegion.Singapore: {
-        CalendarMarket.SGX: ql.Singapore(ql.Singapore.SGX),
-        CalendarMarket.Settlement: ql.Singapore()
-    },
-    CalendarRegion.Slovakia: {
-        CalendarMarket.BSSE: ql.Slovakia(ql.Slovakia.BSSE),
-        CalendarMarket.Settlement: ql.Slovakia()
-    },
-    CalendarRegion.SouthAfrica: {
-        CalendarMarket.Settlement: ql.SouthAfrica()
-    },
-    CalendarRegion.SouthKorea: {
-        CalendarMarket.KRX: ql.SouthKorea(ql.SouthKorea.KRX),
-        CalendarMarket.Settlement: ql.SouthKorea(ql.SouthKorea.Settlement)
-    },
-    CalendarRegion.Sweden: {
-        CalendarMarket.Settlement: ql.Sweden()
-    },
-    CalendarRegion.Switzerland: {
-        CalendarMarket.Settlement: ql.Switzerland()
-    },
-    CalendarRegion.Taiwan: {
-        CalendarMarket.TSEC: ql.Taiwan(ql.Taiwan.TSEC),
-        CalendarMarket.Settlement: ql.Taiwan()
-    },
-    CalendarRegion.TARGET: {
-        CalendarMarket.Settlement: ql.TARGET()
-    },
-    CalendarRegion.Thailand: {
-        CalendarMarket.Settlement: ql.Thailand()
-    },
-    CalendarRegion.Turkey: {
-        CalendarMarket.Settlement: ql.Turkey()
-    },
-    CalendarRegion.Ukraine: {
-        CalendarMarket.USE: ql.Ukraine(ql.Ukraine.USE),
-        CalendarMarket.Settlement: ql.Ukraine()
-    },
-    CalendarRegion.UnitedKingdom: {
-        CalendarMarket.Exchange: ql.UnitedKingdom(ql.UnitedKingdom.Exchange),
-        CalendarMarket.Metals: ql.UnitedKingdom(ql.UnitedKingdom.Metals),
-        CalendarMarket.Settlement: ql.UnitedKingdom(ql.UnitedKingdom.Settlement)
-    },
-    CalendarRegion.UnitedStates: {
-        CalendarMarket.FederalReserve: ql.UnitedStates(ql.UnitedStates.FederalReserve),
-        CalendarMarket.GovernmentBond: ql.UnitedStates(ql.UnitedStates.GovernmentBond),
-        CalendarMarket.LiborImpact: ql.UnitedStates(ql.UnitedStates.LiborImpact),
-        CalendarMarket.NERC: ql.UnitedStates(ql.UnitedStates.NERC),
-        CalendarMarket.NYSE: ql.UnitedStates(ql.UnitedStates.NYSE),
-        CalendarMarket.Settlement: ql.UnitedStates(ql.UnitedStates.Settlement)
-    },
-    CalendarRegion.WeekendsOnly: {
-        CalendarMarket.Settlement: ql.WeekendsOnly()
-    }
+    CalendarRegion.Argentina: LazyMapping({
+        CalendarMarket.Merval: partial(ql.Argentina, ql.Argentina.Merval),
+        CalendarMarket.Settlement: ql.Argentina
+    }),
+    CalendarRegion.Australia: LazyMapping({
+        CalendarMarket.Settlement: ql.Australia
+    }),
+    CalendarRegion.BespokeCalendar: LazyMapping({
+        CalendarMarket.Settlement: partial(ql.BespokeCalendar, 'BespokeCalendar')
+    }),
+    CalendarRegion.Brazil: LazyMapping({
+        CalendarMarket.Exchange: partial(ql.Brazil, ql.Brazil.Exchange),
+        CalendarMarket.Settlement: partial(ql.Brazil, ql.Brazil.Settlement)
+    }),
+    CalendarRegion.Canada: LazyMapping({
+        CalendarMarket.Settlement: partial(ql.Canada, ql.Canada.Settlement),
+        CalendarMarket.TSX: partial(ql.Canada, ql.Canada.TSX)
+    }),
+    CalendarRegion.China: LazyMapping({
+        CalendarMarket.IB: partial(ql.China, ql.China.IB),
+        CalendarMarket.SSE: partial(ql.China, ql.China.SSE),
+        CalendarMarket.Settlement: ql.China
+    }),
+    CalendarRegion.CzechRepublic: LazyMapping({
+        CalendarMarket.PSE: partial(ql.CzechRepublic, ql.CzechRepublic.PSE),
+        CalendarMarket.Settlement: ql.CzechRepublic
+    }),
+    CalendarRegion.Denmark: LazyMapping({
+        CalendarMarket.Settlement: ql.Denmark
+    }),
+    CalendarRegion.Finland: LazyMapping({
+        CalendarMarket.Settlement: ql.Finland
+    }),
+    CalendarRegion.France: LazyMapping({
+        CalendarMarket.Exchange: partial(ql.France, ql.France.Exchange),
+        CalendarMarket.Settlement: partial(ql.France, ql.France.Settlement)
+    }),
+    CalendarRegion.Germany: LazyMapping({
+        CalendarMarket.Eurex: partial(ql.Germany, ql.Germany.Eurex),
+        CalendarMarket.FrankfurtStockExchange: partial(ql.Germany, ql.Germany.FrankfurtStockExchange),
+        CalendarMarket.Settlement: partial(ql.Germany, ql.Germany.Settlement),
+        CalendarMarket.Xetra: partial(ql.Germany, ql.Germany.Xetra)
+    }),
+    CalendarRegion.HongKong: LazyMapping({
+        CalendarMarket.HKEx: partial(ql.HongKong, ql.HongKong.HKEx),
+        CalendarMarket.Settlement: ql.HongKong
+    }),
+    CalendarRegion.Hungary: LazyMapping({
+        CalendarMarket.Settlement: ql.Hungary
+    }),
+    CalendarRegion.Iceland: LazyMapping({
+        CalendarMarket.ICEX: partial(ql.Iceland, ql.Iceland.ICEX),
+        CalendarMarket.Settlement: ql.Iceland
+    }),
+    CalendarRegion.India: LazyMapping({
+        CalendarMarket.NSE: partial(ql.India, ql.India.NSE),
+        CalendarMarket.Settlement: ql.India
+    }),
+    CalendarRegion.Indonesia: LazyMapping({
+        CalendarMarket.BEJ: partial(ql.Indonesia, ql.Indonesia.BEJ),
+        CalendarMarket.JSX: partial(ql.Indonesia, ql.Indonesia.JSX),
+        CalendarMarket.Settlement: ql.Indonesia
+    }),
+    CalendarRegion.Israel: LazyMapping({
+        CalendarMarket.Settlement: partial(ql.Israel, ql.Israel.Settlement),
+        CalendarMarket.TASE: partial(ql.Israel, ql.Israel.TASE)
+    }),
+    CalendarRegion.Italy: LazyMapping({
+        CalendarMarket.Exchange: partial(ql.Italy, ql.Italy.Exchange),
+        CalendarMarket.Settlement: partial(ql.Italy, ql.Italy.Settlement)
+    }),
+    CalendarRegion.Japan: LazyMapping({
+        CalendarMarket.Settlement: ql.Japan
+    }),
+    CalendarRegion.Mexico: LazyMapping({
+        CalendarMarket.BMV: partial(ql.Mexico, ql.Mexico.BMV),
+        CalendarMarket.Settlement: ql.Mexico
+    }),
+    CalendarRegion.NewZealand: LazyMapping({
+        CalendarMarket.Settlement: ql.NewZealand
+    }),
+    CalendarRegion.Norway: LazyMapping({
+        CalendarMarket.Settlement: ql.Norway
+    }),
+    CalendarRegion.NullCalendar: LazyMapping({
+        CalendarMarket.Settlement: ql.NullCalendar
+    }),
+    CalendarRegion.Poland: LazyMapping({
+        CalendarMarket.Settlement: ql.Poland
+    }),
+    CalendarRegion.Romania: LazyMapping({
+        CalendarMarket.Settlement: ql.Romania
+    }),
+    CalendarRegion.Russia: LazyMapping({
+        CalendarMarket.MOEX: partial(ql.Russia, ql.Russia.MOEX),
+        CalendarMarket.Settlement: partial(ql.Russia, ql.Russia.Settlement)
+    }),
+    CalendarRegion.SaudiArabia: LazyMapping({
+        CalendarMarket.Tadawul: partial(ql.SaudiArabia, ql.SaudiArabia.Tadawul),
+        CalendarMarket.Settlement: ql.SaudiArabia
+    }),
+    CalendarRegion.Singapore: LazyMapping({
+        CalendarMarket.SGX: partial(ql.Singapore, ql.Singapore.SGX),
+        CalendarMarket.Settlement: ql.Singapore
+    }),
+    CalendarRegion.Slovakia: LazyMapping({
+        CalendarMarket.BSSE: partial(ql.Slovakia, ql.Slovakia.BSSE),
+        CalendarMarket.Settlement: ql.Slovakia
+    }),
+    CalendarRegion.SouthAfrica: LazyMapping({
+        CalendarMarket.Settlement: ql.SouthAfrica
+    }),
+    CalendarRegion.SouthKorea: LazyMapping({
+        CalendarMarket.KRX: partial(ql.SouthKorea, ql.SouthKorea.KRX),
+        CalendarMarket.Settlement: partial(ql.SouthKorea, ql.SouthKorea.Settlement)
+    }),
+    CalendarRegion.Sweden: LazyMapping({
+        CalendarMarket.Settlement: ql.Sweden
+    }),
+    CalendarRegion.Switzerland: LazyMapping({
+        CalendarMarket.Settlement: ql.Switzerland
+    }),
+    CalendarRegion.Taiwan: LazyMapping({
+        CalendarMarket.TSEC: partial(ql.Taiwan, ql.Taiwan.TSEC),
+        CalendarMarket.Settlement: ql.Taiwan
+    }),
+    CalendarRegion.TARGET: LazyMapping({
+        CalendarMarket.Settlement: ql.TARGET
+    }),
+    CalendarRegion.Thailand: LazyMapping({
+        CalendarMarket.Settlement: ql.Thailand
+    }),
+    CalendarRegion.Turkey: LazyMapping({
+        CalendarMarket.Settlement: ql.Turkey
+    }),
+    CalendarRegion.Ukraine: LazyMapping({
+        CalendarMarket.USE: partial(ql.Ukraine, ql.Ukraine.USE),
+        CalendarMarket.Settlement: ql.Ukraine
+    }),
+    CalendarRegion.UnitedKingdom: LazyMapping({
+        CalendarMarket.Exchange: partial(ql.UnitedKingdom, ql.UnitedKingdom.Exchange),
+        CalendarMarket.Metals: partial(ql.UnitedKingdom, ql.UnitedKingdom.Metals),
+        CalendarMarket.Settlement: partial(ql.UnitedKingdom, ql.UnitedKingdom.Settlement)
+    }),
+    CalendarRegion.UnitedStates: LazyMapping({
+        CalendarMarket.FederalReserve: partial(ql.UnitedStates, ql.UnitedStates.FederalReserve),
+        CalendarMarket.GovernmentBond: partial(ql.UnitedStates, ql.UnitedStates.GovernmentBond),
+        CalendarMarket.LiborImpact: partial(ql.UnitedStates, ql.UnitedStates.LiborImpact),
+        CalendarMarket.NERC: partial(ql.UnitedStates, ql.UnitedStates.NERC),
+        CalendarMarket.NYSE: partial(ql.UnitedStates, ql.UnitedStates.NYSE),
+        CalendarMarket.Settlement: partial(ql.UnitedStates, ql.UnitedStates.Settlement)
+    }),
+    CalendarRegion.WeekendsOnly: LazyMapping({
+        CalendarMarket.Settlement: ql.WeekendsOnly
+    })
 }
@@ -1,6 +1,13 @@
 import enum
+from functools import partial
+from typing import Callable, Dict, Optional, Union
 
 import QuantLib as ql
+import numpy as np
+
+from exotx.data.static.business_day_index import get_business_day_index
+from exotx.helpers.dates import convert_dates_to_datetime64, convert_datetime64_to_ql_dates
+from exotx.helpers.lazy import LazyMapping
 
 
 # based on https://quantlib-python-docs.readthedocs.io/en/latest/dates.html#daycounter
@@ -17,13 +24,162 @@ class DayCounter(enum.Enum):
     Business252 = 7
 
 
-day_counters_to_ql = {
-    DayCounter.SimpleDayCounter: ql.SimpleDayCounter(),
-    DayCounter.Thirty360: ql.Thirty360(),
-    DayCounter.Actual360: ql.Actual360(),
-    DayCounter.Actual365Fixed: ql.Actual365Fixed(),
-    DayCounter.Actual365FixedCanadian: ql.Actual365Fixed(ql.Actual365Fixed.Canadian),
-    DayCounter.Actual365FixedNoLeap: ql.Actual365Fixed(ql.Actual365Fixed.NoLeap),
-    DayCounter.ActualActual: ql.ActualActual(),
-    DayCounter.Business252: ql.Business252()
+# the day counters are only built when first looked up
+day_counters_to_ql = LazyMapping({
+    DayCounter.SimpleDayCounter: ql.SimpleDayCounter,
+    DayCounter.Thirty360: ql.Thirty360,
+    DayCounter.Actual360: ql.Actual360,
+    DayCounter.Actual365Fixed: ql.Actual365Fixed,
+    DayCounter.Actual365FixedCanadian: partial(ql.Actual365Fixed, ql.Actual365Fixed.Canadian),
+    DayCounter.Actual365FixedNoLeap: partial(ql.Actual365Fixed, ql.Actual365Fixed.NoLeap),
+    DayCounter.ActualActual: ql.ActualActual,
+    DayCounter.Business252: ql.Business252
+})
+
+
+# region Vectorized year fractions
+def _date_parts(dates: np.ndarray):
+    months = dates.astype('datetime64[M]')
+    years = dates.astype('datetime64[Y]').astype(np.int64) + 1970
+    return years, months.astype(np.int64) % 12 + 1, (dates - months).astype(np.int64) + 1
+
+
+def _is_end_of_month(dates: np.ndarray) -> np.ndarray:
+    return (dates + 1).astype('datetime64[M]') != dates.astype('datetime64[M]')
+
+
+def _days_between(start_dates: np.ndarray, end_dates: np.ndarray) -> np.ndarray:
+    return (end_dates - start_dates).astype(np.int64)
+
+
+def _thirty_360_year_fractions(start_dates: np.ndarray, end_dates: np.ndarray, **kwargs) -> np.ndarray:
+    # bond basis
+    start_years, start_months, start_days = _date_parts(start_dates)
+    end_years, end_months, end_days = _date_parts(end_dates)
+    start_days = np.minimum(start_days, 30)
+    end_days = np.where((end_days == 31) & (start_days >= 30), 30, end_days)
+    return (360 * (end_years - start_years) + 30 * (end_months - start_months) + end_days - start_days) / 360.0
+
+
+def _simple_year_fractions(start_dates: np.ndarray, end_dates: np.ndarray, **kwargs) -> np.ndarray:
+    # whole months when the days of month match, 30/360 otherwise
+    start_years, start_months, start_days = _date_parts(start_dates)
+    end_years, end_months, end_days = _date_parts(end_dates)
+    is_whole_months = (start_days == end_days) | \
+        ((start_days > end_days) & _is_end_of_month(end_dates)) | \
+        ((start_days < end_days) & _is_end_of_month(start_dates))
+    return np.where(is_whole_months,
+                    (end_years - start_years) + (end_months - start_months) / 12.0,
+                    _thirty_360_year_fractions(start_dates, end_dates))
+
+
+def _actual_360_year_fractions(start_dates: np.ndarray, end_dates: np.ndarray, **kwargs) -> np.ndarray:
+    return _days_between(start_dates, end_dates) / 360.0
+
+
+def _actual_365_fixed_year_fractions(start_dates: np.ndarray, end_dates: np.ndarray, **kwargs) -> np.ndarray:
+    return _days_between(start_dates, end_dates) / 365.0
+
+
+def _actual_365_fixed_canadian_year_fractions(start_dates: np.ndarray, end_dates: np.ndarray,
+                                              **kwargs) -> np.ndarray:
+    # the Canadian convention depends on the coupon period, which is not available here
+    if np.any(start_dates != end_dates):
+        raise ValueError("The Actual365FixedCanadian day counter requires a reference period")
+    return np.zeros(start_dates.shape)
+
+
+def _actual_365_fixed_no_leap_year_fractions(start_dates: np.ndarray, end_dates: np.ndarray,
+                                             **kwargs) -> np.ndarray:
+    # 29th of February is counted as 28th of February
+    def no_leap_serial_numbers(dates: np.ndarray) -> np.ndarray:
+        years, months, days = _date_parts(dates)
+        month_offsets = np.array([0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334])
+        return 365 * years + month_offsets[months - 1] + days - ((months == 2) & (days == 29))
+
+    return (no_leap_serial_numbers(end_dates) - no_leap_serial_numbers(start_dates)) / 365.0
+
+
+def _actual_actual_year_fractions(start_dates: np.ndarray, end_dates: np.ndarray, **kwargs) -> np.ndarray:
+    # ISDA, the days of each calendar year are divided by the length of that year
+    sign = np.where(end_dates < start_dates, -1.0, 1.0)
+    first_dates = np.minimum(start_dates, end_dates)
+    last_dates = np.maximum(start_dates, end_dates)
+    first_years = first_dates.astype('datetime64[Y]')
+    last_years = last_dates.astype('datetime64[Y]')
+
+    def days_in_year(years: np.ndarray) -> np.ndarray:
+        return _days_between(years.astype('datetime64[D]'), (years + 1).astype('datetime64[D]'))
+
+    year_fractions = (last_years - first_years).astype(np.int64) - 1 + \
+        _days_between(first_dates, (first_years + 1).astype('datetime64[D]')) / days_in_year(first_years) + \
+        _days_between(last_years.astype('datetime64[D]'), last_dates) / days_in_year(last_years)
+    return np.where(first_dates == last_dates, 0.0, sign * year_fractions)
+
+
+def _business_252_year_fractions(start_dates: np.ndarray, end_dates: np.ndarray,
+                                 calendar: Optional[ql.Calendar] = None) -> np.ndarray:
+    business_day_index = get_business_day_index(calendar if calendar is not None else ql.Brazil())
+    return business_day_index.business_days_between(start_dates, end_dates) / 252.0
+
+
+day_counters_to_year_fractions: Dict[DayCounter, Callable[..., np.ndarray]] = {
+    DayCounter.SimpleDayCounter: _simple_year_fractions,
+    DayCounter.Thirty360: _thirty_360_year_fractions,
+    DayCounter.Actual360: _actual_360_year_fractions,
+    DayCounter.Actual365Fixed: _actual_365_fixed_year_fractions,
+    DayCounter.Actual365FixedCanadian: _actual_365_fixed_canadian_year_fractions,
+    DayCounter.Actual365FixedNoLeap: _actual_365_fixed_no_leap_year_fractions,
+    DayCounter.ActualActual: _actual_actual_year_fractions,
+    DayCounter.Business252: _business_252_year_fractions
+}
+
+# names of the QuantLib day counters built by day_counters_to_ql, Business252 being named after its calendar
+ql_day_counter_names = {
+    'Simple': DayCounter.SimpleDayCounter,
+    '30/360 (Bond Basis)': DayCounter.Thirty360,
+    'Actual/360': DayCounter.Actual360,
+    'Actual/365 (Fixed)': DayCounter.Actual365Fixed,
+    'Actual/365 (Fixed) Canadian Bond': DayCounter.Actual365FixedCanadian,
+    'Actual/365 (No Leap)': DayCounter.Actual365FixedNoLeap,
+    'Actual/Actual (ISDA)': DayCounter.ActualActual
 }
+
+
+def year_fractions(day_counter: Union[DayCounter, ql.DayCounter],
+                   start_dates,
+                   end_dates,
+                   calendar: Optional[ql.Calendar] = None) -> np.ndarray:
+    """
+    Calculates the year fractions between arrays of dates with array operations, as ql.DayCounter.yearFraction
+    without reference periods.
+
+    QuantLib day counters are matched to their vectorized implementation by name. QuantLib day counters without a
+    vectorized implementation, such as Business252 with a calendar other than the given one, fall back to QuantLib.
+
+    :param day_counter: The day counter.
+    :type day_counter: Union[DayCounter, ql.DayCounter]
+    :param start_dates: The start dates, as QuantLib dates or NumPy datetime64 values.
+    :param end_dates: The end dates, broadcast against the start dates.
+    :param calendar: The calendar of the Business252 day counter, defaults to the Brazilian calendar.
+    :type calendar: ql.Calendar, optional
+    :return: The year fractions.
+    :rtype: np.ndarray
+    """
+    start_dates, end_dates = np.broadcast_arrays(convert_dates_to_datetime64(start_dates),
+                                                 convert_dates_to_datetime64(end_dates))
+    if isinstance(day_counter, ql.DayCounter):
+        name = day_counter.name()
+        business_252_calendar = calendar if calendar is not None else ql.Brazil()
+        if name == f"Business/252({business_252_calendar.name()})":
+            return _business_252_year_fractions(start_dates, end_dates, business_252_calendar)
+        if name not in ql_day_counter_names:
+            ql_start_dates = convert_datetime64_to_ql_dates(start_dates)
+            ql_end_dates = convert_datetime64_to_ql_dates(end_dates)
+            return np.array([day_counter.yearFraction(start_date, end_date)
+                             for start_date, end_date in zip(ql_start_dates, ql_end_dates)]).reshape(
+                start_dates.shape)
+        day_counter = ql_day_counter_names[name]
+    return day_counters_to_year_fractions[day_counter](start_dates, end_dates, calendar=calendar)
+
+# endregion
@@ -4,6 +4,7 @@ from typing import Union
 import QuantLib as ql
 from marshmallow import Schema, fields, post_load, ValidationError
 
+from exotx.data.static.business_day_index import BusinessDayIndex, get_business_day_index
 from exotx.data.static.calendar import Calendar, CalendarSchema
 from exotx.data.static.calendars import calendars_to_ql_calendars
 from exotx.data.static.conventions import business_day_conventions_to_ql, BusinessDayConvention
@@ -24,6 +25,10 @@ class StaticData:
         # calendar
         self._set_calendar(calendar)
 
+    def __reduce__(self) -> tuple:
+        # pickled as the names of the conventions
+        return type(self), (self.day_counter.name, self.business_day_convention.name, self.calendar)
+
     # region Day counter
     @staticmethod
     def get_default_day_counter() -> DayCounter:
@@ -67,6 +72,15 @@ class StaticData:
         else:
             return self.get_ql_default_calendar()
 
+    def get_business_day_index(self) -> BusinessDayIndex:
+        """
+        Gets the precomputed business day index of the calendar, for vectorized date computations.
+
+        :return: The business day index of the calendar.
+        :rtype: BusinessDayIndex
+        """
+        return get_business_day_index(self.get_ql_calendar())
+
     def _set_calendar(self, value: Union[Calendar, dict, None]) -> None:
         if isinstance(value, Calendar):
             self.calendar = value
@@ -152,7 +166,7 @@ class BusinessDayConventionField(fields.Field):
 
 class DayCounterField(fields.Field):
     def _serialize(self, value: DayCounter, attr, obj, **kwargs) -> str:
-        return value.name
+        return None if value is None else value.name
 
     def _deserialize(self, value: str, attr, data, **kwargs) -> DayCounter:
         try:
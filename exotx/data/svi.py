@@ -0,0 +1,164 @@
+from functools import lru_cache
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from scipy.optimize import least_squares
+
+from exotx.data.volsurface import VolSurface
+
+# bounds of the raw SVI parameters, keeping the smiles away from the degenerate shapes
+_maximum_absolute_rho = 0.999
+_minimum_sigma = 1e-4
+_maximum_sigma = 10.0
+# number of calibrated SVI surfaces kept in memory, by content hash of the volatility surface
+svi_cache_size = 32
+
+
+def svi_total_variances(parameters: np.ndarray, log_strikes: np.ndarray) -> np.ndarray:
+    """
+    Evaluates raw SVI total variances w(k) = a + b * (rho * (k - m) + sqrt((k - m)^2 + sigma^2)).
+
+    :param parameters: The raw SVI parameters (a, b, rho, m, sigma) in the last dimension, broadcast against the
+                       log-strikes.
+    :type parameters: np.ndarray
+    :param log_strikes: The log-strikes.
+    :type log_strikes: np.ndarray
+    :return: The total variances.
+    :rtype: np.ndarray
+    """
+    a, b, rho, m, sigma = np.moveaxis(np.asarray(parameters, dtype=float), -1, 0)
+    shifted = log_strikes - m
+    return a + b * (rho * shifted + np.sqrt(shifted ** 2 + sigma ** 2))
+
+
+def _calibrate_smile(log_strikes: np.ndarray, total_variances: np.ndarray,
+                     initial_guess: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    # returns the solution of the least squares problem and the raw SVI parameters, the problem being
+    # parametrized with the minimum total variance v = a + b * sigma * sqrt(1 - rho^2) instead of a, so that the
+    # positivity of the total variances is a bound on v
+    def to_raw(x: np.ndarray) -> np.ndarray:
+        v, b, rho, m, sigma = x
+        return np.array([v - b * sigma * np.sqrt(1.0 - rho ** 2), b, rho, m, sigma])
+
+    def residuals(x: np.ndarray) -> np.ndarray:
+        return svi_total_variances(to_raw(x), log_strikes) - total_variances
+
+    def jacobian(x: np.ndarray) -> np.ndarray:
+        v, b, rho, m, sigma = x
+        shifted = log_strikes - m
+        root = np.sqrt(shifted ** 2 + sigma ** 2)
+        rho_complement = np.sqrt(1.0 - rho ** 2)
+        return np.column_stack((np.ones(shifted.shape),
+                                rho * shifted + root - sigma * rho_complement,
+                                b * (shifted + sigma * rho / rho_complement),
+                                -b * (rho + shifted / root),
+                                b * (sigma / root - rho_complement)))
+
+    width = max(log_strikes[-1] - log_strikes[0], 1e-2)
+    if initial_guess is None:
+        slope = (total_variances[-1] - total_variances[0]) / width
+        initial_guess = np.array([np.min(total_variances), abs(slope) + 2e-3,
+                                  np.clip(slope / (abs(slope) + 1e-3), -0.5, 0.5),
+                                  log_strikes[np.argmin(total_variances)], 0.1 * width])
+    lower_bounds = [0.0, 0.0, -_maximum_absolute_rho, log_strikes[0] - width, _minimum_sigma]
+    upper_bounds = [np.inf, np.inf, _maximum_absolute_rho, log_strikes[-1] + width, _maximum_sigma]
+    initial_guess = np.clip(initial_guess, lower_bounds, upper_bounds)
+    result = least_squares(residuals, initial_guess, jac=jacobian, bounds=(lower_bounds, upper_bounds),
+                           x_scale='jac', ftol=1e-12, xtol=1e-12)
+    return result.x, to_raw(result.x)
+
+
+class SviSurface:
+    """
+    A volatility surface parametrized with one raw SVI smile per expiration date.
+
+    Each smile is calibrated in least squares to the total variances quoted at the expiration date, as a function of
+    the log-strike. Since the SVI family is invariant under a translation of the log-strike, fitting in log-strike is
+    equivalent to fitting in log-moneyness and does not require the forwards. The total variances are given in closed
+    form at the expiration dates, interpolated linearly in time at constant strike in between, and extrapolated
+    proportionally to time before the first and after the last expiration dates, as in VolSurface.
+
+    Attributes:
+        vol_surface (VolSurface): The calibrated volatility surface.
+        times (np.ndarray): The times of the expiration dates.
+        parameters (np.ndarray): The raw SVI parameters (a, b, rho, m, sigma), with one row per expiration date.
+        fit_errors (np.ndarray): The root mean square errors in volatility of the smiles.
+    """
+
+    def __init__(self, vol_surface: VolSurface) -> None:
+        self.vol_surface = vol_surface
+        self.times = vol_surface.times
+        log_strikes = np.log(vol_surface.strikes)
+        total_variances = self.times[:, None] * vol_surface.volatilities ** 2
+        # each smile is calibrated from the solution of the previous expiration date, which is usually close
+        parameters, solution = [], None
+        for smile in total_variances:
+            solution, raw_parameters = _calibrate_smile(log_strikes, smile, solution)
+            parameters.append(raw_parameters)
+        self.parameters = np.array(parameters)
+        fitted_volatilities = np.sqrt(np.maximum(svi_total_variances(self.parameters[:, None, :], log_strikes), 0.0)
+                                      / self.times[:, None])
+        self.fit_errors = np.sqrt(np.mean((fitted_volatilities - vol_surface.volatilities) ** 2, axis=1))
+        for array in (self.parameters, self.fit_errors):
+            array.setflags(write=False)
+
+    def get_total_variances(self, times: Union[float, np.ndarray], strikes: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Computes the total Black variances of the SVI surface.
+
+        :param times: The times, broadcast against the strikes.
+        :type times: Union[float, np.ndarray]
+        :param strikes: The strikes.
+        :type strikes: Union[float, np.ndarray]
+        :return: The total Black variances.
+        :rtype: np.ndarray
+        """
+        times, strikes = np.broadcast_arrays(np.asarray(times, dtype=float), np.asarray(strikes, dtype=float))
+        if np.any(times < 0):
+            raise ValueError("Negative times are not allowed")
+        log_strikes = np.log(strikes)
+        last = self.times.shape[0] - 1
+        upper = np.clip(np.searchsorted(self.times, times, side='left'), 0, last)
+        lower = np.maximum(upper - 1, 0)
+        upper_variances = np.maximum(svi_total_variances(self.parameters[upper], log_strikes), 0.0)
+        lower_variances = np.maximum(svi_total_variances(self.parameters[lower], log_strikes), 0.0)
+        time_steps = self.times[upper] - self.times[lower]
+        upper_weights = np.divide(times - self.times[lower], time_steps, out=np.ones(times.shape),
+                                  where=time_steps > 0)
+        interpolated = lower_variances + np.clip(upper_weights, 0.0, 1.0) * (upper_variances - lower_variances)
+        # proportional to time before the first and after the last expiration dates
+        return np.where(times < self.times[0], upper_variances * times / self.times[0],
+                        np.where(times > self.times[-1], upper_variances * times / self.times[-1], interpolated))
+
+    def get_black_volatilities(self, times: Union[float, np.ndarray],
+                               strikes: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Computes the Black volatilities of the SVI surface.
+
+        :param times: The times, broadcast against the strikes.
+        :type times: Union[float, np.ndarray]
+        :param strikes: The strikes.
+        :type strikes: Union[float, np.ndarray]
+        :return: The Black volatilities.
+        :rtype: np.ndarray
+        """
+        times, strikes = np.broadcast_arrays(np.asarray(times, dtype=float), np.asarray(strikes, dtype=float))
+        # the volatility at time zero is the limit of the volatility before the first expiration date
+        times = np.where(times == 0.0, self.times[0], times)
+        return np.sqrt(self.get_total_variances(times, strikes) / times)
+
+
+@lru_cache(maxsize=svi_cache_size)
+def get_svi_surface(vol_surface: VolSurface) -> SviSurface:
+    """
+    Calibrates the SVI surface of a volatility surface, once per content of the volatility surface.
+
+    Volatility surfaces are hashed and compared by their content hash, so that equal surfaces built independently
+    share the same calibration.
+
+    :param vol_surface: The volatility surface.
+    :type vol_surface: VolSurface
+    :return: The calibrated SVI surface.
+    :rtype: SviSurface
+    """
+    return SviSurface(vol_surface)
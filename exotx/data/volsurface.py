@@ -0,0 +1,213 @@
+import hashlib
+from datetime import datetime
+from typing import Dict, List, Union
+
+import QuantLib as ql
+import numpy as np
+
+from exotx.data.static.daycounters import DayCounter, day_counters_to_ql, year_fractions
+from exotx.enums.enums import VolatilityInterpolation
+from exotx.helpers.dates import convert_dates_to_datetime64, convert_datetime64_to_ql_dates
+from exotx.helpers.interpolation import bilinear_interpolation
+
+# maturity used for the volatility at time zero, as in QuantLib
+_zero_time_substitute = 1e-5
+
+
+class VolSurface:
+    """
+    An immutable Black volatility surface backed by NumPy arrays.
+
+    The surface is defined by Black volatilities quoted on a grid of expiration dates and strikes. Volatilities are
+    interpolated with array operations for any times and strikes, either bilinearly in volatility or bilinearly in
+    total variance as ql.BlackVarianceSurface does, with flat extrapolation in strike in both cases. The QuantLib view
+    of the surface is built once per calendar.
+
+    The content hash identifies the surface by its data, so that it can be used as a cache key by calibrations and
+    pricers.
+
+    Attributes:
+        reference_date (np.datetime64): The reference date of the surface.
+        expiration_dates (np.ndarray): The expiration dates, in increasing order.
+        strikes (np.ndarray): The strikes, in increasing order.
+        volatilities (np.ndarray): The Black volatilities, with one row per expiration date and one column per strike.
+        day_counter (DayCounter): The day counter converting dates to times.
+        times (np.ndarray): The times of the expiration dates from the reference date.
+        content_hash (str): The SHA-256 hash of the content of the surface.
+    """
+
+    def __init__(self,
+                 reference_date: Union[datetime, str, np.datetime64, ql.Date],
+                 expiration_dates: List[Union[datetime, str, np.datetime64, ql.Date]],
+                 strikes: List[float],
+                 volatilities: List[List[float]],
+                 day_counter: DayCounter = DayCounter.Actual365Fixed) -> None:
+        self._reference_date = convert_dates_to_datetime64(reference_date)
+        self._expiration_dates = convert_dates_to_datetime64(expiration_dates)
+        self._strikes = np.array(strikes, dtype=float)
+        self._volatilities = np.array(volatilities, dtype=float)
+        self._day_counter = day_counter
+        assert self._expiration_dates.ndim == 1 and self._expiration_dates.shape[0] > 0, "No expiration dates!"
+        assert self._strikes.ndim == 1 and self._strikes.shape[0] > 0, "No strikes!"
+        assert self._volatilities.shape == (self._expiration_dates.shape[0], self._strikes.shape[0]), \
+            f"Invalid volatilities shape {self._volatilities.shape}, expected " \
+            f"{(self._expiration_dates.shape[0], self._strikes.shape[0])}"
+        assert np.all(self._volatilities >= 0), "Invalid negative volatility"
+        assert np.all(np.diff(self._strikes) > 0), "Strikes must be increasing"
+
+        self._times = year_fractions(day_counter, self._reference_date, self._expiration_dates)
+        if self._times[0] <= 0 or np.any(np.diff(self._times) <= 0):
+            raise ValueError("Expiration dates must be increasing and after the reference date")
+
+        # total variances, starting from zero at the reference date
+        self._variance_times = np.concatenate(([0.0], self._times))
+        self._variances = np.vstack((np.zeros(self._strikes.shape[0]),
+                                     self._times[:, None] * self._volatilities ** 2))
+        for array in (self._expiration_dates, self._strikes, self._volatilities, self._times,
+                      self._variance_times, self._variances):
+            array.setflags(write=False)
+
+        self._content_hash = self._compute_content_hash()
+        self._ql_surfaces: Dict[str, ql.BlackVarianceSurface] = {}
+
+    # region getters
+    @property
+    def reference_date(self) -> np.datetime64:
+        return self._reference_date
+
+    @property
+    def expiration_dates(self) -> np.ndarray:
+        return self._expiration_dates
+
+    @property
+    def strikes(self) -> np.ndarray:
+        return self._strikes
+
+    @property
+    def volatilities(self) -> np.ndarray:
+        return self._volatilities
+
+    @property
+    def day_counter(self) -> DayCounter:
+        return self._day_counter
+
+    @property
+    def times(self) -> np.ndarray:
+        return self._times
+
+    @property
+    def content_hash(self) -> str:
+        return self._content_hash
+
+    # endregion
+
+    def __reduce__(self) -> tuple:
+        # pickled as constructor arguments, the QuantLib views of the surface being rebuilt on first use when unpickled
+        return type(self), (str(self._reference_date), self._expiration_dates, self._strikes, self._volatilities,
+                            self._day_counter)
+
+    def _compute_content_hash(self) -> str:
+        content = hashlib.sha256()
+        content.update(str(self._reference_date).encode())
+        content.update(self._day_counter.name.encode())
+        for array in (self._expiration_dates.astype(np.int64), self._strikes, self._volatilities):
+            content.update(str(array.shape).encode())
+            content.update(np.ascontiguousarray(array).tobytes())
+        return content.hexdigest()
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, VolSurface) and self._content_hash == other._content_hash
+
+    def __hash__(self) -> int:
+        return hash(self._content_hash)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(reference_date={self._reference_date}, " \
+               f"expirations={self._expiration_dates.shape[0]}, strikes={self._strikes.shape[0]}, " \
+               f"content_hash={self._content_hash[:12]})"
+
+    def get_times(self, dates) -> np.ndarray:
+        """
+        Converts dates to times from the reference date of the surface, with the day counter of the surface.
+
+        :param dates: The dates, as QuantLib dates or NumPy datetime64 values.
+        :return: The times.
+        :rtype: np.ndarray
+        """
+        return year_fractions(self._day_counter, self._reference_date, dates)
+
+    def get_black_variances(self, times: Union[float, np.ndarray], strikes: Union[float, np.ndarray],
+                            interpolation: VolatilityInterpolation = VolatilityInterpolation.TOTAL_VARIANCE
+                            ) -> np.ndarray:
+        """
+        Interpolates the total Black variances of the surface.
+
+        :param times: The times, broadcast against the strikes.
+        :type times: Union[float, np.ndarray]
+        :param strikes: The strikes.
+        :type strikes: Union[float, np.ndarray]
+        :param interpolation: The interpolation method, defaults to the bilinear interpolation of total variances.
+        :type interpolation: VolatilityInterpolation, optional
+        :return: The total Black variances.
+        :rtype: np.ndarray
+        """
+        times, strikes = np.broadcast_arrays(np.asarray(times, dtype=float), np.asarray(strikes, dtype=float))
+        return self.get_black_volatilities(times, strikes, interpolation) ** 2 * times
+
+    def get_black_volatilities(self, times: Union[float, np.ndarray], strikes: Union[float, np.ndarray],
+                               interpolation: VolatilityInterpolation = VolatilityInterpolation.TOTAL_VARIANCE
+                               ) -> np.ndarray:
+        """
+        Interpolates the Black volatilities of the surface.
+
+        With the total variance interpolation, the total variances are interpolated bilinearly in time and strike and
+        extrapolated proportionally to time after the last expiration date, as ql.BlackVarianceSurface. With the
+        bilinear interpolation, the volatilities are interpolated bilinearly and extrapolated flat in time. Both
+        extrapolate flat in strike.
+
+        :param times: The times, broadcast against the strikes.
+        :type times: Union[float, np.ndarray]
+        :param strikes: The strikes.
+        :type strikes: Union[float, np.ndarray]
+        :param interpolation: The interpolation method, defaults to the bilinear interpolation of total variances.
+        :type interpolation: VolatilityInterpolation, optional
+        :return: The Black volatilities.
+        :rtype: np.ndarray
+        """
+        times, strikes = np.broadcast_arrays(np.asarray(times, dtype=float), np.asarray(strikes, dtype=float))
+        if np.any(times < 0):
+            raise ValueError("Negative times are not allowed")
+        if interpolation == VolatilityInterpolation.BILINEAR:
+            return bilinear_interpolation(self._times, self._strikes, self._volatilities, times, strikes)
+        elif interpolation == VolatilityInterpolation.TOTAL_VARIANCE:
+            times = np.where(times == 0.0, _zero_time_substitute, times)
+            last_time = self._times[-1]
+            variances = bilinear_interpolation(self._variance_times, self._strikes, self._variances,
+                                                np.minimum(times, last_time), strikes)
+            variances = np.where(times > last_time, variances * times / last_time, variances)
+            return np.sqrt(variances / times)
+        else:
+            raise ValueError(f"Invalid volatility interpolation \'{interpolation}\'")
+
+    def get_ql_black_variance_surface(self, calendar: ql.Calendar) -> ql.BlackVarianceSurface:
+        """
+        Gets the QuantLib view of the surface, built once per calendar, with flat extrapolation in strike.
+
+        :param calendar: The calendar of the surface.
+        :type calendar: ql.Calendar
+        :return: The QuantLib Black variance surface.
+        :rtype: ql.BlackVarianceSurface
+        """
+        key = calendar.name()
+        if key not in self._ql_surfaces:
+            reference_date, *expiration_dates = convert_datetime64_to_ql_dates(
+                np.concatenate(([self._reference_date], self._expiration_dates)))
+            # QuantLib expects one row per strike and one column per expiration date
+            volatility_matrix = ql.Matrix(self._volatilities.T.tolist())
+            surface = ql.BlackVarianceSurface(reference_date, calendar, expiration_dates, self._strikes.tolist(),
+                                              volatility_matrix, day_counters_to_ql[self._day_counter],
+                                              ql.BlackVarianceSurface.ConstantExtrapolation,
+                                              ql.BlackVarianceSurface.ConstantExtrapolation)
+            surface.enableExtrapolation()
+            self._ql_surfaces[key] = surface
+        return self._ql_surfaces[key]
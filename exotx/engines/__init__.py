@@ -0,0 +1,19 @@
+"""Modules for working with pricing engines implemented on top of NumPy.
+
+These engines complement the QuantLib ones when batch pricing or finer numerical control is required."""
+
+from exotx.engines.analytic_barrier_engine import analytic_barrier_prices
+from exotx.engines.analytic_european_engine import analytic_european_prices
+from exotx.engines.fd_autocallable_engine import FdBlackScholesAutocallableEngine
+from exotx.engines.fd_barrier_engine import fd_barrier_prices
+from exotx.engines.fd_heston_autocallable_engine import FdHestonAutocallableEngine
+from exotx.engines.mc_asian_engine import MCDiscreteArithmeticAsianEngine
+
+__all__ = [
+    'analytic_barrier_prices',
+    'analytic_european_prices',
+    'fd_barrier_prices',
+    'FdBlackScholesAutocallableEngine',
+    'FdHestonAutocallableEngine',
+    'MCDiscreteArithmeticAsianEngine'
+]
@@ -0,0 +1,60 @@
+from typing import Union
+
+import QuantLib as ql
+import numpy as np
+from scipy.special import ndtr
+
+ArrayLike = Union[float, int, np.ndarray]
+
+
+def analytic_european_prices(option_types: ArrayLike,
+                             spot: ArrayLike,
+                             strikes: ArrayLike,
+                             times: ArrayLike,
+                             risk_free_rates: ArrayLike,
+                             dividend_yields: ArrayLike,
+                             volatilities: ArrayLike) -> np.ndarray:
+    """
+    Calculates the prices of European vanilla options with the Black-Scholes-Merton formula.
+
+    This is a vectorized counterpart of ql.AnalyticEuropeanEngine: all inputs are broadcast against each other, so that
+    a whole book of vanilla options on the same underlying is priced in a single call.
+
+    :param option_types: The QuantLib option types (ql.Option.Call or ql.Option.Put).
+    :type option_types: ArrayLike
+    :param spot: The spot of the underlying.
+    :type spot: ArrayLike
+    :param strikes: The strikes of the options.
+    :type strikes: ArrayLike
+    :param times: The times to maturity.
+    :type times: ArrayLike
+    :param risk_free_rates: The continuously compounded risk-free zero rates to maturity.
+    :type risk_free_rates: ArrayLike
+    :param dividend_yields: The continuously compounded dividend zero rates to maturity.
+    :type dividend_yields: ArrayLike
+    :param volatilities: The Black-Scholes volatilities.
+    :type volatilities: ArrayLike
+    :return: The prices of the vanilla options.
+    :rtype: np.ndarray
+
+    Example usage:
+
+    >>> analytic_european_prices([ql.Option.Call, ql.Option.Put], 100.0, 100.0, 1.0, 0.05, 0.0, 0.2)
+    array([10.45058357,  5.57352602])
+    """
+    option_types, spot, strikes, times, risk_free_rates, dividend_yields, volatilities = np.broadcast_arrays(
+        *[np.asarray(x) for x in (option_types, spot, strikes, times, risk_free_rates, dividend_yields,
+                                  volatilities)])
+    phi = np.where(option_types == ql.Option.Call, 1.0, -1.0)
+    risk_free_discount = np.exp(-risk_free_rates * times)
+    forwards = spot * np.exp(-dividend_yields * times) / risk_free_discount
+    std_deviation = volatilities * np.sqrt(times)
+    intrinsic = np.maximum(phi * (forwards - strikes), 0.0)
+    # at expiry or without volatility, the options are worth their discounted forward intrinsic value
+    has_time_value = std_deviation > 0
+    safe_std_deviation = np.where(has_time_value, std_deviation, 1.0)
+    with np.errstate(divide='ignore'):
+        d1 = np.log(forwards / strikes) / safe_std_deviation + 0.5 * safe_std_deviation
+    d2 = d1 - safe_std_deviation
+    prices = phi * (forwards * ndtr(phi * d1) - strikes * ndtr(phi * d2))
+    return risk_free_discount * np.where(has_time_value, prices, intrinsic)
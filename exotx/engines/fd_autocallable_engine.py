@@ -0,0 +1,172 @@
+from typing import Callable, Optional
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+from exotx.engines.finite_differences import black_scholes_operator, theta_step
+
+
+def _smoothed_indicator(spots: np.ndarray, level: float, log_spot_step: float) -> np.ndarray:
+    # average of the indicator over the cells of the log-spot grid, which restores the convergence order of the scheme
+    # when a barrier falls on or near a grid point
+    if log_spot_step <= 0.0:
+        return (spots >= level).astype(float)
+    return np.clip(np.log(spots / level) / log_spot_step + 0.5, 0.0, 1.0)
+
+
+def apply_autocallable_observation(values: np.ndarray,
+                                   spots: np.ndarray,
+                                   autocallable,
+                                   accrual_fraction: float,
+                                   is_last: bool,
+                                   log_spot_step: float = 0.0) -> np.ndarray:
+    """
+    Applies the cash flows and the state transitions of an autocallable observation date to a grid of values.
+
+    The last axis of the values indexes the number of consecutive unpaid coupons before the observation, which is
+    the only path-dependent state of the product: a coupon paid at the observation date also pays the unpaid coupons
+    when the product has memory. The first axis of the values must match the spots, any axis in between is carried
+    through (e.g. the variance axis of a stochastic volatility grid).
+
+    :param values: The values right after the observation date, for each number of unpaid coupons.
+    :type values: np.ndarray
+    :param spots: The underlying spots, broadcastable against the values without their last axis.
+    :type spots: np.ndarray
+    :param autocallable: The autocallable instrument, providing the notional, strike, barrier levels and coupon.
+    :type autocallable: Autocallable
+    :param accrual_fraction: The accrual fraction of the coupon paid at the observation date.
+    :type accrual_fraction: float
+    :param is_last: Whether the observation date is the expiration date.
+    :type is_last: bool
+    :param log_spot_step: The step of a uniform log-spot grid, over which the barrier indicators are averaged,
+                          defaults to 0 (no averaging).
+    :type log_spot_step: float, optional
+    :return: The values right before the observation date, for each number of unpaid coupons.
+    :rtype: np.ndarray
+    """
+    number_of_states = values.shape[-1]
+    index = (spots / autocallable.strike)[..., None]
+    unpaid_coupons = np.arange(number_of_states)
+    coupons = autocallable.notional * autocallable.annual_coupon_value * accrual_fraction * (
+        1 + unpaid_coupons * int(autocallable.has_memory))
+    notional = autocallable.notional
+    # fractions of each cell in the disjoint regions delimited by the barriers
+    above_coupon_barrier = _smoothed_indicator(index, autocallable.coupon_barrier_level, log_spot_step)
+    if is_last:
+        # redemption plus coupons above the coupon barrier, capital protected down to the protection barrier
+        above_protection_barrier = _smoothed_indicator(index, autocallable.protection_barrier_level, log_spot_step)
+        with_coupon = np.minimum(above_coupon_barrier, above_protection_barrier)
+        payoff = with_coupon * (notional + coupons) + (above_protection_barrier - with_coupon) * notional + \
+            (1.0 - above_protection_barrier) * notional * index
+        return np.broadcast_to(payoff, values.shape).copy()
+
+    # below the coupon barrier, the coupon is added to the unpaid ones
+    called = _smoothed_indicator(index, autocallable.autocall_barrier_level, log_spot_step)
+    with_coupon = np.maximum(above_coupon_barrier - called, 0.0)
+    missed_coupon_values = values[..., np.minimum(unpaid_coupons + 1, number_of_states - 1)]
+    paid_coupon_values = coupons + values[..., :1]
+    return called * (notional + coupons) + with_coupon * paid_coupon_values + \
+        (1.0 - called - with_coupon) * missed_coupon_values
+
+
+class FdBlackScholesAutocallableEngine:
+    """
+    Finite-difference engine for single-underlying autocallables under Black-Scholes or local volatility dynamics.
+
+    The Black-Scholes equation is solved backwards in log-spot with Crank-Nicolson time stepping. At each observation
+    date the autocall, coupon and protection barrier conditions are applied, followed by fully implicit damping steps
+    to smooth out the discontinuities they introduce. The barrier indicators are averaged over the grid cells. The
+    number of consecutive unpaid coupons, needed by memory coupons, is carried as additional columns of the same
+    linear systems.
+
+    Attributes:
+        spot (float): The spot of the underlying.
+        volatility (float): The Black-Scholes volatility, also used to size the grid with local volatility.
+        local_volatility (Callable[[float, np.ndarray], np.ndarray]): An optional local volatility function of the
+            time and the spots, used instead of the Black-Scholes volatility.
+        time_steps (int): The total number of time steps.
+        space_steps (int): The number of log-spot steps.
+        damping_steps (int): The number of fully implicit steps taken after each observation date.
+        number_of_std_deviations (float): The half-width of the grid, in standard deviations.
+    """
+
+    def __init__(self,
+                 spot: float,
+                 volatility: float,
+                 local_volatility: Optional[Callable[[float, np.ndarray], np.ndarray]] = None,
+                 time_steps: int = 200,
+                 space_steps: int = 400,
+                 damping_steps: int = 2,
+                 number_of_std_deviations: float = 5.0) -> None:
+        self.spot = spot
+        self.volatility = volatility
+        self.local_volatility = local_volatility
+        self.time_steps = time_steps
+        self.space_steps = space_steps
+        self.damping_steps = damping_steps
+        self.number_of_std_deviations = number_of_std_deviations
+
+    def calculate(self,
+                  autocallable,
+                  observation_times: np.ndarray,
+                  accrual_fractions: np.ndarray,
+                  risk_free_discounts: np.ndarray,
+                  dividend_discounts: np.ndarray) -> dict:
+        """
+        Calculates the price, delta and gamma of the autocallable.
+
+        :param autocallable: The autocallable instrument.
+        :type autocallable: Autocallable
+        :param observation_times: The times of the remaining observation dates.
+        :type observation_times: np.ndarray
+        :param accrual_fractions: The accrual fractions of the coupons paid at the observation dates.
+        :type accrual_fractions: np.ndarray
+        :param risk_free_discounts: The risk-free discount factors at the observation dates.
+        :type risk_free_discounts: np.ndarray
+        :param dividend_discounts: The dividend discount factors at the observation dates.
+        :type dividend_discounts: np.ndarray
+        :return: A dictionary containing the price, delta and gamma.
+        :rtype: dict
+        """
+        observation_times = np.asarray(observation_times, dtype=float)
+        maturity = observation_times[-1]
+        number_of_states = observation_times.shape[0] if autocallable.has_memory else 1
+
+        # uniform log-spot grid with the spot on a node
+        half_width = self.number_of_std_deviations * self.volatility * np.sqrt(maturity)
+        dx = 2.0 * half_width / self.space_steps
+        x = np.log(self.spot) + dx * np.arange(-(self.space_steps // 2), self.space_steps - self.space_steps // 2 + 1)
+        spots = np.exp(x)
+
+        # piecewise constant forward rates between observation dates
+        times = np.concatenate(([0.0], observation_times))
+        interval_lengths = np.diff(times)
+        risk_free_rates = -np.diff(np.log(np.concatenate(([1.0], risk_free_discounts)))) / interval_lengths
+        dividend_yields = -np.diff(np.log(np.concatenate(([1.0], dividend_discounts)))) / interval_lengths
+
+        values = np.zeros((spots.shape[0], number_of_states))
+        for j in range(observation_times.shape[0] - 1, -1, -1):
+            values = apply_autocallable_observation(values, spots, autocallable, accrual_fractions[j],
+                                                    j == observation_times.shape[0] - 1, dx)
+            steps = max(int(round(self.time_steps * interval_lengths[j] / maturity)), self.damping_steps + 1)
+            dt = interval_lengths[j] / steps
+            for step in range(steps):
+                t = times[j + 1] - step * dt
+                if self.local_volatility is None:
+                    variance = self.volatility ** 2
+                else:
+                    variance = self.local_volatility(t - 0.5 * dt, spots) ** 2
+                if step == 0 or self.local_volatility is not None:
+                    operator = black_scholes_operator(dx, variance,
+                                                      risk_free_rates[j] - dividend_yields[j] - 0.5 * variance,
+                                                      risk_free_rates[j], spots.shape[0])
+                theta = 1.0 if step < self.damping_steps else 0.5
+                values = theta_step(values, operator, dt, theta)
+
+        spline = CubicSpline(x, values[:, 0])
+        x0 = np.log(self.spot)
+        first_derivative = float(spline(x0, 1))
+        second_derivative = float(spline(x0, 2))
+        return {'price': float(spline(x0)),
+                'delta': first_derivative / self.spot,
+                'gamma': (second_derivative - first_derivative) / self.spot ** 2}
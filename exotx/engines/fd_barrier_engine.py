@@ -0,0 +1,113 @@
+import QuantLib as ql
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+from exotx.engines.analytic_european_engine import analytic_european_prices
+from exotx.engines.finite_differences import black_scholes_operator, theta_step
+
+
+def fd_barrier_prices(barrier_type: ql.Barrier,
+                      option_type: ql.Option,
+                      spot: float,
+                      strikes: np.ndarray,
+                      barrier: float,
+                      rebate: float,
+                      time: float,
+                      risk_free_rate: float,
+                      dividend_yield: float,
+                      volatility: float,
+                      time_steps: int = 100,
+                      space_steps: int = 100,
+                      damping_steps: int = 0,
+                      number_of_std_deviations: float = 5.0) -> np.ndarray:
+    """
+    Calculates the prices of European barrier options sharing a barrier and a maturity, for many strikes, from a single
+    finite-difference solve of the Black-Scholes equation.
+
+    The equation is solved in log-spot on a uniform grid ending on the barrier, with Crank-Nicolson time stepping
+    preceded by optional fully implicit damping steps. All strikes are rolled back together as right-hand sides of the
+    same tridiagonal systems, along with two auxiliary columns used for the rebate: the value of one unit paid when the
+    barrier is hit (knock-out rebate) and the value of one unit paid at maturity if the barrier is never hit (knock-in
+    rebate). Knock-in prices are obtained from the in-out parity with the Black-Scholes vanilla price.
+
+    :param barrier_type: The QuantLib barrier type.
+    :type barrier_type: ql.Barrier
+    :param option_type: The QuantLib option type.
+    :type option_type: ql.Option
+    :param spot: The spot of the underlying.
+    :type spot: float
+    :param strikes: The strikes of the options.
+    :type strikes: np.ndarray
+    :param barrier: The barrier level.
+    :type barrier: float
+    :param rebate: The rebate.
+    :type rebate: float
+    :param time: The time to maturity.
+    :type time: float
+    :param risk_free_rate: The continuously compounded risk-free zero rate to maturity.
+    :type risk_free_rate: float
+    :param dividend_yield: The continuously compounded dividend zero rate to maturity.
+    :type dividend_yield: float
+    :param volatility: The Black-Scholes volatility.
+    :type volatility: float
+    :param time_steps: The number of time steps, defaults to 100.
+    :type time_steps: int, optional
+    :param space_steps: The number of space steps, defaults to 100.
+    :type space_steps: int, optional
+    :param damping_steps: The number of fully implicit steps taken first, defaults to 0.
+    :type damping_steps: int, optional
+    :param number_of_std_deviations: The width of the grid on the side opposite to the barrier, defaults to 5.
+    :type number_of_std_deviations: float, optional
+    :return: The prices of the barrier options, one per strike.
+    :rtype: np.ndarray
+    :raises ValueError: If the barrier has already been touched.
+    """
+    strikes = np.atleast_1d(np.asarray(strikes, dtype=float))
+    is_down = barrier_type in (ql.Barrier.DownIn, ql.Barrier.DownOut)
+    is_in = barrier_type in (ql.Barrier.DownIn, ql.Barrier.UpIn)
+    if (is_down and spot <= barrier) or (not is_down and spot >= barrier):
+        raise ValueError("Barrier touched")
+    phi = 1.0 if option_type == ql.Option.Call else -1.0
+
+    # log-spot grid with the barrier on its boundary, wide enough for the spot and every strike
+    width = number_of_std_deviations * volatility * np.sqrt(time)
+    if is_down:
+        x_min = np.log(barrier)
+        x_max = max(np.log(spot), np.log(strikes.max())) + width
+    else:
+        x_min = min(np.log(spot), np.log(strikes.min())) - width
+        x_max = np.log(barrier)
+    x = np.linspace(x_min, x_max, space_steps + 1)
+    dx = x[1] - x[0]
+    barrier_index = 0 if is_down else space_steps
+
+    # columns: one per strike, then the rebate paid at hit, then the rebate paid at maturity if not hit
+    values = np.empty((space_steps + 1, strikes.shape[0] + 2))
+    values[:, :-2] = np.maximum(phi * (np.exp(x)[:, None] - strikes[None, :]), 0.0)
+    values[:, -2] = 0.0
+    values[:, -1] = 1.0
+    values[barrier_index, :] = 0.0
+    values[barrier_index, -2] = 1.0
+
+    variance = volatility ** 2
+    operator = black_scholes_operator(dx, variance, risk_free_rate - dividend_yield - 0.5 * variance,
+                                      risk_free_rate, space_steps + 1)
+    # Dirichlet condition on the barrier: the values there are frozen
+    for coefficients in operator:
+        coefficients[barrier_index] = 0.0
+
+    dt = time / time_steps
+    for step in range(time_steps):
+        theta = 1.0 if step < damping_steps else 0.5
+        values = theta_step(values, operator, dt, theta)
+
+    spot_values = CubicSpline(x, values, axis=0)(np.log(spot))
+    knock_out_prices = spot_values[:-2]
+    hit_rebate, no_hit_rebate = spot_values[-2], spot_values[-1]
+    if not is_in:
+        return knock_out_prices + rebate * hit_rebate
+
+    # in-out parity
+    vanilla_prices = analytic_european_prices(option_type, spot, strikes, time, risk_free_rate, dividend_yield,
+                                              volatility)
+    return vanilla_prices - knock_out_prices + rebate * no_hit_rebate
@@ -0,0 +1,217 @@
+from typing import Tuple
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+from exotx.engines.fd_autocallable_engine import apply_autocallable_observation
+from exotx.engines.finite_differences import apply_tridiagonal, black_scholes_operator, solve_tridiagonal
+
+
+def _nonuniform_weights(grid: np.ndarray) -> Tuple[np.ndarray, ...]:
+    # central finite-difference weights on a non-uniform grid, for the first and second derivatives at interior points
+    h1 = np.diff(grid)[:-1]
+    h2 = np.diff(grid)[1:]
+    first = (-h2 / (h1 * (h1 + h2)), (h2 - h1) / (h1 * h2), h1 / (h2 * (h1 + h2)))
+    second = (2.0 / (h1 * (h1 + h2)), -2.0 / (h1 * h2), 2.0 / (h2 * (h1 + h2)))
+    return first, second
+
+
+class FdHestonAutocallableEngine:
+    """
+    Finite-difference engine for single-underlying autocallables under the Heston model.
+
+    The Heston equation is solved backwards on a (log-spot, variance) grid with the Craig-Sneyd alternating direction
+    implicit scheme: the mixed derivative term is treated explicitly while the spot and variance directions are treated
+    implicitly one after the other, so that each time step only requires batches of tridiagonal solves along the grid
+    lines. At each observation date the autocall, coupon and protection barrier conditions are applied, followed by
+    damping steps with the fully implicit Douglas scheme. The number of consecutive unpaid coupons, needed by memory
+    coupons, is carried as an additional axis of the grid.
+
+    The log-spot grid is uniform with the spot on a node, the variance grid is refined close to zero where the
+    equation degenerates.
+
+    Attributes:
+        spot (float): The spot of the underlying.
+        v0 (float): The initial variance.
+        kappa (float): The mean reversion speed of the variance.
+        theta (float): The long-term variance.
+        sigma (float): The volatility of the variance.
+        rho (float): The correlation between the underlying and its variance.
+        time_steps (int): The total number of time steps.
+        space_steps (int): The number of log-spot steps.
+        variance_steps (int): The number of variance steps.
+        damping_steps (int): The number of fully implicit steps taken after each observation date.
+        number_of_std_deviations (float): The half-width of the log-spot grid and the height of the variance grid,
+            in standard deviations, wider than for Black-Scholes to cover the fat tails of the model.
+    """
+
+    def __init__(self,
+                 spot: float,
+                 v0: float,
+                 kappa: float,
+                 theta: float,
+                 sigma: float,
+                 rho: float,
+                 time_steps: int = 100,
+                 space_steps: int = 100,
+                 variance_steps: int = 50,
+                 damping_steps: int = 2,
+                 number_of_std_deviations: float = 7.0) -> None:
+        self.spot = spot
+        self.v0 = v0
+        self.kappa = kappa
+        self.theta = theta
+        self.sigma = sigma
+        self.rho = rho
+        self.time_steps = time_steps
+        self.space_steps = space_steps
+        self.variance_steps = variance_steps
+        self.damping_steps = damping_steps
+        self.number_of_std_deviations = number_of_std_deviations
+
+    def _get_variance_grid(self, maturity: float) -> np.ndarray:
+        # mean and standard deviation of the variance at maturity
+        decay = np.exp(-self.kappa * maturity)
+        mean = self.theta + (self.v0 - self.theta) * decay
+        variance = self.v0 * self.sigma ** 2 * decay * (1.0 - decay) / self.kappa + \
+            self.theta * self.sigma ** 2 * (1.0 - decay) ** 2 / (2.0 * self.kappa)
+        v_max = max(self.v0, mean) + self.number_of_std_deviations * np.sqrt(variance)
+        # sinh grid, concentrated around zero
+        concentration = v_max / 10.0
+        xi = np.linspace(0.0, np.arcsinh(v_max / concentration), self.variance_steps + 1)
+        return concentration * np.sinh(xi)
+
+    def _get_operators(self, dx: float, v: np.ndarray, risk_free_rate: float, dividend_yield: float):
+        size = self.space_steps + 1
+        # spot direction, one line per variance, the discounting is shared between both directions
+        spot_lines = [black_scholes_operator(dx, variance, risk_free_rate - dividend_yield - 0.5 * variance,
+                                             0.5 * risk_free_rate, size) for variance in v]
+        spot_operator = tuple(np.stack([line[k] for line in spot_lines], axis=1)[..., None] for k in range(3))
+
+        # variance direction, one line per spot: 0.5 * sigma^2 * v * d2/dv2 + kappa * (theta - v) * d/dv - r / 2
+        (a1, b1, c1), (a2, b2, c2) = _nonuniform_weights(v)
+        diffusion = 0.5 * self.sigma ** 2 * v
+        drift = self.kappa * (self.theta - v)
+        lower = np.zeros(v.shape[0])
+        diagonal = np.full(v.shape[0], -0.5 * risk_free_rate)
+        upper = np.zeros(v.shape[0])
+        lower[1:-1] = diffusion[1:-1] * a2 + drift[1:-1] * a1
+        diagonal[1:-1] += diffusion[1:-1] * b2 + drift[1:-1] * b1
+        upper[1:-1] = diffusion[1:-1] * c2 + drift[1:-1] * c1
+        # zero variance: the diffusion vanishes and the drift points inwards, upwind first derivative
+        h = v[1] - v[0]
+        diagonal[0] += -drift[0] / h
+        upper[0] = drift[0] / h
+        # maximum variance: zero convexity, upwind first derivative
+        h = v[-1] - v[-2]
+        lower[-1] = -drift[-1] / h
+        diagonal[-1] += drift[-1] / h
+        variance_operator = tuple(c[:, None, None] for c in (lower, diagonal, upper))
+
+        # mixed derivative weights, rho * sigma * v * d2/dxdv at interior points
+        mixed_weights = tuple(self.rho * self.sigma * v[1:-1] * w / (2.0 * dx) for w in (a1, b1, c1))
+        return spot_operator, variance_operator, mixed_weights
+
+    @staticmethod
+    def _apply_mixed(values: np.ndarray, mixed_weights: Tuple[np.ndarray, ...]) -> np.ndarray:
+        result = np.zeros(values.shape)
+        # central difference in log-spot of the central difference in variance
+        spot_difference = values[2:] - values[:-2]
+        lower, diagonal, upper = (w[None, :, None] for w in mixed_weights)
+        result[1:-1, 1:-1] = lower * spot_difference[:, :-2] + diagonal * spot_difference[:, 1:-1] + \
+            upper * spot_difference[:, 2:]
+        return result
+
+    @staticmethod
+    def _solve_variance(operator, values: np.ndarray, dt: float, theta: float) -> np.ndarray:
+        lower, diagonal, upper = operator
+        swapped = values.swapaxes(0, 1)
+        return solve_tridiagonal(-theta * dt * lower, 1.0 - theta * dt * diagonal, -theta * dt * upper,
+                                 swapped).swapaxes(0, 1)
+
+    @staticmethod
+    def _apply_variance(operator, values: np.ndarray) -> np.ndarray:
+        return apply_tridiagonal(*operator, values.swapaxes(0, 1)).swapaxes(0, 1)
+
+    def _step(self, values: np.ndarray, operators, dt: float, theta: float, is_damping: bool) -> np.ndarray:
+        spot_operator, variance_operator, mixed_weights = operators
+        lower, diagonal, upper = spot_operator
+        mixed = self._apply_mixed(values, mixed_weights)
+        spot_term = apply_tridiagonal(lower, diagonal, upper, values)
+        variance_term = self._apply_variance(variance_operator, values)
+
+        # Douglas predictor
+        y0 = values + dt * (mixed + spot_term + variance_term)
+        y1 = solve_tridiagonal(-theta * dt * lower, 1.0 - theta * dt * diagonal, -theta * dt * upper,
+                               y0 - theta * dt * spot_term)
+        y2 = self._solve_variance(variance_operator, y1 - theta * dt * variance_term, dt, theta)
+        if is_damping:
+            return y2
+
+        # Craig-Sneyd corrector of the mixed derivative term
+        corrected_y0 = y0 + 0.5 * dt * (self._apply_mixed(y2, mixed_weights) - mixed)
+        corrected_y1 = solve_tridiagonal(-theta * dt * lower, 1.0 - theta * dt * diagonal, -theta * dt * upper,
+                                         corrected_y0 - theta * dt * spot_term)
+        return self._solve_variance(variance_operator, corrected_y1 - theta * dt * variance_term, dt, theta)
+
+    def calculate(self,
+                  autocallable,
+                  observation_times: np.ndarray,
+                  accrual_fractions: np.ndarray,
+                  risk_free_discounts: np.ndarray,
+                  dividend_discounts: np.ndarray) -> dict:
+        """
+        Calculates the price, delta and gamma of the autocallable.
+
+        :param autocallable: The autocallable instrument.
+        :type autocallable: Autocallable
+        :param observation_times: The times of the remaining observation dates.
+        :type observation_times: np.ndarray
+        :param accrual_fractions: The accrual fractions of the coupons paid at the observation dates.
+        :type accrual_fractions: np.ndarray
+        :param risk_free_discounts: The risk-free discount factors at the observation dates.
+        :type risk_free_discounts: np.ndarray
+        :param dividend_discounts: The dividend discount factors at the observation dates.
+        :type dividend_discounts: np.ndarray
+        :return: A dictionary containing the price, delta and gamma.
+        :rtype: dict
+        """
+        observation_times = np.asarray(observation_times, dtype=float)
+        maturity = observation_times[-1]
+        number_of_states = observation_times.shape[0] if autocallable.has_memory else 1
+
+        # uniform log-spot grid with the spot on a node, non-uniform variance grid
+        half_width = self.number_of_std_deviations * np.sqrt(max(self.v0, self.theta) * maturity)
+        dx = 2.0 * half_width / self.space_steps
+        x = np.log(self.spot) + dx * np.arange(-(self.space_steps // 2), self.space_steps - self.space_steps // 2 + 1)
+        spots = np.exp(x)
+        v = self._get_variance_grid(maturity)
+
+        # piecewise constant forward rates between observation dates
+        times = np.concatenate(([0.0], observation_times))
+        interval_lengths = np.diff(times)
+        risk_free_rates = -np.diff(np.log(np.concatenate(([1.0], risk_free_discounts)))) / interval_lengths
+        dividend_yields = -np.diff(np.log(np.concatenate(([1.0], dividend_discounts)))) / interval_lengths
+
+        values = np.zeros((spots.shape[0], v.shape[0], number_of_states))
+        for j in range(observation_times.shape[0] - 1, -1, -1):
+            values = apply_autocallable_observation(values, spots[:, None], autocallable, accrual_fractions[j],
+                                                    j == observation_times.shape[0] - 1, dx)
+            operators = self._get_operators(dx, v, risk_free_rates[j], dividend_yields[j])
+            steps = max(int(round(self.time_steps * interval_lengths[j] / maturity)), self.damping_steps + 1)
+            dt = interval_lengths[j] / steps
+            for step in range(steps):
+                if step < self.damping_steps:
+                    values = self._step(values, operators, dt, 1.0, True)
+                else:
+                    values = self._step(values, operators, dt, 0.5, False)
+
+        # interpolate in variance first, then in log-spot
+        spot_values = CubicSpline(v, values[:, :, 0], axis=1)(self.v0)
+        spline = CubicSpline(x, spot_values)
+        x0 = np.log(self.spot)
+        first_derivative = float(spline(x0, 1))
+        second_derivative = float(spline(x0, 2))
+        return {'price': float(spline(x0)),
+                'delta': first_derivative / self.spot,
+                'gamma': (second_derivative - first_derivative) / self.spot ** 2}
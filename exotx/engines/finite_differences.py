@@ -0,0 +1,129 @@
+from typing import Tuple
+
+import numpy as np
+from scipy.linalg import solve_banded
+
+
+def solve_tridiagonal(lower: np.ndarray, diagonal: np.ndarray, upper: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """
+    Solves a batch of tridiagonal linear systems with the Thomas algorithm.
+
+    The systems are stored along the first axis, every other axis is a batch axis: the coefficients are broadcast
+    against the right-hand side, so that a single operator can be applied to many right-hand sides (e.g. several
+    payoffs sharing a grid) or many operators to many right-hand sides (e.g. the lines of an ADI sweep).
+
+    :param lower: The sub-diagonal coefficients, lower[0] is ignored.
+    :type lower: np.ndarray
+    :param diagonal: The diagonal coefficients.
+    :type diagonal: np.ndarray
+    :param upper: The super-diagonal coefficients, upper[-1] is ignored.
+    :type upper: np.ndarray
+    :param rhs: The right-hand sides.
+    :type rhs: np.ndarray
+    :return: The solutions, with the shape of the broadcast right-hand side.
+    :rtype: np.ndarray
+    """
+    lower, diagonal, upper, rhs = np.broadcast_arrays(lower, diagonal, upper, rhs)
+    size = rhs.shape[0]
+    modified_upper = np.empty(rhs.shape)
+    modified_rhs = np.empty(rhs.shape)
+    modified_upper[0] = upper[0] / diagonal[0]
+    modified_rhs[0] = rhs[0] / diagonal[0]
+    for i in range(1, size):
+        denominator = diagonal[i] - lower[i] * modified_upper[i - 1]
+        modified_upper[i] = upper[i] / denominator
+        modified_rhs[i] = (rhs[i] - lower[i] * modified_rhs[i - 1]) / denominator
+    solution = np.empty(rhs.shape)
+    solution[-1] = modified_rhs[-1]
+    for i in range(size - 2, -1, -1):
+        solution[i] = modified_rhs[i] - modified_upper[i] * solution[i + 1]
+    return solution
+
+
+def apply_tridiagonal(lower: np.ndarray, diagonal: np.ndarray, upper: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Applies a tridiagonal operator to values stored along the first axis.
+
+    :param lower: The sub-diagonal coefficients, lower[0] is ignored.
+    :type lower: np.ndarray
+    :param diagonal: The diagonal coefficients.
+    :type diagonal: np.ndarray
+    :param upper: The super-diagonal coefficients, upper[-1] is ignored.
+    :type upper: np.ndarray
+    :param values: The values the operator is applied to.
+    :type values: np.ndarray
+    :return: The image of the values by the operator.
+    :rtype: np.ndarray
+    """
+    result = diagonal * values
+    result[1:] += lower[1:] * values[:-1]
+    result[:-1] += upper[:-1] * values[1:]
+    return result
+
+
+def black_scholes_operator(dx: float, variance: np.ndarray, drift: np.ndarray, rate: float,
+                           size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Builds the tridiagonal discretization of the Black-Scholes operator in log-spot on a uniform grid.
+
+    The operator is 0.5 * variance * d2/dx2 + drift * d/dx - rate, discretized with central differences in the
+    interior. On both boundaries the second derivative is assumed to vanish and the first derivative is taken
+    one-sided. This is not exact, even for values linear in the spot whose second derivative in log-spot does not
+    vanish, and leaves an error of the order of the variance times the value at the boundaries, which the diffusion
+    damps before it reaches the strikes when the grid is wide enough.
+
+    :param dx: The log-spot step.
+    :type dx: float
+    :param variance: The local variance at each grid point (or a scalar).
+    :type variance: np.ndarray
+    :param drift: The log-spot drift at each grid point (or a scalar).
+    :type drift: np.ndarray
+    :param rate: The discounting rate.
+    :type rate: float
+    :param size: The number of grid points.
+    :type size: int
+    :return: The sub-diagonal, diagonal and super-diagonal coefficients of the operator.
+    :rtype: Tuple[np.ndarray, np.ndarray, np.ndarray]
+    """
+    variance = np.broadcast_to(np.asarray(variance, dtype=float), (size,))
+    drift = np.broadcast_to(np.asarray(drift, dtype=float), (size,))
+    lower = 0.5 * variance / dx ** 2 - 0.5 * drift / dx
+    upper = 0.5 * variance / dx ** 2 + 0.5 * drift / dx
+    diagonal = -variance / dx ** 2 - rate
+    # boundaries: zero convexity, one-sided first derivative
+    lower[0], diagonal[0], upper[0] = 0.0, -drift[0] / dx - rate, drift[0] / dx
+    lower[-1], diagonal[-1], upper[-1] = -drift[-1] / dx, drift[-1] / dx - rate, 0.0
+    return lower, diagonal, upper
+
+
+def theta_step(values: np.ndarray, operator: Tuple[np.ndarray, np.ndarray, np.ndarray], dt: float,
+               theta: float) -> np.ndarray:
+    """
+    Rolls values back by one time step with the theta scheme.
+
+    Solves (I - theta * dt * L) V(t - dt) = (I + (1 - theta) * dt * L) V(t), where theta = 0.5 gives Crank-Nicolson
+    and theta = 1 gives the fully implicit scheme used for damping.
+
+    :param values: The values at time t, stored along the first axis.
+    :type values: np.ndarray
+    :param operator: The sub-diagonal, diagonal and super-diagonal coefficients of the spatial operator L.
+    :type operator: Tuple[np.ndarray, np.ndarray, np.ndarray]
+    :param dt: The time step.
+    :type dt: float
+    :param theta: The implicitness of the scheme.
+    :type theta: float
+    :return: The values at time t - dt.
+    :rtype: np.ndarray
+    """
+    lower, diagonal, upper = operator
+    explicit = values
+    if theta < 1.0:
+        explicit = values + (1.0 - theta) * dt * apply_tridiagonal(
+            *[np.expand_dims(c, tuple(range(1, values.ndim))) for c in operator], values)
+    # the operator is shared by every column, hence a single banded LAPACK solve
+    banded = np.zeros((3, diagonal.shape[0]))
+    banded[0, 1:] = -theta * dt * upper[:-1]
+    banded[1] = 1.0 - theta * dt * diagonal
+    banded[2, :-1] = -theta * dt * lower[1:]
+    solution = solve_banded((1, 1), banded, explicit.reshape(explicit.shape[0], -1), check_finite=False)
+    return solution.reshape(values.shape)
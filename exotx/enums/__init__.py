@@ -2,9 +2,10 @@
 
 Exotic options can refer to auto-callables, barrier options, etc."""
 
-from exotx.enums.enums import PricingModel, NumericalMethod
+from exotx.enums.enums import PricingModel, NumericalMethod, VolatilityInterpolation
 
 __all__ = [
     'PricingModel',
-    'NumericalMethod'
+    'NumericalMethod',
+    'VolatilityInterpolation'
 ]
@@ -3,7 +3,9 @@ from enum import Enum
 
 class PricingModel(Enum):
     BLACK_SCHOLES = "BlackScholes"
+    BLACK_SCHOLES_TERM_STRUCTURE = "BlackScholesTermStructure"
     HESTON = "Heston"
+    LOCAL_VOLATILITY = "LocalVolatility"
 
     @staticmethod
     def values():
@@ -27,3 +29,22 @@ class RandomNumberGenerator(Enum):
     @staticmethod
     def values():
         return [e.value for e in RandomNumberGenerator]
+
+
+class FiniteDifferencePreset(Enum):
+    FAST = "Fast"
+    STANDARD = "Standard"
+    ACCURATE = "Accurate"
+
+    @staticmethod
+    def values():
+        return [e.value for e in FiniteDifferencePreset]
+
+
+class VolatilityInterpolation(Enum):
+    BILINEAR = "Bilinear"
+    TOTAL_VARIANCE = "TotalVariance"
+
+    @staticmethod
+    def values():
+        return [e.value for e in VolatilityInterpolation]
@@ -1,18 +1,20 @@
-from datetime import datetime
-from typing import Union
+from datetime import date, datetime
+from typing import Iterable, List, Union
 
 import QuantLib as ql
+import numpy as np
 
 
-def convert_maturity_to_ql_date(maturity: Union[str, datetime, ql.Date], string_format: str = '%Y-%m-%d') -> ql.Date:
+def convert_maturity_to_ql_date(maturity: Union[str, datetime, date, ql.Date],
+                                string_format: str = '%Y-%m-%d') -> ql.Date:
     """
     Converts a maturity date in various formats to a QuantLib Date object.
 
-    This function accepts input dates as strings, Python datetime objects, or QuantLib Date objects and
+    This function accepts input dates as strings, Python datetime or date objects, or QuantLib Date objects and
     returns the corresponding QuantLib Date object.
 
-    :param maturity: The maturity date to be converted, which can be a string, datetime, or QuantLib Date object.
-    :type maturity: Union[str, datetime, ql.Date]
+    :param maturity: The maturity date to be converted, which can be a string, datetime, date, or QuantLib Date object.
+    :type maturity: Union[str, datetime, date, ql.Date]
     :param string_format: The date format for string input, defaults to '%Y-%m-%d'.
     :type string_format: str, optional
     :return: The converted maturity date as a QuantLib Date object.
@@ -23,8 +25,64 @@ def convert_maturity_to_ql_date(maturity: Union[str, datetime, ql.Date], string_
         return maturity
     elif isinstance(maturity, datetime):
         return ql.Date.from_date(maturity)
+    elif isinstance(maturity, date):
+        # marshmallow Date fields deserialize to dates
+        return ql.Date(maturity.day, maturity.month, maturity.year)
     elif isinstance(maturity, str):
         datetime_maturity = datetime.strptime(maturity, string_format)
         return convert_maturity_to_ql_date(datetime_maturity)
     else:
         raise TypeError(f"Invalid maturity type: {type(maturity)}")
+
+
+# serial number 0 of QuantLib dates, as in spreadsheets
+ql_serial_epoch = np.datetime64('1899-12-30', 'D')
+
+
+def convert_ql_dates_to_datetime64(dates: Union[ql.Date, Iterable[ql.Date]]) -> np.ndarray:
+    """
+    Converts QuantLib Date objects to a NumPy datetime64 array with a daily resolution.
+
+    :param dates: The QuantLib date or dates to be converted.
+    :type dates: Union[ql.Date, Iterable[ql.Date]]
+    :return: The converted dates.
+    :rtype: np.ndarray
+    """
+    if isinstance(dates, ql.Date):
+        return ql_serial_epoch + np.timedelta64(dates.serialNumber(), 'D')
+    serial_numbers = np.fromiter((date.serialNumber() for date in dates), dtype=np.int64)
+    return ql_serial_epoch + serial_numbers.astype('timedelta64[D]')
+
+
+def convert_datetime64_to_ql_dates(dates: np.ndarray) -> List[ql.Date]:
+    """
+    Converts a NumPy datetime64 array to a list of QuantLib Date objects.
+
+    :param dates: The dates to be converted.
+    :type dates: np.ndarray
+    :return: The converted dates.
+    :rtype: List[ql.Date]
+    """
+    serial_numbers = (np.asarray(dates, dtype='datetime64[D]') - ql_serial_epoch).astype(np.int64)
+    return [ql.Date(int(serial_number)) for serial_number in np.ravel(serial_numbers)]
+
+
+def convert_dates_to_datetime64(dates: Union[ql.Date, Iterable[ql.Date], np.ndarray, str]) -> np.ndarray:
+    """
+    Converts dates given either as QuantLib Date objects or as values understood by NumPy to a NumPy datetime64 array
+    with a daily resolution.
+
+    :param dates: The date or dates to be converted.
+    :type dates: Union[ql.Date, Iterable[ql.Date], np.ndarray, str]
+    :return: The converted dates.
+    :rtype: np.ndarray
+    """
+    if isinstance(dates, ql.Date):
+        return convert_ql_dates_to_datetime64(dates)
+    if isinstance(dates, np.ndarray) and dates.dtype != object:
+        return dates.astype('datetime64[D]')
+    if not isinstance(dates, str):
+        dates = np.asarray(dates, dtype=object)
+        if dates.size > 0 and isinstance(dates.flat[0], ql.Date):
+            return convert_ql_dates_to_datetime64(dates.ravel()).reshape(dates.shape)
+    return np.asarray(dates, dtype='datetime64[D]')
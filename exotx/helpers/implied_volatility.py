@@ -0,0 +1,138 @@
+from typing import Tuple, Union
+
+import QuantLib as ql
+import numpy as np
+from scipy.special import ndtr, ndtri
+
+ArrayLike = Union[float, int, np.ndarray]
+
+_inverse_sqrt_two_pi = 1.0 / np.sqrt(2.0 * np.pi)
+# normalized standard deviations bounding the search, far beyond any quoted volatility
+_maximum_std_deviation = 50.0
+
+
+def _normalized_call_prices(log_moneyness: np.ndarray, std_deviations: np.ndarray) -> np.ndarray:
+    # undiscounted Black call prices divided by sqrt(F * K), with log_moneyness = ln(F / K)
+    half = 0.5 * log_moneyness
+    ratios = log_moneyness / std_deviations
+    return np.exp(half) * ndtr(ratios + 0.5 * std_deviations) - np.exp(-half) * ndtr(ratios - 0.5 * std_deviations)
+
+
+def _householder_step(log_moneyness: np.ndarray, std_deviations: np.ndarray, targets: np.ndarray,
+                      use_logarithm: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # third order Householder step on b(s) - beta, or on ln(b(s)) - ln(beta) for the small prices where b is very
+    # convex, b being the normalized call price and s the normalized standard deviation
+    s = std_deviations
+    x2 = log_moneyness ** 2
+    prices = _normalized_call_prices(log_moneyness, s)
+    vegas = _inverse_sqrt_two_pi * np.exp(-0.5 * (x2 / s ** 2 + 0.25 * s ** 2))
+    # b'' / b' and b''' / b'
+    h2 = x2 / s ** 3 - 0.25 * s
+    h3 = h2 ** 2 - 3.0 * x2 / s ** 4 - 0.25
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        ratios = vegas / prices
+        log_objectives = np.log(prices) - np.log(targets)
+        log_h2 = h2 - ratios
+        log_h3 = h3 - 3.0 * h2 * ratios + 2.0 * ratios ** 2
+        newton = np.where(use_logarithm, -log_objectives / ratios, -(prices - targets) / vegas)
+        h2 = np.where(use_logarithm, log_h2, h2)
+        h3 = np.where(use_logarithm, log_h3, h3)
+        steps = newton * (1.0 + 0.5 * h2 * newton) / (1.0 + newton * (h2 + h3 * newton / 6.0))
+    return steps, prices
+
+
+def black_implied_volatilities(option_types: ArrayLike,
+                               prices: ArrayLike,
+                               forwards: ArrayLike,
+                               strikes: ArrayLike,
+                               times: ArrayLike,
+                               discount_factors: ArrayLike = 1.0,
+                               tolerance: float = 1e-12,
+                               maximum_iterations: int = 20) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Inverts the Black formula for whole arrays of option prices at once.
+
+    The prices are normalized and turned into out-of-the-money call prices with the put-call parity, then solved in the
+    normalized standard deviation with third order Householder iterations, all quotes being iterated together. The
+    iterations start from the closed-form solution at the money, corrected for the log-moneyness, and work on the
+    logarithm of the prices below the inflection point of the Black formula, as suggested by Jäckel. Each quote keeps a
+    bracket of its solution, and bisects it whenever a step leaves the bracket, so that every quote converges.
+
+    :param option_types: The QuantLib option types (ql.Option.Call or ql.Option.Put).
+    :type option_types: ArrayLike
+    :param prices: The option prices.
+    :type prices: ArrayLike
+    :param forwards: The forwards of the underlying.
+    :type forwards: ArrayLike
+    :param strikes: The strikes of the options.
+    :type strikes: ArrayLike
+    :param times: The times to maturity.
+    :type times: ArrayLike
+    :param discount_factors: The discount factors to maturity, defaults to 1.
+    :type discount_factors: ArrayLike, optional
+    :param tolerance: The relative tolerance on the normalized standard deviations, defaults to 1e-12.
+    :type tolerance: float, optional
+    :param maximum_iterations: The maximum number of iterations, defaults to 20.
+    :type maximum_iterations: int, optional
+    :return: The implied volatilities, NaN where the price has no implied volatility, and the convergence flags.
+    :rtype: Tuple[np.ndarray, np.ndarray]
+
+    Example usage:
+
+    >>> volatilities, converged = black_implied_volatilities(ql.Option.Call, [9.94764497, 6.19042641], 100.0,
+    ...                                                      [100.0, 110.0], 1.0)
+    >>> volatilities.round(6), converged
+    (array([0.25, 0.25]), array([ True,  True]))
+    """
+    option_types, prices, forwards, strikes, times, discount_factors = np.broadcast_arrays(
+        *[np.asarray(x, dtype=float) for x in (option_types, prices, forwards, strikes, times, discount_factors)])
+    shape = prices.shape
+    option_types, prices, forwards, strikes, times, discount_factors = \
+        [x.ravel() for x in (option_types, prices, forwards, strikes, times, discount_factors)]
+    phi = np.where(option_types == ql.Option.Call, 1.0, -1.0)
+    log_moneyness = np.log(forwards / strikes)
+    # out-of-the-money call prices with a non-positive log-moneyness, the normalized out-of-the-money prices being
+    # symmetric in the log-moneyness
+    intrinsic = np.maximum(phi * (np.exp(0.5 * log_moneyness) - np.exp(-0.5 * log_moneyness)), 0.0)
+    targets = prices / (discount_factors * np.sqrt(forwards * strikes)) - intrinsic
+    x = -np.abs(log_moneyness)
+    upper_limits = np.exp(0.5 * x)
+    solvable = (targets > 0) & (targets < upper_limits) & (times > 0)
+
+    # inflection point of the normalized price, below which the logarithmic objective is used
+    inflection_points = np.sqrt(2.0 * np.abs(x))
+    use_logarithm = targets < np.where(inflection_points > 0,
+                                       _normalized_call_prices(x, np.maximum(inflection_points, 1e-300)), 0.0)
+
+    # closed form solution at the money, shifted by the log-moneyness
+    with np.errstate(invalid='ignore', divide='ignore'):
+        at_the_money = 2.0 * ndtri(0.5 * (1.0 + np.clip(targets + (1.0 - upper_limits), 0.0, 1.0 - 1e-16)))
+        std_deviations = np.where(use_logarithm, np.sqrt(at_the_money ** 2 + 2.0 * np.abs(x)),
+                                  np.maximum(at_the_money, inflection_points))
+    std_deviations = np.clip(np.nan_to_num(std_deviations, nan=1.0), 1e-8, _maximum_std_deviation)
+    lower_bounds = np.zeros(std_deviations.shape)
+    upper_bounds = np.full(std_deviations.shape, _maximum_std_deviation)
+    converged = np.zeros(std_deviations.shape, dtype=bool)
+
+    active = np.flatnonzero(solvable)
+    for _ in range(maximum_iterations):
+        if active.shape[0] == 0:
+            break
+        s = std_deviations[active]
+        steps, model_prices = _householder_step(x[active], s, targets[active], use_logarithm[active])
+        is_above = model_prices > targets[active]
+        lower = np.where(is_above, lower_bounds[active], s)
+        upper = np.where(is_above, s, upper_bounds[active])
+        lower_bounds[active] = lower
+        upper_bounds[active] = upper
+        candidates = s + steps
+        # bisect the bracket when the step is not finite or leaves the bracket
+        outside = ~np.isfinite(candidates) | (candidates < lower) | (candidates > upper)
+        candidates = np.where(outside, 0.5 * (lower + upper), candidates)
+        std_deviations[active] = candidates
+        done = (np.abs(candidates - s) <= tolerance * candidates) | (model_prices == targets[active])
+        converged[active[done]] = True
+        active = active[~done]
+
+    volatilities = np.where(solvable, std_deviations / np.sqrt(np.where(times > 0, times, 1.0)), np.nan)
+    return volatilities.reshape(shape), converged.reshape(shape)
@@ -0,0 +1,39 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def _locate(grid: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # index of the lower node and weight of the upper node, flat outside of the grid
+    if grid.shape[0] == 1:
+        return np.zeros(values.shape, dtype=np.int64), np.zeros(values.shape)
+    values = np.clip(values, grid[0], grid[-1])
+    indices = np.clip(np.searchsorted(grid, values, side='right') - 1, 0, grid.shape[0] - 2)
+    return indices, (values - grid[indices]) / (grid[indices + 1] - grid[indices])
+
+
+def bilinear_interpolation(x_grid: np.ndarray, y_grid: np.ndarray, z: np.ndarray, x: np.ndarray,
+                           y: np.ndarray) -> np.ndarray:
+    """
+    Interpolates bilinearly values given on a grid, with flat extrapolation outside of the grid.
+
+    :param x_grid: The increasing nodes of the first dimension.
+    :type x_grid: np.ndarray
+    :param y_grid: The increasing nodes of the second dimension.
+    :type y_grid: np.ndarray
+    :param z: The values at the nodes, z[i, j] being the value at (x_grid[i], y_grid[j]).
+    :type z: np.ndarray
+    :param x: The first coordinates of the interpolated points, broadcast against the second ones.
+    :type x: np.ndarray
+    :param y: The second coordinates of the interpolated points.
+    :type y: np.ndarray
+    :return: The interpolated values.
+    :rtype: np.ndarray
+    """
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    i, u = _locate(x_grid, x)
+    j, v = _locate(y_grid, y)
+    next_i = np.minimum(i + 1, x_grid.shape[0] - 1)
+    next_j = np.minimum(j + 1, y_grid.shape[0] - 1)
+    return (1.0 - u) * (1.0 - v) * z[i, j] + u * (1.0 - v) * z[next_i, j] + \
+        (1.0 - u) * v * z[i, next_j] + u * v * z[next_i, next_j]
@@ -0,0 +1,53 @@
+from typing import Any, Callable, Dict, Hashable, Iterator, Mapping
+
+
+class LazyMapping(Mapping):
+    """
+    A read-only mapping whose values are built on first access and memoized.
+
+    The mapping is created from factories, i.e. callables without arguments returning the values. The keys are known
+    upfront, so that membership tests, iteration and len() behave as for a dictionary without building any value.
+
+    Example usage:
+
+    >>> import QuantLib as ql
+    >>> from functools import partial
+    >>> calendars = LazyMapping({'NYSE': partial(ql.UnitedStates, ql.UnitedStates.NYSE)})
+    >>> calendars['NYSE'].name()
+    'New York stock exchange'
+    """
+
+    def __init__(self, factories: Mapping[Hashable, Callable[[], Any]]) -> None:
+        self._factories: Dict[Hashable, Callable[[], Any]] = dict(factories)
+        self._values: Dict[Hashable, Any] = {}
+
+    def __getitem__(self, key: Hashable) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            value = self._factories[key]()
+            # keep the first value built if another thread built it concurrently
+            return self._values.setdefault(key, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._factories
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def is_built(self, key: Hashable) -> bool:
+        """
+        Checks whether the value of a key has already been built.
+
+        :param key: The key.
+        :type key: Hashable
+        :return: True if the value has been built, False otherwise.
+        :rtype: bool
+        """
+        return key in self._values
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._factories)})"
@@ -0,0 +1,28 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def refine_times(times: np.ndarray, time_steps_per_year: int = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Inserts equally spaced intermediate times between consecutive times, so that no step is longer than a year divided
+    by the number of time steps per year.
+
+    :param times: The increasing times, such as the times of the observation dates of a simulation.
+    :type times: np.ndarray
+    :param time_steps_per_year: The minimum number of steps per year, defaults to None for no intermediate times.
+    :type time_steps_per_year: int, optional
+    :return: The refined times, and the indices of the given times among them.
+    :rtype: Tuple[np.ndarray, np.ndarray]
+    """
+    times = np.asarray(times, dtype=float)
+    if time_steps_per_year is None or times.shape[0] < 2:
+        return times, np.arange(times.shape[0])
+    steps = np.maximum(np.ceil(np.diff(times) * time_steps_per_year).astype(np.int64), 1)
+    indices = np.concatenate(([0], np.cumsum(steps)))
+    fractions = np.concatenate([np.arange(step) / step for step in steps])
+    starts = np.repeat(times[:-1], steps)
+    refined_times = np.append(starts + fractions * np.repeat(np.diff(times), steps), times[-1])
+    # the given times are kept exactly
+    refined_times[indices] = times
+    return refined_times, indices
@@ -4,16 +4,22 @@ from typing import Union, List
 import QuantLib as ql
 from marshmallow import Schema, fields, post_load
 
-from exotx.enums.enums import PricingModel, NumericalMethod
+from exotx.engines.mc_asian_engine import MCDiscreteArithmeticAsianEngine, default_number_of_paths
+from exotx.enums.enums import PricingModel, NumericalMethod, RandomNumberGenerator
 from exotx.helpers.dates import convert_maturity_to_ql_date
 from exotx.instruments.average_calculation import AverageCalculation, convert_average_calculation, \
     AverageCalculationField
 from exotx.instruments.average_convention import AverageConvention, convert_average_convention, AverageConventionField
-from exotx.instruments.average_type import AverageTypeField, AverageType, convert_average_type_to_ql
+from exotx.instruments.average_type import AverageTypeField, AverageType, convert_average_type_to_ql, \
+    convert_ql_to_average_type
 from exotx.instruments.instrument import Instrument
-from exotx.instruments.option_type import convert_option_type_to_ql, OptionType, OptionTypeField
+from exotx.instruments.option_type import convert_option_type_to_ql, convert_ql_to_option_type, OptionType, \
+    OptionTypeField
 from exotx.models.blackscholesmodel import BlackScholesModel
-from exotx.utils.pricing_configuration import PricingConfiguration
+from exotx.utils.pricing_configuration import PricingConfiguration, NumericalSettings
+
+# number of paths of the QuantLib Monte Carlo engines, unless defined by the numerical settings
+default_number_of_paths = 100000
 
 
 class AsianOption(Instrument):
@@ -34,7 +40,8 @@ class AsianOption(Instrument):
         arithmetic_running_accumulator (float, optional): The arithmetic running accumulator for the option. Defaults to 0.0.
         geometric_running_accumulator (float, optional): The geometric running accumulator for the option. Defaults to 1.0.
         past_fixings (int, optional): The number of past fixings for the option. Defaults to 0.
-        future_fixing_dates (List[datetime], optional): A list of future fixing dates for the option. Defaults to None.
+        future_fixing_dates (List[datetime], optional): A list of future fixing dates for the option, as datetime,
+            string or QuantLib Date objects. Defaults to None.
     """
 
     def __init__(self,
@@ -55,8 +62,17 @@ class AsianOption(Instrument):
         self.arithmetic_running_accumulator = arithmetic_running_accumulator
         self.geometric_running_accumulator = geometric_running_accumulator
         self.past_fixings = past_fixings
-        self.future_fixing_dates = None if not future_fixing_dates else [ql.Date().from_date(future_fixing_date)
-                                                                         for future_fixing_date in future_fixing_dates]
+        self.future_fixing_dates = None if not future_fixing_dates else \
+            [convert_maturity_to_ql_date(future_fixing_date) for future_fixing_date in future_fixing_dates]
+
+    def __reduce__(self) -> tuple:
+        # pickled as primitive constructor arguments, the QuantLib objects being rebuilt when unpickling
+        future_fixing_dates = None if self.future_fixing_dates is None else \
+            [future_fixing_date.ISO() for future_fixing_date in self.future_fixing_dates]
+        return type(self), (self.strike, self.maturity.ISO(), convert_ql_to_option_type(self.option_type).value,
+                            convert_ql_to_average_type(self.average_type).value, self.average_calculation.value,
+                            self.average_convention.value, self.arithmetic_running_accumulator,
+                            self.geometric_running_accumulator, self.past_fixings, future_fixing_dates)
 
     def price(self, market_data, static_data, pricing_config: PricingConfiguration, seed: int = 1) -> dict:
         """
@@ -81,6 +97,12 @@ class AsianOption(Instrument):
             for future_fixing_date in self.future_fixing_dates:
                 assert future_fixing_date >= reference_date, f"Invalid future fixing date {future_fixing_date}"
 
+        # discrete arithmetic averages are simulated with the vectorized Monte Carlo engine
+        if self.average_calculation == AverageCalculation.DISCRETE and self.average_type == ql.Average().Arithmetic \
+                and pricing_config.numerical_method == NumericalMethod.MC:
+            self._check_mc_engine_configuration(pricing_config)
+            return self._price_with_mc_engine(market_data, static_data, seed, pricing_config.get_numerical_settings())
+
         # create the product
         ql_payoff = ql.PlainVanillaPayoff(self.option_type, self.strike)
         ql_exercise = ql.EuropeanExercise(self.maturity)
@@ -137,10 +159,14 @@ class AsianOption(Instrument):
                     # TODO: filter on pricing_config.pricing_model, here we assume black-scholes only
                     bs_model = BlackScholesModel(market_data, static_data)
                     process = bs_model.setup()
-                    random_number_generator = str(
-                        pricing_config.random_number_generator)
+                    random_number_generator = (pricing_config.random_number_generator or
+                                               RandomNumberGenerator.PSEUDORANDOM).value
+                    numerical_settings = pricing_config.get_numerical_settings()
                     if self.average_convention == AverageConvention.PRICE:
-                        return ql.MCDiscreteGeometricAPEngine(process, random_number_generator)
+                        return ql.MCDiscreteGeometricAPEngine(
+                            process, random_number_generator,
+                            requiredSamples=numerical_settings.number_of_paths or default_number_of_paths,
+                            requiredTolerance=numerical_settings.monte_carlo_tolerance, seed=seed)
                     elif self.average_convention == AverageConvention.STRIKE:
                         return ValueError(
                             f"No corresponding engine for asian option for numerical method {pricing_config.numerical_method}, "
@@ -153,18 +179,10 @@ class AsianOption(Instrument):
                         f"No engine for asian option with numerical method {pricing_config.numerical_method}"
                         f"with average calculation {self.average_calculation} and average type {self.average_type}")
             elif self.average_type == ql.Average().Arithmetic:
-                if pricing_config.numerical_method == NumericalMethod.MC:
-                    bs_model = BlackScholesModel(market_data, static_data)
-                    process = bs_model.setup()
-                    random_number_generator = str(
-                        pricing_config.random_number_generator)
-                    if self.average_convention == AverageConvention.PRICE:
-                        return ql.MCDiscreteArithmeticAPEngine(process, random_number_generator)
-                    elif self.average_convention == AverageConvention.STRIKE:
-                        return ql.MCDiscreteArithmeticASEngine(process, random_number_generator)
-                    else:
-                        raise ValueError(
-                            f"Invalid average convention \"{self.average_convention}\"")
+                # the Monte Carlo case is handled by the vectorized engine, see _price_with_mc_engine
+                raise ValueError(
+                    f"No engine for asian option with numerical method {pricing_config.numerical_method}"
+                    f"with average calculation {self.average_calculation} and average type {self.average_type}")
             else:
                 raise ValueError(f"Invalid average type {self.average_type}")
         elif self.average_calculation == AverageCalculation.CONTINUOUS:
@@ -184,6 +202,59 @@ class AsianOption(Instrument):
             raise ValueError(
                 f"Invalid average calculation \"{self.average_calculation}\"")
 
+    @staticmethod
+    def _check_mc_engine_configuration(pricing_config: PricingConfiguration) -> None:
+        """
+        Rejects the pricing configurations the vectorized Monte Carlo engine does not support, rather than ignoring
+        them: the engine draws pseudo-random numbers, simulates exactly on the fixing dates, with a fixed number of
+        paths, and does not compute greeks.
+
+        :param pricing_config: The pricing configuration.
+        :type pricing_config: PricingConfiguration
+        :raises ValueError: If the configuration is not supported by the engine.
+        """
+        if pricing_config.random_number_generator not in (None, RandomNumberGenerator.PSEUDORANDOM):
+            raise ValueError(f"The Monte Carlo engine of discrete arithmetic asian options does not support the "
+                             f"random number generator \"{pricing_config.random_number_generator}\"")
+        if pricing_config.compute_greeks:
+            raise ValueError("The Monte Carlo engine of discrete arithmetic asian options does not compute greeks")
+        numerical_settings = pricing_config.get_numerical_settings()
+        for name in ('time_steps_per_year', 'monte_carlo_tolerance', 'calibration_tolerance',
+                     'calibration_max_iterations'):
+            if getattr(numerical_settings, name) is not None:
+                raise ValueError(f"The numerical setting \"{name}\" is not supported by the Monte Carlo engine of "
+                                 f"discrete arithmetic asian options")
+
+    def _price_with_mc_engine(self, market_data, static_data, seed: int,
+                              numerical_settings: NumericalSettings = None) -> dict:
+        """
+        Prices the discrete arithmetic Asian option with the vectorized Monte Carlo engine.
+
+        The engine uses the discrete geometric average price option as a control variate for average price options
+        and reports the standard error of the estimate alongside the price.
+
+        :param market_data: An object containing the market data needed to price the option.
+        :type market_data: MarketData
+        :param static_data: An object containing the static data needed to price the option.
+        :type static_data: StaticData
+        :param seed: The seed for random number generation.
+        :type seed: int
+        :param numerical_settings: The numerical settings defining the number of paths, defaults to the settings of
+                                   the engine.
+        :type numerical_settings: NumericalSettings, optional
+        :return: A dictionary containing the option price and its standard error.
+        :rtype: dict
+        """
+        bs_model = BlackScholesModel(market_data, static_data)
+        process = bs_model.setup()
+        numerical_settings = numerical_settings or NumericalSettings()
+        engine = MCDiscreteArithmeticAsianEngine(process, static_data.get_ql_day_counter(),
+                                                 number_of_paths=numerical_settings.number_of_paths or
+                                                 default_number_of_paths, seed=seed)
+        return engine.calculate(self.option_type, self.strike, self.maturity, self.future_fixing_dates,
+                                self.average_convention, self.arithmetic_running_accumulator, self.past_fixings,
+                                self.geometric_running_accumulator)
+
     # region serialization/deserialization
     def to_json(self):
         schema = AsianOptionSchema()
@@ -192,8 +263,8 @@ class AsianOption(Instrument):
     @classmethod
     def from_json(cls, json_data):
         schema = AsianOptionSchema()
-        data = schema.load(json_data)
-        return cls(**data)
+        # the schema builds the instrument after loading
+        return schema.load(json_data)
     # endregion
 
 
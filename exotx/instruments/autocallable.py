@@ -1,11 +1,78 @@
+import hashlib
+import pickle
+from collections import OrderedDict
+from typing import Tuple, Union
+
 import QuantLib as ql
 import numpy as np
 
 from exotx.data.marketdata import MarketData
+from exotx.data.static.daycounters import DayCounter, year_fractions
 from exotx.data.staticdata import StaticData
+from exotx.engines.fd_autocallable_engine import FdBlackScholesAutocallableEngine
+from exotx.engines.fd_heston_autocallable_engine import FdHestonAutocallableEngine
+from exotx.enums.enums import PricingModel, NumericalMethod, FiniteDifferencePreset, RandomNumberGenerator
 from exotx.instruments.instrument import Instrument
 from exotx.models.blackscholesmodel import BlackScholesModel
 from exotx.models.hestonmodel import HestonModel
+from exotx.models.localvolmodel import LocalVolatilityModel
+from exotx.utils.path_cache import PathCache
+from exotx.utils.path_store import SharedPathStore, PersistentPathStore
+from exotx.utils.pricing_configuration import PricingConfiguration, FiniteDifferenceSettings, NumericalSettings
+
+# number of observation schedules kept by each autocallable, e.g. while revaluing it over successive reference dates
+observation_schedule_cache_size = 4
+
+# grid sizes of the finite-difference engines, damping steps are taken after each observation date
+finite_difference_presets = {
+    PricingModel.BLACK_SCHOLES: {
+        FiniteDifferencePreset.FAST: FiniteDifferenceSettings(time_steps=50, space_steps=100, damping_steps=2),
+        FiniteDifferencePreset.STANDARD: FiniteDifferenceSettings(time_steps=200, space_steps=400, damping_steps=2),
+        FiniteDifferencePreset.ACCURATE: FiniteDifferenceSettings(time_steps=800, space_steps=1600, damping_steps=4)
+    },
+    PricingModel.HESTON: {
+        FiniteDifferencePreset.FAST: FiniteDifferenceSettings(time_steps=50, space_steps=50, variance_steps=25,
+                                                              damping_steps=2),
+        FiniteDifferencePreset.STANDARD: FiniteDifferenceSettings(time_steps=100, space_steps=100, variance_steps=50,
+                                                                  damping_steps=2),
+        FiniteDifferencePreset.ACCURATE: FiniteDifferenceSettings(time_steps=200, space_steps=200, variance_steps=100,
+                                                                  damping_steps=4)
+    }
+}
+# the local volatility engine shares the Black-Scholes grids
+finite_difference_presets[PricingModel.LOCAL_VOLATILITY] = finite_difference_presets[PricingModel.BLACK_SCHOLES]
+
+# caches and stores of the Monte Carlo paths shared by autocallables
+PathStore = Union[PathCache, SharedPathStore, PersistentPathStore]
+
+# names of the models used by the Monte Carlo simulation
+monte_carlo_model_names = {
+    PricingModel.BLACK_SCHOLES: 'black-scholes',
+    PricingModel.BLACK_SCHOLES_TERM_STRUCTURE: 'black-scholes-term-structure',
+    PricingModel.HESTON: 'heston',
+    PricingModel.LOCAL_VOLATILITY: 'local-volatility'
+}
+
+
+class ObservationSchedule:
+    """
+    The observation schedule of an autocallable seen from a reference date.
+
+    Attributes:
+        reference_date (ql.Date): The reference date.
+        coupon_dates (np.ndarray): All the coupon dates, as QuantLib dates.
+        dates (np.ndarray): The reference date followed by the remaining coupon dates, as QuantLib dates.
+        accrual_fractions (np.ndarray): The Actual/365 (Fixed) accrual fractions of the coupons paid at the
+            remaining coupon dates, each from the previous element of the dates.
+        times (np.ndarray): The times of the dates from the reference date, with the day counter of the static data.
+    """
+
+    def __init__(self, reference_date: ql.Date, coupon_dates: np.ndarray, day_counter: ql.DayCounter) -> None:
+        self.reference_date = reference_date
+        self.coupon_dates = coupon_dates
+        self.dates = np.hstack((np.array([reference_date]), coupon_dates[coupon_dates > reference_date]))
+        self.accrual_fractions = year_fractions(DayCounter.Actual365Fixed, self.dates[:-1], self.dates[1:])
+        self.times = year_fractions(day_counter, reference_date, self.dates)
 
 
 class Autocallable(Instrument):
@@ -65,12 +132,23 @@ class Autocallable(Instrument):
         # self.annual_coupon_value = annual_coupon_value
         self.has_memory = has_memory
 
+        # observation schedules by reference date, calendar, business day convention and day counter, in least recently
+        # used order
+        self._observation_schedules: 'OrderedDict[Tuple, ObservationSchedule]' = OrderedDict()
+
+    def __reduce__(self) -> tuple:
+        # pickled as constructor arguments, the observation schedules being rebuilt on first use when unpickled
+        return type(self), (self.notional, self.strike, self.autocall_barrier_level, self.annual_coupon_value,
+                            self.coupon_barrier_level, self.protection_barrier_level, self.has_memory)
+
     @staticmethod
     def _get_underlying_paths(dates: np.ndarray,
                               market_data: MarketData,
                               static_data: StaticData,
                               model: str,
-                              seed: int = 1) -> np.ndarray:
+                              seed: int = 1,
+                              path_cache: PathStore = None,
+                              numerical_settings: NumericalSettings = None) -> np.ndarray:
         """
         Generates the underlying paths for the autocallable instrument using the given market data, static data,
         and model.
@@ -85,58 +163,186 @@ class Autocallable(Instrument):
         :type model: str
         :param seed: The seed used for random number generation, defaults to 1.
         :type seed: int, optional
+        :param path_cache: The cache of the paths shared with other instruments, defaults to None.
+        :type path_cache: PathStore, optional
+        :param numerical_settings: The numerical settings of the simulation, defaults to the settings of the models.
+        :type numerical_settings: NumericalSettings, optional
         :return: The generated underlying paths.
         :rtype: np.ndarray
+        :raises ValueError: If the numerical settings define a setting the model does not support.
         """
+        numerical_settings = numerical_settings or NumericalSettings()
+        Autocallable._check_numerical_settings(model, numerical_settings)
+        if path_cache is None:
+            return Autocallable._generate_underlying_paths(dates, market_data, static_data, model, seed,
+                                                           numerical_settings)[:, 1:]
+
+        # the paths depend on the market and static data, the numerical settings, the model and the seed, the grid
+        # being the date serial numbers from the reference date, the settings the model does not support having been
+        # rejected
+        content = pickle.dumps((market_data, static_data, numerical_settings), protocol=pickle.HIGHEST_PROTOCOL)
+        key = (model.lower(), seed, hashlib.sha256(content).hexdigest())
+        grid = np.array([date.serialNumber() for date in dates])
+        paths = path_cache.get_paths(key, grid, lambda serial_numbers: Autocallable._generate_underlying_paths(
+            np.array([ql.Date(int(serial_number)) for serial_number in serial_numbers]), market_data, static_data,
+            model, seed, numerical_settings))
+        return paths[:, 1:]
+
+    @staticmethod
+    def _check_numerical_settings(model: str, numerical_settings: NumericalSettings) -> None:
+        # the number of paths is fixed, so that the paths can be shared, and the term-structure paths are simulated
+        # exactly on the observation dates
+        unsupported_settings = ['monte_carlo_tolerance']
+        if model.lower() == 'black-scholes-term-structure':
+            unsupported_settings.append('time_steps_per_year')
+        if model.lower() in ('black-scholes', 'black-scholes-term-structure', 'local-volatility'):
+            unsupported_settings.extend(['calibration_tolerance', 'calibration_max_iterations'])
+        for name in unsupported_settings:
+            if getattr(numerical_settings, name) is not None:
+                raise ValueError(f"The numerical setting \"{name}\" is not supported by the autocallable Monte Carlo "
+                                 f"simulation with the model \"{model}\"")
+
+    @staticmethod
+    def _generate_underlying_paths(dates: np.ndarray,
+                                   market_data: MarketData,
+                                   static_data: StaticData,
+                                   model: str,
+                                   seed: int = 1,
+                                   numerical_settings: NumericalSettings = None) -> np.ndarray:
         # set static data
         day_counter = static_data.get_ql_day_counter()
+        # the settings left undefined take the defaults of the models
+        numerical_settings = numerical_settings or NumericalSettings()
+        path_options = {'seed': seed}
+        if numerical_settings.number_of_paths is not None:
+            path_options['number_of_paths'] = numerical_settings.number_of_paths
+        if numerical_settings.time_steps_per_year is not None:
+            path_options['time_steps_per_year'] = numerical_settings.time_steps_per_year
 
         if model.lower() == 'black-scholes':
             black_scholes_model = BlackScholesModel(market_data, static_data)
             process = black_scholes_model.setup()
-            underlying_paths = black_scholes_model.generate_paths(
-                dates, day_counter, process, seed=seed)[:, 1:]
+            underlying_paths = black_scholes_model.generate_paths(dates, day_counter, process, **path_options)
+        elif model.lower() == 'black-scholes-term-structure':
+            black_scholes_model = BlackScholesModel(market_data, static_data)
+            underlying_paths = black_scholes_model.generate_term_structure_paths(dates, **path_options)
+        elif model.lower() == 'local-volatility':
+            # local volatilities from the volatility surface, up to the last date
+            local_volatility_model = LocalVolatilityModel(market_data, static_data)
+            local_volatility = local_volatility_model.setup(float(year_fractions(day_counter, dates[0], dates[-1])))
+            underlying_paths = local_volatility_model.generate_paths(dates, day_counter, local_volatility,
+                                                                     **path_options)
         else:
             # defaults to Heston model
             # create and calibrate the heston model based on market data
             heston_model = HestonModel(market_data, static_data)
-            process, model = heston_model.calibrate(seed=seed)
-            # generate paths for a given set of dates, exclude the current spot rate
-            underlying_paths = heston_model.generate_paths(
-                dates, day_counter, process, seed=seed)[:, 1:]
+            process, model = heston_model.calibrate(seed, numerical_settings.calibration_max_iterations,
+                                                    numerical_settings.calibration_tolerance)
+            # generate paths for a given set of dates, including the current spot rate
+            underlying_paths = heston_model.generate_paths(dates, day_counter, process, **path_options)
 
         return underlying_paths
 
-    def price(self, market_data: MarketData, static_data: StaticData, model: str, seed: int = 1):
+    @staticmethod
+    def _get_coupon_dates(reference_date: ql.Date, static_data: StaticData) -> np.ndarray:
+        """
+        Generates the semiannual coupon dates of the autocallable, from six months to three years after the reference
+        date.
+
+        :param reference_date: The start date of the schedule.
+        :type reference_date: ql.Date
+        :param static_data: The static data providing the calendar and the business day convention.
+        :type static_data: StaticData
+        :return: The coupon dates.
+        :rtype: np.ndarray
+        """
+        business_day_convention = static_data.get_default_ql_business_day_convention()
+        calendar = static_data.get_ql_calendar()
+
+        start_date = reference_date
+        first_coupon_date = calendar.advance(
+            start_date, ql.Period(6, ql.Months))
+        last_coupon_date = calendar.advance(start_date, ql.Period(3, ql.Years))
+        return np.array(list(ql.Schedule(first_coupon_date, last_coupon_date, ql.Period(ql.Semiannual),
+                                         calendar, business_day_convention, business_day_convention,
+                                         ql.DateGeneration.Forward, False)))
+
+    def _get_observation_schedule(self, reference_date: ql.Date, static_data: StaticData) -> ObservationSchedule:
+        """
+        Gets the observation schedule of the autocallable, built once per reference date, calendar, business day
+        convention and day counter. Only the most recently used schedules are kept.
+
+        :param reference_date: The reference date.
+        :type reference_date: ql.Date
+        :param static_data: The static data providing the calendar, the business day convention and the day counter.
+        :type static_data: StaticData
+        :return: The observation schedule.
+        :rtype: ObservationSchedule
+        """
+        key = (reference_date.serialNumber(), static_data.get_ql_calendar().name(),
+               static_data.business_day_convention, static_data.day_counter)
+        try:
+            self._observation_schedules.move_to_end(key)
+            return self._observation_schedules[key]
+        except KeyError:
+            coupon_dates = self._get_coupon_dates(reference_date, static_data)
+            schedule = ObservationSchedule(reference_date, coupon_dates, static_data.get_ql_day_counter())
+            self._observation_schedules[key] = schedule
+            while len(self._observation_schedules) > observation_schedule_cache_size:
+                self._observation_schedules.popitem(last=False)
+            return schedule
+
+    def price(self, market_data: MarketData, static_data: StaticData, model: str = None, seed: int = 1,
+              path_cache: PathStore = None, pricing_config: PricingConfiguration = None) -> Union[float, dict]:
         """
         Calculates the price of the autocallable instrument using the given market data, static data, and model.
 
+        The model is the name of the model used for a Monte Carlo simulation ('black-scholes',
+        'black-scholes-term-structure', 'heston' or 'local-volatility'), in which case the price is returned as a
+        float. Alternatively, a pricing configuration defines both the model and the numerical method: the
+        Black-Scholes, Heston and local volatility models can then also be solved with finite differences, which
+        returns a smooth price along with its delta and gamma when greeks are requested. The numerical settings of a
+        Monte Carlo configuration define the number of paths, the time steps per year of the Black-Scholes, Heston and
+        local volatility simulations and the calibration of the Heston model, the other settings being rejected.
+
+        The Monte Carlo paths can be shared with other autocallables on the same underlying, model and seed through a
+        path cache, so that a book of autocallables prices against one simulation, through a shared path store across
+        worker processes, or through a persistent path store across runs.
+
         :param market_data: The market data used for pricing the instrument.
         :type market_data: MarketData
         :param static_data: The static data used for pricing the instrument.
         :type static_data: StaticData
-        :param model: The model used for pricing the instrument.
-        :type model: str
+        :param model: The model used for a Monte Carlo simulation, defaults to None when a pricing configuration is
+                      given.
+        :type model: str, optional
         :param seed: The seed used for random number generation, defaults to 1.
         :type seed: int, optional
-        :return: The price of the autocallable instrument.
-        :rtype: float
+        :param path_cache: The cache of the Monte Carlo paths shared with other instruments, defaults to None.
+        :type path_cache: PathStore, optional
+        :param pricing_config: The pricing configuration, used instead of the model, defaults to None.
+        :type pricing_config: PricingConfiguration, optional
+        :return: The price of the autocallable instrument, or a dictionary containing the price and, if applicable,
+                 greeks when a pricing configuration is given.
+        :rtype: Union[float, dict]
+        :raises ValueError: If both or neither of the model and the pricing configuration are given.
         """
+        if (model is None) == (pricing_config is None):
+            raise ValueError("Exactly one of the model and the pricing configuration must be given")
+        if pricing_config is not None:
+            return self._price_with_configuration(market_data, static_data, pricing_config, seed, path_cache)
+        return self._price_with_monte_carlo(market_data, static_data, model, seed, path_cache)
+
+    def _price_with_monte_carlo(self, market_data: MarketData, static_data: StaticData, model: str, seed: int = 1,
+                                path_cache: PathStore = None, numerical_settings: NumericalSettings = None) -> float:
         reference_date: ql.Date = market_data.get_ql_reference_date()
         ql.Settings.instance().evaluationDate = reference_date
 
-        business_day_convention = static_data.get_default_ql_business_day_convention()
-        calendar = static_data.get_ql_calendar()
         day_counter = static_data.get_ql_day_counter()
 
         # coupon schedule
-        start_date = reference_date
-        first_coupon_date = calendar.advance(
-            start_date, ql.Period(6, ql.Months))
-        last_coupon_date = calendar.advance(start_date, ql.Period(3, ql.Years))
-        coupon_dates = np.array(list(ql.Schedule(first_coupon_date, last_coupon_date, ql.Period(ql.Semiannual),
-                                                 calendar, business_day_convention, business_day_convention,
-                                                 ql.DateGeneration.Forward, False)))
+        schedule = self._get_observation_schedule(reference_date, static_data)
+        coupon_dates = schedule.coupon_dates
         # create past fixings into dictionary
         past_fixings = {}
 
@@ -149,14 +355,12 @@ class Autocallable(Instrument):
             if max(past_fixings.values()) >= (self.autocall_barrier_level * self.strike):
                 return 0.0
 
-        # create date array for path generator
-        # combine valuation date and all the remaining coupon dates
-        dates = np.hstack(
-            (np.array([reference_date]), coupon_dates[coupon_dates > reference_date]))
+        # date array for path generator, valuation date and all the remaining coupon dates
+        dates = schedule.dates
 
         # get underlying paths
         paths = self._get_underlying_paths(
-            dates, market_data, static_data, model, seed)
+            dates, market_data, static_data, model, seed, path_cache, numerical_settings)
 
         # identify the past coupon dates
         past_coupon_dates = coupon_dates[coupon_dates <= reference_date]
@@ -174,6 +378,12 @@ class Autocallable(Instrument):
         expiration_date = coupon_dates[-1]
         has_memory = int(self.has_memory)
 
+        # accrual fractions and discount factors are shared by all paths
+        accrual_fractions = schedule.accrual_fractions
+        yield_curve = market_data.get_yield_curve(day_counter)
+        discount_factors = [yield_curve.discount(date) if date > reference_date else 0.0
+                            for date in coupon_dates[:accrual_fractions.shape[0]]]
+
         # loop through all simulated paths
         for path in paths:
             payoff_present_value = 0.0
@@ -181,13 +391,13 @@ class Autocallable(Instrument):
             has_auto_called = False
 
             # loop through set of coupon dates and index ratios
-            for previous_date, date, index in zip(dates, coupon_dates, path / self.strike):
+            for date, index, year_fraction, df in zip(coupon_dates, path / self.strike, accrual_fractions,
+                                                      discount_factors):
                 # if autocall event has been triggered, immediate exit from this path
                 if has_auto_called:
                     break
 
                 payoff = 0.0
-                year_fraction = ql.Actual365Fixed().yearFraction(previous_date, date)
                 # payoff calculation at expiration
                 if date == expiration_date:
                     # index is greater or equal to coupon barrier level
@@ -228,11 +438,83 @@ class Autocallable(Instrument):
 
                 # conditionally, calculate PV for period payoff, add PV to local accumulator
                 if date > reference_date:
-                    df = market_data.get_yield_curve(
-                        day_counter).discount(date)
                     payoff_present_value += payoff * df
 
             # add path PV to global accumulator
             global_pv.append(payoff_present_value)
 
         return np.mean(np.array(global_pv))
+
+    def _price_with_configuration(self, market_data: MarketData, static_data: StaticData,
+                                  pricing_config: PricingConfiguration, seed: int = 1,
+                                  path_cache: PathStore = None) -> dict:
+        if pricing_config.numerical_method == NumericalMethod.MC and pricing_config.model in monte_carlo_model_names:
+            # the paths are drawn from pseudo-random numbers, and the payoffs are not differentiated
+            if pricing_config.random_number_generator not in (None, RandomNumberGenerator.PSEUDORANDOM):
+                raise ValueError(f"The autocallable Monte Carlo simulation does not support the random number "
+                                 f"generator \"{pricing_config.random_number_generator}\"")
+            if pricing_config.compute_greeks:
+                raise ValueError("The autocallable Monte Carlo simulation does not compute greeks")
+            model = monte_carlo_model_names[pricing_config.model]
+            return {'price': self._price_with_monte_carlo(market_data, static_data, model, seed, path_cache,
+                                                          pricing_config.get_numerical_settings())}
+        if pricing_config.numerical_method == NumericalMethod.PDE and \
+                pricing_config.model in finite_difference_presets:
+            result = self._price_with_fd_engine(market_data, static_data, pricing_config, seed)
+            if pricing_config.compute_greeks:
+                return result
+            return {'price': result['price']}
+        raise ValueError(f"Invalid pricing configuration for autocallables: model \"{pricing_config.model}\" "
+                         f"with numerical method \"{pricing_config.numerical_method}\"")
+
+    def _price_with_fd_engine(self, market_data: MarketData, static_data: StaticData,
+                              pricing_config: PricingConfiguration, seed: int = 1) -> dict:
+        reference_date: ql.Date = market_data.get_ql_reference_date()
+        ql.Settings.instance().evaluationDate = reference_date
+        day_counter = static_data.get_ql_day_counter()
+
+        schedule = self._get_observation_schedule(reference_date, static_data)
+        if reference_date >= schedule.coupon_dates[-1]:
+            return {'price': 0.0, 'delta': 0.0, 'gamma': 0.0}
+        # the finite-difference engines roll back from maturity to the reference date, without past fixings
+        if np.any(schedule.coupon_dates <= reference_date):
+            raise ValueError("The finite-difference engines do not handle past fixings, all the observation dates "
+                             "must be after the reference date")
+        dates = schedule.dates
+
+        yield_curve = market_data.get_yield_curve(day_counter)
+        dividend_curve = market_data.get_dividend_curve(day_counter)
+        observation_dates = dates[1:]
+        observation_times = schedule.times[1:]
+        accrual_fractions = schedule.accrual_fractions
+        risk_free_discounts = np.array([yield_curve.discount(date) for date in observation_dates])
+        dividend_discounts = np.array([dividend_curve.discount(date) for date in observation_dates])
+
+        settings = (pricing_config.finite_difference_settings or FiniteDifferenceSettings()).resolve(
+            finite_difference_presets[pricing_config.model])
+        if pricing_config.model == PricingModel.HESTON:
+            numerical_settings = pricing_config.get_numerical_settings()
+            _, model = HestonModel(market_data, static_data).calibrate(
+                seed, numerical_settings.calibration_max_iterations, numerical_settings.calibration_tolerance)
+            engine = FdHestonAutocallableEngine(market_data.underlying_spots[0], model.v0(), model.kappa(),
+                                                model.theta(), model.sigma(), model.rho(),
+                                                time_steps=settings.time_steps,
+                                                space_steps=settings.space_steps,
+                                                variance_steps=settings.variance_steps,
+                                                damping_steps=settings.damping_steps)
+        elif pricing_config.model == PricingModel.LOCAL_VOLATILITY:
+            spot = market_data.underlying_spots[0]
+            local_volatility = LocalVolatilityModel(market_data, static_data).setup(observation_times[-1])
+            # the grid is sized with the at-the-money implied volatility at maturity
+            volatility = float(local_volatility.vol_surface.get_black_volatilities(observation_times[-1], spot))
+            engine = FdBlackScholesAutocallableEngine(spot, volatility, local_volatility=local_volatility,
+                                                      time_steps=settings.time_steps,
+                                                      space_steps=settings.space_steps,
+                                                      damping_steps=settings.damping_steps)
+        else:
+            engine = FdBlackScholesAutocallableEngine(market_data.underlying_spots[0],
+                                                      market_data.underlying_black_scholes_volatilities[0],
+                                                      time_steps=settings.time_steps,
+                                                      space_steps=settings.space_steps,
+                                                      damping_steps=settings.damping_steps)
+        return engine.calculate(self, observation_times, accrual_fractions, risk_free_discounts, dividend_discounts)
@@ -50,6 +50,30 @@ def convert_average_type_to_ql(average_type: Union[str, AverageType]):
             f"Invalid input type {type(average_type)} for average type")
 
 
+def convert_ql_to_average_type(ql_average_type: int) -> AverageType:
+    """
+    Converts a QuantLib average type to the corresponding AverageType enum value, as the inverse of
+    convert_average_type_to_ql.
+
+    :param ql_average_type: The QuantLib average type (ql.Average().Arithmetic or ql.Average().Geometric).
+    :type ql_average_type: int
+    :return: The corresponding AverageType enum value.
+    :rtype: AverageType
+    :raises ValueError: If the QuantLib average type is invalid.
+
+    Example usage:
+
+    >>> convert_ql_to_average_type(ql.Average().Geometric)
+    <AverageType.GEOMETRIC: 'geometric'>
+    """
+    if ql_average_type == ql.Average().Arithmetic:
+        return AverageType.ARITHMETIC
+    elif ql_average_type == ql.Average().Geometric:
+        return AverageType.GEOMETRIC
+    else:
+        raise ValueError(f"Invalid QuantLib average type \"{ql_average_type}\"")
+
+
 class AverageTypeField(fields.Field):
     def _serialize(self, value: AverageType, attr, obj, **kwargs) -> str:
         return value.name
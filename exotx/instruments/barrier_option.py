@@ -1,13 +1,21 @@
 from datetime import datetime
 from enum import Enum
+from typing import List, Union
 
 import QuantLib as ql
+import numpy as np
+from marshmallow import Schema, fields, post_load, validate
 
 from exotx.data.marketdata import MarketData
 from exotx.data.staticdata import StaticData
+from exotx.engines.analytic_barrier_engine import analytic_barrier_prices
+from exotx.engines.fd_barrier_engine import fd_barrier_prices
+from exotx.enums.enums import FiniteDifferencePreset
+from exotx.helpers.dates import convert_maturity_to_ql_date
 from exotx.instruments.instrument import Instrument
 from exotx.models.blackscholesmodel import BlackScholesModel
 from exotx.models.hestonmodel import HestonModel
+from exotx.utils.pricing_configuration import PricingConfiguration, FiniteDifferenceSettings, NumericalSettings
 
 
 class OptionType(Enum):
@@ -34,6 +42,29 @@ class BarrierOptionEngine(Enum):
     FDHESTONBARRIERENGINE = 'fd-heston-barrier'
 
 
+# grid sizes of the finite-difference engines, the standard presets are the QuantLib defaults
+finite_difference_presets = {
+    BarrierOptionEngine.FDBLACKSCHOLESBARRIERENGINE: {
+        FiniteDifferencePreset.FAST: FiniteDifferenceSettings(time_steps=25, space_steps=50, damping_steps=0),
+        FiniteDifferencePreset.STANDARD: FiniteDifferenceSettings(time_steps=100, space_steps=100, damping_steps=0),
+        FiniteDifferencePreset.ACCURATE: FiniteDifferenceSettings(time_steps=800, space_steps=800, damping_steps=0)
+    },
+    BarrierOptionEngine.FDBLACKSCHOLESREBATEENGINE: {
+        FiniteDifferencePreset.FAST: FiniteDifferenceSettings(time_steps=25, space_steps=50, damping_steps=0),
+        FiniteDifferencePreset.STANDARD: FiniteDifferenceSettings(time_steps=100, space_steps=100, damping_steps=0),
+        FiniteDifferencePreset.ACCURATE: FiniteDifferenceSettings(time_steps=800, space_steps=800, damping_steps=0)
+    },
+    BarrierOptionEngine.FDHESTONBARRIERENGINE: {
+        FiniteDifferencePreset.FAST: FiniteDifferenceSettings(time_steps=25, space_steps=50, variance_steps=15,
+                                                              damping_steps=0),
+        FiniteDifferencePreset.STANDARD: FiniteDifferenceSettings(time_steps=100, space_steps=100, variance_steps=50,
+                                                                  damping_steps=0),
+        FiniteDifferencePreset.ACCURATE: FiniteDifferenceSettings(time_steps=100, space_steps=200, variance_steps=100,
+                                                                  damping_steps=1)
+    }
+}
+
+
 class BarrierOption(Instrument):
     """
     BarrierOption is a class representing a barrier option financial instrument.
@@ -57,21 +88,27 @@ class BarrierOption(Instrument):
                  barrier_type: str,
                  barrier: float,
                  strike: float,
-                 maturity: str,
+                 maturity: Union[str, datetime, ql.Date],
                  exercise: str = 'european',
                  option_type: str = 'call',
                  rebate: float = 0):
         self.barrier_type = BarrierType[barrier_type.upper()]
         self.barrier = barrier
         self.strike = strike
-        self.maturity = ql.Date().from_date(datetime.strptime(maturity, "%Y-%m-%d"))
+        self.maturity = convert_maturity_to_ql_date(maturity)
         self.exercise = ExerciseType[exercise.upper()]
         self.option_type = OptionType[option_type.upper()]
         self.rebate = rebate
         self.reference_date = ql.Date().todaysDate()
         self.model = None
 
-    def price(self, market_data: MarketData, static_data: StaticData, model: str):
+    def __reduce__(self) -> tuple:
+        # pickled as primitive constructor arguments, the reference date being set again when pricing
+        return type(self), (self.barrier_type.value, self.barrier, self.strike, self.maturity.ISO(),
+                            self.exercise.value, self.option_type.value, self.rebate)
+
+    def price(self, market_data: MarketData, static_data: StaticData, model: str,
+              pricing_config: PricingConfiguration = None):
         """
         Calculates the price of the barrier option using the given market data, static data, and model.
 
@@ -81,6 +118,10 @@ class BarrierOption(Instrument):
         :type static_data: StaticData
         :param model: The pricing model used for the option.
         :type model: str
+        :param pricing_config: An optional pricing configuration, whose finite-difference settings define the grids of
+                               the finite-difference engines and whose numerical settings define the calibration of
+                               the Heston model, defaults to None.
+        :type pricing_config: PricingConfiguration, optional
         :return: The net present value (NPV) of the option.
         :rtype: float
         """
@@ -96,11 +137,117 @@ class BarrierOption(Instrument):
 
         # set pricing engine
         ql_pricing_engine = self._get_ql_pricing_engine(
-            market_data, static_data, model)
+            market_data, static_data, model, pricing_config)
         ql_option.setPricingEngine(ql_pricing_engine)
 
         return ql_option.NPV()
 
+    def price_strikes(self, strikes: List[float], market_data: MarketData, static_data: StaticData,
+                      pricing_config: PricingConfiguration = None) -> np.ndarray:
+        """
+        Calculates the prices of this barrier option for many strikes from a single finite-difference solve.
+
+        All strikes share the barrier, the rebate, the maturity and the grid, and are rolled back together under the
+        Black-Scholes model. The grid is defined by the finite-difference settings of the pricing configuration, with
+        the presets of the Black-Scholes finite-difference barrier engine.
+
+        :param strikes: The strikes to price.
+        :type strikes: List[float]
+        :param market_data: The market data used for pricing the options.
+        :type market_data: MarketData
+        :param static_data: The static data used for pricing the options.
+        :type static_data: StaticData
+        :param pricing_config: An optional pricing configuration, defaults to None.
+        :type pricing_config: PricingConfiguration, optional
+        :return: The net present values (NPV) of the options, one per strike.
+        :rtype: np.ndarray
+        :raises ValueError: If the option has an American exercise.
+        """
+        self.reference_date: ql.Date = market_data.get_ql_reference_date()
+        ql.Settings.instance().evaluationDate = self.reference_date
+        if self.exercise != ExerciseType.EUROPEAN:
+            raise ValueError("Multi-strike barrier pricing is only available for european exercise")
+
+        settings = self._get_finite_difference_settings(BarrierOptionEngine.FDBLACKSCHOLESBARRIERENGINE,
+                                                        pricing_config)
+        bs_model = BlackScholesModel(market_data, static_data)
+        process = bs_model.setup()
+        time = static_data.get_ql_day_counter().yearFraction(self.reference_date, self.maturity)
+        return fd_barrier_prices(
+            barrier_type=self._get_ql_barrier_type(),
+            option_type=self._get_ql_option_type(),
+            spot=process.x0(),
+            strikes=np.asarray(strikes, dtype=float),
+            barrier=self.barrier,
+            rebate=self.rebate,
+            time=time,
+            risk_free_rate=process.riskFreeRate().zeroRate(time, ql.Continuous, ql.NoFrequency).rate(),
+            dividend_yield=process.dividendYield().zeroRate(time, ql.Continuous, ql.NoFrequency).rate(),
+            volatility=process.blackVolatility().blackVol(time, process.x0()),
+            time_steps=settings.time_steps,
+            space_steps=settings.space_steps,
+            damping_steps=settings.damping_steps)
+
+    @staticmethod
+    def price_batch(barrier_options: List['BarrierOption'], market_data: MarketData,
+                    static_data: StaticData) -> np.ndarray:
+        """
+        Calculates the prices of many European barrier options on the same underlying in a single vectorized call.
+
+        The options are priced with the Reiner-Rubinstein closed-form formulas, which reproduce the prices of the
+        QuantLib analytic barrier engine without building one QuantLib instrument and engine per option.
+
+        :param barrier_options: The barrier options to price.
+        :type barrier_options: List[BarrierOption]
+        :param market_data: The market data used for pricing the options.
+        :type market_data: MarketData
+        :param static_data: The static data used for pricing the options.
+        :type static_data: StaticData
+        :return: The net present values (NPV) of the options, in the same order as the input.
+        :rtype: np.ndarray
+        :raises ValueError: If any option has an American exercise or an already touched barrier.
+        """
+        reference_date: ql.Date = market_data.get_ql_reference_date()
+        ql.Settings.instance().evaluationDate = reference_date
+        if any(option.exercise != ExerciseType.EUROPEAN for option in barrier_options):
+            raise ValueError("Batch barrier pricing is only available for european exercise")
+
+        bs_model = BlackScholesModel(market_data, static_data)
+        process = bs_model.setup()
+        day_counter = static_data.get_ql_day_counter()
+        times = np.array([day_counter.yearFraction(reference_date, option.maturity) for option in barrier_options])
+        # expired options are worth nothing, as with the QuantLib instruments, and have no rates nor volatilities
+        active = times > 0
+        prices = np.zeros(len(barrier_options))
+        if not np.any(active):
+            return prices
+        active_options = [option for option, is_active in zip(barrier_options, active) if is_active]
+        times = times[active]
+        strikes = np.array([option.strike for option in active_options], dtype=float)
+        # zero rates only depend on the maturity, evaluate them once per distinct maturity date
+        zero_rates = {}
+        for option, time in zip(active_options, times):
+            if option.maturity not in zero_rates:
+                zero_rates[option.maturity] = (
+                    process.riskFreeRate().zeroRate(time, ql.Continuous, ql.NoFrequency).rate(),
+                    process.dividendYield().zeroRate(time, ql.Continuous, ql.NoFrequency).rate())
+        risk_free_rates, dividend_yields = np.array([zero_rates[option.maturity] for option in active_options]).T
+        volatilities = np.array([process.blackVolatility().blackVol(time, strike)
+                                 for time, strike in zip(times, strikes)])
+
+        prices[active] = analytic_barrier_prices(
+            barrier_types=np.array([option._get_ql_barrier_type() for option in active_options]),
+            option_types=np.array([option._get_ql_option_type() for option in active_options]),
+            spot=process.x0(),
+            strikes=strikes,
+            barriers=np.array([option.barrier for option in active_options], dtype=float),
+            rebates=np.array([option.rebate for option in active_options], dtype=float),
+            times=times,
+            risk_free_rates=risk_free_rates,
+            dividend_yields=dividend_yields,
+            volatilities=volatilities)
+        return prices
+
     def _get_ql_barrier_type(self) -> ql.Barrier:
         if self.barrier_type == BarrierType.UPANDIN:
             return ql.Barrier.UpIn
@@ -111,7 +258,16 @@ class BarrierOption(Instrument):
         else:
             return ql.Barrier.DownOut
 
-    def _get_ql_pricing_engine(self, market_data: MarketData, static_data: StaticData, model: str):
+    @staticmethod
+    def _get_finite_difference_settings(engine: BarrierOptionEngine,
+                                        pricing_config: PricingConfiguration = None) -> FiniteDifferenceSettings:
+        settings = None
+        if pricing_config is not None:
+            settings = pricing_config.finite_difference_settings
+        return (settings or FiniteDifferenceSettings()).resolve(finite_difference_presets[engine])
+
+    def _get_ql_pricing_engine(self, market_data: MarketData, static_data: StaticData, model: str,
+                               pricing_config: PricingConfiguration = None):
         model = model.lower()
         assert model in [engine.value for engine in BarrierOptionEngine]
         engine = BarrierOptionEngine(model)
@@ -123,15 +279,24 @@ class BarrierOption(Instrument):
         elif engine == BarrierOptionEngine.FDBLACKSCHOLESBARRIERENGINE:
             bs_model = BlackScholesModel(market_data, static_data)
             process = bs_model.setup()
-            return ql.FdBlackScholesBarrierEngine(process)
+            settings = self._get_finite_difference_settings(engine, pricing_config)
+            return ql.FdBlackScholesBarrierEngine(process, settings.time_steps, settings.space_steps,
+                                                  settings.damping_steps)
         elif engine == BarrierOptionEngine.FDBLACKSCHOLESREBATEENGINE:
             bs_model = BlackScholesModel(market_data, static_data)
             process = bs_model.setup()
-            return ql.FdBlackScholesRebateEngine(process)
+            settings = self._get_finite_difference_settings(engine, pricing_config)
+            return ql.FdBlackScholesRebateEngine(process, settings.time_steps, settings.space_steps,
+                                                 settings.damping_steps)
         elif engine == BarrierOptionEngine.FDHESTONBARRIERENGINE:
             heston_model = HestonModel(market_data, static_data)
-            _, model = heston_model.calibrate()
-            return ql.FdHestonBarrierEngine(model)
+            numerical_settings = NumericalSettings() if pricing_config is None else \
+                pricing_config.get_numerical_settings()
+            _, model = heston_model.calibrate(max_iterations=numerical_settings.calibration_max_iterations,
+                                              tolerance=numerical_settings.calibration_tolerance)
+            settings = self._get_finite_difference_settings(engine, pricing_config)
+            return ql.FdHestonBarrierEngine(model, settings.time_steps, settings.space_steps, settings.variance_steps,
+                                            settings.damping_steps)
         else:
             raise NotImplementedError
 
@@ -151,3 +316,51 @@ class BarrierOption(Instrument):
             return ql.EuropeanExercise(self.maturity)
         else:
             return ql.AmericanExercise(self.reference_date, self.maturity)
+
+
+# region Schema
+class BarrierOptionSchema(Schema):
+    """
+    BarrierOptionSchema is a Marshmallow schema class for deserializing and validating JSON data into a BarrierOption
+    object.
+
+    Fields:
+    - barrier_type (str): The barrier type, one of "downandin", "downandout", "upandin" or "upandout".
+    - barrier (float): The barrier level.
+    - strike (float): The option's strike price.
+    - maturity (date): The option's maturity date in the format "YYYY-MM-DD".
+    - exercise (str): The exercise style, either "european" or "american", defaults to "european".
+    - option_type (str): The option type, either "call" or "put", defaults to "call".
+    - rebate (float): The rebate amount, defaults to 0.
+
+    Example usage:
+
+    >>> barrier_option_data = {
+    ...     "barrier_type": "downandout",
+    ...     "barrier": 80.0,
+    ...     "strike": 100.0,
+    ...     "maturity": "2023-05-10"
+    ... }
+    >>> barrier_option = BarrierOptionSchema().load(barrier_option_data)
+    """
+    barrier_type = fields.String(required=True, validate=validate.OneOf([e.value for e in BarrierType]))
+    barrier = fields.Float(required=True)
+    strike = fields.Float(required=True)
+    maturity = fields.Date(format="%Y-%m-%d", required=True)
+    exercise = fields.String(load_default='european', validate=validate.OneOf([e.value for e in ExerciseType]))
+    option_type = fields.String(load_default='call', validate=validate.OneOf([e.value for e in OptionType]))
+    rebate = fields.Float(load_default=0.0)
+
+    @post_load
+    def make_barrier_option(self, data, **kwargs) -> BarrierOption:
+        """
+        Constructs a BarrierOption instance from the deserialized data.
+
+        :param data: A dictionary containing the deserialized data for the barrier option.
+        :type data: dict
+        :param kwargs: Additional keyword arguments.
+        :return: A BarrierOption instance created from the deserialized data.
+        :rtype: BarrierOption
+        """
+        return BarrierOption(**data)
+# endregion
@@ -8,9 +8,14 @@ from exotx.enums.enums import RandomNumberGenerator
 from exotx.helpers.dates import convert_maturity_to_ql_date
 from exotx.instruments.basket_type import BasketType, convert_basket_type, BasketTypeField
 from exotx.instruments.instrument import Instrument
-from exotx.instruments.option_type import convert_option_type_to_ql, OptionType, OptionTypeField
+from exotx.instruments.option_type import convert_option_type_to_ql, convert_ql_to_option_type, OptionType, \
+    OptionTypeField
 from exotx.utils.pricing_configuration import PricingConfiguration
 
+# settings of the Monte Carlo engine, unless defined by the numerical settings
+default_number_of_paths = 100000
+default_time_steps_per_year = 1
+
 
 class BasketOption(Instrument):
     """
@@ -46,6 +51,11 @@ class BasketOption(Instrument):
         self.option_type = convert_option_type_to_ql(option_type)
         self.basket_type = convert_basket_type(basket_type)
 
+    def __reduce__(self) -> tuple:
+        # pickled as primitive constructor arguments, the QuantLib objects being rebuilt when unpickling
+        return type(self), (self.strike, self.maturity.ISO(), convert_ql_to_option_type(self.option_type).value,
+                            self.basket_type.value)
+
     def price(self, market_data, static_data, pricing_config: PricingConfiguration, seed: int = 1) -> dict:
         """
         Calculates the price and optionally the greeks (delta, gamma, and theta) for the basket option using the 
@@ -127,13 +137,16 @@ class BasketOption(Instrument):
         and volatilities provided by the MarketData instance. The processes are then combined into a StochasticProcessArray,
         taking into account the correlation matrix from the MarketData instance.
 
-        Finally, a MCEuropeanBasketEngine is constructed using the StochasticProcessArray, along with the specified
-        random number generator, time steps per year, required samples, and random seed.
+        Finally, a MCEuropeanBasketEngine is constructed using the StochasticProcessArray, along with the random number
+        generator of the pricing configuration, the time steps per year, required samples and required tolerance of
+        its numerical settings, and the random seed.
 
         Args:
             market_data (MarketData): A MarketData instance containing the required market data, including underlying
                                       spot prices, volatilities, and the correlation matrix.
             static_data (StaticData): A StaticData instance containing static information such as calendar and day counter.
+            pricing_config (PricingConfiguration): The pricing configuration, with the random number generator and the
+                                                   numerical settings of the simulations.
             seed (int): A random seed for the Monte Carlo simulations.
 
         Returns:
@@ -163,8 +176,13 @@ class BasketOption(Instrument):
             processes, market_data.get_correlation_matrix())
 
         # TODO: Consider different pricing engines based on self.basket_type and/or pricing_config
-        return ql.MCEuropeanBasketEngine(multi_processes, RandomNumberGenerator.PSEUDORANDOM.value, timeStepsPerYear=1,
-                                         requiredSamples=100000, seed=seed)
+        random_number_generator = pricing_config.random_number_generator or RandomNumberGenerator.PSEUDORANDOM
+        numerical_settings = pricing_config.get_numerical_settings()
+        return ql.MCEuropeanBasketEngine(
+            multi_processes, random_number_generator.value,
+            timeStepsPerYear=numerical_settings.time_steps_per_year or default_time_steps_per_year,
+            requiredSamples=numerical_settings.number_of_paths or default_number_of_paths,
+            requiredTolerance=numerical_settings.monte_carlo_tolerance, seed=seed)
 
 
 # region Schema
@@ -0,0 +1,473 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from enum import Enum
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Type, Union
+
+import QuantLib as ql
+import numpy as np
+from marshmallow import ValidationError
+
+from exotx.helpers.dates import ql_serial_epoch
+from exotx.instruments.asian_option import AsianOption
+from exotx.instruments.average_calculation import AverageCalculation
+from exotx.instruments.average_convention import AverageConvention
+from exotx.instruments.average_type import AverageType
+from exotx.instruments.barrier_option import BarrierOption, BarrierType, ExerciseType
+from exotx.instruments.barrier_option import OptionType as BarrierOptionType
+from exotx.instruments.basket_option import BasketOption
+from exotx.instruments.basket_type import BasketType
+from exotx.instruments.instrument import Instrument
+from exotx.instruments.option_type import OptionType
+from exotx.instruments.vanilla_option import VanillaOption
+
+# error messages of the marshmallow fields, so that both loaders report the same errors
+missing_field_message = "Missing data for required field."
+unknown_field_message = "Unknown field."
+# marker of the fields not given by a trade
+_missing = object()
+
+# column errors, as lists of messages by row
+ColumnErrors = Dict[int, List[str]]
+
+
+def _get_null_values(values: Sequence) -> np.ndarray:
+    # None and NaN values, which stand for missing values in tables
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'f':
+        return np.isnan(values)
+    elif isinstance(values, np.ndarray) and values.dtype.kind == 'M':
+        return np.isnat(values)
+    return np.array([value is None or (isinstance(value, float) and value != value) for value in values], dtype=bool)
+
+
+# region columns
+class Column(ABC):
+    """
+    A field of a columnar schema, validating the values of the field for all the trades at once.
+
+    Attributes:
+        required (bool): Whether the field must be given for every trade.
+        default (Any): The value of the field when it is not given.
+    """
+
+    def __init__(self, required: bool = True, default: Any = None) -> None:
+        self.required = required
+        self.default = default
+
+    @abstractmethod
+    def parse(self, values: List[Any]) -> Tuple[np.ndarray, ColumnErrors]:
+        """
+        Validates the values of the field and converts them to an array.
+
+        :param values: The values of the field, one per trade.
+        :type values: List[Any]
+        :return: The converted values and the error messages of the invalid values, by row.
+        :rtype: Tuple[np.ndarray, ColumnErrors]
+        """
+
+    def to_python(self, value: Any) -> Any:
+        """
+        Converts a value of the column to the argument expected by the constructor of the instrument.
+
+        :param value: A value of the column.
+        :return: The constructor argument.
+        """
+        return value
+
+
+class FloatColumn(Column):
+    """A column of floats, optionally bounded from below."""
+
+    def __init__(self, required: bool = True, default: Optional[float] = None, minimum: Optional[float] = None) -> None:
+        super().__init__(required, default)
+        self.minimum = minimum
+
+    def parse(self, values: List[Any]) -> Tuple[np.ndarray, ColumnErrors]:
+        errors: ColumnErrors = {}
+        try:
+            array = np.array(values, dtype=float)
+        except (TypeError, ValueError):
+            # slow path, only taken to report the invalid values
+            array = np.full(len(values), np.nan)
+            for row, value in enumerate(values):
+                try:
+                    array[row] = float(value)
+                except (TypeError, ValueError):
+                    errors[row] = ["Not a valid number."]
+        for row in np.flatnonzero(~np.isfinite(array)):
+            errors.setdefault(int(row), ["Special numeric values (nan or infinity) are not permitted."])
+        if self.minimum is not None:
+            for row in np.flatnonzero(array < self.minimum):
+                errors[int(row)] = [f"Must be greater than or equal to {self.minimum}."]
+        return array, errors
+
+    def to_python(self, value: Any) -> float:
+        return float(value)
+
+
+class IntegerColumn(FloatColumn):
+    """A column of integers, stored as floats so that missing values can be validated first."""
+
+    def parse(self, values: List[Any]) -> Tuple[np.ndarray, ColumnErrors]:
+        array, errors = super().parse(values)
+        for row in np.flatnonzero(np.isfinite(array) & (array != np.round(array))):
+            errors[int(row)] = ["Not a valid integer."]
+        return array, errors
+
+    def to_python(self, value: Any) -> int:
+        return int(value)
+
+
+class DateColumn(Column):
+    """A column of dates given as strings in the format YYYY-MM-DD, stored as NumPy datetime64 values."""
+
+    def parse(self, values: List[Any]) -> Tuple[np.ndarray, ColumnErrors]:
+        errors: ColumnErrors = {}
+        if isinstance(values, np.ndarray) and values.dtype.kind == 'M':
+            # dates of columnar files
+            array = values.astype('datetime64[D]')
+            for row in np.flatnonzero(np.isnat(array)):
+                errors[int(row)] = ["Not a valid date."]
+            return array, errors
+        strings = np.array(values, dtype=object)
+        is_string = np.array([isinstance(value, str) for value in values], dtype=bool)
+        array = np.full(len(values), np.datetime64('NaT'), dtype='datetime64[D]')
+        try:
+            array[is_string] = np.array(strings[is_string], dtype='datetime64[D]')
+            # NumPy also parses partial and longer ISO strings, which are invalid in the YYYY-MM-DD format
+            is_valid = is_string.copy()
+            is_valid[is_string] = np.datetime_as_string(array[is_string]) == strings[is_string].astype(str)
+        except ValueError:
+            # slow path, only taken to report the invalid values
+            is_valid = is_string.copy()
+            for row in np.flatnonzero(is_string):
+                try:
+                    array[row] = np.datetime64(strings[row], 'D')
+                    is_valid[row] = str(array[row]) == strings[row]
+                except ValueError:
+                    is_valid[row] = False
+        for row in np.flatnonzero(~is_valid):
+            array[row] = np.datetime64('NaT')
+            errors[int(row)] = ["Not a valid date."]
+        return array, errors
+
+    def to_python(self, value: np.datetime64) -> ql.Date:
+        return ql.Date(int((value - ql_serial_epoch).astype(np.int64)))
+
+
+class DateListColumn(Column):
+    """A column of lists of dates given as strings in the format YYYY-MM-DD, stored as an object array of arrays."""
+
+    def __init__(self, required: bool = False, default: Any = None) -> None:
+        super().__init__(required, default)
+        self._date_column = DateColumn()
+
+    def parse(self, values: List[Any]) -> Tuple[np.ndarray, ColumnErrors]:
+        errors: ColumnErrors = {}
+        array = np.empty(len(values), dtype=object)
+        for row, value in enumerate(values):
+            if value is None:
+                continue
+            if not isinstance(value, (list, tuple)):
+                errors[row] = ["Not a valid list."]
+                continue
+            array[row], date_errors = self._date_column.parse(list(value))
+            if date_errors:
+                errors[row] = [f"Not a valid date at position {position}." for position in date_errors]
+        return array, errors
+
+    def to_python(self, value: Optional[np.ndarray]) -> Optional[List[ql.Date]]:
+        return None if value is None else [self._date_column.to_python(date) for date in value]
+
+
+class EnumColumn(Column):
+    """A column of enumeration members given by name or value, case-insensitively, stored as member indices."""
+
+    def __init__(self, enum: Type[Enum], required: bool = True, default: Optional[Enum] = None) -> None:
+        super().__init__(required, None if default is None else list(enum).index(default))
+        self.members = list(enum)
+        self._indices: Dict[str, int] = {}
+        for index, member in enumerate(self.members):
+            self._indices[member.name.upper()] = index
+            self._indices[str(member.value).upper()] = index
+
+    def parse(self, values: List[Any]) -> Tuple[np.ndarray, ColumnErrors]:
+        errors: ColumnErrors = {}
+        indices = self._indices
+        array = np.array([indices.get(value.upper(), -1) if isinstance(value, str) else
+                          (value if isinstance(value, int) and 0 <= value < len(self.members) else -1)
+                          for value in values], dtype=np.int64)
+        for row in np.flatnonzero(array < 0):
+            errors[int(row)] = [f"Invalid value \"{values[row]}\", expected one of "
+                                f"{[member.name for member in self.members]}"]
+        return array, errors
+
+    def to_python(self, value: int) -> Enum:
+        return self.members[value]
+
+
+# endregion
+
+
+class ColumnarSchema:
+    """
+    A schema validating a list of trades of one instrument type column by column.
+
+    The trades are validated as marshmallow schemas do, unknown and missing fields included, but each field is
+    validated for all the trades at once, so that the trades are loaded as NumPy columns. The instruments are built
+    from the columns on demand only.
+
+    Attributes:
+        columns (Dict[str, Column]): The columns by field name.
+        factory (Callable[..., Instrument]): The callable building an instrument from the values of one trade.
+    """
+
+    def __init__(self, columns: Dict[str, Column], factory: Callable[..., Instrument]) -> None:
+        self.columns = columns
+        self.factory = factory
+
+    def load(self, trades: List[Dict[str, Any]],
+             ignored_fields: Tuple[str, ...] = ()) -> Tuple[Dict[str, np.ndarray], Dict[int, Dict[str, List[str]]]]:
+        """
+        Validates the trades and converts them to columns.
+
+        :param trades: The trades, as dictionaries of field values.
+        :type trades: List[Dict[str, Any]]
+        :param ignored_fields: The fields which are not validated, such as the instrument type, defaults to none.
+        :type ignored_fields: Tuple[str, ...], optional
+        :return: The columns by field name and the error messages by trade position and field name.
+        :rtype: Tuple[Dict[str, np.ndarray], Dict[int, Dict[str, List[str]]]]
+        """
+        errors: Dict[int, Dict[str, List[str]]] = {}
+        known_fields = set(self.columns).union(ignored_fields)
+        for row, trade in enumerate(trades):
+            for name in trade.keys() - known_fields:
+                errors.setdefault(row, {})[name] = [unknown_field_message]
+
+        columns = {}
+        for name, column in self.columns.items():
+            values = [trade.get(name, _missing) for trade in trades]
+            missing_rows = [row for row, value in enumerate(values) if value is _missing]
+            for row in missing_rows:
+                if column.required:
+                    errors.setdefault(row, {})[name] = [missing_field_message]
+                # the missing values are replaced before parsing, so that they are not reported twice
+                values[row] = column.default if not column.required else self._placeholder(column)
+            columns[name], column_errors = column.parse(values)
+            for row, messages in column_errors.items():
+                errors.setdefault(row, {}).setdefault(name, messages)
+        return columns, errors
+
+    def load_columns(self, columns: Mapping[str, Sequence],
+                     size: int) -> Tuple[Dict[str, np.ndarray], Dict[Union[int, str], Any]]:
+        """
+        Validates trades given as columns, such as the columns of a table, and converts them to NumPy columns.
+
+        Null values, None or NaN, stand for the values which are not given, so that the default values of the optional
+        fields are used.
+
+        :param columns: The values of the trades by field name.
+        :type columns: Mapping[str, Sequence]
+        :param size: The number of trades.
+        :type size: int
+        :return: The columns by field name and the error messages, by field name for the whole columns and by trade
+                 position and field name for the values.
+        :rtype: Tuple[Dict[str, np.ndarray], Dict[Union[int, str], Any]]
+        """
+        errors: Dict[Union[int, str], Any] = {name: [unknown_field_message] for name in columns
+                                              if name not in self.columns}
+        loaded_columns = {}
+        for name, column in self.columns.items():
+            if name not in columns:
+                if column.required:
+                    errors[name] = [missing_field_message]
+                    continue
+                values = [column.default] * size
+            else:
+                values = columns[name]
+                if len(values) != size:
+                    errors[name] = [f"Invalid length {len(values)}, expected {size}."]
+                    continue
+                is_null = _get_null_values(values)
+                # null dates of date columns are reported as invalid dates
+                if np.any(is_null) and not (isinstance(values, np.ndarray) and values.dtype.kind == 'M'):
+                    values = list(values)
+                    for row in np.flatnonzero(is_null):
+                        if column.required:
+                            errors.setdefault(int(row), {})[name] = [missing_field_message]
+                        values[row] = column.default if not column.required else self._placeholder(column)
+            loaded_columns[name], column_errors = column.parse(values)
+            for row, messages in column_errors.items():
+                errors.setdefault(row, {}).setdefault(name, messages)
+        return loaded_columns, errors
+
+    @staticmethod
+    def _placeholder(column: Column) -> Any:
+        # a valid value for the columns of missing required fields
+        if isinstance(column, DateColumn):
+            return '1970-01-01'
+        elif isinstance(column, EnumColumn):
+            return 0
+        return 0.0
+
+    def build(self, columns: Dict[str, np.ndarray], row: int) -> Instrument:
+        """
+        Builds the instrument of one trade from the columns.
+
+        :param columns: The columns by field name.
+        :type columns: Dict[str, np.ndarray]
+        :param row: The position of the trade in the columns.
+        :type row: int
+        :return: The instrument.
+        :rtype: Instrument
+        """
+        return self.factory(**{name: column.to_python(columns[name][row]) for name, column in self.columns.items()})
+
+
+# columnar schemas by instrument type, with the same fields as the marshmallow schemas of the instruments
+columnar_schemas: Dict[str, ColumnarSchema] = {
+    'vanilla_option': ColumnarSchema({
+        'strike': FloatColumn(minimum=0.0),
+        'maturity': DateColumn(),
+        'option_type': EnumColumn(OptionType)
+    }, VanillaOption),
+    'asian_option': ColumnarSchema({
+        'strike': FloatColumn(minimum=0.0),
+        'maturity': DateColumn(),
+        'option_type': EnumColumn(OptionType),
+        'average_type': EnumColumn(AverageType),
+        'average_calculation': EnumColumn(AverageCalculation),
+        'average_convention': EnumColumn(AverageConvention),
+        'arithmetic_running_accumulator': FloatColumn(required=False, default=0.0),
+        'geometric_running_accumulator': FloatColumn(required=False, default=1.0),
+        'past_fixings': IntegerColumn(required=False, default=0, minimum=0),
+        'future_fixing_dates': DateListColumn()
+    }, AsianOption),
+    'basket_option': ColumnarSchema({
+        'strike': FloatColumn(minimum=0.0),
+        'maturity': DateColumn(),
+        'option_type': EnumColumn(OptionType),
+        'basket_type': EnumColumn(BasketType)
+    }, BasketOption),
+    'barrier_option': ColumnarSchema({
+        'barrier_type': EnumColumn(BarrierType),
+        'barrier': FloatColumn(),
+        'strike': FloatColumn(),
+        'maturity': DateColumn(),
+        'exercise': EnumColumn(ExerciseType, required=False, default=ExerciseType.EUROPEAN),
+        'option_type': EnumColumn(BarrierOptionType, required=False, default=BarrierOptionType.CALL),
+        'rebate': FloatColumn(required=False, default=0.0)
+    }, lambda barrier_type, exercise, option_type, **kwargs: BarrierOption(
+        barrier_type.value, exercise=exercise.value, option_type=option_type.value, **kwargs))
+}
+
+
+class InstrumentBatch(Sequence):
+    """
+    A sequence of instruments loaded in bulk, stored as columns and built on first access.
+
+    Attributes:
+        instrument_types (np.ndarray): The instrument type of each trade.
+        rows (np.ndarray): The position of each trade in the columns of its instrument type.
+    """
+
+    def __init__(self, instrument_types: np.ndarray, rows: np.ndarray,
+                 columns: Dict[str, Dict[str, np.ndarray]]) -> None:
+        self.instrument_types = instrument_types
+        self.rows = rows
+        self._columns = columns
+        self._instruments: Dict[int, Instrument] = {}
+
+    def __reduce__(self) -> tuple:
+        # pickled as columns only, the instruments being built on first access when unpickled
+        return type(self), (self.instrument_types, self.rows, self._columns)
+
+    def __len__(self) -> int:
+        return self.rows.shape[0]
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Instrument, List[Instrument]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self))[index]
+        try:
+            return self._instruments[index]
+        except KeyError:
+            instrument_type = self.instrument_types[index]
+            instrument = columnar_schemas[instrument_type].build(self._columns[instrument_type],
+                                                                 int(self.rows[index]))
+            # keep the first instrument built if another thread built it concurrently
+            return self._instruments.setdefault(index, instrument)
+
+    def get_columns(self, instrument_type: str) -> Dict[str, np.ndarray]:
+        """
+        Gets the columns of the trades of one instrument type, in the order of the trades.
+
+        :param instrument_type: The instrument type.
+        :type instrument_type: str
+        :return: The columns by field name, empty when there is no trade of this type.
+        :rtype: Dict[str, np.ndarray]
+        """
+        return self._columns.get(instrument_type, {})
+
+    def is_built(self, index: int) -> bool:
+        """
+        Checks whether the instrument of a trade has already been built.
+
+        :param index: The position of the trade.
+        :type index: int
+        :return: True if the instrument has been built, False otherwise.
+        :rtype: bool
+        """
+        return index in self._instruments
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(trades={len(self)}, instrument_types={sorted(self._columns)})"
+
+
+def load_instruments(trades: List[Dict[str, Any]],
+                     instrument_type: Optional[str] = None,
+                     instrument_type_key: str = 'instrument_type') -> InstrumentBatch:
+    """
+    Validates a list of trades in bulk and loads them as instruments built on demand.
+
+    The trades are dispatched on their instrument type, then validated column by column with the columnar schema of
+    their instrument type, instead of one marshmallow schema load and one instrument construction per trade.
+
+    :param trades: The trades, as dictionaries of field values in the format of the marshmallow schemas.
+    :type trades: List[Dict[str, Any]]
+    :param instrument_type: The instrument type of all the trades, defaults to the type given by each trade.
+    :type instrument_type: str, optional
+    :param instrument_type_key: The field holding the instrument type of each trade, defaults to 'instrument_type'.
+    :type instrument_type_key: str, optional
+    :return: The instruments.
+    :rtype: InstrumentBatch
+    :raises ValidationError: If any trade is invalid, with the error messages by trade position and field name.
+
+    Example usage:
+
+    >>> instruments = load_instruments([{'strike': 100.0, 'maturity': '2023-05-10', 'option_type': 'call'}],
+    ...                                instrument_type='vanilla_option')
+    >>> instruments.get_columns('vanilla_option')['strike']
+    array([100.])
+    """
+    errors: Dict[int, Dict[str, List[str]]] = {}
+    if instrument_type is None:
+        instrument_types = np.array([trade.get(instrument_type_key) for trade in trades], dtype=object)
+    else:
+        instrument_types = np.full(len(trades), instrument_type, dtype=object)
+    rows = np.zeros(len(trades), dtype=np.int64)
+    columns = {}
+    for name in dict.fromkeys(instrument_types):
+        positions = np.flatnonzero(instrument_types == name)
+        if name not in columnar_schemas:
+            for position in positions:
+                errors[int(position)] = {instrument_type_key: [f"Invalid instrument type \"{name}\", expected one "
+                                                               f"of {list(columnar_schemas)}"]}
+            continue
+        rows[positions] = np.arange(positions.shape[0])
+        columns[name], schema_errors = columnar_schemas[name].load([trades[position] for position in positions],
+                                                                   (instrument_type_key,))
+        for row, messages in schema_errors.items():
+            errors[int(positions[row])] = messages
+    if errors:
+        raise ValidationError(dict(sorted(errors.items())))
+    return InstrumentBatch(instrument_types, rows, columns)
@@ -54,6 +54,30 @@ def convert_option_type_to_ql(option_type: Union[str, OptionType]) -> ql.Option:
             f"Invalid input type {type(option_type)} for option type")
 
 
+def convert_ql_to_option_type(ql_option_type: int) -> OptionType:
+    """
+    Converts a QuantLib option type to the corresponding OptionType enum value, as the inverse of
+    convert_option_type_to_ql.
+
+    :param ql_option_type: The QuantLib option type (ql.Option.Call or ql.Option.Put).
+    :type ql_option_type: int
+    :return: The corresponding OptionType enum value.
+    :rtype: OptionType
+    :raises ValueError: If the QuantLib option type is invalid.
+
+    Example usage:
+
+    >>> convert_ql_to_option_type(ql.Option.Put)
+    <OptionType.PUT: 'put'>
+    """
+    if ql_option_type == ql.Option.Call:
+        return OptionType.CALL
+    elif ql_option_type == ql.Option.Put:
+        return OptionType.PUT
+    else:
+        raise ValueError(f"Invalid QuantLib option type \"{ql_option_type}\"")
+
+
 class OptionTypeField(fields.Field):
     def _serialize(self, value: OptionType, attr, obj, **kwargs) -> str:
         return value.name
@@ -0,0 +1,320 @@
+from collections.abc import Sequence
+from typing import Any, Dict, List, Mapping, Tuple, Union
+
+import QuantLib as ql
+import numpy as np
+from marshmallow import ValidationError
+
+from exotx.data.marketdata import MarketData
+from exotx.data.static.daycounters import year_fractions
+from exotx.data.staticdata import StaticData
+from exotx.engines.analytic_barrier_engine import analytic_barrier_prices
+from exotx.engines.analytic_european_engine import analytic_european_prices
+from exotx.helpers.dates import convert_dates_to_datetime64
+from exotx.instruments.barrier_option import BarrierType, ExerciseType
+from exotx.instruments.barrier_option import OptionType as BarrierOptionType
+from exotx.instruments.bulk_loader import ColumnarSchema, columnar_schemas
+from exotx.instruments.instrument import Instrument
+from exotx.instruments.option_type import OptionType
+from exotx.models.blackscholesmodel import BlackScholesModel
+
+# QuantLib types of the enumeration members, looked up with the member indices of the columns
+_ql_option_types = {
+    OptionType.CALL: ql.Option.Call,
+    OptionType.PUT: ql.Option.Put,
+    BarrierOptionType.CALL: ql.Option.Call,
+    BarrierOptionType.PUT: ql.Option.Put
+}
+_ql_barrier_types = {
+    BarrierType.DOWNANDIN: ql.Barrier.DownIn,
+    BarrierType.DOWNANDOUT: ql.Barrier.DownOut,
+    BarrierType.UPANDIN: ql.Barrier.UpIn,
+    BarrierType.UPANDOUT: ql.Barrier.UpOut
+}
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError("Reading Arrow tables and Parquet files requires pyarrow, install it with "
+                          "'pip install pyarrow'") from error
+    return pyarrow
+
+
+class Portfolio(Sequence):
+    """
+    A portfolio of trades of one instrument type, stored as one NumPy column per field.
+
+    The trades are validated column by column with the columnar schema of their instrument type, so that tables read
+    from CSV, Arrow or Parquet files are loaded without one dictionary and one instrument per trade. The vectorized
+    engines price the whole portfolio from the columns, and the instruments of the trades are built on demand only.
+
+    Dates are stored as datetime64[D] values and enumerations as the indices of their members.
+
+    Attributes:
+        instrument_type (str): The instrument type of the trades.
+        columns (Dict[str, np.ndarray]): The columns by field name.
+    """
+
+    def __init__(self, instrument_type: str, columns: Dict[str, np.ndarray]) -> None:
+        if instrument_type not in columnar_schemas:
+            raise ValueError(f"Invalid instrument type \"{instrument_type}\", expected one of "
+                             f"{list(columnar_schemas)}")
+        self.instrument_type = instrument_type
+        self.columns = columns
+        self._schema: ColumnarSchema = columnar_schemas[instrument_type]
+        self._instruments: Dict[int, Instrument] = {}
+
+    def __reduce__(self) -> tuple:
+        # pickled as columns only, the instruments being built on first access when unpickled
+        return type(self), (self.instrument_type, self.columns)
+
+    # region constructors
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any], instrument_type: str) -> 'Portfolio':
+        """
+        Validates and loads trades given as columns of values.
+
+        Null values, None or NaN, stand for the values which are not given, so that the default values of the optional
+        fields are used.
+
+        :param columns: The values of the trades by field name, in the format of the marshmallow schemas, dates being
+                        given either as strings in the format YYYY-MM-DD or as datetime64 arrays.
+        :type columns: Mapping[str, Any]
+        :param instrument_type: The instrument type of the trades.
+        :type instrument_type: str
+        :return: The portfolio.
+        :rtype: Portfolio
+        :raises ValidationError: If any column or trade is invalid, with the error messages by field name for the
+                                 columns and by trade position and field name for the trades.
+
+        Example usage:
+
+        >>> portfolio = Portfolio.from_columns({'strike': [90.0, 100.0], 'maturity': ['2023-05-10', '2023-11-10'],
+        ...                                   'option_type': ['call', 'put']}, 'vanilla_option')
+        >>> portfolio.columns['maturity']
+        array(['2023-05-10', '2023-11-10'], dtype='datetime64[D]')
+        """
+        if instrument_type not in columnar_schemas:
+            raise ValueError(f"Invalid instrument type \"{instrument_type}\", expected one of "
+                             f"{list(columnar_schemas)}")
+        sizes = {len(values) for values in columns.values()}
+        if len(sizes) > 1:
+            raise ValidationError(f"Columns of different lengths {sorted(sizes)}")
+        loaded_columns, errors = columnar_schemas[instrument_type].load_columns(columns, sizes.pop() if sizes else 0)
+        if errors:
+            # errors of whole columns first, then errors of trades in order
+            column_errors = {key: messages for key, messages in errors.items() if isinstance(key, str)}
+            trade_errors = sorted((key, messages) for key, messages in errors.items() if isinstance(key, int))
+            raise ValidationError({**column_errors, **dict(trade_errors)})
+        return cls(instrument_type, loaded_columns)
+
+    @classmethod
+    def from_records(cls, trades: List[Dict[str, Any]], instrument_type: str) -> 'Portfolio':
+        """
+        Validates and loads trades given as dictionaries of field values.
+
+        :param trades: The trades, in the format of the marshmallow schemas.
+        :type trades: List[Dict[str, Any]]
+        :param instrument_type: The instrument type of the trades.
+        :type instrument_type: str
+        :return: The portfolio.
+        :rtype: Portfolio
+        :raises ValidationError: If any trade is invalid, with the error messages by trade position and field name.
+        """
+        if instrument_type not in columnar_schemas:
+            raise ValueError(f"Invalid instrument type \"{instrument_type}\", expected one of "
+                             f"{list(columnar_schemas)}")
+        columns, errors = columnar_schemas[instrument_type].load(trades)
+        if errors:
+            raise ValidationError(dict(sorted(errors.items())))
+        return cls(instrument_type, columns)
+
+    @classmethod
+    def from_data_frame(cls, data_frame, instrument_type: str) -> 'Portfolio':
+        """
+        Validates and loads trades given as the rows of a pandas data frame.
+
+        :param data_frame: The trades, with one column per field.
+        :type data_frame: pandas.DataFrame
+        :param instrument_type: The instrument type of the trades.
+        :type instrument_type: str
+        :return: The portfolio.
+        :rtype: Portfolio
+        :raises ValidationError: If any column or trade is invalid.
+        """
+        return cls.from_columns({str(name): data_frame[name].to_numpy() for name in data_frame.columns},
+                                instrument_type)
+
+    @classmethod
+    def from_csv(cls, path, instrument_type: str, **kwargs) -> 'Portfolio':
+        """
+        Validates and loads trades from a CSV file with one column per field, dates being written as YYYY-MM-DD.
+
+        Empty cells stand for the values which are not given. Fields holding lists, such as the future fixing dates of
+        Asian options, cannot be read from CSV files.
+
+        :param path: The path or buffer of the CSV file.
+        :param instrument_type: The instrument type of the trades.
+        :type instrument_type: str
+        :param kwargs: The keyword arguments of pandas.read_csv.
+        :return: The portfolio.
+        :rtype: Portfolio
+        :raises ValidationError: If any column or trade is invalid.
+        """
+        import pandas as pd
+        # dates are kept as strings, so that they are validated as the marshmallow schemas do
+        return cls.from_data_frame(pd.read_csv(path, **kwargs), instrument_type)
+
+    @classmethod
+    def from_arrow(cls, table, instrument_type: str) -> 'Portfolio':
+        """
+        Validates and loads trades from an Arrow table with one column per field.
+
+        Date columns may be stored as Arrow dates or timestamps, or as strings in the format YYYY-MM-DD, and lists of
+        dates as Arrow lists.
+
+        :param table: The trades.
+        :type table: pyarrow.Table
+        :param instrument_type: The instrument type of the trades.
+        :type instrument_type: str
+        :return: The portfolio.
+        :rtype: Portfolio
+        :raises ImportError: If pyarrow is not installed.
+        :raises ValidationError: If any column or trade is invalid.
+        """
+        pyarrow = _import_pyarrow()
+        columns = {}
+        for name in table.column_names:
+            column = table.column(name)
+            if pyarrow.types.is_dictionary(column.type):
+                column = column.cast(column.type.value_type)
+            if pyarrow.types.is_list(column.type) or pyarrow.types.is_large_list(column.type):
+                # lists of dates are validated from their ISO format
+                columns[name] = [None if values is None else [str(value) for value in values]
+                                 for values in column.to_pylist()]
+            else:
+                columns[name] = column.to_numpy(zero_copy_only=False)
+        return cls.from_columns(columns, instrument_type)
+
+    @classmethod
+    def from_parquet(cls, path, instrument_type: str, **kwargs) -> 'Portfolio':
+        """
+        Validates and loads trades from a Parquet file with one column per field.
+
+        :param path: The path or buffer of the Parquet file.
+        :param instrument_type: The instrument type of the trades.
+        :type instrument_type: str
+        :param kwargs: The keyword arguments of pyarrow.parquet.read_table.
+        :return: The portfolio.
+        :rtype: Portfolio
+        :raises ImportError: If pyarrow is not installed.
+        :raises ValidationError: If any column or trade is invalid.
+        """
+        pyarrow = _import_pyarrow()
+        return cls.from_arrow(pyarrow.parquet.read_table(path, **kwargs), instrument_type)
+
+    # endregion
+
+    def __len__(self) -> int:
+        return next(iter(self.columns.values())).shape[0] if self.columns else 0
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Instrument, List[Instrument]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = range(len(self))[index]
+        try:
+            return self._instruments[index]
+        except KeyError:
+            instrument = self._schema.build(self.columns, index)
+            # keep the first instrument built if another thread built it concurrently
+            return self._instruments.setdefault(index, instrument)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(instrument_type={self.instrument_type!r}, trades={len(self)})"
+
+    def get_enum_members(self, name: str) -> np.ndarray:
+        """
+        Gets the enumeration members of an enumeration column.
+
+        :param name: The field name.
+        :type name: str
+        :return: The enumeration members of the trades, as an object array.
+        :rtype: np.ndarray
+        """
+        members = np.empty(len(self._schema.columns[name].members), dtype=object)
+        members[:] = self._schema.columns[name].members
+        return members[self.columns[name]]
+
+    def _get_ql_values(self, name: str, ql_values: Dict[Any, int]) -> np.ndarray:
+        # QuantLib values of an enumeration column, looked up once per member
+        lookup = np.array([ql_values[member] for member in self._schema.columns[name].members])
+        return lookup[self.columns[name]]
+
+    def _get_black_scholes_inputs(self, market_data: MarketData,
+                                  static_data: StaticData) -> Tuple[float, np.ndarray, np.ndarray, np.ndarray, float]:
+        # spot, times to maturity, zero rates and volatility of the Black-Scholes model of the pricers
+        process = BlackScholesModel(market_data, static_data).setup()
+        reference_date = convert_dates_to_datetime64(market_data.get_ql_reference_date())
+        # expired trades have non-positive times, clamped for the zero rate lookup
+        times = np.maximum(year_fractions(static_data.day_counter, reference_date, self.columns['maturity']), 0.0)
+        # zero rates only depend on the maturity, evaluate them once per distinct time
+        unique_times, inverse = np.unique(times, return_inverse=True)
+        zero_rates = np.array([(process.riskFreeRate().zeroRate(time, ql.Continuous, ql.NoFrequency).rate(),
+                                process.dividendYield().zeroRate(time, ql.Continuous, ql.NoFrequency).rate())
+                               for time in unique_times]).reshape(-1, 2)
+        volatility = market_data.underlying_black_scholes_volatilities[0]
+        return process.x0(), times, zero_rates[inverse, 0], zero_rates[inverse, 1], volatility
+
+    def price(self, market_data: MarketData, static_data: StaticData) -> np.ndarray:
+        """
+        Prices all the trades at once with the vectorized closed-form engines under the Black-Scholes model.
+
+        Vanilla options are priced with the Black-Scholes-Merton formula, and barrier options with the
+        Reiner-Rubinstein formulas, which reproduce the QuantLib analytic engines.
+
+        :param market_data: The market data used for pricing the trades.
+        :type market_data: MarketData
+        :param static_data: The static data used for pricing the trades.
+        :type static_data: StaticData
+        :return: The net present values (NPV) of the trades, in the order of the portfolio.
+        :rtype: np.ndarray
+        :raises ValueError: If any barrier option has an American exercise or an already touched barrier.
+        :raises NotImplementedError: If the instrument type has no vectorized engine.
+        """
+        if len(self) == 0:
+            return np.zeros(0)
+        if self.instrument_type not in ('vanilla_option', 'barrier_option'):
+            raise NotImplementedError(f"No vectorized engine for the instrument type \"{self.instrument_type}\"")
+        spot, times, risk_free_rates, dividend_yields, volatility = self._get_black_scholes_inputs(market_data,
+                                                                                                  static_data)
+        # expired trades are worth nothing, as with the QuantLib instruments
+        active = times > 0
+        prices = np.zeros(len(self))
+        if self.instrument_type == 'vanilla_option':
+            prices[active] = analytic_european_prices(
+                option_types=self._get_ql_values('option_type', _ql_option_types)[active],
+                spot=spot,
+                strikes=self.columns['strike'][active],
+                times=times[active],
+                risk_free_rates=risk_free_rates[active],
+                dividend_yields=dividend_yields[active],
+                volatilities=volatility)
+        else:
+            if np.any(self.get_enum_members('exercise') != ExerciseType.EUROPEAN):
+                raise ValueError("Batch barrier pricing is only available for european exercise")
+            if np.any(active):
+                prices[active] = analytic_barrier_prices(
+                    barrier_types=self._get_ql_values('barrier_type', _ql_barrier_types)[active],
+                    option_types=self._get_ql_values('option_type', _ql_option_types)[active],
+                    spot=spot,
+                    strikes=self.columns['strike'][active],
+                    barriers=self.columns['barrier'][active],
+                    rebates=self.columns['rebate'][active],
+                    times=times[active],
+                    risk_free_rates=risk_free_rates[active],
+                    dividend_yields=dividend_yields[active],
+                    volatilities=volatility)
+        return prices
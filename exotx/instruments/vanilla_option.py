@@ -7,7 +7,8 @@ from marshmallow import Schema, fields, post_load
 from exotx.enums.enums import PricingModel, NumericalMethod
 from exotx.helpers.dates import convert_maturity_to_ql_date
 from exotx.instruments.instrument import Instrument
-from exotx.instruments.option_type import convert_option_type_to_ql, OptionType, OptionTypeField
+from exotx.instruments.option_type import convert_option_type_to_ql, convert_ql_to_option_type, OptionType, \
+    OptionTypeField
 from exotx.models.blackscholesmodel import BlackScholesModel
 from exotx.models.hestonmodel import HestonModel
 from exotx.utils.pricing_configuration import PricingConfiguration
@@ -44,6 +45,10 @@ class VanillaOption(Instrument):
         self.maturity = convert_maturity_to_ql_date(maturity)
         self.option_type = convert_option_type_to_ql(option_type)
 
+    def __reduce__(self) -> tuple:
+        # pickled as primitive constructor arguments, the QuantLib objects being rebuilt when unpickling
+        return type(self), (self.strike, self.maturity.ISO(), convert_ql_to_option_type(self.option_type).value)
+
     def price(self, market_data, static_data, pricing_config: PricingConfiguration, seed: int = 1) -> dict:
         """
         Calculates the price and optionally the greeks (delta, gamma, and theta) for the vanilla option using the 
@@ -120,7 +125,9 @@ class VanillaOption(Instrument):
         elif pricing_config.model == PricingModel.HESTON and \
                 pricing_config.numerical_method == NumericalMethod.ANALYTIC:
             heston_model = HestonModel(market_data, static_data)
-            _, model = heston_model.calibrate(seed)
+            numerical_settings = pricing_config.get_numerical_settings()
+            _, model = heston_model.calibrate(seed, numerical_settings.calibration_max_iterations,
+                                              numerical_settings.calibration_tolerance)
             ql_engine = ql.AnalyticHestonEngine(model)
         else:
             raise ValueError(f"Invalid pricing model {pricing_config.model} with numerical method "
@@ -150,8 +157,8 @@ class VanillaOption(Instrument):
         :rtype: VanillaOption
         """
         schema = VanillaOptionSchema()
-        data = schema.load(json_data)
-        return cls(**data)
+        # the schema builds the instrument after loading
+        return schema.load(json_data)
     # endregion
 
 
@@ -2,8 +2,11 @@
 
 from exotx.models.blackscholesmodel import BlackScholesModel
 from exotx.models.hestonmodel import HestonModel
+from exotx.models.localvolmodel import LocalVolatilityModel, LocalVolatilitySurface
 
 __all__ = [
     'BlackScholesModel',
-    'HestonModel'
+    'HestonModel',
+    'LocalVolatilityModel',
+    'LocalVolatilitySurface'
 ]
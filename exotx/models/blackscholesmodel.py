@@ -2,7 +2,9 @@ import QuantLib as ql
 import numpy as np
 
 from exotx.data.marketdata import MarketData
+from exotx.data.static.daycounters import year_fractions
 from exotx.data.staticdata import StaticData
+from exotx.helpers.time_grid import refine_times
 
 
 class BlackScholesModel:
@@ -16,6 +18,7 @@ class BlackScholesModel:
         # set static data
         self._calendar: ql.Calendar = static_data.get_ql_calendar()
         self._day_counter: ql.DayCounter = static_data.get_ql_day_counter()
+        self._vol_surface_day_counter = static_data.day_counter
 
     def setup(self) -> ql.BlackScholesMertonProcess:
         spot_handle = ql.QuoteHandle(ql.SimpleQuote(self.market_data.underlying_spots[0]))
@@ -34,15 +37,22 @@ class BlackScholesModel:
                        day_counter: ql.DayCounter,
                        process: ql.BlackScholesMertonProcess,
                        number_of_paths: int = 100000,
-                       seed: int = 1) -> np.ndarray:
-        """Generate underlying and volatility paths."""
+                       seed: int = 1,
+                       time_steps_per_year: int = None) -> np.ndarray:
+        """
+        Generate underlying and volatility paths.
+
+        The paths are simulated on the dates, with intermediate steps when a number of time steps per year is given,
+        and are returned on the dates only.
+        """
         dimension = process.factors()
-        times = np.array([day_counter.yearFraction(dates[0], d) for d in dates])
-        time_step = times.shape[0] - 1
+        times = year_fractions(day_counter, dates[0], dates)
+        simulation_times, date_indices = refine_times(times, time_steps_per_year)
+        time_step = simulation_times.shape[0] - 1
         uniform_random_generator = ql.UniformRandomGenerator(seed=seed)
         sequence_generator = ql.UniformRandomSequenceGenerator(dimension * time_step, uniform_random_generator)
         gaussian_sequence_generator = ql.GaussianRandomSequenceGenerator(sequence_generator)
-        paths_generator = ql.GaussianMultiPathGenerator(process, times, gaussian_sequence_generator)
+        paths_generator = ql.GaussianMultiPathGenerator(process, simulation_times, gaussian_sequence_generator)
         paths = np.zeros(shape=(number_of_paths, times.shape[0]))
 
         for i in range(number_of_paths):
@@ -50,6 +60,55 @@ class BlackScholesModel:
             values = sample_path.value()
             spot = values[0]
             # first argument refers to the underlying path, the second the volatility
-            paths[i, :] = np.array(list(spot))
+            paths[i, :] = np.array(list(spot))[date_indices]
 
         return paths
+
+    def get_total_variances(self, dates) -> np.ndarray:
+        """
+        Gets the at-the-money forward total variances at the given dates.
+
+        The variances are read from the volatility surface of the market data, with the total variance interpolation,
+        or from the Black-Scholes volatility when there is no surface. They are made non-decreasing, so that the
+        forward variances between consecutive dates are never negative.
+
+        :param dates: The dates, the first one being the reference date.
+        :return: The total variances.
+        :rtype: np.ndarray
+        """
+        times = year_fractions(self._day_counter, self._reference_date, dates)
+        vol_surface = self.market_data.get_vol_surface(self._vol_surface_day_counter)
+        if vol_surface is None:
+            return self.market_data.underlying_black_scholes_volatilities[0] ** 2 * times
+        forwards = self.market_data.underlying_spots[0] * \
+            np.exp((self.market_data.risk_free_rate - self.market_data.dividend_rate) * times)
+        return np.maximum.accumulate(vol_surface.get_black_variances(times, forwards))
+
+    def generate_term_structure_paths(self,
+                                      dates,
+                                      number_of_paths: int = 100000,
+                                      seed: int = 1) -> np.ndarray:
+        """
+        Generates underlying paths with a deterministic volatility term structure.
+
+        The forward variances between consecutive dates are taken from the at-the-money term structure of the
+        volatility surface, so that the paths are simulated exactly on the dates, all at once and without intermediate
+        steps.
+
+        :param dates: The dates of the paths, the first one being the reference date.
+        :param number_of_paths: The number of paths, defaults to 100000.
+        :type number_of_paths: int, optional
+        :param seed: The seed of the random number generator, defaults to 1.
+        :type seed: int, optional
+        :return: The underlying paths, with one row per path and one column per date.
+        :rtype: np.ndarray
+        """
+        times = year_fractions(self._day_counter, dates[0], dates)
+        forward_variances = np.diff(self.get_total_variances(dates))
+        drifts = (self.market_data.risk_free_rate - self.market_data.dividend_rate) * np.diff(times) - \
+            0.5 * forward_variances
+        random_generator = np.random.default_rng(seed)
+        increments = drifts + np.sqrt(forward_variances) * random_generator.standard_normal(
+            (number_of_paths, times.shape[0] - 1))
+        log_paths = np.log(self.market_data.underlying_spots[0]) + np.cumsum(increments, axis=1)
+        return np.hstack((np.full((number_of_paths, 1), self.market_data.underlying_spots[0]), np.exp(log_paths)))
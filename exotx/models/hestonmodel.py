@@ -5,7 +5,10 @@ import numpy as np
 from scipy.optimize import differential_evolution
 
 from exotx.data.marketdata import MarketData
+from exotx.data.static.daycounters import year_fractions
 from exotx.data.staticdata import StaticData
+from exotx.helpers.dates import convert_datetime64_to_ql_dates
+from exotx.helpers.time_grid import refine_times
 
 
 class HestonModel:
@@ -25,14 +28,28 @@ class HestonModel:
         # set pricing engine
         self._pricing_engine = ql.AnalyticHestonEngine
 
-    def calibrate(self, seed: int = 1) -> Tuple[ql.HestonProcess, ql.HestonModel]:
-        """Calibrate the Heston model."""
+    def calibrate(self, seed: int = 1, max_iterations: int = None,
+                  tolerance: float = None) -> Tuple[ql.HestonProcess, ql.HestonModel]:
+        """
+        Calibrate the Heston model.
+
+        :param seed: The seed of the differential evolution, defaults to 1.
+        :type seed: int, optional
+        :param max_iterations: The maximum number of generations of the differential evolution, defaults to 100.
+        :type max_iterations: int, optional
+        :param tolerance: The relative tolerance of the differential evolution, defaults to 0.01.
+        :type tolerance: float, optional
+        :return: The calibrated Heston process and model.
+        :rtype: Tuple[ql.HestonProcess, ql.HestonModel]
+        """
         process, model = self._setup()
         # set the engine
         ql_engine = self._pricing_engine(model)
         helpers, grid_data = self._setup_helpers(ql_engine)
         cost_function = self._cost_function_generator(model, helpers, norm=True)
-        differential_evolution(cost_function, self._bounds, seed=seed, maxiter=100)
+        differential_evolution(cost_function, self._bounds, seed=seed,
+                               maxiter=100 if max_iterations is None else max_iterations,
+                               tol=0.01 if tolerance is None else tolerance)
         print('Calibrated Heston parameters:', model.params())
 
         return process, model
@@ -55,11 +72,14 @@ class HestonModel:
         List[ql.HestonModelHelper], List[Tuple[ql.Date, float]]]:
         helpers = []
         grid_data = []
-        for i, date in enumerate([ql.Date().from_date(date) for date in self.market_data.expiration_dates]):
-            for j, strike in enumerate(self.market_data.strikes):
+        vol_surface = self.market_data.get_vol_surface()
+        if vol_surface is None:
+            raise ValueError("The Heston model requires a volatility surface in the market data to be calibrated")
+        for i, date in enumerate(convert_datetime64_to_ql_dates(vol_surface.expiration_dates)):
+            for j, strike in enumerate(vol_surface.strikes.tolist()):
                 t = (date - self._reference_date)
                 p = ql.Period(t, ql.Days)
-                vols = self.market_data.data[i][j]
+                vols = float(vol_surface.volatilities[i, j])
                 helper = ql.HestonModelHelper(
                     p, self._calendar, self.market_data.underlying_spots[0], strike,
                     ql.QuoteHandle(ql.SimpleQuote(vols)),
@@ -89,15 +109,22 @@ class HestonModel:
                        day_counter: ql.DayCounter,
                        process: ql.HestonProcess,
                        number_of_paths: int = 10000,
-                       seed: int = 1) -> np.ndarray:
-        """Generate underlying and volatility paths."""
+                       seed: int = 1,
+                       time_steps_per_year: int = None) -> np.ndarray:
+        """
+        Generate underlying and volatility paths.
+
+        The paths are simulated on the dates, with intermediate steps when a number of time steps per year is given,
+        and are returned on the dates only.
+        """
         dimension = process.factors()
-        times = np.array([day_counter.yearFraction(dates[0], d) for d in dates])
-        time_step = times.shape[0] - 1
+        times = year_fractions(day_counter, dates[0], dates)
+        simulation_times, date_indices = refine_times(times, time_steps_per_year)
+        time_step = simulation_times.shape[0] - 1
         uniform_random_generator = ql.UniformRandomGenerator(seed=seed)
         sequence_generator = ql.UniformRandomSequenceGenerator(dimension * time_step, uniform_random_generator)
         gaussian_sequence_generator = ql.GaussianRandomSequenceGenerator(sequence_generator)
-        paths_generator = ql.GaussianMultiPathGenerator(process, times, gaussian_sequence_generator)
+        paths_generator = ql.GaussianMultiPathGenerator(process, simulation_times, gaussian_sequence_generator)
         paths = np.zeros(shape=(number_of_paths, times.shape[0]))
 
         for i in range(number_of_paths):
@@ -105,7 +132,7 @@ class HestonModel:
             values = sample_path.value()
             spot = values[0]
             # first argument refers to the underlying path, the second the volatility
-            paths[i, :] = np.array(list(spot))
+            paths[i, :] = np.array(list(spot))[date_indices]
 
         # return array dimensions: [number of paths, number of items in t array]
         return paths
@@ -0,0 +1,213 @@
+from typing import Tuple, Union
+
+import QuantLib as ql
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+from exotx.data.marketdata import MarketData
+from exotx.data.static.daycounters import year_fractions
+from exotx.data.staticdata import StaticData
+from exotx.data.volsurface import VolSurface
+from exotx.helpers.interpolation import bilinear_interpolation
+
+# guards against the regions of the implied volatility surface with butterfly arbitrage, where the denominator of the
+# Dupire formula vanishes or becomes negative
+minimum_dupire_denominator = 0.1
+minimum_local_volatility = 0.01
+maximum_local_volatility = 5.0
+
+
+class LocalVolatilitySurface:
+    """
+    Dupire local volatilities precomputed on a (time, log-spot) grid.
+
+    The local variances are derived from the total implied variances w of the volatility surface with the Dupire
+    formula in log-moneyness y = ln(K / F(T)):
+
+        sigma^2(T, K) = dw/dT / (1 - y / w * dw/dy + 1/4 * (-1/4 - 1/w + y^2 / w^2) * (dw/dy)^2 + 1/2 * d2w/dy2)
+
+    At each expiration date the total variances are interpolated in log-strike with natural cubic splines, flat
+    outside of the quoted strikes, and they are interpolated linearly in time at constant log-moneyness, proportionally
+    to time before the first and after the last expiration dates. The local volatilities are then looked up with
+    bilinear interpolation in time and log-spot, flat outside of the grid.
+
+    Attributes:
+        vol_surface (VolSurface): The implied volatility surface.
+        spot (float): The spot of the underlying.
+        risk_free_rate (float): The continuously compounded risk-free rate.
+        dividend_rate (float): The continuously compounded dividend yield.
+        maximum_time (float): The last time of the grid.
+        times (np.ndarray): The times of the grid.
+        log_spots (np.ndarray): The log-spots of the grid.
+        local_volatilities (np.ndarray): The local volatilities, with one row per time and one column per log-spot.
+    """
+
+    def __init__(self,
+                 vol_surface: VolSurface,
+                 spot: float,
+                 risk_free_rate: float,
+                 dividend_rate: float,
+                 maximum_time: float = None,
+                 time_steps: int = 100,
+                 space_steps: int = 200,
+                 number_of_std_deviations: float = 5.0) -> None:
+        assert spot > 0, f"Invalid spot {spot}"
+        self.vol_surface = vol_surface
+        self.spot = spot
+        self.risk_free_rate = risk_free_rate
+        self.dividend_rate = dividend_rate
+        self.maximum_time = vol_surface.times[-1] if maximum_time is None else maximum_time
+        assert self.maximum_time > 0, f"Invalid maximum time {self.maximum_time}"
+
+        # grid times at the middle of the time steps, avoiding the singularity at time zero
+        dt = self.maximum_time / time_steps
+        self.times = dt * (np.arange(time_steps) + 0.5)
+        half_width = number_of_std_deviations * np.max(vol_surface.volatilities) * np.sqrt(self.maximum_time)
+        self.log_spots = np.log(spot) + np.linspace(-half_width, half_width, space_steps + 1)
+        self.local_volatilities = self._get_local_volatilities(self.times[:, None], self.log_spots[None, :])
+        for array in (self.times, self.log_spots, self.local_volatilities):
+            array.setflags(write=False)
+
+    def _get_total_variances(self, times: np.ndarray, log_moneyness: np.ndarray) -> Tuple[np.ndarray, ...]:
+        # total variance and its derivatives dw/dT, dw/dy and d2w/dy2 at constant log-moneyness
+        log_strikes = np.log(self.vol_surface.strikes)
+        expiration_times = self.vol_surface.times
+        drift = self.risk_free_rate - self.dividend_rate
+        node_values = []
+        for expiration_time, volatilities in zip(expiration_times, self.vol_surface.volatilities):
+            log_forward_strikes = np.log(self.spot) + drift * expiration_time + log_moneyness
+            if log_strikes.shape[0] == 1:
+                flat = np.full(log_forward_strikes.shape, expiration_time * volatilities[0] ** 2)
+                node_values.append((flat, np.zeros(flat.shape), np.zeros(flat.shape)))
+                continue
+            spline = CubicSpline(log_strikes, expiration_time * volatilities ** 2, bc_type='natural')
+            inside = (log_forward_strikes >= log_strikes[0]) & (log_forward_strikes <= log_strikes[-1])
+            clipped = np.clip(log_forward_strikes, log_strikes[0], log_strikes[-1])
+            node_values.append((spline(clipped),
+                                np.where(inside, spline(clipped, 1), 0.0),
+                                np.where(inside, spline(clipped, 2), 0.0)))
+        # no variance at time zero
+        zeros = np.zeros(np.broadcast(times, log_moneyness).shape)
+        node_values = [(zeros, zeros, zeros)] + node_values
+        node_times = np.concatenate(([0.0], expiration_times))
+
+        # linear interpolation in time between the surrounding expiration dates, proportional after the last one
+        times = np.broadcast_to(times, zeros.shape)
+        upper = np.clip(np.searchsorted(node_times, times, side='left'), 1, node_times.shape[0] - 1)
+        is_after_last = times > node_times[-1]
+        lower = np.where(is_after_last, upper, upper - 1)
+        time_steps = np.where(is_after_last, node_times[-1], node_times[upper] - node_times[lower])
+        upper_weights = np.where(is_after_last, times / node_times[-1], (times - node_times[lower]) / time_steps)
+        lower_weights = np.where(is_after_last, 0.0, 1.0 - upper_weights)
+        lower_time_weights = np.where(is_after_last, 0.0, -1.0 / time_steps)
+        upper_time_weights = 1.0 / time_steps
+
+        # gathered along the stacked nodes rather than with np.choose, which is limited to 32 choices in NumPy 1.x
+        stacked_values = [np.stack([np.broadcast_to(values[k], zeros.shape) for values in node_values])
+                          for k in range(3)]
+
+        def select(indices: np.ndarray, k: int) -> np.ndarray:
+            return np.take_along_axis(stacked_values[k], indices[None], 0)[0]
+
+        w, w_y, w_yy = (lower_weights * select(lower, k) + upper_weights * select(upper, k) for k in range(3))
+        w_t = lower_time_weights * select(lower, 0) + upper_time_weights * select(upper, 0)
+        return w, w_t, w_y, w_yy
+
+    def _get_local_volatilities(self, times: np.ndarray, log_spots: np.ndarray) -> np.ndarray:
+        log_moneyness = log_spots - np.log(self.spot) - (self.risk_free_rate - self.dividend_rate) * times
+        w, w_t, w_y, w_yy = self._get_total_variances(times, log_moneyness)
+        y = np.broadcast_to(log_moneyness, w.shape)
+        denominator = 1.0 - y / w * w_y + 0.25 * (-0.25 - 1.0 / w + y ** 2 / w ** 2) * w_y ** 2 + 0.5 * w_yy
+        local_variances = np.maximum(w_t, 0.0) / np.maximum(denominator, minimum_dupire_denominator)
+        return np.clip(np.sqrt(local_variances), minimum_local_volatility, maximum_local_volatility)
+
+    def __call__(self, time: Union[float, np.ndarray], spots: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Looks up the local volatilities at the given time and spots.
+
+        :param time: The time, or the times broadcast against the spots.
+        :type time: Union[float, np.ndarray]
+        :param spots: The spots.
+        :type spots: Union[float, np.ndarray]
+        :return: The local volatilities.
+        :rtype: np.ndarray
+        """
+        return bilinear_interpolation(self.times, self.log_spots, self.local_volatilities, time, np.log(spots))
+
+
+class LocalVolatilityModel:
+    """Class for the Dupire local volatility model."""
+
+    def __init__(self,
+                 market_data: MarketData,
+                 static_data: StaticData) -> None:
+        self._reference_date: ql.Date = market_data.get_ql_reference_date()
+        self.market_data = market_data
+        # set static data
+        self._day_counter = static_data.day_counter
+
+    def setup(self,
+              maximum_time: float = None,
+              time_steps: int = 100,
+              space_steps: int = 200) -> LocalVolatilitySurface:
+        """
+        Builds the local volatility surface from the implied volatility surface of the market data.
+
+        :param maximum_time: The last time of the local volatility grid, defaults to the last expiration date of the
+                             implied volatility surface.
+        :type maximum_time: float, optional
+        :param time_steps: The number of time steps of the grid, defaults to 100.
+        :type time_steps: int, optional
+        :param space_steps: The number of log-spot steps of the grid, defaults to 200.
+        :type space_steps: int, optional
+        :return: The local volatility surface.
+        :rtype: LocalVolatilitySurface
+        """
+        vol_surface = self.market_data.get_vol_surface(self._day_counter)
+        if vol_surface is None:
+            raise ValueError("The local volatility model requires a volatility surface in the market data")
+        return LocalVolatilitySurface(vol_surface, self.market_data.underlying_spots[0],
+                                      self.market_data.risk_free_rate, self.market_data.dividend_rate,
+                                      maximum_time, time_steps, space_steps)
+
+    @staticmethod
+    def generate_paths(dates,
+                       day_counter: ql.DayCounter,
+                       local_volatility: LocalVolatilitySurface,
+                       number_of_paths: int = 100000,
+                       seed: int = 1,
+                       time_steps_per_year: int = 100) -> np.ndarray:
+        """
+        Generates underlying paths with a log-Euler scheme, all paths being advanced at once.
+
+        :param dates: The dates of the paths, the first one being the reference date.
+        :param day_counter: The day counter converting dates to times.
+        :type day_counter: ql.DayCounter
+        :param local_volatility: The local volatility surface.
+        :type local_volatility: LocalVolatilitySurface
+        :param number_of_paths: The number of paths, defaults to 100000.
+        :type number_of_paths: int, optional
+        :param seed: The seed of the random number generator, defaults to 1.
+        :type seed: int, optional
+        :param time_steps_per_year: The minimum number of simulation steps per year, defaults to 100.
+        :type time_steps_per_year: int, optional
+        :return: The underlying paths, with one row per path and one column per date.
+        :rtype: np.ndarray
+        """
+        times = year_fractions(day_counter, dates[0], dates)
+        random_generator = np.random.default_rng(seed)
+        drift = local_volatility.risk_free_rate - local_volatility.dividend_rate
+        log_spots = np.full(number_of_paths, np.log(local_volatility.spot))
+        paths = np.zeros(shape=(number_of_paths, times.shape[0]))
+        paths[:, 0] = local_volatility.spot
+
+        for i in range(1, times.shape[0]):
+            steps = max(int(np.ceil((times[i] - times[i - 1]) * time_steps_per_year)), 1)
+            dt = (times[i] - times[i - 1]) / steps
+            for step in range(steps):
+                volatilities = local_volatility(times[i - 1] + step * dt, np.exp(log_spots))
+                log_spots += (drift - 0.5 * volatilities ** 2) * dt + \
+                    volatilities * np.sqrt(dt) * random_generator.standard_normal(number_of_paths)
+            paths[:, i] = np.exp(log_spots)
+
+        return paths
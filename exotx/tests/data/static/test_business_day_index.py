@@ -0,0 +1,112 @@
+import QuantLib as ql
+import numpy as np
+import pytest
+
+from exotx.data import StaticData
+from exotx.data.static import BusinessDayIndex, BusinessDayConvention, Calendar, get_business_day_index
+from exotx.data.static.conventions import business_day_conventions_to_ql
+from exotx.helpers.dates import convert_ql_dates_to_datetime64, convert_datetime64_to_ql_dates
+
+
+# Arrange
+@pytest.fixture(params=[ql.TARGET(), ql.UnitedStates(ql.UnitedStates.NYSE), ql.Brazil(), ql.Japan()],
+                ids=lambda calendar: calendar.name())
+def my_calendar(request) -> ql.Calendar:
+    return request.param
+
+
+@pytest.fixture
+def my_dates() -> np.ndarray:
+    random_generator = np.random.default_rng(0)
+    return np.datetime64('2000-01-01') + random_generator.integers(0, 365 * 40, 300).astype('timedelta64[D]')
+
+
+def test_business_day_index_is_business_day(my_calendar: ql.Calendar, my_dates: np.ndarray):
+    # Act
+    is_business_day = get_business_day_index(my_calendar).is_business_day(my_dates)
+
+    # Assert
+    expected = [my_calendar.isBusinessDay(date) for date in convert_datetime64_to_ql_dates(my_dates)]
+    np.testing.assert_array_equal(is_business_day, expected)
+
+
+@pytest.mark.parametrize('convention', list(BusinessDayConvention))
+def test_business_day_index_adjust(my_calendar: ql.Calendar, my_dates: np.ndarray,
+                                   convention: BusinessDayConvention):
+    # Act
+    adjusted = get_business_day_index(my_calendar).adjust(my_dates, convention)
+
+    # Assert
+    expected = convert_ql_dates_to_datetime64(
+        [my_calendar.adjust(date, business_day_conventions_to_ql[convention])
+         for date in convert_datetime64_to_ql_dates(my_dates)])
+    np.testing.assert_array_equal(adjusted, expected)
+
+
+@pytest.mark.parametrize('n, time_unit', [(-5, ql.Days), (0, ql.Days), (1, ql.Days), (20, ql.Days),
+                                          (2, ql.Weeks), (-1, ql.Months), (6, ql.Months), (3, ql.Years)])
+@pytest.mark.parametrize('convention', [BusinessDayConvention.Following, BusinessDayConvention.ModifiedFollowing,
+                                        BusinessDayConvention.Unadjusted])
+@pytest.mark.parametrize('end_of_month', [False, True])
+def test_business_day_index_advance(my_calendar: ql.Calendar, my_dates: np.ndarray, n: int, time_unit: int,
+                                    convention: BusinessDayConvention, end_of_month: bool):
+    # Act
+    advanced = get_business_day_index(my_calendar).advance(my_dates, n, time_unit, convention, end_of_month)
+
+    # Assert
+    expected = convert_ql_dates_to_datetime64(
+        [my_calendar.advance(date, n, time_unit, business_day_conventions_to_ql[convention], end_of_month)
+         for date in convert_datetime64_to_ql_dates(my_dates)])
+    np.testing.assert_array_equal(advanced, expected)
+
+
+@pytest.mark.parametrize('tenor_months', [1, 6, 12])
+@pytest.mark.parametrize('convention, termination_convention', [
+    (BusinessDayConvention.ModifiedFollowing, BusinessDayConvention.ModifiedFollowing),
+    (BusinessDayConvention.Following, BusinessDayConvention.Unadjusted),
+    (BusinessDayConvention.Preceding, BusinessDayConvention.Preceding)
+])
+@pytest.mark.parametrize('end_of_month', [False, True])
+def test_business_day_index_schedule(my_calendar: ql.Calendar, my_dates: np.ndarray, tenor_months: int,
+                                     convention: BusinessDayConvention,
+                                     termination_convention: BusinessDayConvention, end_of_month: bool):
+    # Arrange
+    random_generator = np.random.default_rng(1)
+    effective_dates = my_dates[:50]
+    termination_dates = effective_dates + random_generator.integers(40, 3000, 50).astype('timedelta64[D]')
+
+    # Act
+    schedules = get_business_day_index(my_calendar).schedule(effective_dates, termination_dates, tenor_months,
+                                                              convention, termination_convention, end_of_month)
+
+    # Assert
+    for schedule, effective_date, termination_date in zip(schedules, effective_dates, termination_dates):
+        effective_date, termination_date = convert_datetime64_to_ql_dates(np.array([effective_date,
+                                                                                    termination_date]))
+        expected = convert_ql_dates_to_datetime64(
+            list(ql.Schedule(effective_date, termination_date, ql.Period(tenor_months, ql.Months), my_calendar,
+                             business_day_conventions_to_ql[convention],
+                             business_day_conventions_to_ql[termination_convention], ql.DateGeneration.Forward,
+                             end_of_month)))
+        np.testing.assert_array_equal(schedule[~np.isnat(schedule)], expected)
+
+
+def test_business_day_index_out_of_range():
+    # Arrange
+    index = BusinessDayIndex(ql.TARGET(), '2020-01-01', '2020-12-31')
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="outside of the business day index range"):
+        index.adjust(np.array(['2021-01-04'], dtype='datetime64[D]'))
+
+
+def test_static_data_business_day_index():
+    # Arrange
+    static_data = StaticData(calendar=Calendar(region='UnitedStates', market='NYSE'))
+
+    # Act
+    index = static_data.get_business_day_index()
+
+    # Assert
+    assert index is static_data.get_business_day_index()
+    assert not index.is_business_day(np.datetime64('2023-07-04'))
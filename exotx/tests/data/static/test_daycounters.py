@@ -0,0 +1,72 @@
+import QuantLib as ql
+import numpy as np
+import pytest
+
+from exotx.data.static import DayCounter, day_counters_to_ql, year_fractions
+from exotx.helpers.dates import convert_datetime64_to_ql_dates
+
+
+# Arrange
+@pytest.fixture
+def my_date_pairs():
+    random_generator = np.random.default_rng(0)
+    start_dates = np.datetime64('2000-01-01') + random_generator.integers(0, 365 * 50, 2000).astype('timedelta64[D]')
+    end_dates = start_dates + random_generator.integers(-3000, 3000, 2000).astype('timedelta64[D]')
+    # dates close to the end of their month, where the 30/360 based conventions differ
+    month_end_start_dates = (start_dates.astype('datetime64[M]') + 1).astype('datetime64[D]') - \
+        random_generator.integers(1, 4, 2000).astype('timedelta64[D]')
+    month_end_end_dates = (end_dates.astype('datetime64[M]') + 1).astype('datetime64[D]') - \
+        random_generator.integers(1, 4, 2000).astype('timedelta64[D]')
+    return np.concatenate((start_dates, month_end_start_dates)), np.concatenate((end_dates, month_end_end_dates))
+
+
+@pytest.mark.parametrize('day_counter', [day_counter for day_counter in DayCounter
+                                         if day_counter != DayCounter.Actual365FixedCanadian])
+def test_year_fractions(day_counter: DayCounter, my_date_pairs) -> None:
+    # Arrange
+    start_dates, end_dates = my_date_pairs
+    ql_day_counter = day_counters_to_ql[day_counter]
+
+    # Act
+    result = year_fractions(day_counter, start_dates, end_dates)
+    ql_result = year_fractions(ql_day_counter, start_dates, end_dates)
+
+    # Assert
+    expected = [ql_day_counter.yearFraction(start_date, end_date) for start_date, end_date in
+                zip(convert_datetime64_to_ql_dates(start_dates), convert_datetime64_to_ql_dates(end_dates))]
+    np.testing.assert_allclose(result, expected, rtol=0.0, atol=1e-12)
+    np.testing.assert_allclose(ql_result, expected, rtol=0.0, atol=1e-12)
+
+
+def test_year_fractions_ql_dates() -> None:
+    # Arrange
+    reference_date = ql.Date(15, 3, 2022)
+    dates = np.array([reference_date, ql.Date(15, 9, 2022), ql.Date(15, 3, 2023)])
+
+    # Act
+    result = year_fractions(ql.Actual365Fixed(), reference_date, dates)
+
+    # Assert
+    np.testing.assert_allclose(result, [0.0, 184 / 365, 1.0])
+
+
+def test_year_fractions_business_252_calendar() -> None:
+    # Arrange
+    calendar = ql.TARGET()
+    start_date, end_date = ql.Date(1, 12, 2022), ql.Date(1, 2, 2023)
+
+    # Act
+    result = year_fractions(ql.Business252(calendar), start_date, end_date, calendar)
+    result_without_calendar = year_fractions(ql.Business252(calendar), start_date, end_date)
+
+    # Assert
+    expected = ql.Business252(calendar).yearFraction(start_date, end_date)
+    assert result == pytest.approx(expected, abs=1e-14)
+    assert result_without_calendar == pytest.approx(expected, abs=1e-14)
+
+
+def test_year_fractions_canadian() -> None:
+    # Act & Assert
+    assert year_fractions(DayCounter.Actual365FixedCanadian, '2022-01-03', '2022-01-03') == 0.0
+    with pytest.raises(ValueError, match="requires a reference period"):
+        year_fractions(DayCounter.Actual365FixedCanadian, '2022-01-03', '2022-07-03')
@@ -1,6 +1,12 @@
+import pickle
 from datetime import datetime
 
+import QuantLib as ql
+import numpy as np
+import pytest
+
 from exotx.data.marketdata import MarketData
+from exotx.data.static.daycounters import DayCounter
 
 
 def test_market_data_from_json():
@@ -18,3 +24,91 @@ def test_market_data_from_json():
 
     # Assert
     assert isinstance(my_market_data.reference_date, datetime)
+
+
+def test_market_data_from_option_prices(my_market_data: MarketData) -> None:
+    # Arrange
+    vol_surface = my_market_data.get_vol_surface()
+    times = vol_surface.times[:, None]
+    forwards = 100.0 * np.exp((my_market_data.risk_free_rate - my_market_data.dividend_rate) * times)
+    option_types = np.where(vol_surface.strikes >= forwards, ql.Option.Call, ql.Option.Put)
+    prices = [[ql.blackFormula(int(option_type), strike, float(forward), volatility * np.sqrt(time),
+                               np.exp(-my_market_data.risk_free_rate * time))
+               for option_type, strike, forward, volatility in zip(types, vol_surface.strikes, row_forwards, row)]
+              for types, row_forwards, row, time in zip(option_types, np.broadcast_to(forwards, option_types.shape),
+                                                       vol_surface.volatilities, times[:, 0])]
+
+    # Act
+    market_data = MarketData.from_option_prices(my_market_data.underlying_spots, my_market_data.risk_free_rate,
+                                                my_market_data.dividend_rate, my_market_data.reference_date,
+                                                my_market_data.expiration_dates, my_market_data.strikes, prices,
+                                                option_types)
+
+    # Assert
+    np.testing.assert_allclose(market_data.data, my_market_data.data, rtol=1e-10)
+    prices[0][0] = 0.0
+    with pytest.raises(ValueError, match=r"\(0, 0\)"):
+        MarketData.from_option_prices(my_market_data.underlying_spots, my_market_data.risk_free_rate,
+                                      my_market_data.dividend_rate, my_market_data.reference_date,
+                                      my_market_data.expiration_dates, my_market_data.strikes, prices, option_types)
+
+
+def test_market_data_from_option_prices_round_trip_with_other_day_counter(my_market_data: MarketData) -> None:
+    # Arrange: prices implied with Actual365Fixed times, the surface being read with the Actual360 default of the
+    # static data
+    strikes = np.array([90.0, 100.0, 110.0])
+    times = my_market_data.get_vol_surface(DayCounter.Actual365Fixed).times
+    forwards = 100.0 * np.exp((my_market_data.risk_free_rate - my_market_data.dividend_rate) * times)
+    discounts = np.exp(-my_market_data.risk_free_rate * times)
+    prices = [[ql.blackFormula(ql.Option.Call, float(strike), float(forward), 0.2 * np.sqrt(time), float(discount))
+               for strike in strikes] for forward, time, discount in zip(forwards, times, discounts)]
+
+    # Act
+    market_data = MarketData.from_option_prices([100.0], my_market_data.risk_free_rate, my_market_data.dividend_rate,
+                                                my_market_data.reference_date, my_market_data.expiration_dates,
+                                                strikes.tolist(), prices,
+                                                underlying_black_scholes_volatilities=[0.2], correlation_matrix=[[1.0]])
+    vol_surface = market_data.get_vol_surface(DayCounter.Actual360)
+    round_trip_prices = [[ql.blackFormula(ql.Option.Call, float(strike), float(forward),
+                                          float(volatility * np.sqrt(time)), float(discount))
+                          for strike, volatility in zip(strikes, row)]
+                         for forward, time, discount, row in zip(forwards, vol_surface.times, discounts,
+                                                                 vol_surface.volatilities)]
+
+    # Assert
+    assert market_data.volatility_day_counter == DayCounter.Actual365Fixed
+    assert pickle.loads(pickle.dumps(market_data)).volatility_day_counter == DayCounter.Actual365Fixed
+    assert MarketData.from_json(market_data.to_json()).volatility_day_counter == DayCounter.Actual365Fixed
+    np.testing.assert_allclose(round_trip_prices, prices, rtol=1e-8, atol=1e-10)
+    assert not np.allclose(vol_surface.volatilities, 0.2)
+
+
+def test_market_data_get_vol_surface_sorts_quotes_and_drops_expired() -> None:
+    # Arrange
+    market_data = MarketData(underlying_spots=[100.0], risk_free_rate=0.01, dividend_rate=0.0,
+                             reference_date='2015-11-06',
+                             expiration_dates=['2016-11-06', '2015-11-06', '2016-05-06', '2015-08-06'],
+                             strikes=[110.0, 90.0, 100.0],
+                             data=[[0.23, 0.21, 0.22], [0.5, 0.5, 0.5], [0.26, 0.24, 0.25], [0.6, 0.6, 0.6]])
+
+    # Act
+    vol_surface = market_data.get_vol_surface()
+
+    # Assert
+    np.testing.assert_array_equal(vol_surface.expiration_dates,
+                                  np.array(['2016-05-06', '2016-11-06'], dtype='datetime64[D]'))
+    np.testing.assert_array_equal(vol_surface.strikes, [90.0, 100.0, 110.0])
+    np.testing.assert_array_equal(vol_surface.volatilities, [[0.24, 0.25, 0.26], [0.21, 0.22, 0.23]])
+
+
+def test_market_data_pickle(my_market_data: MarketData):
+    # Arrange
+    vol_surface = my_market_data.get_vol_surface()
+    vol_surface.get_ql_black_variance_surface(ql.TARGET())
+
+    # Act
+    market_data = pickle.loads(pickle.dumps(my_market_data))
+
+    # Assert
+    assert market_data.to_json() == my_market_data.to_json()
+    assert market_data.get_vol_surface() == vol_surface
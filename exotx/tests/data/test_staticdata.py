@@ -1,3 +1,4 @@
+import pickle
 from typing import Optional, Union
 
 import QuantLib as ql
@@ -291,3 +292,19 @@ def test_static_data_to_json(day_counter: Union[str, None], business_day_convent
     assert my_json['calendar']['market'] == market
 
 # endregion
+
+
+# region pickle
+def test_static_data_pickle():
+    # Arrange
+    my_static_data = StaticData(day_counter='Actual365Fixed', business_day_convention='Following',
+                                calendar=Calendar(region='UnitedStates', market='NYSE'))
+
+    # Act
+    static_data = pickle.loads(pickle.dumps(my_static_data))
+
+    # Assert
+    assert static_data.to_json() == my_static_data.to_json()
+    assert static_data.get_ql_calendar() == my_static_data.get_ql_calendar()
+
+# endregion
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from exotx.data.marketdata import MarketData
+from exotx.data.svi import SviSurface, get_svi_surface, svi_total_variances
+from exotx.data.volsurface import VolSurface
+
+
+def test_svi_surface_recovers_svi_smiles() -> None:
+    # Arrange
+    parameters = np.array([[0.002, 0.05, -0.6, 4.65, 0.15], [0.010, 0.08, -0.5, 4.62, 0.25]])
+    strikes = np.linspace(60.0, 150.0, 10)
+    vol_surface = VolSurface('2015-11-06', ['2016-05-06', '2017-11-06'], strikes, np.zeros((2, 10)))
+    volatilities = np.sqrt(svi_total_variances(parameters[:, None, :], np.log(strikes)) / vol_surface.times[:, None])
+    vol_surface = VolSurface('2015-11-06', ['2016-05-06', '2017-11-06'], strikes, volatilities)
+
+    # Act
+    svi_surface = SviSurface(vol_surface)
+
+    # Assert
+    assert np.max(svi_surface.fit_errors) < 1e-5
+    np.testing.assert_allclose(svi_surface.get_black_volatilities(vol_surface.times[:, None], strikes),
+                               volatilities, atol=1e-5)
+
+
+def test_svi_surface_from_market_data(my_market_data: MarketData) -> None:
+    # Arrange
+    vol_surface = my_market_data.get_vol_surface()
+    times = np.array([0.0, 0.05, 0.5, 1.25, 3.0])[:, None]
+    strikes = np.linspace(50.0, 160.0, 12)[None, :]
+
+    # Act
+    svi_surface = my_market_data.get_svi_surface()
+
+    # Assert
+    assert np.max(svi_surface.fit_errors) < 5e-3
+    assert get_svi_surface(VolSurface(vol_surface.reference_date, vol_surface.expiration_dates, vol_surface.strikes,
+                                      vol_surface.volatilities)) is svi_surface
+    volatilities = svi_surface.get_black_volatilities(times, strikes)
+    assert volatilities.shape == (5, 12)
+    inside = (strikes >= vol_surface.strikes[0]) & (strikes <= vol_surface.strikes[-1])
+    np.testing.assert_allclose(volatilities[1:] * inside, vol_surface.get_black_volatilities(times[1:], strikes) *
+                               inside, atol=1e-2)
+    variances = svi_surface.get_total_variances(np.array([[vol_surface.times[-1]], [3.0]]), strikes)
+    np.testing.assert_allclose(variances[1], variances[0] * 3.0 / vol_surface.times[-1], rtol=1e-12)
+    with pytest.raises(ValueError):
+        svi_surface.get_total_variances(-1.0, 100.0)
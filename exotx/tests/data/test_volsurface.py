@@ -0,0 +1,106 @@
+import pickle
+
+import QuantLib as ql
+import numpy as np
+import pytest
+
+from exotx.data.marketdata import MarketData
+from exotx.data.static import DayCounter
+from exotx.data.volsurface import VolSurface
+from exotx.enums.enums import VolatilityInterpolation
+
+
+# Arrange
+@pytest.fixture
+def my_vol_surface(my_market_data: MarketData) -> VolSurface:
+    return my_market_data.get_vol_surface()
+
+
+def test_vol_surface_from_market_data(my_market_data: MarketData, my_vol_surface: VolSurface) -> None:
+    # Assert
+    assert my_vol_surface.volatilities.shape == (len(my_market_data.expiration_dates), len(my_market_data.strikes))
+    np.testing.assert_array_equal(my_vol_surface.volatilities, my_market_data.data)
+    assert my_vol_surface.times[0] == pytest.approx(30 / 365)
+    assert my_market_data.get_vol_surface() is my_vol_surface
+    with pytest.raises(ValueError):
+        my_vol_surface.volatilities[0, 0] = 0.5
+
+
+def test_vol_surface_total_variance_interpolation(my_vol_surface: VolSurface) -> None:
+    # Arrange
+    random_generator = np.random.default_rng(0)
+    times = np.concatenate(([0.0], my_vol_surface.times[:8], random_generator.uniform(0.0, 3.0, 500)))
+    strikes = np.concatenate((my_vol_surface.strikes[:1], my_vol_surface.strikes,
+                              random_generator.uniform(50.0, 160.0, 500)))
+    ql_surface = my_vol_surface.get_ql_black_variance_surface(ql.TARGET())
+
+    # Act
+    volatilities = my_vol_surface.get_black_volatilities(times, strikes)
+
+    # Assert
+    expected = [ql_surface.blackVol(float(time), float(strike)) for time, strike in zip(times, strikes)]
+    np.testing.assert_allclose(volatilities, expected, rtol=0.0, atol=1e-12)
+    assert my_vol_surface.get_ql_black_variance_surface(ql.TARGET()) is ql_surface
+
+
+def test_vol_surface_bilinear_interpolation(my_vol_surface: VolSurface) -> None:
+    # Arrange
+    times = my_vol_surface.times
+    strikes = my_vol_surface.strikes
+
+    # Act
+    nodes = my_vol_surface.get_black_volatilities(times[:, None], strikes[None, :],
+                                                  VolatilityInterpolation.BILINEAR)
+    middle = my_vol_surface.get_black_volatilities(0.5 * (times[0] + times[1]), 0.5 * (strikes[0] + strikes[1]),
+                                                   VolatilityInterpolation.BILINEAR)
+    extrapolated = my_vol_surface.get_black_volatilities([10.0, 0.0], [1000.0, 1.0],
+                                                         VolatilityInterpolation.BILINEAR)
+
+    # Assert
+    np.testing.assert_array_equal(nodes, my_vol_surface.volatilities)
+    assert middle == pytest.approx(my_vol_surface.volatilities[:2, :2].mean())
+    np.testing.assert_array_equal(extrapolated, [my_vol_surface.volatilities[-1, -1],
+                                                 my_vol_surface.volatilities[0, 0]])
+
+
+def test_vol_surface_content_hash(my_market_data: MarketData, my_vol_surface: VolSurface) -> None:
+    # Arrange
+    same_vol_surface = VolSurface(my_market_data.reference_date, my_market_data.expiration_dates,
+                                  my_market_data.strikes, my_market_data.data)
+    bumped_data = [[volatility + 0.01 for volatility in row] for row in my_market_data.data]
+
+    # Act
+    my_market_data.data = bumped_data
+    bumped_vol_surface = my_market_data.get_vol_surface()
+
+    # Assert
+    assert same_vol_surface.content_hash == my_vol_surface.content_hash
+    assert same_vol_surface == my_vol_surface and hash(same_vol_surface) == hash(my_vol_surface)
+    assert bumped_vol_surface is not my_vol_surface
+    assert bumped_vol_surface.content_hash != my_vol_surface.content_hash
+    assert my_market_data.get_vol_surface(DayCounter.Actual360).content_hash != bumped_vol_surface.content_hash
+
+
+def test_vol_surface_without_data() -> None:
+    # Arrange
+    my_market_data = MarketData(underlying_spots=[100.0], risk_free_rate=0.01, dividend_rate=0.0,
+                                reference_date='2015-11-06', underlying_black_scholes_volatilities=[0.2])
+
+    # Act & Assert
+    assert my_market_data.get_vol_surface() is None
+    with pytest.raises(ValueError, match="after the reference date"):
+        VolSurface('2015-11-06', ['2015-11-06'], [100.0], [[0.2]])
+
+
+def test_vol_surface_pickle(my_vol_surface: VolSurface) -> None:
+    # Arrange
+    my_vol_surface.get_ql_black_variance_surface(ql.TARGET())
+
+    # Act
+    vol_surface = pickle.loads(pickle.dumps(my_vol_surface))
+
+    # Assert
+    assert vol_surface == my_vol_surface
+    np.testing.assert_array_equal(vol_surface.times, my_vol_surface.times)
+    assert vol_surface.get_ql_black_variance_surface(ql.TARGET()).blackVol(0.5, 100.0) == \
+        my_vol_surface.get_ql_black_variance_surface(ql.TARGET()).blackVol(0.5, 100.0)
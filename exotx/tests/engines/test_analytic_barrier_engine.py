@@ -0,0 +1,59 @@
+import itertools
+
+import QuantLib as ql
+import numpy as np
+import pytest
+
+from exotx.engines.analytic_barrier_engine import analytic_barrier_prices
+
+
+# Arrange
+@pytest.fixture
+def my_process() -> ql.BlackScholesMertonProcess:
+    reference_date = ql.Date(6, 11, 2015)
+    ql.Settings.instance().evaluationDate = reference_date
+    day_counter = ql.Actual360()
+    return ql.BlackScholesMertonProcess(
+        ql.QuoteHandle(ql.SimpleQuote(100.0)),
+        ql.YieldTermStructureHandle(ql.FlatForward(reference_date, 0.04, day_counter)),
+        ql.YieldTermStructureHandle(ql.FlatForward(reference_date, 0.08, day_counter)),
+        ql.BlackVolTermStructureHandle(ql.BlackConstantVol(reference_date, ql.TARGET(), 0.25, day_counter)))
+
+
+def test_analytic_barrier_prices_match_quantlib(my_process: ql.BlackScholesMertonProcess) -> None:
+    # Arrange
+    reference_date = ql.Date(6, 11, 2015)
+    rows = []
+    for barrier_type, option_type, strike, barrier, rebate, days in itertools.product(
+            [ql.Barrier.DownIn, ql.Barrier.DownOut, ql.Barrier.UpIn, ql.Barrier.UpOut],
+            [ql.Option.Call, ql.Option.Put], [90.0, 100.0, 110.0], [95.0, 105.0], [0.0, 3.0], [180, 400]):
+        is_down = barrier_type in (ql.Barrier.DownIn, ql.Barrier.DownOut)
+        if (is_down and barrier > 100.0) or (not is_down and barrier < 100.0):
+            continue
+        ql_option = ql.BarrierOption(barrier_type, barrier, rebate, ql.PlainVanillaPayoff(option_type, strike),
+                                     ql.EuropeanExercise(reference_date + days))
+        ql_option.setPricingEngine(ql.AnalyticBarrierEngine(my_process))
+        rows.append((barrier_type, option_type, strike, barrier, rebate, days / 360.0, ql_option.NPV()))
+    data = np.array(rows)
+
+    # Act
+    prices = analytic_barrier_prices(data[:, 0], data[:, 1], 100.0, data[:, 2], data[:, 3], data[:, 4], data[:, 5],
+                                     0.08, 0.04, 0.25)
+
+    # Assert
+    np.testing.assert_allclose(prices, data[:, 6], rtol=0, atol=1e-10)
+
+
+def test_analytic_barrier_prices_broadcast_scalars() -> None:
+    # Act
+    prices = analytic_barrier_prices(ql.Barrier.UpIn, ql.Option.Call, 100.0, [90.0, 100.0, 110.0], 105.0, 3.0, 0.5,
+                                     0.08, 0.04, 0.25)
+
+    # Assert
+    np.testing.assert_allclose(prices, [14.111173119603055, 8.448206354250173, 4.590969266108855], atol=1e-10)
+
+
+def test_analytic_barrier_prices_touched_barrier() -> None:
+    with pytest.raises(ValueError, match="Barrier touched"):
+        _ = analytic_barrier_prices(ql.Barrier.DownOut, ql.Option.Call, 100.0, 100.0, [95.0, 105.0], 0.0, 0.5,
+                                    0.08, 0.04, 0.25)
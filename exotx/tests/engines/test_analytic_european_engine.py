@@ -0,0 +1,47 @@
+import itertools
+
+import QuantLib as ql
+import numpy as np
+import pytest
+
+from exotx.engines.analytic_european_engine import analytic_european_prices
+
+
+# Arrange
+@pytest.fixture
+def my_process() -> ql.BlackScholesMertonProcess:
+    reference_date = ql.Date(6, 11, 2015)
+    ql.Settings.instance().evaluationDate = reference_date
+    day_counter = ql.Actual360()
+    return ql.BlackScholesMertonProcess(
+        ql.QuoteHandle(ql.SimpleQuote(100.0)),
+        ql.YieldTermStructureHandle(ql.FlatForward(reference_date, 0.03, day_counter)),
+        ql.YieldTermStructureHandle(ql.FlatForward(reference_date, 0.06, day_counter)),
+        ql.BlackVolTermStructureHandle(ql.BlackConstantVol(reference_date, ql.TARGET(), 0.25, day_counter)))
+
+
+def test_analytic_european_prices_match_quantlib(my_process: ql.BlackScholesMertonProcess) -> None:
+    # Arrange
+    reference_date = ql.Date(6, 11, 2015)
+    rows = []
+    for option_type, strike, days in itertools.product([ql.Option.Call, ql.Option.Put], [60.0, 90.0, 100.0, 140.0],
+                                                       [30, 180, 720]):
+        ql_option = ql.VanillaOption(ql.PlainVanillaPayoff(option_type, strike),
+                                     ql.EuropeanExercise(reference_date + days))
+        ql_option.setPricingEngine(ql.AnalyticEuropeanEngine(my_process))
+        rows.append((option_type, strike, days / 360.0, ql_option.NPV()))
+    data = np.array(rows)
+
+    # Act
+    prices = analytic_european_prices(data[:, 0], 100.0, data[:, 1], data[:, 2], 0.06, 0.03, 0.25)
+
+    # Assert
+    np.testing.assert_allclose(prices, data[:, 3], rtol=0, atol=1e-10)
+
+
+def test_analytic_european_prices_at_expiry() -> None:
+    # Act
+    prices = analytic_european_prices([ql.Option.Call, ql.Option.Put], 100.0, [90.0, 90.0], 0.0, 0.05, 0.0, 0.2)
+
+    # Assert
+    np.testing.assert_allclose(prices, [10.0, 0.0])
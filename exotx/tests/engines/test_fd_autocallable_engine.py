@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from scipy.special import ndtr
+
+from exotx.engines.fd_autocallable_engine import FdBlackScholesAutocallableEngine
+from exotx.instruments.autocallable import Autocallable
+
+
+# Arrange
+@pytest.fixture
+def my_autocallable() -> Autocallable:
+    return Autocallable(notional=100, strike=100, autocall_barrier_level=1.0, annual_coupon_value=0.03,
+                        coupon_barrier_level=0.75, protection_barrier_level=0.75)
+
+
+@pytest.fixture
+def my_observations() -> dict:
+    times = np.arange(1, 7) * 0.5
+    return {'observation_times': times,
+            'accrual_fractions': np.full(6, 0.5),
+            'risk_free_discounts': np.exp(-0.01 * times),
+            'dividend_discounts': np.exp(-0.02 * times)}
+
+
+def test_fd_autocallable_single_observation_matches_closed_form(my_autocallable: Autocallable) -> None:
+    # Arrange
+    time, rate, dividend, volatility, spot = 1.0, 0.01, 0.02, 0.2, 100.0
+    engine = FdBlackScholesAutocallableEngine(spot, volatility, time_steps=200, space_steps=800)
+
+    # Act
+    result = engine.calculate(my_autocallable, np.array([time]), np.array([1.0]), np.array([np.exp(-rate * time)]),
+                              np.array([np.exp(-dividend * time)]))
+
+    # Assert: redemption plus coupon above the barrier, the underlying below
+    barrier = my_autocallable.strike * my_autocallable.coupon_barrier_level
+    std_deviation = volatility * np.sqrt(time)
+    d1 = (np.log(spot / barrier) + (rate - dividend) * time) / std_deviation + 0.5 * std_deviation
+    expected = np.exp(-rate * time) * 103.0 * ndtr(d1 - std_deviation) + \
+        spot * np.exp(-dividend * time) * ndtr(-d1)
+    assert result['price'] == pytest.approx(expected, abs=5e-4)
+
+
+def test_fd_autocallable_constant_local_volatility(my_autocallable: Autocallable, my_observations: dict) -> None:
+    # Arrange
+    engine = FdBlackScholesAutocallableEngine(100.0, 0.2)
+    local_volatility_engine = FdBlackScholesAutocallableEngine(
+        100.0, 0.2, local_volatility=lambda t, spots: np.full(spots.shape, 0.2))
+
+    # Act
+    result = engine.calculate(my_autocallable, **my_observations)
+    local_volatility_result = local_volatility_engine.calculate(my_autocallable, **my_observations)
+
+    # Assert
+    for key in ['price', 'delta', 'gamma']:
+        assert local_volatility_result[key] == pytest.approx(result[key], abs=1e-10)
+
+
+def test_fd_autocallable_memory_adds_value(my_autocallable: Autocallable, my_observations: dict) -> None:
+    # Arrange
+    memory_autocallable = Autocallable(100, 100, 1.0, 0.03, 0.75, 0.75, has_memory=True)
+    engine = FdBlackScholesAutocallableEngine(100.0, 0.2)
+
+    # Act
+    price = engine.calculate(my_autocallable, **my_observations)['price']
+    memory_price = engine.calculate(memory_autocallable, **my_observations)['price']
+
+    # Assert
+    assert memory_price > price
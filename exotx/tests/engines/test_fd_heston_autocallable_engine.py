@@ -0,0 +1,67 @@
+import QuantLib as ql
+import numpy as np
+import pytest
+
+from exotx.engines.fd_autocallable_engine import FdBlackScholesAutocallableEngine
+from exotx.engines.fd_heston_autocallable_engine import FdHestonAutocallableEngine
+from exotx.instruments.autocallable import Autocallable
+
+
+# Arrange
+@pytest.fixture
+def my_autocallable() -> Autocallable:
+    return Autocallable(notional=100, strike=100, autocall_barrier_level=1.0, annual_coupon_value=0.03,
+                        coupon_barrier_level=0.75, protection_barrier_level=0.75)
+
+
+def test_fd_heston_autocallable_single_observation_matches_analytic_heston(my_autocallable: Autocallable) -> None:
+    # Arrange
+    time, rate, dividend, spot = 1.0, 0.01, 0.02, 100.0
+    v0, kappa, theta, sigma, rho = 0.04, 1.5, 0.05, 0.6, -0.7
+    reference_date = ql.Date(6, 11, 2015)
+    ql.Settings.instance().evaluationDate = reference_date
+    day_counter = ql.Actual365Fixed()
+    process = ql.HestonProcess(ql.YieldTermStructureHandle(ql.FlatForward(reference_date, rate, day_counter)),
+                               ql.YieldTermStructureHandle(ql.FlatForward(reference_date, dividend, day_counter)),
+                               ql.QuoteHandle(ql.SimpleQuote(spot)), v0, kappa, theta, sigma, rho)
+    analytic_engine = ql.AnalyticHestonEngine(ql.HestonModel(process))
+
+    def call_price(strike: float) -> float:
+        option = ql.VanillaOption(ql.PlainVanillaPayoff(ql.Option.Call, strike),
+                                  ql.EuropeanExercise(reference_date + 365))
+        option.setPricingEngine(analytic_engine)
+        return option.NPV()
+
+    engine = FdHestonAutocallableEngine(spot, v0, kappa, theta, sigma, rho, time_steps=100, space_steps=200,
+                                        variance_steps=50)
+
+    # Act
+    result = engine.calculate(my_autocallable, np.array([time]), np.array([1.0]), np.array([np.exp(-rate * time)]),
+                              np.array([np.exp(-dividend * time)]))
+
+    # Assert: redemption plus coupon above the barrier, the underlying below
+    barrier = 75.0
+    digital = (call_price(barrier - 1e-3) - call_price(barrier + 1e-3)) / 2e-3
+    expected = (103.0 - barrier) * digital + spot * np.exp(-dividend * time) - call_price(barrier)
+    assert result['price'] == pytest.approx(expected, abs=2e-3)
+
+
+@pytest.mark.parametrize("has_memory", [False, True])
+def test_fd_heston_autocallable_black_scholes_limit(has_memory: bool) -> None:
+    # Arrange
+    autocallable = Autocallable(100, 100, 1.0, 0.03, 0.75, 0.75, has_memory)
+    times = np.arange(1, 7) * 0.5
+    observations = {'observation_times': times,
+                    'accrual_fractions': np.full(6, 0.5),
+                    'risk_free_discounts': np.exp(-0.01 * times),
+                    'dividend_discounts': np.exp(-0.02 * times)}
+    engine = FdHestonAutocallableEngine(100.0, 0.04, 1.0, 0.04, 1e-3, -0.5, time_steps=100, space_steps=200,
+                                        variance_steps=20)
+
+    # Act
+    result = engine.calculate(autocallable, **observations)
+    expected = FdBlackScholesAutocallableEngine(100.0, 0.2).calculate(autocallable, **observations)
+
+    # Assert
+    assert result['price'] == pytest.approx(expected['price'], abs=2e-2)
+    assert result['delta'] == pytest.approx(expected['delta'], abs=1e-3)
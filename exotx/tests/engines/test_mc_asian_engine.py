@@ -0,0 +1,101 @@
+from typing import List
+
+import QuantLib as ql
+import numpy as np
+import pytest
+
+from exotx.data.marketdata import MarketData
+from exotx.data.staticdata import StaticData
+from exotx.engines.mc_asian_engine import MCDiscreteArithmeticAsianEngine
+from exotx.instruments.average_convention import AverageConvention
+from exotx.models.blackscholesmodel import BlackScholesModel
+
+
+# Arrange
+@pytest.fixture
+def my_process(my_static_data: StaticData) -> ql.BlackScholesMertonProcess:
+    market_data = MarketData(reference_date='2015-11-06', underlying_spots=[100.0], risk_free_rate=0.06,
+                             dividend_rate=0.03, underlying_black_scholes_volatilities=[0.2])
+    ql.Settings.instance().evaluationDate = market_data.get_ql_reference_date()
+    return BlackScholesModel(market_data, my_static_data).setup()
+
+
+@pytest.fixture
+def my_fixing_dates() -> List[ql.Date]:
+    reference_date = ql.Date(6, 11, 2015)
+    return [reference_date + 36 * i for i in range(1, 11)]
+
+
+@pytest.mark.parametrize('option_type, strike', [
+    (ql.Option.Call, 90.0),
+    (ql.Option.Call, 110.0),
+    (ql.Option.Put, 100.0)
+])
+def test_geometric_average_price_matches_quantlib(my_process: ql.BlackScholesMertonProcess,
+                                                  my_static_data: StaticData,
+                                                  my_fixing_dates: List[ql.Date],
+                                                  option_type: ql.Option,
+                                                  strike: float) -> None:
+    # Arrange
+    maturity = my_fixing_dates[-1]
+    ql_option = ql.DiscreteAveragingAsianOption(ql.Average.Geometric, 1.0, 0, my_fixing_dates,
+                                                ql.PlainVanillaPayoff(option_type, strike),
+                                                ql.EuropeanExercise(maturity))
+    ql_option.setPricingEngine(ql.AnalyticDiscreteGeometricAveragePriceAsianEngine(my_process))
+    reference_date = my_process.riskFreeRate().referenceDate()
+    day_counter = my_static_data.get_ql_day_counter()
+    times = np.array([day_counter.yearFraction(reference_date, date) for date in my_fixing_dates])
+    log_forwards = np.log([my_process.x0() * my_process.dividendYield().discount(date) /
+                           my_process.riskFreeRate().discount(date) for date in my_fixing_dates])
+
+    # Act
+    result = MCDiscreteArithmeticAsianEngine.geometric_average_price(
+        option_type, strike, times, log_forwards, my_process.blackVolatility().blackVol(maturity, strike),
+        my_process.riskFreeRate().discount(maturity))
+
+    # Assert
+    assert result == pytest.approx(ql_option.NPV(), abs=1e-10)
+
+
+@pytest.mark.parametrize('option_type, strike', [
+    (ql.Option.Call, 100.0),
+    (ql.Option.Put, 100.0)
+])
+def test_arithmetic_average_price_matches_quantlib(my_process: ql.BlackScholesMertonProcess,
+                                                   my_static_data: StaticData,
+                                                   my_fixing_dates: List[ql.Date],
+                                                   option_type: ql.Option,
+                                                   strike: float) -> None:
+    # Arrange
+    maturity = my_fixing_dates[-1]
+    ql_option = ql.DiscreteAveragingAsianOption(ql.Average.Arithmetic, 0.0, 0, my_fixing_dates,
+                                                ql.PlainVanillaPayoff(option_type, strike),
+                                                ql.EuropeanExercise(maturity))
+    ql_option.setPricingEngine(ql.MCDiscreteArithmeticAPEngine(my_process, 'pseudorandom', requiredSamples=200000,
+                                                               controlVariate=True, seed=3))
+    engine = MCDiscreteArithmeticAsianEngine(my_process, my_static_data.get_ql_day_counter(), seed=1)
+
+    # Act
+    result = engine.calculate(option_type, strike, maturity, my_fixing_dates, AverageConvention.PRICE)
+
+    # Assert
+    assert result['price'] == pytest.approx(ql_option.NPV(), abs=5e-3)
+    assert 0.0 < result['std_error'] < 1e-3
+
+
+def test_control_variate_reduces_standard_error(my_process: ql.BlackScholesMertonProcess,
+                                                my_static_data: StaticData,
+                                                my_fixing_dates: List[ql.Date]) -> None:
+    # Arrange
+    day_counter = my_static_data.get_ql_day_counter()
+    maturity = my_fixing_dates[-1]
+
+    # Act
+    with_control = MCDiscreteArithmeticAsianEngine(my_process, day_counter, 20000).calculate(
+        ql.Option.Call, 100.0, maturity, my_fixing_dates, AverageConvention.PRICE)
+    without_control = MCDiscreteArithmeticAsianEngine(my_process, day_counter, 20000, control_variate=False).calculate(
+        ql.Option.Call, 100.0, maturity, my_fixing_dates, AverageConvention.PRICE)
+
+    # Assert
+    assert with_control['std_error'] < 0.1 * without_control['std_error']
+    assert with_control['price'] == pytest.approx(without_control['price'], abs=4 * without_control['std_error'])
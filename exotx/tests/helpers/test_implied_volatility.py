@@ -0,0 +1,65 @@
+import QuantLib as ql
+import numpy as np
+import pytest
+from scipy.special import ndtr
+
+from exotx.helpers.implied_volatility import black_implied_volatilities
+
+
+def _black_prices(option_types, forwards, strikes, times, discount_factors, volatilities):
+    phi = np.where(option_types == ql.Option.Call, 1.0, -1.0)
+    std_deviations = volatilities * np.sqrt(times)
+    d1 = np.log(forwards / strikes) / std_deviations + 0.5 * std_deviations
+    return discount_factors * phi * (forwards * ndtr(phi * d1) - strikes * ndtr(phi * (d1 - std_deviations)))
+
+
+def test_black_implied_volatilities_against_quantlib() -> None:
+    # Arrange
+    quotes = [(ql.Option.Call, 80.0, 100.0, 0.1, 0.95, 0.5), (ql.Option.Put, 80.0, 100.0, 2.0, 0.9, 0.15),
+              (ql.Option.Call, 250.0, 100.0, 5.0, 0.8, 0.35), (ql.Option.Put, 49.0, 50.0, 0.02, 1.0, 0.04)]
+    option_types, strikes, forwards, times, discount_factors, volatilities = map(np.array, zip(*quotes))
+    prices = [ql.blackFormula(*quote[:3], quote[5] * np.sqrt(quote[3]), quote[4]) for quote in quotes]
+
+    # Act
+    implied_volatilities, converged = black_implied_volatilities(option_types, prices, forwards, strikes, times,
+                                                                 discount_factors)
+
+    # Assert
+    assert np.all(converged)
+    np.testing.assert_allclose(implied_volatilities, volatilities, rtol=1e-10)
+
+
+def test_black_implied_volatilities_batch() -> None:
+    # Arrange
+    random_generator = np.random.default_rng(0)
+    size = 100000
+    strikes = random_generator.uniform(30.0, 250.0, size)
+    times = random_generator.uniform(0.01, 5.0, size)
+    volatilities = random_generator.uniform(0.03, 1.5, size)
+    option_types = np.where(strikes > 100.0, ql.Option.Call, ql.Option.Put)
+    discount_factors = np.exp(-0.03 * times)
+    prices = _black_prices(option_types, 100.0, strikes, times, discount_factors, volatilities)
+    # out-of-the-money quotes with a price too small to be represented are not invertible
+    quoted = prices > 1e-10
+
+    # Act
+    implied_volatilities, converged = black_implied_volatilities(option_types, prices, 100.0, strikes, times,
+                                                                 discount_factors)
+
+    # Assert
+    assert np.all(converged[quoted])
+    np.testing.assert_allclose(implied_volatilities[quoted], volatilities[quoted], rtol=0.0, atol=1e-12)
+    in_the_money_prices = _black_prices(-option_types, 100.0, strikes, times, discount_factors, volatilities)
+    implied_volatilities, converged = black_implied_volatilities(-option_types, in_the_money_prices, 100.0, strikes,
+                                                                 times, discount_factors)
+    repriced = _black_prices(-option_types, 100.0, strikes, times, discount_factors, implied_volatilities)
+    np.testing.assert_allclose(repriced[converged], in_the_money_prices[converged], rtol=1e-13, atol=1e-12)
+
+
+@pytest.mark.parametrize('price', [0.0, -1.0, 20.0, 101.0])
+def test_black_implied_volatilities_out_of_bounds(price: float) -> None:
+    # Act
+    implied_volatility, converged = black_implied_volatilities(ql.Option.Call, price, 100.0, 80.0, 1.0)
+
+    # Assert
+    assert np.isnan(implied_volatility) and not converged
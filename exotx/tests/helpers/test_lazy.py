@@ -0,0 +1,59 @@
+import QuantLib as ql
+import pytest
+
+from exotx.data.static.calendars import calendars_to_ql_calendars, CalendarRegion, CalendarMarket, region_to_markets
+from exotx.data.static.daycounters import day_counters_to_ql, DayCounter
+from exotx.helpers.lazy import LazyMapping
+
+
+def test_lazy_mapping_builds_values_once_on_first_access():
+    # Arrange
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return object()
+
+    mapping = LazyMapping({'a': factory, 'b': factory})
+
+    # Act
+    first = mapping['a']
+    second = mapping['a']
+
+    # Assert
+    assert first is second
+    assert len(calls) == 1
+    assert mapping.is_built('a') and not mapping.is_built('b')
+    assert 'b' in mapping and 'c' not in mapping
+    assert list(mapping.keys()) == ['a', 'b'] and len(mapping) == 2
+    assert len(calls) == 1
+
+
+def test_lazy_mapping_missing_key():
+    with pytest.raises(KeyError):
+        LazyMapping({})['missing']
+
+
+def test_calendars_to_ql_calendars_lookup():
+    # Act
+    calendar = calendars_to_ql_calendars[CalendarRegion.UnitedStates][CalendarMarket.NYSE]
+
+    # Assert
+    assert calendar == ql.UnitedStates(ql.UnitedStates.NYSE)
+    assert calendar is calendars_to_ql_calendars[CalendarRegion.UnitedStates][CalendarMarket.NYSE]
+
+
+def test_calendars_to_ql_calendars_every_market_builds():
+    for region, markets in region_to_markets.items():
+        assert set(calendars_to_ql_calendars[region].keys()) == set(markets)
+        for market in markets:
+            assert calendars_to_ql_calendars[region][market].name()
+
+
+@pytest.mark.parametrize("day_counter, expected", [
+    (DayCounter.Actual360, ql.Actual360()),
+    (DayCounter.Actual365FixedNoLeap, ql.Actual365Fixed(ql.Actual365Fixed.NoLeap)),
+    (DayCounter.Thirty360, ql.Thirty360())
+])
+def test_day_counters_to_ql_lookup(day_counter, expected):
+    assert day_counters_to_ql[day_counter] == expected
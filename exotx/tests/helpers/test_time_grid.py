@@ -0,0 +1,27 @@
+import numpy as np
+
+from exotx.helpers.time_grid import refine_times
+
+
+def test_refine_times_inserts_intermediate_times():
+    # Arrange
+    times = np.array([0.0, 0.5, 0.52, 1.0])
+
+    # Act
+    refined_times, indices = refine_times(times, 4)
+
+    # Assert
+    np.testing.assert_allclose(refined_times, [0.0, 0.25, 0.5, 0.52, 0.76, 1.0], rtol=0.0, atol=1e-15)
+    np.testing.assert_array_equal(refined_times[indices], times)
+
+
+def test_refine_times_without_time_steps():
+    # Arrange
+    times = np.array([0.0, 0.5, 1.5])
+
+    # Act
+    refined_times, indices = refine_times(times)
+
+    # Assert
+    np.testing.assert_array_equal(refined_times, times)
+    np.testing.assert_array_equal(indices, [0, 1, 2])
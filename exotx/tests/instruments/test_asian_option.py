@@ -1,3 +1,4 @@
+import pickle
 from datetime import timedelta
 
 import QuantLib as ql
@@ -6,11 +7,11 @@ import pytest
 from exotx import price
 from exotx.data.marketdata import MarketData
 from exotx.data.staticdata import StaticData
-from exotx.enums.enums import PricingModel, NumericalMethod
+from exotx.enums.enums import PricingModel, NumericalMethod, RandomNumberGenerator
 from exotx.instruments.asian_option import AsianOption, AverageCalculation, AverageConvention
 from exotx.instruments.average_type import AverageType
 from exotx.instruments.option_type import OptionType
-from exotx.utils.pricing_configuration import PricingConfiguration
+from exotx.utils.pricing_configuration import PricingConfiguration, NumericalSettings
 
 
 # Arrange
@@ -146,3 +147,102 @@ def test_price_analytic_discrete_geometric_average_strike(my_asian_option: Asian
 
     # Assert
     assert result['price'] == pytest.approx(expected_price, abs=1e-5)
+
+
+def test_price_discrete_arithmetic_average_price_monte_carlo(my_asian_option: AsianOption,
+                                                            my_market_data: MarketData,
+                                                            my_static_data: StaticData) -> None:
+    # Arrange
+    my_asian_option.average_type = ql.Average().Arithmetic
+    my_asian_option.average_calculation = AverageCalculation.DISCRETE
+    my_asian_option.future_fixing_dates = [ql.Date().from_date(my_market_data.reference_date + timedelta(days=9 * i))
+                                           for i in range(1, 11)]
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.MC)
+
+    # Act
+    result = price(my_asian_option, my_market_data, my_static_data, pricing_config)
+
+    # Assert
+    # the arithmetic average is always greater than the geometric one, hence a cheaper put
+    geometric_result = price(AsianOption(85, '2016-02-04', OptionType.PUT, AverageType.GEOMETRIC,
+                                         AverageCalculation.DISCRETE, AverageConvention.PRICE,
+                                         future_fixing_dates=[my_market_data.reference_date + timedelta(days=9 * i)
+                                                              for i in range(1, 11)]),
+                             my_market_data, my_static_data, PricingConfiguration(PricingModel.BLACK_SCHOLES,
+                                                                                  NumericalMethod.ANALYTIC))
+    assert result['price'] < geometric_result['price']
+    assert result['price'] == pytest.approx(geometric_result['price'], abs=0.2)
+    assert 0.0 < result['std_error'] < 1e-3
+
+
+def test_price_discrete_geometric_average_price_monte_carlo(my_market_data: MarketData,
+                                                           my_static_data: StaticData) -> None:
+    # Arrange
+    asian_option = AsianOption(85, '2016-02-04', OptionType.PUT, AverageType.GEOMETRIC, AverageCalculation.DISCRETE,
+                               AverageConvention.PRICE,
+                               future_fixing_dates=[my_market_data.reference_date + timedelta(days=9 * i)
+                                                    for i in range(1, 11)])
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.MC,
+                                          RandomNumberGenerator.LOWDISCREPANCY,
+                                          numerical_settings=NumericalSettings(number_of_paths=10000))
+
+    # Act
+    result = price(asian_option, my_market_data, my_static_data, pricing_config)
+
+    # Assert
+    analytic_result = price(asian_option, my_market_data, my_static_data,
+                            PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.ANALYTIC))
+    assert result['price'] == pytest.approx(analytic_result['price'], abs=0.01)
+
+
+def test_price_discrete_arithmetic_average_price_number_of_paths(my_asian_option: AsianOption,
+                                                                 my_market_data: MarketData,
+                                                                 my_static_data: StaticData) -> None:
+    # Arrange
+    my_asian_option.average_type = ql.Average().Arithmetic
+    my_asian_option.average_calculation = AverageCalculation.DISCRETE
+    my_asian_option.future_fixing_dates = [ql.Date().from_date(my_market_data.reference_date + timedelta(days=9 * i))
+                                           for i in range(1, 11)]
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.MC)
+
+    # Act
+    result = price(my_asian_option, my_market_data, my_static_data, pricing_config)
+    pricing_config.numerical_settings = NumericalSettings(number_of_paths=1000)
+    fast_result = price(my_asian_option, my_market_data, my_static_data, pricing_config)
+
+    # Assert
+    # the standard error decreases as the square root of the number of paths
+    assert fast_result['std_error'] == pytest.approx(10 * result['std_error'], rel=0.2)
+    assert fast_result['price'] == pytest.approx(result['price'], abs=5 * fast_result['std_error'])
+
+
+@pytest.mark.parametrize("pricing_config", [
+    PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.MC, RandomNumberGenerator.LOWDISCREPANCY),
+    PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.MC, compute_greeks=True),
+    PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.MC,
+                         numerical_settings=NumericalSettings(monte_carlo_tolerance=0.01))
+])
+def test_price_discrete_arithmetic_monte_carlo_rejects_unsupported_configuration(
+        pricing_config: PricingConfiguration, my_asian_option: AsianOption, my_market_data: MarketData,
+        my_static_data: StaticData) -> None:
+    # Arrange
+    my_asian_option.average_type = ql.Average().Arithmetic
+    my_asian_option.average_calculation = AverageCalculation.DISCRETE
+    my_asian_option.future_fixing_dates = [ql.Date().from_date(my_market_data.reference_date + timedelta(days=9 * i))
+                                           for i in range(1, 11)]
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="does not|is not supported"):
+        price(my_asian_option, my_market_data, my_static_data, pricing_config)
+
+
+def test_asian_option_pickle() -> None:
+    # Arrange
+    asian_option = AsianOption(85, '2016-02-04', OptionType.CALL, AverageType.ARITHMETIC, AverageCalculation.DISCRETE,
+                               AverageConvention.STRIKE, 5.0, 1.0, 2, ['2016-01-04', '2016-02-04'])
+
+    # Act
+    unpickled_asian_option = pickle.loads(pickle.dumps(asian_option))
+
+    # Assert
+    assert vars(unpickled_asian_option) == vars(asian_option)
@@ -1,9 +1,16 @@
+import pickle
+
+import QuantLib as ql
+import numpy as np
 import pytest
 
 from exotx import price
 from exotx.data.marketdata import MarketData
 from exotx.data.staticdata import StaticData
-from exotx.instruments.autocallable import Autocallable
+from exotx.enums.enums import PricingModel, NumericalMethod, RandomNumberGenerator
+from exotx.instruments.autocallable import Autocallable, observation_schedule_cache_size
+from exotx.utils.path_cache import PathCache
+from exotx.utils.pricing_configuration import PricingConfiguration, NumericalSettings
 
 
 # Arrange
@@ -45,3 +52,220 @@ def test_autocallable_black_scholes_price(my_autocallable: Autocallable,
 
     # Assert
     assert pv == pytest.approx(96.08517973497098, abs=1e-10)
+
+
+@pytest.mark.parametrize("has_memory", [False, True])
+def test_autocallable_black_scholes_pde_price(has_memory: bool,
+                                              my_market_data: MarketData,
+                                              my_static_data: StaticData) -> None:
+    # Arrange
+    autocallable = Autocallable(100, 100, 1.0, 0.03, 0.75, 0.75, has_memory)
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.PDE, compute_greeks=True)
+
+    # Act
+    result = price(autocallable, my_market_data, my_static_data, pricing_config=pricing_config)
+    mc_pv = price(autocallable, my_market_data, my_static_data, 'black-scholes', 125)
+
+    # Assert
+    assert result['price'] == pytest.approx(mc_pv, abs=0.1)
+    assert 0.0 < result['delta'] < 1.0
+    assert result['gamma'] < 0.0
+
+
+def test_autocallable_observation_schedule_is_cached(my_autocallable: Autocallable,
+                                                     my_market_data: MarketData,
+                                                     my_static_data: StaticData) -> None:
+    # Arrange
+    reference_date = my_market_data.get_ql_reference_date()
+    other_static_data = StaticData(day_counter='Actual365Fixed', business_day_convention='Following')
+
+    # Act
+    schedule = my_autocallable._get_observation_schedule(reference_date, my_static_data)
+    other_schedule = my_autocallable._get_observation_schedule(reference_date, other_static_data)
+    price(my_autocallable, my_market_data, my_static_data, 'black-scholes', 125)
+
+    # Assert
+    assert my_autocallable._get_observation_schedule(reference_date, my_static_data) is schedule
+    assert other_schedule is not schedule
+    assert list(schedule.coupon_dates) == list(Autocallable._get_coupon_dates(reference_date, my_static_data))
+    assert schedule.dates[0] == reference_date
+    assert schedule.times == pytest.approx([my_static_data.get_ql_day_counter().yearFraction(reference_date, date)
+                                            for date in schedule.dates])
+    assert schedule.accrual_fractions.shape[0] == schedule.coupon_dates.shape[0]
+
+
+def test_autocallable_observation_schedules_are_bounded(my_autocallable: Autocallable,
+                                                        my_static_data: StaticData) -> None:
+    # Arrange
+    reference_dates = [ql.Date(6, 11, 2015) + days for days in range(10)]
+
+    # Act
+    schedules = [my_autocallable._get_observation_schedule(reference_date, my_static_data)
+                 for reference_date in reference_dates]
+
+    # Assert
+    assert len(my_autocallable._observation_schedules) == observation_schedule_cache_size
+    assert my_autocallable._get_observation_schedule(reference_dates[-1], my_static_data) is schedules[-1]
+    assert my_autocallable._get_observation_schedule(reference_dates[0], my_static_data) is not schedules[0]
+
+
+def test_autocallable_black_scholes_term_structure_price(my_autocallable: Autocallable,
+                                                         my_market_data: MarketData,
+                                                         my_static_data: StaticData) -> None:
+    # Arrange
+    flat_market_data = MarketData(reference_date='2015-11-06', underlying_spots=[100.0], risk_free_rate=0.01,
+                                  dividend_rate=0.0, expiration_dates=['2016-11-06', '2018-11-06'],
+                                  strikes=[50.0, 150.0], data=[[0.2, 0.2], [0.2, 0.2]],
+                                  underlying_black_scholes_volatilities=[0.2])
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES_TERM_STRUCTURE, NumericalMethod.MC)
+
+    # Act
+    result = price(my_autocallable, flat_market_data, my_static_data, seed=125, pricing_config=pricing_config)
+    pde_result = price(my_autocallable, my_market_data, my_static_data,
+                       pricing_config=PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.PDE))
+
+    # Assert
+    assert result['price'] == pytest.approx(pde_result['price'], abs=0.1)
+
+
+def test_autocallable_pickle_after_pricing(my_autocallable: Autocallable,
+                                           my_market_data: MarketData,
+                                           my_static_data: StaticData) -> None:
+    # Arrange
+    expected = price(my_autocallable, my_market_data, my_static_data, 'black-scholes', 125)
+
+    # Act
+    autocallable = pickle.loads(pickle.dumps(my_autocallable))
+
+    # Assert
+    assert not autocallable._observation_schedules
+    assert price(autocallable, my_market_data, my_static_data, 'black-scholes', 125) == expected
+
+
+def test_autocallable_black_scholes_price_with_path_cache(my_autocallable: Autocallable,
+                                                          my_market_data: MarketData,
+                                                          my_static_data: StaticData) -> None:
+    # Arrange
+    path_cache = PathCache()
+
+    # Act
+    pv = price(my_autocallable, my_market_data, my_static_data, 'black-scholes', 125, path_cache=path_cache)
+
+    # Assert
+    assert pv == pytest.approx(96.08517973497098, abs=1e-10)
+    assert path_cache.misses == 1
+
+
+def test_autocallables_share_paths(my_autocallable: Autocallable,
+                                   my_market_data: MarketData,
+                                   my_static_data: StaticData) -> None:
+    # Arrange
+    path_cache = PathCache()
+    other_autocallable = Autocallable(100, 100, 1.1, 0.05, 0.8, 0.6, True)
+    model = 'black-scholes-term-structure'
+    expected = [price(autocallable, my_market_data, my_static_data, model, 7)
+                for autocallable in [my_autocallable, other_autocallable]]
+
+    # Act
+    pvs = [price(autocallable, pickle.loads(pickle.dumps(my_market_data)), my_static_data, model, 7,
+                 path_cache=path_cache)
+           for autocallable in [my_autocallable, other_autocallable]]
+
+    # Assert
+    assert pvs == pytest.approx(expected, abs=1e-12)
+    assert (path_cache.hits, path_cache.misses) == (1, 1)
+
+
+def test_autocallable_monte_carlo_numerical_settings(my_autocallable: Autocallable,
+                                                     my_market_data: MarketData,
+                                                     my_static_data: StaticData) -> None:
+    # Arrange
+    path_cache = PathCache()
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES_TERM_STRUCTURE, NumericalMethod.MC,
+                                          numerical_settings=NumericalSettings(number_of_paths=5000))
+
+    # Act
+    result = price(my_autocallable, my_market_data, my_static_data, seed=7, path_cache=path_cache,
+                   pricing_config=pricing_config)
+
+    # Assert
+    (_, paths), = path_cache._simulations.values()
+    assert paths.shape[0] == 5000
+    assert result['price'] == pytest.approx(price(my_autocallable, my_market_data, my_static_data,
+                                                  'black-scholes-term-structure', 7), abs=1.0)
+
+
+def test_autocallable_pde_price_rejects_past_fixings(my_autocallable: Autocallable,
+                                                     my_market_data: MarketData,
+                                                     my_static_data: StaticData,
+                                                     monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange: a schedule with a first coupon date before the reference date
+    coupon_dates = Autocallable._get_coupon_dates(my_market_data.get_ql_reference_date(), my_static_data)
+    past_coupon_dates = np.hstack((np.array([my_market_data.get_ql_reference_date() - 30]), coupon_dates))
+    monkeypatch.setattr(Autocallable, '_get_coupon_dates', staticmethod(lambda *args: past_coupon_dates))
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.PDE)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="past fixings"):
+        price(my_autocallable, my_market_data, my_static_data, pricing_config=pricing_config)
+
+
+def test_autocallable_price_requires_model_or_pricing_configuration(my_autocallable: Autocallable,
+                                                                    my_market_data: MarketData,
+                                                                    my_static_data: StaticData) -> None:
+    # Arrange
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.PDE)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Exactly one"):
+        price(my_autocallable, my_market_data, my_static_data)
+    with pytest.raises(ValueError, match="Exactly one"):
+        price(my_autocallable, my_market_data, my_static_data, 'black-scholes', pricing_config=pricing_config)
+
+
+def test_autocallable_monte_carlo_time_steps(my_autocallable: Autocallable,
+                                             my_market_data: MarketData,
+                                             my_static_data: StaticData) -> None:
+    # Arrange
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.MC,
+                                          numerical_settings=NumericalSettings(number_of_paths=20000,
+                                                                               time_steps_per_year=12))
+
+    # Act
+    result = price(my_autocallable, my_market_data, my_static_data, seed=7, pricing_config=pricing_config)
+
+    # Assert
+    assert result['price'] == pytest.approx(price(my_autocallable, my_market_data, my_static_data,
+                                                  'black-scholes', 7), abs=0.5)
+
+
+@pytest.mark.parametrize("model, numerical_settings", [
+    (PricingModel.BLACK_SCHOLES, NumericalSettings(monte_carlo_tolerance=0.01)),
+    (PricingModel.BLACK_SCHOLES_TERM_STRUCTURE, NumericalSettings(time_steps_per_year=12)),
+    (PricingModel.LOCAL_VOLATILITY, NumericalSettings(calibration_max_iterations=10))
+])
+def test_autocallable_monte_carlo_rejects_unsupported_settings(model: PricingModel,
+                                                               numerical_settings: NumericalSettings,
+                                                               my_autocallable: Autocallable,
+                                                               my_market_data: MarketData,
+                                                               my_static_data: StaticData) -> None:
+    # Arrange
+    pricing_config = PricingConfiguration(model, NumericalMethod.MC, numerical_settings=numerical_settings)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="is not supported"):
+        price(my_autocallable, my_market_data, my_static_data, pricing_config=pricing_config)
+
+
+@pytest.mark.parametrize("pricing_config", [
+    PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.MC, RandomNumberGenerator.LOWDISCREPANCY),
+    PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.MC, compute_greeks=True),
+    PricingConfiguration(None, NumericalMethod.MC)
+])
+def test_autocallable_monte_carlo_rejects_unsupported_configuration(pricing_config: PricingConfiguration,
+                                                                    my_autocallable: Autocallable,
+                                                                    my_market_data: MarketData,
+                                                                    my_static_data: StaticData) -> None:
+    # Act & Assert
+    with pytest.raises(ValueError, match="does not|Invalid pricing configuration"):
+        price(my_autocallable, my_market_data, my_static_data, pricing_config=pricing_config)
@@ -3,7 +3,9 @@ import pytest
 from exotx import price
 from exotx.data.marketdata import MarketData
 from exotx.data.staticdata import StaticData
+from exotx.enums.enums import PricingModel, NumericalMethod
 from exotx.instruments.autocallable import Autocallable
+from exotx.utils.pricing_configuration import PricingConfiguration
 
 
 # Arrange
@@ -77,3 +79,18 @@ def test_autocallable_heston_price(my_autocallable: Autocallable,
 
     # Assert
     assert pv == pytest.approx(101.94274054345938, abs=1e-10)
+
+
+def test_autocallable_heston_pde_price(my_autocallable: Autocallable,
+                                       my_market_data: MarketData,
+                                       my_static_data: StaticData) -> None:
+    # Arrange
+    seed = 125
+    pricing_config = PricingConfiguration(PricingModel.HESTON, NumericalMethod.PDE, compute_greeks=True)
+
+    # Act
+    result = price(my_autocallable, my_market_data, my_static_data, seed=seed, pricing_config=pricing_config)
+
+    # Assert
+    assert result['price'] == pytest.approx(90.29257958377747, abs=1e-6)
+    assert 0.0 < result['delta'] < 1.0
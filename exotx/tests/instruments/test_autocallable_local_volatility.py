@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from exotx import price
+from exotx.data.marketdata import MarketData
+from exotx.data.staticdata import StaticData
+from exotx.enums.enums import PricingModel, NumericalMethod
+from exotx.instruments.autocallable import Autocallable
+from exotx.utils.pricing_configuration import PricingConfiguration
+
+
+# Arrange
+@pytest.fixture
+def my_market_data() -> MarketData:
+    # arbitrage-free smile, with a skew and a rising term structure
+    expiration_dates = ['2016-05-06', '2016-11-06', '2017-05-06', '2017-11-06', '2018-11-06']
+    times = [182 / 365, 366 / 365, 547 / 365, 731 / 365, 1096 / 365]
+    strikes = [40.0, 50.0, 60.0, 70.0, 80.0, 90.0, 100.0, 110.0, 120.0, 130.0, 140.0, 160.0, 180.0, 200.0]
+    data = [[0.2 + 0.05 * np.sqrt(t) - 0.1 * np.log(k / 100) + 0.3 * np.log(k / 100) ** 2 / np.sqrt(1 + t)
+             for k in strikes] for t in times]
+    return MarketData(underlying_spots=[100.0], risk_free_rate=0.01, dividend_rate=0.0, reference_date='2015-11-06',
+                      expiration_dates=expiration_dates, strikes=strikes, data=data,
+                      underlying_black_scholes_volatilities=[0.25])
+
+
+@pytest.mark.parametrize("has_memory", [False, True])
+def test_autocallable_local_volatility_price(has_memory: bool,
+                                             my_market_data: MarketData,
+                                             my_static_data: StaticData) -> None:
+    # Arrange
+    autocallable = Autocallable(100, 100, 1.0, 0.03, 0.75, 0.75, has_memory)
+    pde_config = PricingConfiguration(PricingModel.LOCAL_VOLATILITY, NumericalMethod.PDE, compute_greeks=True)
+    mc_config = PricingConfiguration(PricingModel.LOCAL_VOLATILITY, NumericalMethod.MC)
+
+    # Act
+    pde_result = price(autocallable, my_market_data, my_static_data, pricing_config=pde_config)
+    mc_result = price(autocallable, my_market_data, my_static_data, seed=125, pricing_config=mc_config)
+    mc_pv = price(autocallable, my_market_data, my_static_data, 'local-volatility', 125)
+
+    # Assert
+    assert mc_result['price'] == mc_pv
+    assert pde_result['price'] == pytest.approx(mc_pv, abs=0.15)
+    assert 0.0 < pde_result['delta'] < 1.0
@@ -1,9 +1,13 @@
+import pickle
+
 import pytest
 
 from exotx import price
 from exotx.data.marketdata import MarketData
 from exotx.data.staticdata import StaticData
+from exotx.enums.enums import PricingModel, NumericalMethod, FiniteDifferencePreset
 from exotx.instruments.barrier_option import BarrierOption, BarrierType
+from exotx.utils.pricing_configuration import PricingConfiguration, FiniteDifferenceSettings
 
 
 # replicates the tests in https://github.com/lballabio/QuantLib/blob/master/test-suite/barrieroption.cpp
@@ -71,3 +75,118 @@ def test_barrier_option_fd_heston_barrier_engine_constant_vol(my_barrier_option:
 
     # Assert
     assert pv == pytest.approx(14.114219673481117, abs=1e-8)
+
+
+def test_barrier_option_price_batch_matches_analytic_barrier_engine(my_market_data: MarketData,
+                                                                    my_static_data: StaticData) -> None:
+    # Arrange
+    barrier_options = [BarrierOption(barrier_type, barrier, strike, '2016-05-04', 'european', option_type, rebate)
+                       for barrier_type, barrier in [('downandin', 95), ('downandout', 95), ('upandin', 105),
+                                                     ('upandout', 105)]
+                       for strike in [90, 100, 110]
+                       for option_type in ['call', 'put']
+                       for rebate in [0.0, 3.0]]
+    expected = [price(barrier_option, my_market_data, my_static_data, 'analytic')
+                for barrier_option in barrier_options]
+
+    # Act
+    pvs = BarrierOption.price_batch(barrier_options, my_market_data, my_static_data)
+
+    # Assert
+    assert pvs == pytest.approx(expected, abs=1e-10)
+
+
+def test_barrier_option_price_batch_with_expired_options(my_market_data: MarketData,
+                                                       my_static_data: StaticData) -> None:
+    # Arrange
+    barrier_options = [BarrierOption('downandout', 95, 90, '2015-08-06', 'european', 'call', 0.0),
+                       BarrierOption('upandin', 105, 110, '2016-05-04', 'european', 'put', 3.0),
+                       BarrierOption('downandin', 95, 100, '2015-11-06', 'european', 'put', 0.0)]
+    expected = [price(barrier_option, my_market_data, my_static_data, 'analytic')
+                for barrier_option in barrier_options]
+
+    # Act
+    pvs = BarrierOption.price_batch(barrier_options, my_market_data, my_static_data)
+
+    # Assert
+    assert pvs[0] == 0.0 and pvs[2] == 0.0
+    assert pvs == pytest.approx(expected, abs=1e-10)
+    assert BarrierOption.price_batch(barrier_options[::2], my_market_data, my_static_data).tolist() == [0.0, 0.0]
+
+
+@pytest.mark.parametrize('preset, tolerance', [
+    (FiniteDifferencePreset.FAST, 5e-2),
+    (FiniteDifferencePreset.ACCURATE, 1e-3)
+])
+def test_barrier_option_fd_black_scholes_barrier_engine_presets(my_barrier_option: BarrierOption,
+                                                                my_market_data: MarketData,
+                                                                my_static_data: StaticData,
+                                                                preset: FiniteDifferencePreset,
+                                                                tolerance: float) -> None:
+    # Arrange
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.PDE,
+                                          finite_difference_settings=FiniteDifferenceSettings(preset=preset))
+
+    # Act
+    pv = price(my_barrier_option, my_market_data, my_static_data, 'fd-bs-barrier', pricing_config)
+
+    # Assert
+    assert pv == pytest.approx(14.111173119603055, abs=tolerance)
+
+
+def test_barrier_option_fd_black_scholes_barrier_engine_standard_preset(my_barrier_option: BarrierOption,
+                                                                        my_market_data: MarketData,
+                                                                        my_static_data: StaticData) -> None:
+    # Arrange
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.PDE,
+                                          finite_difference_settings=FiniteDifferenceSettings(
+                                              preset=FiniteDifferencePreset.STANDARD))
+
+    # Act
+    pv = price(my_barrier_option, my_market_data, my_static_data, 'fd-bs-barrier', pricing_config)
+
+    # Assert
+    assert pv == pytest.approx(14.113898622657395, abs=1e-8)
+
+
+@pytest.mark.parametrize('barrier_type, barrier, option_type', [
+    ('upandin', 105, 'call'),
+    ('upandout', 130, 'call'),
+    ('downandin', 95, 'put'),
+    ('downandout', 95, 'put')
+])
+def test_barrier_option_price_strikes(my_market_data: MarketData,
+                                      my_static_data: StaticData,
+                                      barrier_type: str,
+                                      barrier: float,
+                                      option_type: str) -> None:
+    # Arrange
+    strikes = [80.0, 90.0, 100.0, 110.0, 120.0]
+    my_barrier_option = BarrierOption(barrier_type, barrier, 100.0, '2016-05-04', 'european', option_type, 3.0)
+    expected = BarrierOption.price_batch(
+        [BarrierOption(barrier_type, barrier, strike, '2016-05-04', 'european', option_type, 3.0)
+         for strike in strikes], my_market_data, my_static_data)
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.PDE,
+                                          finite_difference_settings=FiniteDifferenceSettings(
+                                              preset=FiniteDifferencePreset.ACCURATE))
+
+    # Act
+    pvs = my_barrier_option.price_strikes(strikes, my_market_data, my_static_data, pricing_config)
+
+    # Assert
+    assert pvs == pytest.approx(expected, abs=1e-3)
+
+
+def test_barrier_option_pickle(my_barrier_option: BarrierOption,
+                               my_market_data: MarketData,
+                               my_static_data: StaticData) -> None:
+    # Arrange
+    expected = price(my_barrier_option, my_market_data, my_static_data, 'analytic')
+
+    # Act
+    barrier_option = pickle.loads(pickle.dumps(my_barrier_option))
+
+    # Assert
+    for name in ['barrier_type', 'barrier', 'strike', 'maturity', 'exercise', 'option_type', 'rebate']:
+        assert getattr(barrier_option, name) == getattr(my_barrier_option, name)
+    assert price(barrier_option, my_market_data, my_static_data, 'analytic') == expected
@@ -1,13 +1,16 @@
+import pickle
+
+import QuantLib as ql
 import pytest
 
 from exotx import price
 from exotx.data.marketdata import MarketData
 from exotx.data.staticdata import StaticData
-from exotx.enums.enums import PricingModel, NumericalMethod
+from exotx.enums.enums import PricingModel, NumericalMethod, RandomNumberGenerator
 from exotx.instruments.basket_option import BasketOption
 from exotx.instruments.basket_type import BasketType
 from exotx.instruments.option_type import OptionType
-from exotx.utils.pricing_configuration import PricingConfiguration
+from exotx.utils.pricing_configuration import PricingConfiguration, NumericalSettings
 
 
 # Arrange
@@ -76,3 +79,43 @@ def test_price(my_basket_option: BasketOption,
 
     # Assert
     assert result['price'] == pytest.approx(expected_price, abs=1e-4)
+
+
+def test_basket_option_pickle(my_basket_option: BasketOption) -> None:
+    # Act
+    basket_option = pickle.loads(pickle.dumps(my_basket_option))
+
+    # Assert
+    assert vars(basket_option) == vars(my_basket_option)
+
+
+def test_price_with_numerical_settings(my_basket_option: BasketOption,
+                                       my_market_data: MarketData,
+                                       my_static_data: StaticData) -> None:
+    # Arrange
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.MC,
+                                          RandomNumberGenerator.LOWDISCREPANCY,
+                                          numerical_settings=NumericalSettings(number_of_paths=4096,
+                                                                               time_steps_per_year=12))
+
+    reference_date = my_market_data.get_ql_reference_date()
+    day_counter = my_static_data.get_ql_day_counter()
+    processes = [ql.BlackScholesMertonProcess(ql.QuoteHandle(ql.SimpleQuote(spot)),
+                                              my_market_data.get_dividend_curve(day_counter),
+                                              my_market_data.get_yield_curve(day_counter),
+                                              ql.BlackVolTermStructureHandle(ql.BlackConstantVol(
+                                                  reference_date, my_static_data.get_ql_calendar(), volatility,
+                                                  day_counter)))
+                 for spot, volatility in zip(my_market_data.underlying_spots,
+                                             my_market_data.underlying_black_scholes_volatilities)]
+    engine = ql.MCEuropeanBasketEngine(ql.StochasticProcessArray(processes, my_market_data.get_correlation_matrix()),
+                                       'lowdiscrepancy', timeStepsPerYear=12, requiredSamples=4096, seed=42)
+
+    # Act
+    result = price(my_basket_option, my_market_data, my_static_data, pricing_config, 42)
+
+    # Assert
+    ql_option = ql.BasketOption(ql.MinBasketPayoff(ql.PlainVanillaPayoff(ql.Option.Put, 85)),
+                                ql.EuropeanExercise(ql.Date(4, 2, 2016)))
+    ql_option.setPricingEngine(engine)
+    assert result['price'] == pytest.approx(ql_option.NPV(), abs=1e-12)
@@ -0,0 +1,118 @@
+import os
+import time
+
+import QuantLib as ql
+import numpy as np
+import pytest
+from marshmallow import ValidationError
+
+from exotx.instruments.asian_option import AsianOption
+from exotx.instruments.barrier_option import BarrierOption, BarrierOptionSchema
+from exotx.instruments.basket_option import BasketOptionSchema
+from exotx.instruments.bulk_loader import load_instruments
+from exotx.instruments.vanilla_option import VanillaOption, VanillaOptionSchema
+
+
+# Arrange
+@pytest.fixture
+def my_trades() -> list:
+    return [
+        {'instrument_type': 'vanilla_option', 'strike': 100.0, 'maturity': '2023-05-10', 'option_type': 'CALL'},
+        {'instrument_type': 'barrier_option', 'barrier_type': 'downandout', 'barrier': 80.0, 'strike': 100.0,
+         'maturity': '2023-05-10', 'option_type': 'put', 'rebate': 1.0},
+        {'instrument_type': 'basket_option', 'strike': 95.0, 'maturity': '2024-01-15', 'option_type': 'PUT',
+         'basket_type': 'MINBASKET'},
+        {'instrument_type': 'asian_option', 'strike': 100.0, 'maturity': '2023-12-01', 'option_type': 'call',
+         'average_type': 'arithmetic', 'average_calculation': 'discrete', 'average_convention': 'price',
+         'future_fixing_dates': ['2023-06-01', '2023-09-01', '2023-12-01']},
+        {'instrument_type': 'vanilla_option', 'strike': 110.0, 'maturity': '2023-08-10', 'option_type': 'PUT'}
+    ]
+
+
+def test_load_instruments(my_trades: list) -> None:
+    # Act
+    instruments = load_instruments(my_trades)
+
+    # Assert
+    assert len(instruments) == 5
+    assert not any(instruments.is_built(i) for i in range(5))
+    np.testing.assert_array_equal(instruments.get_columns('vanilla_option')['strike'], [100.0, 110.0])
+    np.testing.assert_array_equal(instruments.get_columns('vanilla_option')['maturity'],
+                                  np.array(['2023-05-10', '2023-08-10'], dtype='datetime64[D]'))
+    assert isinstance(instruments[0], VanillaOption) and instruments.is_built(0)
+    assert instruments[0] is instruments[0]
+    assert instruments[-1].option_type == ql.Option.Put
+    assert isinstance(instruments[1], BarrierOption) and instruments[1].rebate == 1.0
+    asian_option = instruments[3]
+    assert isinstance(asian_option, AsianOption)
+    assert asian_option.future_fixing_dates == [ql.Date(1, 6, 2023), ql.Date(1, 9, 2023), ql.Date(1, 12, 2023)]
+
+
+def test_load_instruments_matches_marshmallow_schemas(my_trades: list) -> None:
+    # Arrange
+    schemas = {'vanilla_option': VanillaOptionSchema(), 'barrier_option': BarrierOptionSchema(),
+               'basket_option': BasketOptionSchema()}
+    trades = [trade for trade in my_trades if trade['instrument_type'] in schemas]
+
+    # Act
+    instruments = load_instruments(trades)
+
+    # Assert
+    for trade, instrument in zip(trades, instruments):
+        fields = {key: value for key, value in trade.items() if key != 'instrument_type'}
+        if trade['instrument_type'] == 'barrier_option':
+            fields['option_type'] = fields['option_type'].lower()
+        expected = schemas[trade['instrument_type']].load(fields)
+        assert vars(instrument).keys() == vars(expected).keys()
+        for name, value in vars(expected).items():
+            if name != 'reference_date':
+                assert getattr(instrument, name) == value
+
+
+def test_load_instruments_errors(my_trades: list) -> None:
+    # Arrange
+    my_trades[0]['maturity'] = '2023-05'
+    my_trades[1]['strikes'] = 100.0
+    del my_trades[2]['basket_type']
+    my_trades[3]['future_fixing_dates'] = ['2023-06-01', '2023-13-01']
+    my_trades[4]['strike'] = -1.0
+
+    # Act
+    with pytest.raises(ValidationError) as error:
+        load_instruments(my_trades + [{'instrument_type': 'swap'}])
+
+    # Assert
+    assert error.value.messages == {
+        0: {'maturity': ['Not a valid date.']},
+        1: {'strikes': ['Unknown field.']},
+        2: {'basket_type': ['Missing data for required field.']},
+        3: {'future_fixing_dates': ['Not a valid date at position 1.']},
+        4: {'strike': ['Must be greater than or equal to 0.0.']},
+        5: {'instrument_type': ["Invalid instrument type \"swap\", expected one of ['vanilla_option', "
+                                "'asian_option', 'basket_option', 'barrier_option']"]}
+    }
+
+
+# wall-clock benchmark, only run on request as it depends on the load of the machine
+@pytest.mark.skipif(not os.environ.get('EXOTX_BENCHMARKS'), reason="Benchmark, run with EXOTX_BENCHMARKS=1")
+def test_load_instruments_is_faster_than_marshmallow() -> None:
+    # Arrange
+    random_generator = np.random.default_rng(0)
+    maturities = np.datetime64('2024-01-01') + random_generator.integers(0, 2000, 20000)
+    trades = [{'strike': strike, 'maturity': str(maturity), 'option_type': option_type}
+              for strike, maturity, option_type in zip(random_generator.uniform(50.0, 150.0, 20000).tolist(),
+                                                       maturities, random_generator.choice(['CALL', 'PUT'], 20000))]
+    schema = VanillaOptionSchema()
+
+    # Act
+    start = time.perf_counter()
+    instruments = load_instruments(trades, instrument_type='vanilla_option')
+    bulk_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = [schema.load(trade) for trade in trades]
+    marshmallow_elapsed = time.perf_counter() - start
+
+    # Assert
+    assert instruments[12345].maturity == expected[12345].maturity
+    # generous margin, the bulk loader is about 20 times faster
+    assert bulk_elapsed < marshmallow_elapsed / 3
@@ -0,0 +1,183 @@
+import pickle
+
+import QuantLib as ql
+import numpy as np
+import pandas as pd
+import pytest
+from marshmallow import ValidationError
+
+from exotx.data.marketdata import MarketData
+from exotx.data.staticdata import StaticData
+from exotx.enums.enums import NumericalMethod, PricingModel
+from exotx.instruments.barrier_option import BarrierOption
+from exotx.instruments.instrument import price
+from exotx.instruments.portfolio import Portfolio
+from exotx.instruments.vanilla_option import VanillaOption
+from exotx.utils.pricing_configuration import PricingConfiguration
+
+
+# Arrange
+@pytest.fixture
+def my_barrier_data_frame() -> pd.DataFrame:
+    rows = [(barrier_type, barrier, strike, maturity, option_type, rebate)
+            for barrier_type, barrier in [('downandin', 95.0), ('downandout', 95.0), ('upandin', 105.0),
+                                          ('upandout', 105.0)]
+            for strike in [90.0, 110.0]
+            for maturity in ['2016-05-04', '2016-11-04']
+            for option_type in ['call', 'put']
+            for rebate in [np.nan, 3.0]]
+    return pd.DataFrame(rows, columns=['barrier_type', 'barrier', 'strike', 'maturity', 'option_type', 'rebate'])
+
+
+def test_portfolio_from_csv(my_barrier_data_frame: pd.DataFrame, tmp_path) -> None:
+    # Arrange
+    path = tmp_path / 'barrier_options.csv'
+    my_barrier_data_frame.to_csv(path, index=False)
+
+    # Act
+    portfolio = Portfolio.from_csv(path, 'barrier_option')
+
+    # Assert
+    assert len(portfolio) == my_barrier_data_frame.shape[0]
+    np.testing.assert_array_equal(portfolio.columns['strike'], my_barrier_data_frame['strike'])
+    np.testing.assert_array_equal(portfolio.columns['maturity'],
+                                  my_barrier_data_frame['maturity'].to_numpy(dtype='datetime64[D]'))
+    # empty rebates take the default value
+    np.testing.assert_array_equal(portfolio.columns['rebate'], my_barrier_data_frame['rebate'].fillna(0.0))
+    barrier_option = portfolio[-1]
+    assert isinstance(barrier_option, BarrierOption)
+    assert barrier_option.maturity == ql.Date(4, 11, 2016)
+    assert portfolio[-1] is barrier_option
+
+
+def test_portfolio_barrier_option_prices(my_barrier_data_frame: pd.DataFrame,
+                                         my_market_data: MarketData,
+                                         my_static_data: StaticData) -> None:
+    # Arrange
+    portfolio = Portfolio.from_data_frame(my_barrier_data_frame, 'barrier_option')
+    expected = [price(portfolio[i], my_market_data, my_static_data, 'analytic') for i in range(len(portfolio))]
+
+    # Act
+    pvs = portfolio.price(my_market_data, my_static_data)
+
+    # Assert
+    np.testing.assert_allclose(pvs, expected, rtol=0, atol=1e-10)
+
+
+def test_portfolio_vanilla_option_prices(my_market_data: MarketData, my_static_data: StaticData) -> None:
+    # Arrange
+    columns = {'strike': np.array([80.0, 100.0, 120.0, 100.0]),
+               'maturity': np.array(['2016-02-06', '2016-11-06', '2017-11-06', '2016-05-06'], dtype='datetime64[D]'),
+               'option_type': ['call', 'put', 'CALL', 'Put']}
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.ANALYTIC)
+    expected = [VanillaOption(strike, str(maturity), option_type).price(my_market_data, my_static_data,
+                                                                       pricing_config)['price']
+                for strike, maturity, option_type in zip(*columns.values())]
+
+    # Act
+    portfolio = Portfolio.from_columns(columns, 'vanilla_option')
+    pvs = portfolio.price(my_market_data, my_static_data)
+
+    # Assert
+    np.testing.assert_allclose(pvs, expected, rtol=0, atol=1e-10)
+
+
+@pytest.mark.parametrize("instrument_type, columns", [
+    ('vanilla_option', {'strike': np.array([100.0, 100.0, 90.0]),
+                        'maturity': np.array(['2015-08-06', '2016-11-06', '2015-11-06'], dtype='datetime64[D]'),
+                        'option_type': ['call', 'put', 'call']}),
+    ('barrier_option', {'barrier_type': ['downandout', 'upandin', 'downandin'],
+                        'barrier': np.array([95.0, 105.0, 95.0]),
+                        'strike': np.array([90.0, 110.0, 100.0]),
+                        'maturity': np.array(['2015-08-06', '2016-11-04', '2015-11-06'], dtype='datetime64[D]'),
+                        'option_type': ['call', 'put', 'put']})
+])
+def test_portfolio_prices_with_expired_trades(instrument_type: str, columns: dict, my_market_data: MarketData,
+                                              my_static_data: StaticData) -> None:
+    # Arrange
+    portfolio = Portfolio.from_columns(columns, instrument_type)
+    if instrument_type == 'vanilla_option':
+        pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.ANALYTIC)
+        expected = [price(portfolio[i], my_market_data, my_static_data, pricing_config)['price']
+                    for i in range(len(portfolio))]
+    else:
+        expected = [price(portfolio[i], my_market_data, my_static_data, 'analytic') for i in range(len(portfolio))]
+
+    # Act
+    pvs = portfolio.price(my_market_data, my_static_data)
+
+    # Assert
+    assert pvs[0] == 0.0 and pvs[2] == 0.0 and pvs[1] > 0.0
+    np.testing.assert_allclose(pvs, expected, rtol=0, atol=1e-10)
+
+
+def test_portfolio_from_records() -> None:
+    # Act
+    portfolio = Portfolio.from_records([{'strike': 100.0, 'maturity': '2023-05-10', 'option_type': 'call'}],
+                                       'vanilla_option')
+
+    # Assert
+    assert len(portfolio) == 1
+    assert portfolio[0].strike == 100.0
+
+
+def test_portfolio_validation_errors() -> None:
+    # Arrange
+    columns = {'barrier_type': ['downandout', 'sideways'], 'barrier': [80.0, 80.0],
+               'maturity': ['2023-05-10', None], 'color': ['red', 'blue']}
+
+    # Act
+    with pytest.raises(ValidationError) as error:
+        Portfolio.from_columns(columns, 'barrier_option')
+
+    # Assert
+    assert error.value.messages == {
+        'color': ["Unknown field."],
+        'strike': ["Missing data for required field."],
+        1: {'barrier_type': ["Invalid value \"sideways\", expected one of "
+                             "['DOWNANDIN', 'DOWNANDOUT', 'UPANDIN', 'UPANDOUT']"],
+            'maturity': ["Missing data for required field."]}
+    }
+
+
+def test_portfolio_american_barrier_options_are_not_vectorized(my_market_data: MarketData,
+                                                              my_static_data: StaticData) -> None:
+    # Arrange
+    portfolio = Portfolio.from_columns({'barrier_type': ['downandout'], 'barrier': [80.0], 'strike': [100.0],
+                                        'maturity': ['2016-05-04'], 'exercise': ['american']}, 'barrier_option')
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="european exercise"):
+        portfolio.price(my_market_data, my_static_data)
+
+
+def test_portfolio_from_parquet(my_barrier_data_frame: pd.DataFrame, tmp_path) -> None:
+    # Arrange
+    pyarrow = pytest.importorskip('pyarrow')
+    import pyarrow.parquet
+    table = pyarrow.Table.from_pandas(my_barrier_data_frame.assign(
+        maturity=pd.to_datetime(my_barrier_data_frame['maturity']).dt.date), preserve_index=False)
+    path = tmp_path / 'barrier_options.parquet'
+    pyarrow.parquet.write_table(table, path)
+
+    # Act
+    portfolio = Portfolio.from_parquet(path, 'barrier_option')
+
+    # Assert
+    expected = Portfolio.from_data_frame(my_barrier_data_frame, 'barrier_option')
+    for name, column in expected.columns.items():
+        np.testing.assert_array_equal(portfolio.columns[name], column)
+
+
+def test_portfolio_pickle(my_barrier_data_frame: pd.DataFrame) -> None:
+    # Arrange
+    portfolio = Portfolio.from_data_frame(my_barrier_data_frame, 'barrier_option')
+    barrier_option = portfolio[0]
+
+    # Act
+    unpickled_portfolio = pickle.loads(pickle.dumps(portfolio))
+
+    # Assert
+    assert len(unpickled_portfolio) == len(portfolio)
+    assert vars(unpickled_portfolio[0]).keys() == vars(barrier_option).keys()
+    assert unpickled_portfolio[0].maturity == barrier_option.maturity
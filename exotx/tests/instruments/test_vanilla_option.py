@@ -1,3 +1,6 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 
 from exotx import price
@@ -95,3 +98,34 @@ def test_price(my_vanilla_option: VanillaOption,
         assert result['delta'] == pytest.approx(expected_delta, abs=1e-8)
         assert result['gamma'] == pytest.approx(expected_gamma, abs=1e-8)
         assert result['theta'] == pytest.approx(expected_theta, abs=1e-8)
+
+
+def test_vanilla_option_pickle(my_vanilla_option, my_market_data, my_static_data, my_pricing_config):
+    # Act
+    data = pickle.dumps(my_vanilla_option)
+    vanilla_option = pickle.loads(data)
+
+    # Assert
+    assert len(data) < 200
+    assert vanilla_option.strike == my_vanilla_option.strike
+    assert vanilla_option.maturity == my_vanilla_option.maturity
+    assert vanilla_option.option_type == my_vanilla_option.option_type
+    assert price(vanilla_option, my_market_data, my_static_data, my_pricing_config) == \
+        price(my_vanilla_option, my_market_data, my_static_data, my_pricing_config)
+
+
+def test_vanilla_option_price_in_process_pool(my_market_data, my_static_data, my_pricing_config):
+    # Arrange
+    vanilla_options = [VanillaOption(strike, '2016-05-04', option_type)
+                       for strike in [90, 100, 110] for option_type in ['call', 'put']]
+    expected = [price(vanilla_option, my_market_data, my_static_data, my_pricing_config)
+                for vanilla_option in vanilla_options]
+
+    # Act
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(price, vanilla_options, [my_market_data] * len(vanilla_options),
+                                    [my_static_data] * len(vanilla_options),
+                                    [my_pricing_config] * len(vanilla_options)))
+
+    # Assert
+    assert results == expected
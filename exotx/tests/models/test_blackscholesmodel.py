@@ -0,0 +1,67 @@
+import QuantLib as ql
+import numpy as np
+import pytest
+
+from exotx.data.marketdata import MarketData
+from exotx.data.staticdata import StaticData
+from exotx.models.blackscholesmodel import BlackScholesModel
+
+
+# Arrange
+@pytest.fixture
+def my_dates() -> np.ndarray:
+    return np.array([ql.Date(6, 11, 2015), ql.Date(6, 5, 2016), ql.Date(7, 11, 2016), ql.Date(8, 5, 2017),
+                     ql.Date(6, 11, 2017), ql.Date(7, 5, 2018), ql.Date(6, 11, 2018)])
+
+
+def test_black_scholes_total_variances_without_surface(my_dates: np.ndarray, my_static_data: StaticData) -> None:
+    # Arrange
+    market_data = MarketData(underlying_spots=[100.0], risk_free_rate=0.01, dividend_rate=0.0,
+                             reference_date='2015-11-06', underlying_black_scholes_volatilities=[0.2])
+
+    # Act
+    total_variances = BlackScholesModel(market_data, my_static_data).get_total_variances(my_dates)
+
+    # Assert
+    times = [my_static_data.get_ql_day_counter().yearFraction(my_dates[0], date) for date in my_dates]
+    np.testing.assert_allclose(total_variances, 0.04 * np.array(times), rtol=1e-14)
+
+
+def test_black_scholes_term_structure_paths(my_dates: np.ndarray, my_market_data: MarketData,
+                                            my_static_data: StaticData) -> None:
+    # Arrange
+    model = BlackScholesModel(my_market_data, my_static_data)
+    day_counter = my_static_data.get_ql_day_counter()
+    times = np.array([day_counter.yearFraction(my_dates[0], date) for date in my_dates])
+    forwards = my_market_data.underlying_spots[0] * np.exp((my_market_data.risk_free_rate -
+                                                            my_market_data.dividend_rate) * times)
+
+    # Act
+    total_variances = model.get_total_variances(my_dates)
+    paths = model.generate_term_structure_paths(my_dates, number_of_paths=200000, seed=7)
+
+    # Assert
+    vol_surface = my_market_data.get_vol_surface(my_static_data.day_counter)
+    np.testing.assert_allclose(total_variances, vol_surface.get_black_variances(times, forwards), rtol=1e-12)
+    assert paths.shape == (200000, my_dates.shape[0])
+    np.testing.assert_allclose(paths.mean(axis=0), forwards, rtol=2e-3)
+    np.testing.assert_allclose(np.diff(np.log(paths), axis=1).var(axis=0), np.diff(total_variances), rtol=2e-2)
+
+
+def test_black_scholes_paths_with_intermediate_steps(my_dates: np.ndarray, my_static_data: StaticData) -> None:
+    # Arrange
+    market_data = MarketData(underlying_spots=[100.0], risk_free_rate=0.01, dividend_rate=0.0,
+                             reference_date='2015-11-06', underlying_black_scholes_volatilities=[0.2])
+    model = BlackScholesModel(market_data, my_static_data)
+    day_counter = my_static_data.get_ql_day_counter()
+    times = np.array([day_counter.yearFraction(my_dates[0], date) for date in my_dates])
+
+    # Act
+    paths = model.generate_paths(my_dates, day_counter, model.setup(), number_of_paths=20000, seed=7,
+                                 time_steps_per_year=12)
+
+    # Assert
+    assert paths.shape == (20000, my_dates.shape[0])
+    np.testing.assert_allclose(paths[:, 0], 100.0)
+    np.testing.assert_allclose(paths.mean(axis=0), 100.0 * np.exp(0.01 * times), rtol=1e-2)
+    np.testing.assert_allclose(np.diff(np.log(paths), axis=1).var(axis=0), 0.04 * np.diff(times), rtol=5e-2)
@@ -1,3 +1,4 @@
+import QuantLib as ql
 import pytest
 
 from exotx.data.marketdata import MarketData
@@ -75,3 +76,22 @@ def test_heston_model_calibrate(my_market_data: MarketData, my_static_data: Stat
     assert sigma == pytest.approx(0.9764083761, abs=1e-8)
     assert rho == pytest.approx(-0.58773215478, abs=1e-8)
     assert v0 == pytest.approx(0.0801189418321, abs=1e-8)
+
+
+def test_heston_model_helpers_with_unsorted_expiration_dates(my_static_data: StaticData) -> None:
+    # Arrange
+    market_data = MarketData(reference_date='2015-11-06', underlying_spots=[659.37], risk_free_rate=0.01,
+                             dividend_rate=0.0, expiration_dates=['2016-11-06', '2015-12-06', '2016-05-06'],
+                             strikes=[593.43, 659.37, 725.31],
+                             data=[[0.33617, 0.32965, 0.31831], [0.30394, 0.26453, 0.25941],
+                                   [0.33154, 0.31948, 0.30424]])
+    heston_model = HestonModel(market_data, my_static_data)
+    _, model = heston_model._setup()
+
+    # Act
+    helpers, grid_data = heston_model._setup_helpers(ql.AnalyticHestonEngine(model))
+
+    # Assert
+    assert len(helpers) == 9
+    assert [date for date, _ in grid_data[::3]] == [ql.Date(6, 12, 2015), ql.Date(6, 5, 2016), ql.Date(6, 11, 2016)]
+    assert all(helper.modelValue() > 0 for helper in helpers)
@@ -0,0 +1,89 @@
+import QuantLib as ql
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from exotx.data.marketdata import MarketData
+from exotx.data.staticdata import StaticData
+from exotx.data.volsurface import VolSurface
+from exotx.models.localvolmodel import LocalVolatilityModel, LocalVolatilitySurface
+
+
+# Arrange
+@pytest.fixture
+def my_static_data() -> StaticData:
+    return StaticData(day_counter='Actual365Fixed')
+
+
+@pytest.fixture
+def my_market_data() -> MarketData:
+    # arbitrage-free smile, with a skew and a rising term structure
+    expiration_dates = ['2016-02-06', '2016-05-06', '2016-11-06', '2017-05-06', '2017-11-06']
+    times = [92 / 365, 182 / 365, 366 / 365, 547 / 365, 731 / 365]
+    strikes = [50.0, 60.0, 70.0, 80.0, 90.0, 100.0, 110.0, 120.0, 130.0, 140.0, 160.0, 180.0, 200.0]
+    data = [[0.2 + 0.05 * np.sqrt(t) - 0.1 * np.log(k / 100) + 0.3 * np.log(k / 100) ** 2 / np.sqrt(1 + t)
+             for k in strikes] for t in times]
+    return MarketData(underlying_spots=[100.0], risk_free_rate=0.03, dividend_rate=0.01, reference_date='2015-11-06',
+                      expiration_dates=expiration_dates, strikes=strikes, data=data,
+                      underlying_black_scholes_volatilities=[0.25])
+
+
+def test_local_volatility_flat_surface() -> None:
+    # Arrange
+    vol_surface = VolSurface('2015-11-06', ['2016-05-06', '2016-11-06'], [80.0, 100.0, 120.0],
+                             [[0.25, 0.25, 0.25], [0.25, 0.25, 0.25]])
+
+    # Act
+    local_volatility = LocalVolatilitySurface(vol_surface, 100.0, 0.03, 0.01, maximum_time=2.0)
+
+    # Assert
+    np.testing.assert_allclose(local_volatility.local_volatilities, 0.25, rtol=0.0, atol=1e-12)
+    np.testing.assert_allclose(local_volatility(1.5, np.array([50.0, 100.0, 300.0])), 0.25, rtol=0.0, atol=1e-12)
+
+
+def test_local_volatility_many_expiration_dates() -> None:
+    # Arrange
+    reference_date = ql.Date(6, 11, 2015)
+    expiration_dates = [reference_date + ql.Period(i, ql.Months) for i in range(1, 49)]
+    strikes = [80.0, 100.0, 120.0]
+    vol_surface = VolSurface(reference_date, expiration_dates, strikes, [[0.25] * len(strikes)] * len(expiration_dates))
+
+    # Act
+    local_volatility = LocalVolatilitySurface(vol_surface, 100.0, 0.03, 0.01)
+
+    # Assert
+    assert len(expiration_dates) > 32
+    np.testing.assert_allclose(local_volatility.local_volatilities, 0.25, rtol=0.0, atol=1e-10)
+
+
+def test_local_volatility_paths_reprice_surface(my_market_data: MarketData, my_static_data: StaticData) -> None:
+    # Arrange
+    model = LocalVolatilityModel(my_market_data, my_static_data)
+    local_volatility = model.setup()
+    dates = np.array([ql.Date(6, 11, 2015), ql.Date(6, 11, 2016)])
+    maturity = 366 / 365
+    strikes = np.array([80.0, 90.0, 100.0, 110.0, 120.0])
+
+    # Act
+    paths = model.generate_paths(dates, ql.Actual365Fixed(), local_volatility, number_of_paths=100000, seed=3)
+
+    # Assert
+    discount = np.exp(-0.03 * maturity)
+    prices = discount * np.maximum(paths[:, -1, None] - strikes, 0.0).mean(axis=0)
+    forward = 100.0 * np.exp(0.02 * maturity)
+    volatilities = local_volatility.vol_surface.get_black_volatilities(maturity, strikes)
+    d1 = (np.log(forward / strikes) + 0.5 * volatilities ** 2 * maturity) / (volatilities * np.sqrt(maturity))
+    d2 = d1 - volatilities * np.sqrt(maturity)
+    expected = discount * (forward * norm.cdf(d1) - strikes * norm.cdf(d2))
+    np.testing.assert_allclose(prices, expected, rtol=0.0, atol=0.1)
+    assert paths[:, -1].mean() == pytest.approx(forward, abs=0.2)
+
+
+def test_local_volatility_model_without_surface(my_static_data: StaticData) -> None:
+    # Arrange
+    market_data = MarketData(underlying_spots=[100.0], risk_free_rate=0.03, dividend_rate=0.01,
+                             reference_date='2015-11-06', underlying_black_scholes_volatilities=[0.25])
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="requires a volatility surface"):
+        LocalVolatilityModel(market_data, my_static_data).setup()
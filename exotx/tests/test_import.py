@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+import pytest
+
+# heavy dependencies which must only be loaded when pricing, not when importing exotx
+heavy_modules = ['QuantLib', 'numpy', 'scipy', 'pandas', 'marshmallow', 'matplotlib', 'plotly']
+
+import_script = """
+import sys
+
+import exotx
+print(','.join(sorted(name for name in {heavy_modules} if name in sys.modules)))
+"""
+
+
+def test_import_exotx_does_not_load_heavy_dependencies():
+    # Act: a fresh interpreter, the current one already imported everything
+    output = subprocess.run([sys.executable, '-c', import_script.format(heavy_modules=heavy_modules)],
+                            capture_output=True, text=True, check=True).stdout.splitlines()
+
+    # Assert
+    loaded_modules = output[0] if output else ''
+    assert loaded_modules == ''
+
+
+def test_exotx_lazy_attributes_match_subpackages():
+    # Arrange: the attributes the star imports of the subpackages used to export
+    import importlib
+    import exotx
+    expected = {}
+    for submodule in exotx._star_exported_submodules:
+        for name in importlib.import_module(f"exotx.{submodule}").__all__:
+            expected[name] = f"exotx.{submodule}"
+
+    # Assert
+    assert exotx._lazy_attributes == expected
+
+
+@pytest.mark.parametrize("name, module", [
+    ('Autocallable', 'exotx.instruments.autocallable'),
+    ('PricingModel', 'exotx.enums.enums'),
+    ('MarketData', 'exotx.data.marketdata'),
+    ('HestonModel', 'exotx.models.hestonmodel'),
+    ('VolSurface', 'exotx.data.volsurface'),
+    ('LocalVolatilityModel', 'exotx.models.localvolmodel'),
+    ('VolatilityInterpolation', 'exotx.enums.enums')
+])
+def test_exotx_lazy_attributes(name, module):
+    # Act
+    import exotx
+    value = getattr(exotx, name)
+
+    # Assert
+    assert value.__module__ == module
+    assert name in dir(exotx)
+
+
+def test_exotx_lazy_submodules():
+    # Act
+    import exotx
+
+    # Assert
+    assert exotx.instruments.BarrierOption is exotx.BarrierOption
+    assert exotx.utils.pricing_configuration.PricingConfiguration is not None
+    assert exotx.helpers.dates.convert_maturity_to_ql_date is not None
+    assert {'helpers', 'utils'} <= set(dir(exotx))
+    with pytest.raises(AttributeError):
+        getattr(exotx, 'missing')
@@ -0,0 +1,110 @@
+import asyncio
+import pickle
+
+import pytest
+
+from exotx.data.marketdata import MarketData
+from exotx.data.staticdata import StaticData
+from exotx.instruments.barrier_option import BarrierOption
+from exotx.instruments.instrument import price
+from exotx.utils import async_pricer
+from exotx.utils.async_pricer import AsyncPricer
+
+
+# Arrange
+@pytest.fixture
+def my_barrier_options() -> list:
+    return [BarrierOption('upandin', 105, strike, '2016-05-04', 'european', 'call', 3.0) for strike in [90, 100, 110]]
+
+
+def test_async_pricer_coalesces_identical_requests(my_barrier_options: list,
+                                                   my_market_data: MarketData,
+                                                   my_static_data: StaticData) -> None:
+    # Arrange
+    expected = [price(barrier_option, my_market_data, my_static_data, 'analytic')
+                for barrier_option in my_barrier_options]
+
+    async def price_all(pricer: AsyncPricer) -> list:
+        # identical requests built independently, as different clients would
+        return await asyncio.gather(*[pricer.price(BarrierOption('upandin', 105, barrier_option.strike, '2016-05-04',
+                                                                 'european', 'call', 3.0),
+                                                   pickle.loads(pickle.dumps(my_market_data)), my_static_data,
+                                                   'analytic')
+                                      for barrier_option in my_barrier_options for _ in range(5)])
+
+    async def main() -> tuple:
+        async with AsyncPricer(max_workers=2) as pricer:
+            prices = await price_all(pricer)
+            return prices, pricer.requests, pricer.computations
+
+    # Act
+    prices, requests, computations = asyncio.run(main())
+
+    # Assert
+    assert prices == pytest.approx([pv for pv in expected for _ in range(5)], abs=1e-12)
+    assert requests == 15
+    assert computations == 3
+
+
+def test_async_pricer_bounds_pending_computations(my_barrier_options: list,
+                                                  my_market_data: MarketData,
+                                                  my_static_data: StaticData) -> None:
+    # Arrange
+    async def main() -> tuple:
+        async with AsyncPricer(max_workers=1, max_pending=1) as pricer:
+            prices = await asyncio.gather(*[pricer.price(barrier_option, my_market_data, my_static_data, 'analytic')
+                                            for barrier_option in my_barrier_options])
+            return prices, pricer.computations, len(pricer._in_flight)
+
+    # Act
+    prices, computations, in_flight = asyncio.run(main())
+
+    # Assert
+    assert prices == pytest.approx([price(barrier_option, my_market_data, my_static_data, 'analytic')
+                                    for barrier_option in my_barrier_options], abs=1e-12)
+    assert computations == 3
+    assert in_flight == 0
+
+
+def test_async_pricer_pickles_data_once_per_object(my_barrier_options: list,
+                                                  my_market_data: MarketData,
+                                                  my_static_data: StaticData,
+                                                  monkeypatch) -> None:
+    # Arrange
+    pickled = []
+    get_payload = async_pricer.get_payload
+
+    def get_counted_payload(data):
+        pickled.append(data)
+        return get_payload(data)
+
+    monkeypatch.setattr(async_pricer, 'get_payload', get_counted_payload)
+
+    async def main() -> list:
+        async with AsyncPricer(max_workers=1) as pricer:
+            prices = []
+            for barrier_option in my_barrier_options:
+                prices.append(await pricer.price(barrier_option, my_market_data, my_static_data, 'analytic'))
+            return prices
+
+    # Act
+    prices = asyncio.run(main())
+
+    # Assert
+    assert prices == pytest.approx([price(barrier_option, my_market_data, my_static_data, 'analytic')
+                                    for barrier_option in my_barrier_options], abs=1e-12)
+    assert len(pickled) == 2
+    assert pickled[0] is my_market_data and pickled[1] is my_static_data
+
+
+def test_async_pricer_raises_pricing_errors(my_barrier_options: list,
+                                            my_market_data: MarketData,
+                                            my_static_data: StaticData) -> None:
+    # Arrange
+    async def main() -> None:
+        async with AsyncPricer(max_workers=1) as pricer:
+            await pricer.price(my_barrier_options[0], my_market_data, my_static_data, 'invalid')
+
+    # Act / Assert
+    with pytest.raises(AssertionError):
+        asyncio.run(main())
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from exotx.utils.path_cache import PathCache
+
+
+class FakeGenerator:
+    def __init__(self) -> None:
+        self.grids = []
+
+    def __call__(self, grid: np.ndarray) -> np.ndarray:
+        # paths whose values are the times of the grid, shifted by the path number
+        self.grids.append(grid)
+        return np.arange(4.0)[:, np.newaxis] + grid[np.newaxis, :]
+
+
+def test_path_cache_slices_sub_grids() -> None:
+    # Arrange
+    path_cache = PathCache()
+    generate = FakeGenerator()
+    path_cache.get_paths('key', np.array([0, 1, 2, 3, 4]), generate)
+
+    # Act
+    paths = path_cache.get_paths('key', np.array([0, 2, 4]), generate)
+
+    # Assert
+    assert np.array_equal(paths, generate(np.array([0, 2, 4])))
+    assert len(generate.grids) == 2
+    assert (path_cache.hits, path_cache.misses) == (1, 1)
+
+
+def test_path_cache_grows_grids_to_their_union() -> None:
+    # Arrange
+    path_cache = PathCache()
+    generate = FakeGenerator()
+    path_cache.get_paths('key', np.array([0, 2, 4]), generate)
+
+    # Act
+    paths = path_cache.get_paths('key', np.array([0, 1, 4]), generate)
+    other_paths = path_cache.get_paths('key', np.array([0, 2]), generate)
+
+    # Assert
+    assert np.array_equal(generate.grids[-1], [0, 1, 2, 4])
+    assert np.array_equal(paths, generate(np.array([0, 1, 4])))
+    assert np.array_equal(other_paths, generate(np.array([0, 2])))
+    assert len(path_cache) == 1
+    assert (path_cache.hits, path_cache.misses) == (1, 2)
+
+
+def test_path_cache_keeps_keys_apart() -> None:
+    # Arrange
+    path_cache = PathCache()
+    generate = FakeGenerator()
+
+    # Act
+    path_cache.get_paths(('black-scholes', 1), np.array([0, 1]), generate)
+    path_cache.get_paths(('black-scholes', 2), np.array([0, 1]), generate)
+
+    # Assert
+    assert len(path_cache) == 2
+    assert path_cache.misses == 2
+
+
+def test_path_cache_evicts_least_recently_used() -> None:
+    # Arrange
+    grid = np.array([0, 1, 2, 3])
+    path_cache = PathCache(max_bytes=2 * 4 * grid.shape[0] * 8)
+    generate = FakeGenerator()
+
+    # Act
+    path_cache.get_paths('first', grid, generate)
+    path_cache.get_paths('second', grid, generate)
+    path_cache.get_paths('first', grid, generate)
+    path_cache.get_paths('third', grid, generate)
+
+    # Assert
+    assert path_cache.evictions == 1
+    assert path_cache.nbytes <= path_cache.max_bytes
+    path_cache.get_paths('first', grid, generate)
+    assert (path_cache.hits, path_cache.misses) == (2, 3)
+
+
+def test_path_cache_paths_are_read_only() -> None:
+    # Arrange
+    path_cache = PathCache()
+
+    # Act
+    paths = path_cache.get_paths('key', np.array([0, 1]), FakeGenerator())
+
+    # Assert
+    with pytest.raises(ValueError):
+        paths[0, 0] = 0.0
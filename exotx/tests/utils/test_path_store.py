@@ -0,0 +1,215 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from exotx.data.marketdata import MarketData
+from exotx.data.staticdata import StaticData
+from exotx.instruments.autocallable import Autocallable
+from exotx.instruments.instrument import price
+from exotx.utils.path_store import SharedPathStore, PersistentPathStore
+from exotx.utils.pricing_executor import PricingExecutor, PricingTask
+
+
+def generate(grid: np.ndarray) -> np.ndarray:
+    return np.arange(3.0)[:, np.newaxis] + grid[np.newaxis, :]
+
+
+def fail(grid: np.ndarray) -> np.ndarray:
+    raise AssertionError("The paths should have been published")
+
+
+def get_paths_in_worker(path_store: SharedPathStore, grid: np.ndarray) -> tuple:
+    paths = path_store.get_paths('key', grid, fail)
+    return np.array(paths), path_store.hits, path_store.misses
+
+
+def test_shared_path_store_attaches_published_paths() -> None:
+    # Arrange
+    grid = np.array([0, 1, 2, 3])
+
+    with SharedPathStore() as path_store:
+        published_paths = path_store.get_paths('key', grid, generate)
+
+        # Act
+        worker_store = pickle.loads(pickle.dumps(path_store))
+        paths = worker_store.get_paths('key', grid, fail)
+        sliced_paths = worker_store.get_paths('key', grid[[0, 2]], fail)
+
+        # Assert
+        assert np.array_equal(published_paths, generate(grid))
+        assert np.array_equal(paths, generate(grid))
+        assert np.array_equal(sliced_paths, generate(grid[[0, 2]]))
+        assert not paths.flags.owndata and not paths.flags.writeable
+        assert (worker_store.hits, worker_store.misses) == (2, 0)
+        del published_paths, paths
+        worker_store.close()
+
+
+def test_shared_path_store_in_worker_processes() -> None:
+    # Arrange
+    grid = np.array([0, 2, 4])
+
+    with SharedPathStore() as path_store:
+        path_store.get_paths('key', grid, generate)
+
+        # Act
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(get_paths_in_worker, [path_store] * 2, [grid, grid[1:]]))
+
+    # Assert
+    assert np.array_equal(results[0][0], generate(grid))
+    assert np.array_equal(results[1][0], generate(grid[1:]))
+    assert [result[1:] for result in results] == [(1, 0), (1, 0)]
+
+
+def test_shared_path_store_workers_generate_missing_paths() -> None:
+    # Arrange
+    worker_store = pickle.loads(pickle.dumps(SharedPathStore()))
+
+    # Act
+    paths = worker_store.get_paths('key', np.array([0, 1]), generate)
+
+    # Assert
+    assert np.array_equal(paths, generate(np.array([0, 1])))
+    assert (len(worker_store), worker_store.misses) == (0, 1)
+
+
+def test_shared_path_store_close_frees_shared_memory() -> None:
+    # Arrange
+    path_store = SharedPathStore()
+    path_store.get_paths('key', np.array([0, 1]), generate)
+    (_, name, _, _), = path_store._manifest.values()
+
+    # Act
+    path_store.close()
+
+    # Assert
+    assert len(path_store) == 0
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name)
+
+
+def test_autocallables_priced_with_shared_paths(my_market_data: MarketData, my_static_data: StaticData) -> None:
+    # Arrange
+    autocallables = [Autocallable(100, 100, autocall_barrier_level, 0.03, 0.75, 0.75)
+                     for autocall_barrier_level in [1.0, 1.05, 1.1]]
+    model = 'black-scholes-term-structure'
+    expected = [price(autocallable, my_market_data, my_static_data, model, 3) for autocallable in autocallables]
+
+    with SharedPathStore() as path_store:
+        price(autocallables[0], my_market_data, my_static_data, model, 3, path_cache=path_store)
+
+        # Act
+        with PricingExecutor(max_workers=2) as executor:
+            results = executor.price([PricingTask(autocallable, my_market_data, my_static_data, model, 3,
+                                                  path_cache=path_store) for autocallable in autocallables])
+
+    # Assert
+    assert [result.get() for result in results] == pytest.approx(expected, abs=1e-12)
+    assert path_store.misses == 1
+
+
+def test_persistent_path_store_reads_stored_paths(tmp_path) -> None:
+    # Arrange
+    grid = np.array([0, 1, 2, 3])
+    PersistentPathStore(str(tmp_path)).get_paths('key', grid, generate)
+    path_store = pickle.loads(pickle.dumps(PersistentPathStore(str(tmp_path))))
+
+    # Act
+    paths = path_store.get_paths('key', grid, fail)
+    sliced_paths = path_store.get_paths('key', grid[[1, 3]], fail)
+
+    # Assert
+    assert isinstance(paths, np.memmap) and not paths.flags.writeable
+    assert np.array_equal(paths, generate(grid))
+    assert np.array_equal(sliced_paths, generate(grid[[1, 3]]))
+    assert (path_store.hits, path_store.misses) == (2, 0)
+
+
+def test_persistent_path_store_grows_grids_to_their_union(tmp_path) -> None:
+    # Arrange
+    path_store = PersistentPathStore(str(tmp_path))
+    path_store.get_paths('key', np.array([0, 2]), generate)
+
+    # Act
+    paths = path_store.get_paths('key', np.array([0, 1]), generate)
+
+    # Assert
+    assert np.array_equal(paths, generate(np.array([0, 1])))
+    assert np.array_equal(path_store.get_paths('key', np.array([0, 1, 2]), fail), generate(np.array([0, 1, 2])))
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_persistent_path_store_regenerates_corrupted_paths(tmp_path) -> None:
+    # Arrange
+    grid = np.array([0, 1, 2])
+    PersistentPathStore(str(tmp_path)).get_paths('key', grid, generate)
+    paths_file_name, _ = PersistentPathStore(str(tmp_path))._get_file_names('key')
+    corrupted_paths = np.load(paths_file_name)
+    corrupted_paths[1, 1] = -1.0
+    np.save(paths_file_name, corrupted_paths)
+    path_store = PersistentPathStore(str(tmp_path))
+
+    # Act
+    paths = path_store.get_paths('key', grid, generate)
+
+    # Assert
+    assert np.array_equal(paths, generate(grid))
+    assert (path_store.corruptions, path_store.misses) == (1, 1)
+    assert PersistentPathStore(str(tmp_path)).get_paths('key', grid, fail)[1, 1] == 2.0
+
+
+def test_persistent_path_store_regenerates_paths_of_other_versions(tmp_path) -> None:
+    # Arrange
+    grid = np.array([0, 1, 2])
+    PersistentPathStore(str(tmp_path), version='old').get_paths('key', grid, lambda grid: 2.0 * generate(grid))
+    path_store = pickle.loads(pickle.dumps(PersistentPathStore(str(tmp_path), version='new')))
+
+    # Act
+    paths = path_store.get_paths('key', grid, generate)
+
+    # Assert
+    assert path_store.version == 'new'
+    assert np.array_equal(paths, generate(grid))
+    assert (path_store.corruptions, path_store.misses) == (0, 1)
+    assert np.array_equal(PersistentPathStore(str(tmp_path), version='new').get_paths('key', grid, fail),
+                          generate(grid))
+    assert 'QuantLib' in PersistentPathStore(str(tmp_path)).version
+
+
+@pytest.mark.parametrize("manifest", ['[1, 2]', '{"version": "1"}', '{"version": "1", "shape": [3, 3]}'])
+def test_persistent_path_store_regenerates_paths_of_invalid_manifests(tmp_path, manifest: str) -> None:
+    # Arrange
+    grid = np.array([0, 1, 2])
+    PersistentPathStore(str(tmp_path), version='1').get_paths('key', grid, generate)
+    _, manifest_file_name = PersistentPathStore(str(tmp_path), version='1')._get_file_names('key')
+    with open(manifest_file_name, 'w') as manifest_file:
+        manifest_file.write(manifest)
+    path_store = PersistentPathStore(str(tmp_path), version='1')
+
+    # Act
+    paths = path_store.get_paths('key', grid, generate)
+
+    # Assert
+    assert np.array_equal(paths, generate(grid))
+    assert (path_store.corruptions, path_store.misses) == (1, 1)
+
+
+def test_autocallable_priced_with_persistent_paths(tmp_path, my_market_data: MarketData,
+                                                   my_static_data: StaticData) -> None:
+    # Arrange
+    autocallable = Autocallable(100, 100, 1.0, 0.03, 0.75, 0.75)
+    model = 'black-scholes-term-structure'
+    expected = price(autocallable, my_market_data, my_static_data, model, 3)
+    price(autocallable, my_market_data, my_static_data, model, 3, path_cache=PersistentPathStore(str(tmp_path)))
+    path_store = PersistentPathStore(str(tmp_path))
+
+    # Act
+    pv = price(autocallable, my_market_data, my_static_data, model, 3, path_cache=path_store)
+
+    # Assert
+    assert pv == pytest.approx(expected, abs=1e-12)
+    assert (path_store.hits, path_store.misses) == (1, 0)
@@ -0,0 +1,133 @@
+import pickle
+
+import pytest
+
+from exotx import price
+from exotx.data.marketdata import MarketData
+from exotx.data.staticdata import StaticData
+from exotx.enums.enums import PricingModel, NumericalMethod
+from exotx.instruments.autocallable import Autocallable
+from exotx.instruments.option_type import OptionType
+from exotx.instruments.vanilla_option import VanillaOption
+from exotx.utils.path_cache import PathCache
+from exotx.utils.price_cache import PriceCache, fingerprint
+from exotx.utils.pricing_configuration import PricingConfiguration
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+# Arrange
+@pytest.fixture
+def my_pricing_config() -> PricingConfiguration:
+    return PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.ANALYTIC, compute_greeks=True)
+
+
+def test_fingerprint_depends_on_content_only(my_market_data: MarketData, my_static_data: StaticData,
+                                            my_pricing_config: PricingConfiguration) -> None:
+    # Arrange
+    vanilla_option = VanillaOption(90, '2016-05-04', OptionType.CALL)
+    market_data = pickle.loads(pickle.dumps(my_market_data))
+
+    # Act
+    digest = fingerprint(vanilla_option, my_market_data, my_static_data, my_pricing_config)
+
+    # Assert
+    assert fingerprint(VanillaOption(90, '2016-05-04', OptionType.CALL), market_data, my_static_data,
+                       my_pricing_config) == digest
+    assert fingerprint(VanillaOption(95, '2016-05-04', OptionType.CALL), market_data, my_static_data,
+                       my_pricing_config) != digest
+    market_data.risk_free_rate += 0.01
+    assert fingerprint(vanilla_option, market_data, my_static_data, my_pricing_config) != digest
+
+
+def test_price_cache_reuses_results(my_market_data: MarketData, my_static_data: StaticData,
+                                    my_pricing_config: PricingConfiguration) -> None:
+    # Arrange
+    cache = PriceCache()
+    expected = price(VanillaOption(90, '2016-05-04', OptionType.CALL), my_market_data, my_static_data,
+                     my_pricing_config)
+
+    # Act
+    results = [cache.price(VanillaOption(90, '2016-05-04', OptionType.CALL), my_market_data, my_static_data,
+                           my_pricing_config) for _ in range(4)]
+    results[0]['price'] = 0.0
+
+    # Assert
+    assert results[1:] == [expected] * 3
+    assert cache.price(VanillaOption(90, '2016-05-04', OptionType.CALL), my_market_data, my_static_data,
+                       my_pricing_config) == expected
+    assert (cache.hits, cache.misses) == (4, 1)
+    assert cache.hit_rate == pytest.approx(0.8)
+
+
+def test_price_cache_evicts_least_recently_used(my_market_data: MarketData, my_static_data: StaticData,
+                                                my_pricing_config: PricingConfiguration) -> None:
+    # Arrange
+    cache = PriceCache(max_size=2)
+    options = [VanillaOption(strike, '2016-05-04', OptionType.CALL) for strike in [90, 100, 110]]
+
+    # Act
+    cache.price(options[0], my_market_data, my_static_data, my_pricing_config)
+    cache.price(options[1], my_market_data, my_static_data, my_pricing_config)
+    cache.price(options[0], my_market_data, my_static_data, my_pricing_config)
+    cache.price(options[2], my_market_data, my_static_data, my_pricing_config)
+    cache.price(options[0], my_market_data, my_static_data, my_pricing_config)
+    cache.price(options[1], my_market_data, my_static_data, my_pricing_config)
+
+    # Assert
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 4, 2)
+
+
+def test_price_cache_expires_results(my_market_data: MarketData, my_static_data: StaticData,
+                                     my_pricing_config: PricingConfiguration) -> None:
+    # Arrange
+    clock = FakeClock()
+    cache = PriceCache(time_to_live=10.0, clock=clock)
+    vanilla_option = VanillaOption(90, '2016-05-04', OptionType.CALL)
+
+    # Act
+    cache.price(vanilla_option, my_market_data, my_static_data, my_pricing_config)
+    clock.time = 9.0
+    cache.price(vanilla_option, my_market_data, my_static_data, my_pricing_config)
+    clock.time = 10.0
+    cache.price(vanilla_option, my_market_data, my_static_data, my_pricing_config)
+
+    # Assert
+    assert (cache.hits, cache.misses, cache.expirations) == (1, 2, 1)
+
+
+def test_price_cache_does_not_cache_errors(my_market_data: MarketData, my_static_data: StaticData) -> None:
+    # Arrange
+    cache = PriceCache()
+    vanilla_option = VanillaOption(90, '2016-05-04', OptionType.CALL)
+
+    # Act / Assert
+    for _ in range(2):
+        with pytest.raises(Exception):
+            cache.price(vanilla_option, my_market_data, my_static_data, 'invalid')
+    assert len(cache) == 0
+    assert cache.misses == 2
+
+
+def test_price_cache_with_path_cache(my_market_data: MarketData, my_static_data: StaticData) -> None:
+    # Arrange
+    cache = PriceCache()
+    autocallable = Autocallable(100, 100, 1.0, 0.03, 0.75, 0.75)
+    path_cache = PathCache()
+    expected = price(autocallable, my_market_data, my_static_data, 'black-scholes', 3)
+
+    # Act
+    first = cache.price(autocallable, my_market_data, my_static_data, 'black-scholes', 3, path_cache=path_cache)
+    second = cache.price(autocallable, my_market_data, my_static_data, 'black-scholes', 3, path_cache=PathCache())
+    third = cache.price(autocallable, my_market_data, my_static_data, 'black-scholes', 3, path_cache)
+
+    # Assert
+    assert first == second == third == expected
+    assert (cache.hits, cache.misses) == (2, 1)
@@ -1,8 +1,9 @@
 import pytest
 from marshmallow import ValidationError
 
-from exotx.enums.enums import PricingModel, NumericalMethod
-from exotx.utils.pricing_configuration import PricingConfiguration, PricingConfigurationSchema
+from exotx.enums.enums import PricingModel, NumericalMethod, FiniteDifferencePreset
+from exotx.utils.pricing_configuration import PricingConfiguration, PricingConfigurationSchema, \
+    FiniteDifferenceSettings, NumericalSettings
 
 
 def test_to_json():
@@ -17,7 +18,9 @@ def test_to_json():
         'model': 'BLACK_SCHOLES',
         'numerical_method': 'ANALYTIC',
         'compute_greeks': True,
-        'random_number_generator': ''
+        'random_number_generator': '',
+        'finite_difference_settings': None,
+        'numerical_settings': None
     }
 
 
@@ -62,3 +65,101 @@ def test_from_json_invalid_method():
     with pytest.raises(ValidationError) as e:
         _ = schema.load(json_data)
     assert 'numerical_method' in e.value.messages
+
+
+def test_finite_difference_settings_json_round_trip():
+    pricing_config = PricingConfiguration(
+        model=PricingModel.BLACK_SCHOLES,
+        numerical_method=NumericalMethod.PDE,
+        finite_difference_settings=FiniteDifferenceSettings(time_steps=200, damping_steps=2,
+                                                            preset=FiniteDifferencePreset.FAST)
+    )
+    json_data = pricing_config.to_json()
+
+    assert json_data['finite_difference_settings'] == {
+        'time_steps': 200,
+        'space_steps': None,
+        'variance_steps': None,
+        'damping_steps': 2,
+        'preset': 'FAST'
+    }
+
+    settings = PricingConfiguration.from_json(json_data).finite_difference_settings
+    assert isinstance(settings, FiniteDifferenceSettings)
+    assert settings.time_steps == 200
+    assert settings.space_steps is None
+    assert settings.damping_steps == 2
+    assert settings.preset == FiniteDifferencePreset.FAST
+
+
+def test_finite_difference_settings_resolve():
+    presets = {
+        FiniteDifferencePreset.FAST: FiniteDifferenceSettings(10, 20, 5, 0),
+        FiniteDifferencePreset.STANDARD: FiniteDifferenceSettings(100, 200, 50, 0),
+        FiniteDifferencePreset.ACCURATE: FiniteDifferenceSettings(1000, 2000, 500, 2)
+    }
+
+    standard = FiniteDifferenceSettings(space_steps=300).resolve(presets)
+    accurate = FiniteDifferenceSettings(damping_steps=0, preset=FiniteDifferencePreset.ACCURATE).resolve(presets)
+
+    assert (standard.time_steps, standard.space_steps, standard.variance_steps, standard.damping_steps) == \
+           (100, 300, 50, 0)
+    assert (accurate.time_steps, accurate.space_steps, accurate.variance_steps, accurate.damping_steps) == \
+           (1000, 2000, 500, 0)
+
+
+def test_numerical_settings_json_round_trip():
+    pricing_config = PricingConfiguration(
+        model=PricingModel.HESTON,
+        numerical_method=NumericalMethod.MC,
+        numerical_settings=NumericalSettings(number_of_paths=5000, calibration_tolerance=1e-3,
+                                             calibration_max_iterations=20)
+    )
+    json_data = pricing_config.to_json()
+
+    assert json_data['numerical_settings'] == {
+        'number_of_paths': 5000,
+        'time_steps_per_year': None,
+        'monte_carlo_tolerance': None,
+        'calibration_tolerance': 1e-3,
+        'calibration_max_iterations': 20
+    }
+
+    settings = PricingConfiguration.from_json(json_data).numerical_settings
+    assert isinstance(settings, NumericalSettings)
+    assert settings.number_of_paths == 5000
+    assert settings.time_steps_per_year is None
+    assert settings.calibration_tolerance == 1e-3
+    assert settings.calibration_max_iterations == 20
+
+
+def test_numerical_settings_defaults():
+    pricing_config = PricingConfiguration(PricingModel.BLACK_SCHOLES, NumericalMethod.MC)
+
+    settings = pricing_config.get_numerical_settings()
+
+    assert vars(settings) == vars(NumericalSettings())
+    assert all(value is None for value in vars(settings).values())
+
+
+def test_numerical_settings_invalid_number_of_paths():
+    with pytest.raises(AssertionError):
+        NumericalSettings(number_of_paths=0)
+
+
+@pytest.mark.parametrize("settings_name, settings", [
+    ('numerical_settings', {'number_of_paths': 0}),
+    ('numerical_settings', {'monte_carlo_tolerance': 0.0}),
+    ('numerical_settings', {'calibration_max_iterations': -1}),
+    ('finite_difference_settings', {'time_steps': 0}),
+    ('finite_difference_settings', {'damping_steps': -1})
+])
+def test_from_json_invalid_settings(settings_name: str, settings: dict):
+    json_data = {
+        'model': 'BLACK_SCHOLES',
+        'numerical_method': 'MC',
+        settings_name: settings
+    }
+    with pytest.raises(ValidationError) as e:
+        PricingConfiguration.from_json(json_data)
+    assert list(e.value.messages[settings_name]) == list(settings)
@@ -0,0 +1,80 @@
+from datetime import date
+
+import pytest
+
+from exotx.data.marketdata import MarketData
+from exotx.data.staticdata import StaticData
+from exotx.instruments.barrier_option import BarrierOption
+from exotx.instruments.instrument import price
+from exotx.utils import pricing_executor
+from exotx.utils.pricing_executor import PricingExecutor, PricingTask
+
+
+# Arrange
+@pytest.fixture
+def my_tasks(my_market_data: MarketData, my_static_data: StaticData) -> list:
+    other_market_data = MarketData(underlying_spots=[100], risk_free_rate=0.08, dividend_rate=0.04,
+                                   reference_date='2016-01-06', underlying_black_scholes_volatilities=[0.25])
+    return [PricingTask(BarrierOption(barrier_type, barrier, strike, '2016-05-04', 'european', 'call', 3.0),
+                        market_data, my_static_data, 'analytic')
+            for strike in [90, 100, 110]
+            for barrier_type, barrier in [('downandout', 95), ('upandin', 105)]
+            for market_data in [my_market_data, other_market_data]]
+
+
+def test_pricing_executor_prices_in_order(my_tasks: list) -> None:
+    # Arrange
+    expected = [price(task.instrument, task.market_data, task.static_data, *task.args) for task in my_tasks]
+
+    # Act
+    with PricingExecutor(max_workers=2) as executor:
+        results = executor.price(my_tasks)
+
+    # Assert
+    assert [result.get() for result in results] == pytest.approx(expected, abs=1e-12)
+    assert [result.reference_date for result in results] == [task.get_reference_date() for task in my_tasks]
+    assert {result.reference_date for result in results} == {date(2015, 11, 6), date(2016, 1, 6)}
+    assert all(result.succeeded and result.elapsed_time > 0 for result in results)
+
+
+def test_pricing_executor_reports_errors(my_tasks: list) -> None:
+    # Arrange
+    failing_task = PricingTask(my_tasks[0].instrument, my_tasks[0].market_data, my_tasks[0].static_data, 'invalid')
+
+    # Act
+    with PricingExecutor(max_workers=1, chunk_size=1) as executor:
+        failed_result, result = executor.price([failing_task, my_tasks[0]])
+
+    # Assert
+    assert not failed_result.succeeded
+    assert isinstance(failed_result.error, AssertionError)
+    with pytest.raises(AssertionError):
+        failed_result.get()
+    assert result.succeeded
+
+
+def test_pricing_executor_chunks_by_reference_date(my_tasks: list) -> None:
+    # Arrange
+    executor = PricingExecutor(max_workers=2)
+
+    # Act
+    chunks = executor._get_chunks(my_tasks)
+    executor.shutdown()
+
+    # Assert
+    assert len(chunks) == 4
+    for reference_date, positions in chunks:
+        assert {my_tasks[position].get_reference_date() for position in positions} == {reference_date}
+    assert sorted(position for _, positions in chunks for position in positions) == list(range(len(my_tasks)))
+
+
+def test_pricing_executor_worker_cache(my_market_data: MarketData) -> None:
+    # Arrange
+    payload = pricing_executor.get_payload(my_market_data)
+
+    # Act
+    market_data = pricing_executor._get_cached(payload)
+
+    # Assert
+    assert pricing_executor._get_cached(payload) is market_data
+    assert market_data.to_json() == my_market_data.to_json()
@@ -0,0 +1,134 @@
+import asyncio
+import hashlib
+import pickle
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+from exotx.data.marketdata import MarketData
+from exotx.data.staticdata import StaticData
+from exotx.instruments.instrument import Instrument
+from exotx.utils.pricing_executor import Payload, get_payload, price_chunk
+
+
+class AsyncPricer:
+    """
+    An asyncio front-end pricing instruments in worker processes.
+
+    Identical requests, i.e. the same instrument, market data, static data and pricing arguments by content, are
+    coalesced while they are in flight: a single computation is run and its result is shared by all the requests.
+    The number of pending computations is bounded, so that requests wait for a free slot instead of piling up in the
+    executor when the load is bursty.
+
+    The executor must run each pricing in its own process, since QuantLib prices with a global evaluation date. The
+    worker processes keep the market and static data they received, as the workers of PricingExecutor.
+
+    The market and static data are pickled once per object, off the event loop, and their payloads are kept as long as
+    the objects are alive: they must not be modified once they have been priced.
+
+    Attributes:
+        max_pending (int): The maximum number of pending computations.
+        requests (int): The number of requests received.
+        computations (int): The number of computations run, the other requests having been coalesced.
+
+    Example usage:
+
+    >>> async with AsyncPricer(max_workers=4) as pricer:
+    ...     prices = await asyncio.gather(*[pricer.price(option, market_data, static_data, pricing_config)
+    ...                                     for option in options])
+    """
+
+    def __init__(self, max_workers: int = None, max_pending: int = 64, executor: Optional[Executor] = None) -> None:
+        """
+        :param max_workers: The number of worker processes of the default executor, defaults to the number of
+                            processors.
+        :type max_workers: int, optional
+        :param max_pending: The maximum number of pending computations, defaults to 64.
+        :type max_pending: int, optional
+        :param executor: The process pool executor running the computations, defaults to a new one owned by the pricer.
+        :type executor: Executor, optional
+        """
+        assert max_pending > 0, f"Invalid maximum number of pending computations: {max_pending}"
+        self.max_pending = max_pending
+        self._owns_executor = executor is None
+        self._executor: Executor = ProcessPoolExecutor(max_workers) if executor is None else executor
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._payloads: 'weakref.WeakKeyDictionary[Any, Payload]' = weakref.WeakKeyDictionary()
+        self.requests = 0
+        self.computations = 0
+
+    async def price(self, instrument: Instrument, market_data: MarketData, static_data: StaticData, *args,
+                    **kwargs) -> Any:
+        """
+        Prices an instrument in a worker process.
+
+        :param instrument: The instrument to price.
+        :type instrument: Instrument
+        :param market_data: The market data used for pricing the instrument.
+        :type market_data: MarketData
+        :param static_data: The static data used for pricing the instrument.
+        :type static_data: StaticData
+        :param args: The other positional arguments of the price method of the instrument.
+        :param kwargs: The keyword arguments of the price method of the instrument.
+        :return: The value returned by the price method of the instrument.
+        :rtype: Any
+        :raises Exception: The exception raised by the price method of the instrument, if any.
+        """
+        if self._semaphore is None:
+            # created on first use, within the event loop of the requests
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+        self.requests += 1
+        market_data_payload = await self._get_payload(market_data)
+        static_data_payload = await self._get_payload(static_data)
+        key = hashlib.sha256(pickle.dumps((instrument, args, kwargs), protocol=pickle.HIGHEST_PROTOCOL) +
+                             market_data_payload[0].encode() + static_data_payload[0].encode()).hexdigest()
+
+        computation = self._in_flight.get(key)
+        if computation is None:
+            await self._semaphore.acquire()
+            # an identical request may have started the computation while waiting for a slot
+            computation = self._in_flight.get(key)
+            if computation is None:
+                self.computations += 1
+                computation = asyncio.ensure_future(self._compute(
+                    key, market_data.reference_date.date(), market_data_payload, static_data_payload,
+                    (instrument, 0, 0, args, kwargs)))
+                self._in_flight[key] = computation
+            else:
+                self._semaphore.release()
+        # a cancelled request does not cancel the computation shared with other requests
+        return await asyncio.shield(computation)
+
+    async def _get_payload(self, data: Any) -> Payload:
+        payload = self._payloads.get(data)
+        if payload is None:
+            # pickling and hashing large market data would block the event loop
+            payload = await asyncio.get_running_loop().run_in_executor(None, get_payload, data)
+            self._payloads[data] = payload
+        return payload
+
+    async def _compute(self, key: str, reference_date, market_data_payload, static_data_payload, task) -> Any:
+        try:
+            _, [(value, error, _)] = await asyncio.get_running_loop().run_in_executor(
+                self._executor, price_chunk, reference_date, [market_data_payload], [static_data_payload], [task])
+        finally:
+            del self._in_flight[key]
+            self._semaphore.release()
+        if error is not None:
+            raise error
+        return value
+
+    def close(self) -> None:
+        """Stops the worker processes of the default executor, waiting for the pending computations."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> 'AsyncPricer':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        # wait for the computations of the requests which were cancelled
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
+        self.close()
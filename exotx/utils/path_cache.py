@@ -0,0 +1,105 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
+
+import numpy as np
+
+
+def _get_grid_indices(simulation_grid: np.ndarray, grid: np.ndarray) -> Optional[np.ndarray]:
+    # indices of the times of the grid in the grid of a simulation, None if the simulation does not cover the grid
+    indices = np.minimum(np.searchsorted(simulation_grid, grid), simulation_grid.shape[0] - 1)
+    return indices if np.array_equal(simulation_grid[indices], grid) else None
+
+
+class PathCache:
+    """
+    A cache of simulated path matrices, shared by the instruments priced on the same underlying and model.
+
+    The paths are keyed by everything but the time grid: the process parameters, the random number generator and the
+    seed. Each key holds a single simulation, whose time grid grows as the union of the grids requested, so that paths
+    requested on a sub-grid of the simulation are sliced from it instead of being generated again. Instruments with
+    different observation dates thus price against one simulation, once it covers all their dates. The least recently
+    used simulations are evicted when the size of the path matrices exceeds the memory limit.
+
+    Attributes:
+        max_bytes (int): The maximum size of the path matrices kept, in bytes.
+        hits (int): The number of requests sliced from a simulation.
+        misses (int): The number of requests which generated a simulation.
+        evictions (int): The number of simulations evicted by the memory limit.
+
+    Example usage:
+
+    >>> path_cache = PathCache(max_bytes=2 ** 30)
+    >>> prices = [price(autocallable, market_data, static_data, 'black-scholes', path_cache=path_cache)
+    ...           for autocallable in autocallables]
+    """
+
+    def __init__(self, max_bytes: int = 2 ** 28) -> None:
+        """
+        :param max_bytes: The maximum size of the path matrices kept, in bytes, defaults to 256 MiB.
+        :type max_bytes: int, optional
+        """
+        assert max_bytes > 0, f"Invalid maximum size: {max_bytes}"
+        self.max_bytes = max_bytes
+        # time grids and path matrices by key, in least recently used order
+        self._simulations: 'OrderedDict[Hashable, Tuple[np.ndarray, np.ndarray]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def nbytes(self) -> int:
+        return sum(paths.nbytes for _, paths in self._simulations.values())
+
+    def __len__(self) -> int:
+        return len(self._simulations)
+
+    def get_paths(self, key: Hashable, grid: np.ndarray, generate: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        """
+        Gets the paths on the given time grid, sliced from the cached simulation of the key or generated.
+
+        :param key: The key of the simulation, identifying the process parameters, the random number generator and the
+                    seed.
+        :type key: Hashable
+        :param grid: The increasing times of the paths, in any unit, such as date serial numbers.
+        :type grid: np.ndarray
+        :param generate: The function generating the paths on a time grid, with one row per path and one column per
+                         time.
+        :type generate: Callable[[np.ndarray], np.ndarray]
+        :return: The paths, with one row per path and one column per time of the grid.
+        :rtype: np.ndarray
+        """
+        grid = np.asarray(grid)
+        simulation_grid = grid
+        with self._lock:
+            simulation = self._simulations.get(key)
+            if simulation is not None:
+                cached_grid, paths = simulation
+                indices = _get_grid_indices(cached_grid, grid)
+                if indices is not None:
+                    self._simulations.move_to_end(key)
+                    self.hits += 1
+                    return paths[:, indices]
+                # the simulation is generated again on the union of the grids, so that it covers both
+                simulation_grid = np.union1d(cached_grid, grid)
+            self.misses += 1
+
+        # generated outside of the lock, identical concurrent requests may both generate the paths
+        paths = generate(simulation_grid)
+        # the cached paths are shared by the requests, hence read-only
+        paths.flags.writeable = False
+        with self._lock:
+            self._simulations[key] = (simulation_grid, paths)
+            self._simulations.move_to_end(key)
+            while self.nbytes > self.max_bytes:
+                self._simulations.popitem(last=False)
+                self.evictions += 1
+        if simulation_grid is grid:
+            return paths
+        return paths[:, np.searchsorted(simulation_grid, grid)]
+
+    def clear(self) -> None:
+        """Removes all the simulations, keeping the statistics."""
+        with self._lock:
+            self._simulations.clear()
@@ -0,0 +1,343 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from exotx._version import __version__
+from exotx.utils.path_cache import _get_grid_indices
+
+# version of the layout of the files of the persistent path store, increased when it changes
+path_file_format_version = 1
+
+
+def get_path_generator_version() -> str:
+    """
+    Gets the version of the path generators, made of the versions of the file format, of exotx and of QuantLib, whose
+    random number generators and processes the generators use.
+
+    :return: The version of the path generators.
+    :rtype: str
+    """
+    import QuantLib as ql
+
+    return f"format-{path_file_format_version}/exotx-{__version__}/QuantLib-{ql.__version__}"
+
+# (time grid, shared memory block name, shape, data type) of a published simulation
+ManifestEntry = Tuple[np.ndarray, str, Tuple[int, ...], str]
+
+
+class SharedPathStore:
+    """
+    A store of simulated path matrices published into shared memory, for the worker processes of a pricing run.
+
+    The store has the interface of PathCache. The process creating the store publishes each simulation it generates
+    into a shared memory block, and records it in a small manifest: the key, the time grid, the block name, the shape
+    and the data type of the paths. The store pickles as its manifest, so that the worker processes receiving it,
+    with a PricingExecutor task for instance, attach zero-copy read-only NumPy views of the published paths instead of
+    generating them again. The worker processes must be children of the publishing process, and the simulations they
+    miss are generated without being published.
+
+    The shared memory blocks are freed by closing the store in the publishing process.
+
+    Attributes:
+        hits (int): The number of requests served from published paths.
+        misses (int): The number of requests which generated paths.
+
+    Example usage:
+
+    >>> with SharedPathStore() as path_store:
+    ...     price(autocallables[0], market_data, static_data, 'black-scholes', path_cache=path_store)
+    ...     with PricingExecutor(max_workers=4) as executor:
+    ...         results = executor.price([PricingTask(autocallable, market_data, static_data, 'black-scholes',
+    ...                                               path_cache=path_store) for autocallable in autocallables])
+    """
+
+    def __init__(self, manifest: Dict[Hashable, ManifestEntry] = None) -> None:
+        """
+        :param manifest: The simulations published by another process, defaults to none for the store of the
+                         publishing process.
+        :type manifest: Dict[Hashable, ManifestEntry], optional
+        """
+        self._is_publisher = manifest is None
+        self._manifest: Dict[Hashable, ManifestEntry] = dict(manifest or {})
+        # shared memory blocks created or attached by this process, by name
+        self._blocks: Dict[str, SharedMemory] = {}
+        # blocks released while views of their paths were still alive, kept until the end of the process
+        self._released_blocks: List[SharedMemory] = []
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __reduce__(self) -> tuple:
+        # pickled as its manifest, the worker processes attaching the shared memory blocks on first use
+        return type(self), (self._manifest,)
+
+    def __len__(self) -> int:
+        return len(self._manifest)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(int(np.prod(shape)) * np.dtype(dtype).itemsize for _, _, shape, dtype in self._manifest.values())
+
+    def _attach(self, entry: ManifestEntry) -> np.ndarray:
+        _, name, shape, dtype = entry
+        block = self._blocks.get(name)
+        if block is None:
+            block = self._blocks[name] = SharedMemory(name)
+        paths = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        paths.flags.writeable = False
+        return paths
+
+    def publish(self, key: Hashable, grid: np.ndarray, paths: np.ndarray) -> np.ndarray:
+        """
+        Publishes paths into shared memory, replacing the simulation of the key if any, in the publishing process.
+
+        :param key: The key of the simulation, identifying the process parameters, the random number generator and the
+                    seed.
+        :type key: Hashable
+        :param grid: The increasing times of the paths.
+        :type grid: np.ndarray
+        :param paths: The paths, with one row per path and one column per time of the grid.
+        :type paths: np.ndarray
+        :return: The read-only view of the published paths.
+        :rtype: np.ndarray
+        """
+        assert self._is_publisher, "Paths can only be published by the process which created the store"
+        paths = np.ascontiguousarray(paths)
+        block = SharedMemory(create=True, size=max(paths.nbytes, 1))
+        np.ndarray(paths.shape, dtype=paths.dtype, buffer=block.buf)[...] = paths
+        entry = (np.asarray(grid).copy(), block.name, paths.shape, paths.dtype.str)
+        with self._lock:
+            self._blocks[block.name] = block
+            previous_entry = self._manifest.get(key)
+            self._manifest[key] = entry
+            if previous_entry is not None:
+                self._release(previous_entry[1])
+        return self._attach(entry)
+
+    def get_paths(self, key: Hashable, grid: np.ndarray, generate: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        """
+        Gets the paths on the given time grid, from the published simulation of the key or generated.
+
+        The paths on the grid of the published simulation are a view of the shared memory, the paths on a sub-grid
+        being sliced from it. In the publishing process, the paths generated are published, on the union of the grids
+        when the key is already published.
+
+        :param key: The key of the simulation, identifying the process parameters, the random number generator and the
+                    seed.
+        :type key: Hashable
+        :param grid: The increasing times of the paths, in any unit, such as date serial numbers.
+        :type grid: np.ndarray
+        :param generate: The function generating the paths on a time grid, with one row per path and one column per
+                         time.
+        :type generate: Callable[[np.ndarray], np.ndarray]
+        :return: The paths, with one row per path and one column per time of the grid.
+        :rtype: np.ndarray
+        """
+        grid = np.asarray(grid)
+        simulation_grid = grid
+        with self._lock:
+            entry = self._manifest.get(key)
+            if entry is not None:
+                indices = _get_grid_indices(entry[0], grid)
+                if indices is not None:
+                    self.hits += 1
+                    paths = self._attach(entry)
+                    return paths if indices.shape[0] == paths.shape[1] else paths[:, indices]
+                simulation_grid = np.union1d(entry[0], grid)
+            self.misses += 1
+
+        if not self._is_publisher:
+            # the worker processes do not publish, their simulations would not be seen by the other processes
+            return generate(grid)
+        paths = self.publish(key, simulation_grid, generate(simulation_grid))
+        if simulation_grid is grid:
+            return paths
+        return paths[:, np.searchsorted(simulation_grid, grid)]
+
+    def _release(self, name: str) -> None:
+        block = self._blocks.pop(name, None)
+        if block is not None:
+            try:
+                block.close()
+            except BufferError:
+                # the views handed out still use the memory of the block, mapped until the end of the process
+                self._released_blocks.append(block)
+            if self._is_publisher:
+                block.unlink()
+
+    def close(self) -> None:
+        """Detaches the shared memory blocks, freeing those published by this process."""
+        with self._lock:
+            if self._is_publisher:
+                self._manifest.clear()
+            for name in list(self._blocks):
+                self._release(name)
+
+    def __enter__(self) -> 'SharedPathStore':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class PersistentPathStore:
+    """
+    A store of simulated path matrices persisted on disk, for the pricing runs re-simulating identical scenarios.
+
+    The store has the interface of PathCache. Each simulation is written to an NPY file named after the hash of its
+    key, with a JSON manifest holding its time grid, shape, data type and the SHA-256 hash of the paths. The paths are
+    read back as read-only memory-mapped arrays, so that the pricers stream them from the disk instead of simulating
+    them again, and their hash is checked once per process and file. Simulations whose file is corrupted, was written
+    by another version of the path generators or does not cover the requested grid are generated again and
+    overwritten, the files being replaced atomically so that
+    concurrent processes never read partial files. The store pickles as its directory, for worker processes.
+
+    Attributes:
+        directory (str): The directory of the files.
+        verify (bool): Whether the hashes of the paths are checked when reading them.
+        version (str): The version of the path generators, the files of other versions being ignored.
+        hits (int): The number of requests read from the disk.
+        misses (int): The number of requests which generated paths.
+        corruptions (int): The number of files found corrupted.
+
+    Example usage:
+
+    >>> path_store = PersistentPathStore('/var/cache/exotx/paths')
+    >>> prices = [price(autocallable, market_data, static_data, 'black-scholes', path_cache=path_store)
+    ...           for autocallable in autocallables]
+    """
+
+    def __init__(self, directory: str, verify: bool = True, version: str = None) -> None:
+        """
+        :param directory: The directory of the files, created if needed.
+        :type directory: str
+        :param verify: Whether the hashes of the paths are checked when reading them, defaults to True.
+        :type verify: bool, optional
+        :param version: The version of the path generators, defaults to the versions of the file format, exotx and
+                        QuantLib.
+        :type version: str, optional
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.verify = verify
+        self.version = get_path_generator_version() if version is None else version
+        # (modification time, size) of the files whose hash was checked by this process, by file name
+        self._verified_files: Dict[str, Tuple[int, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.corruptions = 0
+
+    def __reduce__(self) -> tuple:
+        # pickled as its directory, the worker processes reading the same files
+        return type(self), (self.directory, self.verify, self.version)
+
+    def _get_file_names(self, key: Hashable) -> Tuple[str, str]:
+        digest = hashlib.sha256(pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+        return os.path.join(self.directory, f"{digest}.npy"), os.path.join(self.directory, f"{digest}.json")
+
+    @staticmethod
+    def _get_hash(paths: np.ndarray) -> str:
+        return hashlib.sha256(np.ascontiguousarray(paths).data).hexdigest()
+
+    def _load(self, key: Hashable) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        paths_file_name, manifest_file_name = self._get_file_names(key)
+        try:
+            with open(manifest_file_name) as manifest_file:
+                manifest = json.load(manifest_file)
+            paths = np.load(paths_file_name, mmap_mode='r')
+            file_status = os.stat(paths_file_name)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict):
+            self.corruptions += 1
+            return None
+        # paths of another version of the generators are stale, they are generated again
+        if manifest.get('version') != self.version:
+            return None
+        try:
+            if list(paths.shape) != manifest['shape'] or paths.dtype.str != manifest['dtype']:
+                self.corruptions += 1
+                return None
+            file_version = (file_status.st_mtime_ns, file_status.st_size)
+            if self.verify and self._verified_files.get(paths_file_name) != file_version:
+                if self._get_hash(paths) != manifest['sha256']:
+                    self.corruptions += 1
+                    return None
+                self._verified_files[paths_file_name] = file_version
+            return np.array(manifest['grid']), paths
+        except (KeyError, TypeError):
+            # incomplete manifest
+            self.corruptions += 1
+            return None
+
+    def save(self, key: Hashable, grid: np.ndarray, paths: np.ndarray) -> np.ndarray:
+        """
+        Writes paths to the disk, replacing the simulation of the key if any.
+
+        :param key: The key of the simulation, identifying the process parameters, the random number generator and the
+                    seed.
+        :type key: Hashable
+        :param grid: The increasing times of the paths.
+        :type grid: np.ndarray
+        :param paths: The paths, with one row per path and one column per time of the grid.
+        :type paths: np.ndarray
+        :return: The read-only memory-mapped paths.
+        :rtype: np.ndarray
+        """
+        paths_file_name, manifest_file_name = self._get_file_names(key)
+        manifest = {'key': repr(key), 'version': self.version, 'grid': np.asarray(grid).tolist(), 'shape': list(paths.shape),
+                    'dtype': paths.dtype.str, 'sha256': self._get_hash(paths)}
+        # written to temporary files first, the files being replaced atomically
+        for file_name, write in [(paths_file_name, lambda file: np.save(file, paths)),
+                                 (manifest_file_name, lambda file: file.write(json.dumps(manifest).encode()))]:
+            file_descriptor, temporary_file_name = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(file_descriptor, 'wb') as file:
+                    write(file)
+                os.replace(temporary_file_name, file_name)
+            except BaseException:
+                os.remove(temporary_file_name)
+                raise
+        return np.load(paths_file_name, mmap_mode='r')
+
+    def get_paths(self, key: Hashable, grid: np.ndarray, generate: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        """
+        Gets the paths on the given time grid, read from the disk or generated and written to the disk.
+
+        The paths on the grid of the stored simulation are memory-mapped, the paths on a sub-grid being sliced from
+        them. When the stored simulation does not cover the grid, it is generated again on the union of the grids.
+
+        :param key: The key of the simulation, identifying the process parameters, the random number generator and the
+                    seed.
+        :type key: Hashable
+        :param grid: The increasing times of the paths, in any unit, such as date serial numbers.
+        :type grid: np.ndarray
+        :param generate: The function generating the paths on a time grid, with one row per path and one column per
+                         time.
+        :type generate: Callable[[np.ndarray], np.ndarray]
+        :return: The paths, with one row per path and one column per time of the grid.
+        :rtype: np.ndarray
+        """
+        grid = np.asarray(grid)
+        simulation_grid = grid
+        simulation = self._load(key)
+        if simulation is not None:
+            stored_grid, paths = simulation
+            indices = _get_grid_indices(stored_grid, grid)
+            if indices is not None:
+                self.hits += 1
+                return paths if indices.shape[0] == paths.shape[1] else paths[:, indices]
+            simulation_grid = np.union1d(stored_grid, grid)
+        self.misses += 1
+
+        paths = self.save(key, simulation_grid, generate(simulation_grid))
+        if simulation_grid is grid:
+            return paths
+        return paths[:, np.searchsorted(simulation_grid, grid)]
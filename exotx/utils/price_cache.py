@@ -0,0 +1,134 @@
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Tuple
+
+from exotx.instruments.instrument import Instrument, price
+from exotx.utils.path_cache import PathCache
+from exotx.utils.path_store import SharedPathStore, PersistentPathStore
+
+# the path caches share simulations between requests, they change how a result is computed and not its value
+_path_cache_types = (PathCache, SharedPathStore, PersistentPathStore)
+
+
+def fingerprint(*values: Any) -> str:
+    """
+    Computes a stable content hash of pricing inputs.
+
+    The inputs are hashed through their pickled form: the instruments, market data and static data pickle as their
+    primitive constructor arguments, so that inputs with the same content have the same fingerprint, whichever objects
+    hold them.
+
+    :param values: The inputs, such as an instrument, its market data, static data and pricing configuration.
+    :return: The SHA-256 hash of the inputs.
+    :rtype: str
+    """
+    return hashlib.sha256(pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+
+class PriceCache:
+    """
+    An opt-in cache of the results of exotx.instruments.instrument.price, with a least recently used size limit and a
+    time to live.
+
+    Results are keyed by the fingerprint of all the pricing inputs: the instrument, the market data, the static data and
+    the other arguments of the price method, such as the pricing configuration or the model, and the seed. The path
+    caches given to the price method are left out, as they are not pricing inputs. Since the fingerprint is computed
+    from the content of the inputs, inputs modified in place are priced afresh. A result is reused until it expires,
+    and exceptions are not cached.
+
+    Attributes:
+        max_size (int): The maximum number of results kept.
+        time_to_live (float): The number of seconds during which a result is reused.
+        hits (int): The number of requests served from the cache.
+        misses (int): The number of requests priced, the expired results included.
+        evictions (int): The number of results evicted by the size limit.
+        expirations (int): The number of results expired.
+
+    Example usage:
+
+    >>> cache = PriceCache(max_size=10000, time_to_live=30.0)
+    >>> result = cache.price(vanilla_option, market_data, static_data, pricing_config)
+    >>> cache.hit_rate
+    0.0
+    """
+
+    def __init__(self, max_size: int = 1024, time_to_live: float = 60.0,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        :param max_size: The maximum number of results kept, defaults to 1024.
+        :type max_size: int, optional
+        :param time_to_live: The number of seconds during which a result is reused, defaults to 60.
+        :type time_to_live: float, optional
+        :param clock: The clock giving the current time in seconds, defaults to time.monotonic.
+        :type clock: Callable[[], float], optional
+        """
+        assert max_size > 0, f"Invalid maximum size: {max_size}"
+        assert time_to_live > 0, f"Invalid time to live: {time_to_live}"
+        self.max_size = max_size
+        self.time_to_live = time_to_live
+        self._clock = clock
+        # results with their expiry times, by fingerprint, in least recently used order
+        self._results: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def price(self, instrument: Instrument, *args, **kwargs) -> Any:
+        """
+        Calculates the price of the given financial instrument, or reuses the result of an identical request.
+
+        :param instrument: An instance of a subclass of the Instrument class.
+        :type instrument: Instrument
+        :param args: Positional arguments to be passed to the price method of the instrument.
+        :param kwargs: Keyword arguments to be passed to the price method of the instrument.
+        :return: The price of the financial instrument, either as a single float or a dictionary containing additional
+                 information such as greeks.
+        :rtype: Union[float, dict]
+        """
+        key = fingerprint(instrument, [arg for arg in args if not isinstance(arg, _path_cache_types)],
+                          sorted((name, value) for name, value in kwargs.items()
+                                 if name != 'path_cache' and not isinstance(value, _path_cache_types)))
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                expiry_time, result = cached
+                if self._clock() < expiry_time:
+                    self._results.move_to_end(key)
+                    self.hits += 1
+                    return self._copy(result)
+                del self._results[key]
+                self.expirations += 1
+            self.misses += 1
+
+        # priced outside of the lock, identical concurrent requests may both be priced
+        result = price(instrument, *args, **kwargs)
+        with self._lock:
+            self._results[key] = (self._clock() + self.time_to_live, result)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+                self.evictions += 1
+        return self._copy(result)
+
+    @staticmethod
+    def _copy(result: Any) -> Any:
+        # results with greeks are dictionaries, copied so that callers cannot alter the cached results
+        return dict(result) if isinstance(result, dict) else result
+
+    def clear(self) -> None:
+        """Removes all the results, keeping the statistics."""
+        with self._lock:
+            self._results.clear()
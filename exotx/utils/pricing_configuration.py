@@ -1,16 +1,110 @@
-from marshmallow import Schema, fields, ValidationError, post_load
+from typing import Dict
 
-from exotx.enums.enums import PricingModel, NumericalMethod, RandomNumberGenerator
+from marshmallow import Schema, fields, ValidationError, post_load
+from marshmallow.validate import Range
+
+from exotx.enums.enums import PricingModel, NumericalMethod, RandomNumberGenerator, FiniteDifferencePreset
+
+
+class FiniteDifferenceSettings:
+    """
+    Grid settings of the finite-difference pricing engines.
+
+    Explicit grid sizes take precedence over the preset, the missing ones are taken from the preset of the engine in
+    use (or from its standard preset when no preset is given).
+
+    Attributes:
+        time_steps (int): The number of time steps.
+        space_steps (int): The number of steps in the underlying dimension.
+        variance_steps (int): The number of steps in the variance dimension, for stochastic volatility models.
+        damping_steps (int): The number of fully implicit steps taken first to smooth the payoff.
+        preset (FiniteDifferencePreset): The accuracy-versus-speed preset.
+    """
+
+    def __init__(self, time_steps: int = None, space_steps: int = None, variance_steps: int = None,
+                 damping_steps: int = None, preset: FiniteDifferencePreset = None):
+        for name, value in [('time steps', time_steps), ('space steps', space_steps),
+                            ('variance steps', variance_steps)]:
+            assert value is None or value > 0, f"Invalid number of {name}: {value}"
+        assert damping_steps is None or damping_steps >= 0, f"Invalid number of damping steps: {damping_steps}"
+        self.time_steps = time_steps
+        self.space_steps = space_steps
+        self.variance_steps = variance_steps
+        self.damping_steps = damping_steps
+        self.preset = preset
+
+    def resolve(self, presets: Dict[FiniteDifferencePreset, 'FiniteDifferenceSettings']) -> 'FiniteDifferenceSettings':
+        """
+        Completes the settings with the preset values of a given engine.
+
+        :param presets: The settings of the engine for each preset.
+        :type presets: Dict[FiniteDifferencePreset, FiniteDifferenceSettings]
+        :return: The settings with every grid size defined.
+        :rtype: FiniteDifferenceSettings
+        """
+        defaults = presets[self.preset or FiniteDifferencePreset.STANDARD]
+        return FiniteDifferenceSettings(
+            time_steps=defaults.time_steps if self.time_steps is None else self.time_steps,
+            space_steps=defaults.space_steps if self.space_steps is None else self.space_steps,
+            variance_steps=defaults.variance_steps if self.variance_steps is None else self.variance_steps,
+            damping_steps=defaults.damping_steps if self.damping_steps is None else self.damping_steps,
+            preset=self.preset)
+
+
+class NumericalSettings:
+    """
+    Numerical settings of the Monte Carlo engines and of the model calibrations.
+
+    The settings left undefined take the defaults of the engine or model in use, the grids of the finite-difference
+    engines being defined by the finite-difference settings.
+
+    Attributes:
+        number_of_paths (int): The number of Monte Carlo paths.
+        time_steps_per_year (int): The number of Monte Carlo time steps per year, for the engines discretizing time.
+        monte_carlo_tolerance (float): The target standard error of the Monte Carlo engines supporting it, the engines
+            then drawing paths until it is reached.
+        calibration_tolerance (float): The relative tolerance of the model calibrations.
+        calibration_max_iterations (int): The maximum number of iterations of the model calibrations.
+    """
+
+    def __init__(self, number_of_paths: int = None, time_steps_per_year: int = None,
+                 monte_carlo_tolerance: float = None, calibration_tolerance: float = None,
+                 calibration_max_iterations: int = None):
+        for name, value in [('paths', number_of_paths), ('time steps per year', time_steps_per_year),
+                            ('calibration iterations', calibration_max_iterations)]:
+            assert value is None or value > 0, f"Invalid number of {name}: {value}"
+        assert monte_carlo_tolerance is None or monte_carlo_tolerance > 0, \
+            f"Invalid Monte Carlo tolerance: {monte_carlo_tolerance}"
+        assert calibration_tolerance is None or calibration_tolerance > 0, \
+            f"Invalid calibration tolerance: {calibration_tolerance}"
+        self.number_of_paths = number_of_paths
+        self.time_steps_per_year = time_steps_per_year
+        self.monte_carlo_tolerance = monte_carlo_tolerance
+        self.calibration_tolerance = calibration_tolerance
+        self.calibration_max_iterations = calibration_max_iterations
 
 
 class PricingConfiguration:
     def __init__(self, model: PricingModel, numerical_method: NumericalMethod,
                  random_number_generator: RandomNumberGenerator = None,
-                 compute_greeks: bool = False):
+                 compute_greeks: bool = False,
+                 finite_difference_settings: FiniteDifferenceSettings = None,
+                 numerical_settings: NumericalSettings = None):
         self.model = model
         self.numerical_method = numerical_method
         self.compute_greeks = compute_greeks
         self.random_number_generator = random_number_generator
+        self.finite_difference_settings = finite_difference_settings
+        self.numerical_settings = numerical_settings
+
+    def get_numerical_settings(self) -> NumericalSettings:
+        """
+        Gets the numerical settings, with every setting undefined when the configuration has none.
+
+        :return: The numerical settings.
+        :rtype: NumericalSettings
+        """
+        return self.numerical_settings or NumericalSettings()
 
     def to_json(self):
         return PricingConfigurationSchema().dump(self)
@@ -51,17 +145,58 @@ class RandomNumberGeneratorField(fields.Field):
         return value.name
 
     def _deserialize(self, value: str, attr, data, **kwargs) -> RandomNumberGenerator:
+        if not value:
+            return None
         try:
             return RandomNumberGenerator[value]
         except KeyError as error:
             raise ValidationError(f"Invalid random number generator \'{value}\'") from error
 
 
+class FiniteDifferencePresetField(fields.Field):
+    def _serialize(self, value: FiniteDifferencePreset, attr, obj, **kwargs) -> str:
+        if not value:
+            return None
+        return value.name
+
+    def _deserialize(self, value: str, attr, data, **kwargs) -> FiniteDifferencePreset:
+        try:
+            return FiniteDifferencePreset[value]
+        except KeyError as error:
+            raise ValidationError(f"Invalid finite difference preset \'{value}\'") from error
+
+
+class FiniteDifferenceSettingsSchema(Schema):
+    time_steps = fields.Integer(allow_none=True, validate=Range(min=1))
+    space_steps = fields.Integer(allow_none=True, validate=Range(min=1))
+    variance_steps = fields.Integer(allow_none=True, validate=Range(min=1))
+    damping_steps = fields.Integer(allow_none=True, validate=Range(min=0))
+    preset = FiniteDifferencePresetField(allow_none=True)
+
+    @post_load
+    def make_finite_difference_settings(self, data, **kwargs) -> FiniteDifferenceSettings:
+        return FiniteDifferenceSettings(**data)
+
+
+class NumericalSettingsSchema(Schema):
+    number_of_paths = fields.Integer(allow_none=True, validate=Range(min=1))
+    time_steps_per_year = fields.Integer(allow_none=True, validate=Range(min=1))
+    monte_carlo_tolerance = fields.Float(allow_none=True, validate=Range(min=0, min_inclusive=False))
+    calibration_tolerance = fields.Float(allow_none=True, validate=Range(min=0, min_inclusive=False))
+    calibration_max_iterations = fields.Integer(allow_none=True, validate=Range(min=1))
+
+    @post_load
+    def make_numerical_settings(self, data, **kwargs) -> NumericalSettings:
+        return NumericalSettings(**data)
+
+
 class PricingConfigurationSchema(Schema):
     model = PricingModelField(allow_none=False)
     numerical_method = NumericalMethodField(allow_none=False)
     compute_greeks = fields.Boolean()
     random_number_generator = RandomNumberGeneratorField(allow_none=True)
+    finite_difference_settings = fields.Nested(FiniteDifferenceSettingsSchema(), allow_none=True)
+    numerical_settings = fields.Nested(NumericalSettingsSchema(), allow_none=True)
 
     @post_load
     def make_pricing_configuration(self, data, **kwargs) -> PricingConfiguration:
@@ -0,0 +1,258 @@
+import hashlib
+import math
+import os
+import pickle
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import QuantLib as ql
+
+from exotx.data.marketdata import MarketData
+from exotx.data.staticdata import StaticData
+from exotx.instruments.instrument import Instrument
+
+# number of market and static data kept alive by each worker process, with the volatility surfaces they cache
+worker_cache_size = 16
+
+# market and static data of the worker process, by content digest, in least recently used order
+_worker_cache: 'OrderedDict[str, Any]' = OrderedDict()
+
+# (digest, pickled content) of market or static data
+Payload = Tuple[str, bytes]
+
+
+class PricingTask:
+    """
+    A pricing request: an instrument, its market and static data, and the other arguments of its price method.
+
+    Attributes:
+        instrument (Instrument): The instrument to price.
+        market_data (MarketData): The market data used for pricing the instrument.
+        static_data (StaticData): The static data used for pricing the instrument.
+        args (tuple): The other positional arguments of the price method, such as the model or pricing configuration.
+        kwargs (dict): The keyword arguments of the price method.
+    """
+
+    def __init__(self, instrument: Instrument, market_data: MarketData, static_data: StaticData, *args,
+                 **kwargs) -> None:
+        self.instrument = instrument
+        self.market_data = market_data
+        self.static_data = static_data
+        self.args = args
+        self.kwargs = kwargs
+
+    def get_reference_date(self) -> date:
+        return self.market_data.reference_date.date()
+
+
+class PricingResult:
+    """
+    The outcome of a pricing task.
+
+    Attributes:
+        value (Any): The value returned by the price method, None if it raised an exception.
+        error (Optional[BaseException]): The exception raised by the price method, None if it succeeded.
+        elapsed_time (float): The time spent in the price method, in seconds.
+        reference_date (date): The reference date of the market data.
+        worker (int): The process id of the worker process which priced the task.
+    """
+
+    def __init__(self, value: Any, error: Optional[BaseException], elapsed_time: float, reference_date: date,
+                 worker: int) -> None:
+        self.value = value
+        self.error = error
+        self.elapsed_time = elapsed_time
+        self.reference_date = reference_date
+        self.worker = worker
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    def get(self) -> Any:
+        """
+        Gets the value of the task.
+
+        :return: The value returned by the price method.
+        :rtype: Any
+        :raises BaseException: The exception raised by the price method, if any.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def __repr__(self) -> str:
+        outcome = f"value={self.value!r}" if self.error is None else f"error={self.error!r}"
+        return f"{type(self).__name__}({outcome}, elapsed_time={self.elapsed_time:.6f}, " \
+               f"reference_date={self.reference_date}, worker={self.worker})"
+
+
+def _get_cached(payload: Payload) -> Any:
+    # unpickles market or static data once per worker process, so that their caches stay warm across chunks
+    digest, content = payload
+    try:
+        _worker_cache.move_to_end(digest)
+        return _worker_cache[digest]
+    except KeyError:
+        value = pickle.loads(content)
+        _worker_cache[digest] = value
+        while len(_worker_cache) > worker_cache_size:
+            _worker_cache.popitem(last=False)
+        return value
+
+
+def price_chunk(reference_date: date, market_data_payloads: List[Payload], static_data_payloads: List[Payload],
+                tasks: List[Tuple[Instrument, int, int, tuple, dict]]) -> Tuple[int, List[Tuple[Any, Any, float]]]:
+    """
+    Prices tasks sharing the same reference date one after the other in a worker process, so that the global evaluation
+    date of the process is never shared by concurrent pricings.
+
+    :param reference_date: The reference date of the tasks.
+    :type reference_date: date
+    :param market_data_payloads: The payloads of the market data of the tasks.
+    :type market_data_payloads: List[Payload]
+    :param static_data_payloads: The payloads of the static data of the tasks.
+    :type static_data_payloads: List[Payload]
+    :param tasks: The tasks, as tuples of the instrument, the indices of its market and static data payloads, and the
+                  other positional and keyword arguments of its price method.
+    :type tasks: List[Tuple[Instrument, int, int, tuple, dict]]
+    :return: The id of the worker process, and the value, error and pricing time of each task.
+    :rtype: Tuple[int, List[Tuple[Any, Any, float]]]
+    """
+    ql.Settings.instance().evaluationDate = ql.Date(reference_date.day, reference_date.month, reference_date.year)
+    market_data = [_get_cached(payload) for payload in market_data_payloads]
+    static_data = [_get_cached(payload) for payload in static_data_payloads]
+    results = []
+    for instrument, market_data_index, static_data_index, args, kwargs in tasks:
+        start = time.perf_counter()
+        try:
+            value, error = instrument.price(market_data[market_data_index], static_data[static_data_index], *args,
+                                            **kwargs), None
+        except Exception as exception:
+            value, error = None, exception
+        elapsed_time = time.perf_counter() - start
+        try:
+            pickle.dumps(error)
+        except Exception:
+            # exceptions which cannot be sent back to the parent process are reported by their description
+            error = RuntimeError(repr(error))
+        results.append((value, error, elapsed_time))
+    return os.getpid(), results
+
+
+def get_payload(value: Any) -> Payload:
+    """
+    Pickles market or static data for the worker processes, with the digest identifying their content.
+
+    :param value: The market or static data.
+    :type value: Any
+    :return: The digest and the pickled content.
+    :rtype: Payload
+    """
+    content = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    return hashlib.sha256(content).hexdigest(), content
+
+
+class PricingExecutor:
+    """
+    A pricing service sharding pricing tasks across worker processes by reference date.
+
+    QuantLib prices with a global evaluation date, so that instruments of different reference dates cannot be priced
+    concurrently in one process. The executor groups the tasks by reference date and sends them to worker processes in
+    chunks of a single reference date, each worker pricing the tasks of a chunk one after the other. The market and
+    static data are pickled once per batch and kept alive by each worker, so that the volatility surfaces they cache are
+    reused by the following chunks and batches. The results come back in the order of the tasks, with their pricing times.
+
+    Example usage:
+
+    >>> with PricingExecutor(max_workers=4) as executor:
+    ...     results = executor.price([PricingTask(option, market_data, static_data, pricing_config)
+    ...                               for option, market_data in zip(options, market_data_by_option)])
+    >>> [result.get() for result in results]
+    """
+
+    def __init__(self, max_workers: int = None, chunk_size: int = None, mp_context=None) -> None:
+        """
+        :param max_workers: The number of worker processes, defaults to the number of processors.
+        :type max_workers: int, optional
+        :param chunk_size: The maximum number of tasks sent at once to a worker, defaults to a size spreading the tasks
+                           of each reference date over all the workers.
+        :type chunk_size: int, optional
+        :param mp_context: The multiprocessing context of the worker processes, defaults to the platform default.
+        """
+        assert max_workers is None or max_workers > 0, f"Invalid number of workers: {max_workers}"
+        assert chunk_size is None or chunk_size > 0, f"Invalid chunk size: {chunk_size}"
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor: Executor = ProcessPoolExecutor(self.max_workers, mp_context=mp_context)
+
+    def _get_chunks(self, tasks: Sequence[PricingTask]) -> List[Tuple[date, List[int]]]:
+        positions_by_date: Dict[date, List[int]] = {}
+        for position, task in enumerate(tasks):
+            positions_by_date.setdefault(task.get_reference_date(), []).append(position)
+        chunks = []
+        for reference_date, positions in positions_by_date.items():
+            chunk_size = self.chunk_size or math.ceil(len(positions) / self.max_workers)
+            for start in range(0, len(positions), chunk_size):
+                chunks.append((reference_date, positions[start:start + chunk_size]))
+        return chunks
+
+    def price(self, tasks: Sequence[PricingTask]) -> List[PricingResult]:
+        """
+        Prices the tasks in the worker processes.
+
+        The exceptions raised by the price methods are reported in the results of their tasks, without stopping the
+        other tasks.
+
+        :param tasks: The pricing tasks.
+        :type tasks: Sequence[PricingTask]
+        :return: The results, in the order of the tasks.
+        :rtype: List[PricingResult]
+        """
+        # the market and static data are pickled once, however many tasks share them
+        payloads: Dict[int, Payload] = {}
+        for task in tasks:
+            for data in (task.market_data, task.static_data):
+                if id(data) not in payloads:
+                    payloads[id(data)] = get_payload(data)
+
+        futures = []
+        for reference_date, positions in self._get_chunks(tasks):
+            # indices of the distinct market and static data of the chunk, by object id
+            market_data_indices: Dict[int, int] = {}
+            static_data_indices: Dict[int, int] = {}
+            chunk_tasks = []
+            for position in positions:
+                task = tasks[position]
+                market_data_index = market_data_indices.setdefault(id(task.market_data), len(market_data_indices))
+                static_data_index = static_data_indices.setdefault(id(task.static_data), len(static_data_indices))
+                chunk_tasks.append((task.instrument, market_data_index, static_data_index, task.args, task.kwargs))
+            future = self._executor.submit(price_chunk, reference_date,
+                                           [payloads[data_id] for data_id in market_data_indices],
+                                           [payloads[data_id] for data_id in static_data_indices], chunk_tasks)
+            futures.append((reference_date, positions, future))
+
+        results: List[Optional[PricingResult]] = [None] * len(tasks)
+        for reference_date, positions, future in futures:
+            worker, chunk_results = future.result()
+            for position, (value, error, elapsed_time) in zip(positions, chunk_results):
+                results[position] = PricingResult(value, error, elapsed_time, reference_date, worker)
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the worker processes.
+
+        :param wait: Whether to wait for the pending tasks, defaults to True.
+        :type wait: bool, optional
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> 'PricingExecutor':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
@@ -21,12 +21,16 @@ setup(name='exotx',
           'numpy>=1.23.5',
           'pandas>=1.5.1',
           'scipy>=1.9.3',
-          'matplotlib',
-          'plotly>=4.12.0',
           'quantlib>=1.26',
           'pytest>=7.1.3',
           'marshmallow>=3.19.0'
       ],
+      extras_require={
+          'plot': [
+              'matplotlib',
+              'plotly>=4.12.0'
+          ]
+      },
       python_requires='>=3.10.2, <4',
       classifiers=[
           'Development Status :: 4 - Beta',